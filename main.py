@@ -9,7 +9,8 @@ import logging
 # src 폴더를 파이썬 경로에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from config import GOOGLE_API_KEY, TAVILY_API_KEY
+from config import GOOGLE_API_KEY, TAVILY_API_KEY, TRACING_CONFIG
+from src.tracing import KIND_REQUEST, enable_tracing, traced, tracer
 # supervisor 또는 테스트를 위해 general_agent를 직접 호출
 from general_agent import run_general_agent
 
@@ -105,6 +106,7 @@ def update_conversation_history(context, query, response, agent_type):
     context["last_response"] = response
     context["last_agent_type"] = agent_type
 
+@traced(kind=KIND_REQUEST)
 def process_query(query, context):
     """쿼리를 처리하고 적절한 에이전트로 라우팅합니다."""
     # 현재 시간 업데이트
@@ -205,9 +207,22 @@ def main():
     # 컨텍스트 로드
     user_context = load_context()
     
+    # 요청 추적 활성화
+    if TRACING_CONFIG["enabled"]:
+        enable_tracing(TRACING_CONFIG["jsonl_path"])
+    
     # 쿼리 처리
     final_response = process_query(query, user_context)
     
+    # 요청 추적 결과 저장
+    if tracer.enabled:
+        trace_path = os.path.join(
+            TRACING_CONFIG["chrome_trace_dir"],
+            f"trace_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        tracer.export_chrome_trace(trace_path)
+        logger.info(f"요청 추적 요약: {json.dumps(tracer.summarize(), ensure_ascii=False)}")
+    
     # 컨텍스트 저장
     save_context(user_context)
     
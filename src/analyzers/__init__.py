@@ -11,6 +11,7 @@ from .income_analyzer import IncomeAnalyzer
 from .trend_analyzer import TrendAnalyzer
 from .comparison_analyzer import ComparisonAnalyzer
 from .integrated_analyzer import IntegratedAnalyzer
+from .result_cache import AnalysisResultCache, analysis_result_cache
 
 __all__ = [
     'BaseAnalyzer',
@@ -18,5 +19,7 @@ __all__ = [
     'IncomeAnalyzer',
     'TrendAnalyzer',
     'ComparisonAnalyzer',
-    'IntegratedAnalyzer'
+    'IntegratedAnalyzer',
+    'AnalysisResultCache',
+    'analysis_result_cache'
 ]
\ No newline at end of file
@@ -15,6 +15,8 @@ import pandas as pd
 from src.models import Transaction
 from src.repositories.transaction_repository import TransactionRepository
 from src.analyzers.base_analyzer import BaseAnalyzer
+from src.analyzers.result_cache import memoize_by_data_version
+from src.tracing import KIND_ANALYZER, traced
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -52,6 +54,8 @@ class ComparisonAnalyzer(BaseAnalyzer):
         raise NotImplementedError("비교 분석기에서는 analyze 메서드를 직접 사용하지 않습니다. "
                                 "compare_periods 또는 다른 비교 메서드를 사용하세요.")
     
+    @traced(kind=KIND_ANALYZER)
+    @memoize_by_data_version
     def compare_periods(self, 
                        period1_start: date, period1_end: date, 
                        period2_start: date, period2_end: date,
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+분석 결과 캐시
+
+분석기와 분석 도구의 결과를 거래 테이블 데이터 버전을 포함한 키로 메모이제이션합니다.
+데이터 버전은 거래 테이블이 바뀔 때마다 트리거로 증가하므로(TransactionRepository.get_data_version)
+캐시된 결과는 항상 최신 데이터 기준이며, 같은 대화에서 반복되는 조회는 다시 계산하지 않습니다.
+같은 키를 동시에 요청하면 먼저 도착한 호출만 계산하고 나머지는 그 결과를 함께 받습니다.
+저장소를 통한 쓰기는 캐시 태그(table:transactions)도 무효화하므로, 같은 태그 세대 번호를 키에 넣고
+무효화 리스너로 이전 세대 결과를 바로 비웁니다(CacheManager와 같은 태그 계층 사용).
+"""
+
+import copy
+import functools
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.cache_tags import table_tag, tag_versions
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 분석 결과가 의존하는 거래 테이블 태그
+TRANSACTIONS_TAG = table_tag('transactions')
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    인자 값을 캐시 키로 사용할 수 있는 형태로 변환
+    
+    Args:
+        value: 인자 값
+    
+    Returns:
+        Hashable: 딕셔너리/리스트/집합을 정렬된 튜플로 바꾼 값
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(item) for item in value))
+    return value
+
+
+class AnalysisResultCache:
+    """
+    데이터 버전 기반 분석 결과 캐시 클래스
+    
+    키에 (저장소 DB 경로, 데이터 버전, 오늘 날짜)가 포함되므로 거래가 바뀌거나 날짜가 바뀌면
+    이전 결과는 자연스럽게 사용되지 않고 LRU 순서로 밀려납니다.
+    결과는 호출자가 수정해도 캐시에 영향이 없도록 복사해서 반환합니다.
+    """
+    
+    def __init__(self, max_size: int = 256):
+        """
+        분석 결과 캐시 초기화
+        
+        Args:
+            max_size: 최대 항목 수
+        """
+        self.max_size = max_size
+        self._entries: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.coalesced = 0
+        tag_versions.add_listener(self._on_tags_invalidated)
+    
+    def get_or_compute(self, repository: Any, name: str, args: tuple, kwargs: Dict[str, Any],
+                       compute: Callable[[], Any], is_cacheable: Callable[[Any], bool] = None) -> Any:
+        """
+        캐시된 결과를 반환하거나 계산 후 저장
+        
+        같은 키의 계산이 진행 중이면 새로 계산하지 않고 그 결과(또는 예외)를 기다려 받습니다.
+        
+        Args:
+            repository: 거래 저장소 (데이터 버전 조회용)
+            name: 결과 이름 (함수/메서드 이름)
+            args: 위치 인자
+            kwargs: 키워드 인자
+            compute: 결과 계산 함수
+            is_cacheable: 결과 저장 여부 판단 함수 (기본값: 항상 저장)
+        
+        Returns:
+            Any: 분석 결과 (복사본)
+        """
+        version = self._data_version(repository)
+        if version is None:
+            # 데이터 버전을 알 수 없으면 캐시를 사용하지 않음
+            self.bypassed += 1
+            return compute()
+        
+        key = (name, version, tag_versions.version(TRANSACTIONS_TAG), date.today().toordinal(),
+               _freeze(args), _freeze(kwargs))
+        
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+            
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        
+        if not leader:
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = compute()
+            shared = copy.deepcopy(result)
+            if is_cacheable is None or is_cacheable(result):
+                with self._lock:
+                    self._entries[key] = shared
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(shared)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+    
+    def _on_tags_invalidated(self, tags: Tuple[str, ...]) -> None:
+        """
+        거래 테이블 태그가 무효화되면 저장된 결과를 비움
+        
+        Args:
+            tags: 무효화된 태그
+        """
+        if TRANSACTIONS_TAG in tags:
+            with self._lock:
+                self._entries.clear()
+    
+    def clear(self) -> None:
+        """
+        캐시 전체 삭제 및 통계 초기화
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.bypassed = self.coalesced = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+        
+        Returns:
+            Dict[str, Any]: 항목 수, 히트/미스/우회/합류 횟수, 히트율(%)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'total_items': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'bypassed': self.bypassed,
+                'coalesced': self.coalesced,
+                'hit_rate': self.hits / lookups * 100 if lookups else 0
+            }
+    
+    @staticmethod
+    def _data_version(repository: Any) -> Optional[Tuple[str, int]]:
+        """
+        저장소의 (DB 경로, 데이터 버전) 조회
+        
+        Returns:
+            Optional[Tuple[str, int]]: 데이터 버전 (지원하지 않는 저장소나 조회 실패 시 None)
+        """
+        db_path = getattr(getattr(repository, 'db', None), 'db_path', None)
+        get_data_version = getattr(repository, 'get_data_version', None)
+        if not isinstance(db_path, str) or get_data_version is None:
+            return None
+        
+        try:
+            version = get_data_version()
+        except Exception as e:
+            logger.warning(f"데이터 버전 조회 실패, 캐시를 사용하지 않습니다: {e}")
+            return None
+        
+        return (db_path, version) if isinstance(version, int) else None
+
+
+# 전역 분석 결과 캐시
+analysis_result_cache = AnalysisResultCache()
+
+
+def memoize_by_data_version(method: Callable) -> Callable:
+    """
+    분석기 메서드 결과 메모이제이션 데코레이터
+    
+    self.repository의 데이터 버전이 같고 인자가 같으면 저장된 결과를 반환합니다.
+    
+    Args:
+        method: 분석기 메서드
+    
+    Returns:
+        Callable: 래핑된 메서드
+    """
+    name = method.__qualname__
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return analysis_result_cache.get_or_compute(
+            self.repository, name, args, kwargs, lambda: method(self, *args, **kwargs)
+        )
+    return wrapper
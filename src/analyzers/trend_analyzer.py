@@ -17,6 +17,8 @@ import numpy as np
 from src.models import Transaction
 from src.repositories.transaction_repository import TransactionRepository
 from src.analyzers.base_analyzer import BaseAnalyzer
+from src.analyzers.result_cache import memoize_by_data_version
+from src.tracing import KIND_ANALYZER, traced
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -38,6 +40,8 @@ class TrendAnalyzer(BaseAnalyzer):
         """
         super().__init__(transaction_repository)
     
+    @traced(kind=KIND_ANALYZER)
+    @memoize_by_data_version
     def analyze(self, start_date: date, end_date: date, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         지정된 기간의 트렌드를 분석합니다.
@@ -0,0 +1,551 @@
+"""
+Google API 요청 속도 제한기와 서킷 브레이커
+
+이 모듈은 Gmail 감시, 캘린더 배치 작업, 에이전트 도구 호출처럼 동시에 실행되는 작업들이
+같은 API 할당량을 나눠 쓰도록 프로세스 전역 토큰 버킷을 API/할당량 버킷별로 제공합니다.
+429 응답을 받으면 Retry-After 동안 버킷 전체를 멈추고 속도를 줄이며(적응형),
+서버 오류가 이어지면 서킷 브레이커가 열려 복구될 때까지 요청을 즉시 실패시킵니다.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# API별 기본 속도 제한 (초당 요청 수, 최대 버스트)
+# Calendar API는 사용자당 분당 600회, Gmail API는 사용자당 초당 250 할당량 단위(messages.get 5단위) 기준
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    'calendar': (10.0, 50.0),
+    'gmail': (40.0, 50.0),
+}
+FALLBACK_LIMIT: Tuple[float, float] = (10.0, 10.0)
+
+# 할당량 초과로 간주하는 403 응답 사유
+RATE_LIMIT_REASONS = ('ratelimitexceeded', 'userratelimitexceeded', 'quotaexceeded')
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 요청을 보내지 않은 경우"""
+    
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} API 서킷 브레이커가 열려 있습니다. {retry_after:.1f}초 후에 다시 시도하세요.")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    적응형 토큰 버킷
+    
+    429 응답 시 속도를 decrease_factor배로 줄이고(곱셈 감소),
+    성공할 때마다 increase_step만큼 설정 속도까지 회복합니다(덧셈 증가).
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        increase_step: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        TokenBucket 초기화
+        
+        Args:
+            rate: 초당 보충 토큰 수 (최대 속도)
+            capacity: 버킷 크기 (최대 버스트)
+            min_rate: 감속 시 최저 속도 (기본값: rate의 1/10)
+            decrease_factor: 429 응답 시 속도 감소 비율
+            increase_step: 성공 시 속도 증가량 (기본값: rate의 1/100)
+            clock: 경과 시간 측정 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step if increase_step is not None else rate / 100
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+    
+    @property
+    def tokens(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 얻을 때까지 대기합니다.
+        
+        Args:
+            tokens: 필요한 토큰 수 (버킷 크기보다 크면 버킷 크기로 제한)
+        
+        Returns:
+            대기한 시간(초)
+        """
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                
+                if now < self._blocked_until:
+                    wait_time = self._blocked_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                else:
+                    wait_time = (tokens - self._tokens) / self.rate
+            
+            self._sleep(wait_time)
+            waited += wait_time
+    
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        429 응답을 반영하여 속도를 줄이고 Retry-After 동안 토큰 지급을 멈춥니다.
+        
+        Args:
+            retry_after: 서버가 지정한 대기 시간(초)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = 0.0
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+    
+    def recover(self) -> None:
+        """성공한 요청을 반영하여 속도를 조금씩 회복합니다."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+    
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰을 보충합니다 (잠금을 잡은 상태에서 호출)."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 요청을 차단하는 서킷 브레이커
+    
+    failure_threshold번 연속 실패하면 열림 상태가 되어 recovery_timeout 동안 요청을 거부하고,
+    이후 반열림 상태에서 시험 요청 하나가 성공하면 닫힘 상태로 돌아갑니다.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        CircuitBreaker 초기화
+        
+        Args:
+            failure_threshold: 열림 상태로 전환할 연속 실패 횟수
+            recovery_timeout: 열림 상태 유지 시간(초)
+            clock: 경과 시간 측정 함수 (테스트용)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        """현재 상태 (closed, open, half_open)"""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+                return HALF_OPEN
+            return self._state
+    
+    def before_call(self) -> Optional[float]:
+        """
+        요청 가능 여부를 확인합니다.
+        
+        Returns:
+            요청 가능하면 None, 차단되면 남은 대기 시간(초)
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return None
+            
+            remaining = self.recovery_timeout - (self._clock() - self._opened_at)
+            if self._state == OPEN and remaining > 0:
+                return remaining
+            
+            # 반열림 상태에서는 시험 요청 하나만 통과
+            if self._trial_in_flight:
+                return max(remaining, 1.0)
+            self._state = HALF_OPEN
+            self._trial_in_flight = True
+            return None
+    
+    def record_success(self) -> None:
+        """성공한 요청을 기록합니다."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("서킷 브레이커가 닫혔습니다 (API 복구).")
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        """실패한 요청을 기록합니다."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(f"서킷 브레이커가 열렸습니다: 연속 실패 {self._failures}회")
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+
+class ApiRateLimiter:
+    """API/할당량 버킷 하나에 대한 토큰 버킷, 서킷 브레이커, 지표 묶음"""
+    
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: float,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        ApiRateLimiter 초기화
+        
+        Args:
+            name: 제한기 이름 (예: "calendar", "gmail:send")
+            rate: 초당 요청 수
+            capacity: 최대 버스트
+            failure_threshold: 서킷 브레이커를 열 연속 실패 횟수
+            recovery_timeout: 서킷 브레이커 열림 유지 시간(초)
+            clock: 경과 시간 측정 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.name = name
+        self.bucket = TokenBucket(rate, capacity, clock=clock, sleep=sleep)
+        self.breaker = CircuitBreaker(failure_threshold, recovery_timeout, clock=clock)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._metrics = {
+            'requests': 0,
+            'successes': 0,
+            'throttled': 0,
+            'failures': 0,
+            'rejected': 0,
+            'wait_time': 0.0,
+        }
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        요청 전에 서킷 상태를 확인하고 토큰을 얻습니다.
+        
+        Args:
+            tokens: 필요한 토큰 수 (배치 요청은 하위 요청 수)
+        
+        Returns:
+            대기한 시간(초)
+        
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+        """
+        remaining = self.breaker.before_call()
+        if remaining is not None:
+            with self._lock:
+                self._metrics['rejected'] += 1
+            raise CircuitOpenError(self.name, remaining)
+        
+        waited = self.bucket.acquire(tokens)
+        with self._lock:
+            self._metrics['requests'] += int(tokens)
+            self._metrics['wait_time'] += waited
+        return waited
+    
+    def record_success(self) -> None:
+        """성공 응답(클라이언트 오류 포함)을 기록합니다."""
+        self.breaker.record_success()
+        self.bucket.recover()
+        with self._lock:
+            self._metrics['successes'] += 1
+    
+    def record_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        429/할당량 초과 응답을 기록합니다.
+        
+        Args:
+            retry_after: Retry-After 헤더 값(초)
+        """
+        self.bucket.throttle(retry_after)
+        with self._lock:
+            self._metrics['throttled'] += 1
+        logger.warning(
+            f"{self.name} API 속도 제한 응답: 속도를 초당 {self.bucket.rate:.2f}회로 낮춥니다"
+            + (f", {retry_after}초 대기" if retry_after else "")
+        )
+    
+    def record_failure(self) -> None:
+        """서버 오류/네트워크 오류를 기록합니다."""
+        self.breaker.record_failure()
+        with self._lock:
+            self._metrics['failures'] += 1
+    
+    def record_response(self, error: Optional[Exception]) -> bool:
+        """
+        응답 결과를 분류하여 기록합니다.
+        
+        어떤 결과든 성공 또는 실패 중 하나로 기록하여 서킷 브레이커의 시험 요청을 정리합니다.
+        
+        Args:
+            error: 요청 오류 (성공이면 None)
+        
+        Returns:
+            다시 시도할 만한 오류인지 여부
+        """
+        if error is None:
+            self.record_success()
+            return False
+        
+        if isinstance(error, HttpError):
+            status = int(getattr(error.resp, 'status', 0) or 0)
+            if is_rate_limit_error(error):
+                self.record_throttled(get_retry_after(error))
+                return True
+            if status >= 500:
+                self.record_failure()
+                return True
+            # 4xx 클라이언트 오류는 API가 정상 동작 중이라는 뜻
+            self.record_success()
+            return False
+        
+        if isinstance(error, (ConnectionError, OSError)):
+            self.record_failure()
+            return True
+        
+        # 그 밖의 오류(httplib2.ServerNotFoundError, google.auth TransportError 등)도 실패로 기록해
+        # 반열림 상태의 시험 요청이 항상 정리되도록 함 (재시도하지는 않음)
+        self.record_failure()
+        return False
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        제한기 지표를 반환합니다.
+        
+        Returns:
+            요청/성공/제한/실패/거부 횟수, 누적 대기 시간, 현재 속도, 서킷 상태 등
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics.update({
+            'rate': self.bucket.rate,
+            'max_rate': self.bucket.max_rate,
+            'tokens': self.bucket.tokens,
+            'circuit_state': self.breaker.state,
+        })
+        return metrics
+
+
+class RateLimiterRegistry:
+    """프로세스 전역에서 API/할당량 버킷별 제한기를 공유하는 레지스트리"""
+    
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        """
+        RateLimiterRegistry 초기화
+        
+        Args:
+            limits: API별 (초당 요청 수, 최대 버스트) 설정
+        """
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self._limiters: Dict[str, ApiRateLimiter] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, api: str, bucket: str = "default") -> ApiRateLimiter:
+        """
+        API/할당량 버킷에 해당하는 제한기를 가져옵니다 (없으면 생성).
+        
+        Args:
+            api: API 이름 (예: "calendar", "gmail")
+            bucket: 할당량 버킷 이름 (기본값: "default")
+        
+        Returns:
+            공유 제한기
+        """
+        name = api if bucket == "default" else f"{api}:{bucket}"
+        with self._lock:
+            limiter = self._limiters.get(name)
+            if limiter is None:
+                rate, capacity = self.limits.get(name) or self.limits.get(api) or FALLBACK_LIMIT
+                limiter = ApiRateLimiter(name, rate, capacity)
+                self._limiters[name] = limiter
+            return limiter
+    
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        모든 제한기의 지표를 반환합니다.
+        
+        Returns:
+            제한기 이름별 지표
+        """
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.name: limiter.get_metrics() for limiter in limiters}
+    
+    def reset(self) -> None:
+        """등록된 제한기를 모두 제거합니다."""
+        with self._lock:
+            self._limiters.clear()
+
+
+_registry = RateLimiterRegistry()
+
+
+def get_rate_limiter(api: str, bucket: str = "default") -> ApiRateLimiter:
+    """
+    프로세스 전역 제한기를 가져옵니다.
+    
+    Args:
+        api: API 이름 (예: "calendar", "gmail")
+        bucket: 할당량 버킷 이름 (기본값: "default")
+    
+    Returns:
+        공유 제한기
+    """
+    return _registry.get(api, bucket)
+
+
+def get_rate_limiter_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    프로세스 전역 제한기들의 지표를 반환합니다.
+    
+    Returns:
+        제한기 이름별 지표
+    """
+    return _registry.get_metrics()
+
+
+def get_retry_after(error: HttpError) -> Optional[float]:
+    """
+    HttpError 응답의 Retry-After 헤더 값을 초 단위로 반환합니다.
+    
+    Args:
+        error: Google API 오류
+    
+    Returns:
+        대기 시간(초) 또는 None
+    """
+    resp = getattr(error, 'resp', None)
+    
+    # httplib2 응답은 소문자 헤더 딕셔너리이고, 다른 HTTP 클라이언트는 headers 속성을 가짐
+    for headers in (resp, getattr(resp, 'headers', None)):
+        try:
+            value = headers.get('retry-after') or headers.get('Retry-After')
+            if value is not None:
+                return float(value)
+        except (AttributeError, TypeError, ValueError):
+            continue
+    return None
+
+
+def is_rate_limit_error(error: HttpError) -> bool:
+    """
+    429 또는 할당량 초과 사유의 403 응답인지 확인합니다.
+    
+    Args:
+        error: Google API 오류
+    
+    Returns:
+        속도 제한 오류 여부
+    """
+    status = int(getattr(error.resp, 'status', 0) or 0)
+    if status == 429:
+        return True
+    if status == 403:
+        content = error.content.decode('utf-8', 'ignore') if isinstance(error.content, bytes) else str(error.content)
+        return any(reason in content.lower() for reason in RATE_LIMIT_REASONS)
+    return False
+
+
+def rate_limited_request_builder(
+    limiter: ApiRateLimiter,
+    max_tries: int = 5,
+    delay: float = 1.0,
+    backoff_factor: float = 2.0
+) -> Type[HttpRequest]:
+    """
+    googleapiclient.discovery.build의 requestBuilder로 사용할 요청 클래스를 만듭니다.
+    
+    생성된 클래스의 execute()는 토큰을 얻은 뒤 요청을 보내고, 응답을 제한기에 기록합니다.
+    속도 제한 응답은 버킷이 Retry-After 동안 멈춘 뒤, 서버/네트워크 오류는 지수 백오프 후 다시 시도합니다.
+    
+    Args:
+        limiter: 사용할 제한기
+        max_tries: 최대 시도 횟수 (기본값: 5)
+        delay: 서버 오류 시 첫 재시도 전 대기 시간(초) (기본값: 1.0)
+        backoff_factor: 대기 시간 증가 계수 (기본값: 2.0)
+    
+    Returns:
+        HttpRequest 하위 클래스
+    """
+    class RateLimitedHttpRequest(HttpRequest):
+        """제한기를 거쳐 실행되는 Google API 요청"""
+        
+        def execute(self, http=None, num_retries=0):
+            current_delay = delay
+            
+            for attempt in range(1, max_tries + 1):
+                limiter.acquire()
+                try:
+                    result = super().execute(http=http, num_retries=0)
+                except Exception as e:
+                    retryable = limiter.record_response(e)
+                    if not retryable or attempt >= max_tries:
+                        raise
+                    
+                    # 속도 제한은 버킷이 대기를 담당하고, 그 외 오류만 직접 백오프
+                    if not (isinstance(e, HttpError) and is_rate_limit_error(e)):
+                        limiter._sleep(current_delay * (1 + random.uniform(-0.1, 0.1)))
+                        current_delay *= backoff_factor
+                    logger.warning(f"{limiter.name} API 요청 재시도 ({attempt}/{max_tries}): {e}")
+                    continue
+                
+                limiter.record_success()
+                return result
+    
+    return RateLimitedHttpRequest
@@ -4,6 +4,9 @@
 
 데이터베이스 및 설정 파일의 백업 및 복원을 관리하는 시스템입니다.
 자동 백업 스케줄링, 데이터 내보내기/가져오기, 증분 백업, 무결성 검증 기능을 제공합니다.
+
+증분 백업은 스냅샷을 고정 크기 청크(여러 페이지)로 나누어 내용 해시로 저장하는 백업 체인입니다.
+매니페스트는 부모 백업을 가리키고 바뀐 청크만 기록하며, 같은 내용의 청크는 한 번만 저장합니다.
 """
 
 import os
@@ -14,10 +17,12 @@ import sqlite3
 import json
 import csv
 import zipfile
+import zlib
 import hashlib
 import time
 import threading
 import schedule
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union, Tuple
@@ -35,6 +40,54 @@ if parent_dir not in sys.path:
 from src.config_manager import ConfigManager
 from src.repositories.db_connection import DatabaseConnection
 
+# Connection.serialize()는 Python 3.11부터 제공되므로 없으면 항상 임시 파일로 스냅샷을 뜸
+_SQLITE_CAN_SERIALIZE = hasattr(sqlite3.Connection, 'serialize')
+
+class _HashingWriter:
+    """
+    쓰는 바이트의 해시와 길이를 함께 계산하는 파일 래퍼
+    
+    seek를 제공하지 않으므로 ZipFile은 로컬 헤더를 되돌아가 고치지 않고
+    데이터 디스크립터를 붙여 순차적으로 기록합니다.
+    """
+    
+    def __init__(self, raw):
+        """
+        해시 파일 래퍼 초기화
+        
+        Args:
+            raw: 실제로 기록할 바이너리 파일 객체
+        """
+        self.raw = raw
+        self.hasher = hashlib.sha256()
+        self.position = 0
+    
+    def write(self, data) -> int:
+        """
+        데이터 기록 및 해시 갱신
+        """
+        self.hasher.update(data)
+        self.position += len(data)
+        return self.raw.write(data)
+    
+    def tell(self) -> int:
+        """
+        지금까지 기록한 바이트 수
+        """
+        return self.position
+    
+    def flush(self) -> None:
+        """
+        버퍼 비우기
+        """
+        self.raw.flush()
+    
+    def hexdigest(self) -> str:
+        """
+        기록한 바이트의 SHA-256 체크섬
+        """
+        return self.hasher.hexdigest()
+
 class BackupManager:
     """
     백업 관리자 클래스
@@ -59,6 +112,12 @@ class BackupManager:
     BACKUP_TYPE_FULL = 'full'
     BACKUP_TYPE_INCREMENTAL = 'incremental'
     
+    # 압축 파일에 기록하는 청크 크기
+    ARCHIVE_CHUNK_SIZE = 1024 * 1024
+    
+    # 증분 백업 체인 디렉토리명 (데이터베이스 백업 디렉토리 아래)
+    CHAIN_DIR_NAME = 'chain'
+    
     def __init__(self, config_manager: ConfigManager = None):
         """
         백업 관리자 초기화
@@ -88,6 +147,17 @@ class BackupManager:
         self.backup_interval_days = self.config_manager.get_config_value('system.database.backup_interval_days', 7)
         self.max_backups = self.config_manager.get_config_value('system.database.max_backups', 5)
         
+        # 온라인 백업 설정 (한 단계에 복사할 페이지 수, 잠금 충돌 시 대기 시간)
+        self.backup_step_pages = self.config_manager.get_config_value('system.database.backup_step_pages', 1024)
+        self.backup_step_sleep_ms = self.config_manager.get_config_value('system.database.backup_step_sleep_ms', 50)
+        # 이 크기 이하의 데이터베이스는 메모리 스냅샷을 거쳐 바로 압축 파일에 기록
+        self.snapshot_memory_limit_mb = self.config_manager.get_config_value('system.database.snapshot_memory_limit_mb', 256)
+        
+        # 증분 백업 체인 설정 (청크 크기, 새 기준 백업을 만들기 전까지의 증분 수, 보관할 체인 수)
+        self.chain_chunk_kb = self.config_manager.get_config_value('system.database.chain_chunk_kb', 64)
+        self.chain_max_length = self.config_manager.get_config_value('system.database.chain_max_length', 30)
+        self.max_backup_chains = self.config_manager.get_config_value('system.database.max_backup_chains', 2)
+        
         # 스케줄러 스레드
         self.scheduler_thread = None
         self.scheduler_running = False
@@ -99,42 +169,42 @@ class BackupManager:
         """
         데이터베이스를 백업합니다.
         
+        전체 백업은 SQLite 온라인 백업 API로 페이지 단위 스냅샷을 만든 뒤,
+        압축 파일에 한 번만 기록하면서 같은 쓰기에서 체크섬을 계산합니다.
+        증분 백업은 백업 체인에 바뀐 청크만 저장하고 매니페스트 경로를 반환합니다.
+        
         Args:
             backup_type: 백업 유형 (full/incremental)
             
         Returns:
-            str: 백업 파일 경로
+            str: 백업 파일 경로 (증분 백업: 매니페스트 경로)
         """
         try:
             if not os.path.exists(self.db_path):
                 logger.error(f"데이터베이스 파일을 찾을 수 없습니다: {self.db_path}")
                 return ""
             
-            # 백업 파일명 생성
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # 백업 파일명 생성 (같은 초에 만든 백업이 서로 덮어쓰지 않도록 마이크로초 포함)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
             backup_filename = f"db_backup_{backup_type}_{timestamp}.db"
-            backup_file = os.path.join(self.db_backup_dir, backup_filename)
+            backup_file = os.path.join(self.db_backup_dir, f"{backup_filename}.zip")
             
             # 데이터베이스 백업
             if backup_type == self.BACKUP_TYPE_FULL:
-                # 전체 백업
-                shutil.copy2(self.db_path, backup_file)
+                # 전체 백업 (온라인 스냅샷을 바로 압축 파일에 기록)
+                checksum = self._archive_snapshot(backup_file, backup_filename)
+                size = os.path.getsize(backup_file)
                 logger.info(f"데이터베이스 전체 백업 완료: {backup_file}")
             else:
-                # 증분 백업 (변경된 테이블만)
-                self._create_incremental_backup(backup_file)
-                logger.info(f"데이터베이스 증분 백업 완료: {backup_file}")
-            
-            # 백업 파일 압축
-            zip_file = self._compress_backup(backup_file)
-            
-            # 원본 백업 파일 삭제
-            if os.path.exists(zip_file):
-                os.remove(backup_file)
-                backup_file = zip_file
-            
-            # 백업 체크섬 생성
-            checksum = self._create_checksum(backup_file)
+                # 증분 백업 (백업 체인에 바뀐 청크만 저장)
+                manifest = self._create_incremental_backup(timestamp)
+                backup_file = self._manifest_path(manifest['id'])
+                checksum = manifest['checksum']
+                size = manifest['stored_bytes']
+                logger.info(
+                    f"데이터베이스 증분 백업 완료: {backup_file} "
+                    f"(변경 청크 {len(manifest['chunks'])}/{manifest['chunk_count']}, 새로 저장 {size} bytes)"
+                )
             
             # 백업 정보 저장
             backup_info = {
@@ -142,14 +212,17 @@ class BackupManager:
                 'type': backup_type,
                 'timestamp': datetime.now().isoformat(),
                 'checksum': checksum,
-                'size': os.path.getsize(backup_file)
+                'size': size
             }
             
             self.last_backup_info = backup_info
             self._save_last_backup_info()
             
             # 오래된 백업 정리
-            self._cleanup_old_backups()
+            if backup_type == self.BACKUP_TYPE_FULL:
+                self._cleanup_old_backups()
+            else:
+                self._prune_backup_chains()
             
             return backup_file
             
@@ -175,6 +248,10 @@ class BackupManager:
             # 현재 데이터베이스 백업
             current_backup = self.backup_database()
             
+            # 증분 백업 체인 매니페스트
+            if self._is_manifest(backup_file):
+                return self._restore_chain(self._load_manifest(backup_file))
+            
             # 압축 파일 확인
             if backup_file.endswith('.zip'):
                 # 압축 해제
@@ -207,6 +284,41 @@ class BackupManager:
             logger.error(f"데이터베이스 복원 중 오류 발생: {e}")
             return False
     
+    def restore_to_point_in_time(self, point_in_time: Union[datetime, str]) -> bool:
+        """
+        증분 백업 체인에서 지정한 시각의 데이터베이스를 복원합니다.
+        
+        지정한 시각 이전의 가장 최근 백업을 찾아 기준 백업부터 체인을 재생합니다.
+        
+        Args:
+            point_in_time: 복원할 시각 (datetime 또는 ISO 형식 문자열)
+            
+        Returns:
+            bool: 복원 성공 여부
+        """
+        try:
+            if isinstance(point_in_time, str):
+                point_in_time = datetime.fromisoformat(point_in_time)
+            
+            candidates = [
+                manifest for manifest in self._load_manifests()
+                if datetime.fromisoformat(manifest['timestamp']) <= point_in_time
+            ]
+            
+            if not candidates:
+                logger.error(f"해당 시각 이전의 증분 백업이 없습니다: {point_in_time.isoformat()}")
+                return False
+            
+            # 현재 데이터베이스 백업
+            if os.path.exists(self.db_path):
+                current_backup = self.backup_database()
+            
+            return self._restore_chain(candidates[-1])
+            
+        except Exception as e:
+            logger.error(f"시점 복원 중 오류 발생: {e}")
+            return False
+    
     def backup_config(self) -> str:
         """
         설정 파일을 백업합니다.
@@ -577,7 +689,7 @@ class BackupManager:
         백업 목록을 반환합니다.
         
         Args:
-            backup_type: 백업 유형 (database/config)
+            backup_type: 백업 유형 (database/config/chain)
             
         Returns:
             List[Dict[str, Any]]: 백업 정보 목록
@@ -586,6 +698,26 @@ class BackupManager:
             if backup_type == 'config':
                 # 설정 백업 목록
                 return self.config_manager.list_backups()
+            elif backup_type == 'chain':
+                # 증분 백업 체인 목록
+                backups = []
+                
+                for manifest in self._load_manifests():
+                    backups.append({
+                        'file': self._manifest_path(manifest['id']),
+                        'filename': f"{manifest['id']}.json",
+                        'type': self.BACKUP_TYPE_FULL if manifest['parent'] is None else self.BACKUP_TYPE_INCREMENTAL,
+                        'timestamp': datetime.fromisoformat(manifest['timestamp']),
+                        'size': manifest['stored_bytes'],
+                        'checksum': manifest['checksum'],
+                        'parent': manifest['parent'],
+                        'base': manifest['base']
+                    })
+                
+                # 최신 순으로 정렬
+                backups.reverse()
+                
+                return backups
             else:
                 # 데이터베이스 백업 목록
                 backups = []
@@ -602,9 +734,9 @@ class BackupManager:
                         parts = item.split('_')
                         if len(parts) >= 4:
                             backup_type = parts[2]
-                            timestamp_str = parts[3].split('.')[0]
+                            timestamp_str = '_'.join(parts[3:]).split('.')[0]
                             try:
-                                timestamp = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
+                                timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S_%f')
                             except ValueError:
                                 timestamp = datetime.fromtimestamp(file_stat.st_mtime)
                         else:
@@ -651,6 +783,13 @@ class BackupManager:
                 logger.error(f"백업 파일을 찾을 수 없습니다: {backup_file}")
                 return False
             
+            # 증분 백업 체인 검증 (청크를 재조립하여 스냅샷 체크섬 비교)
+            if self._is_manifest(backup_file):
+                checksum = self._assemble_chain(self._load_manifest(backup_file), None)
+                if checksum:
+                    logger.debug(f"백업 체인 검증 성공: {backup_file}")
+                return bool(checksum)
+            
             # 체크섬 검증
             return self._verify_checksum(backup_file)
             
@@ -658,108 +797,469 @@ class BackupManager:
             logger.error(f"백업 검증 중 오류 발생: {e}")
             return False
     
-    def _create_incremental_backup(self, backup_file: str) -> bool:
+    def _create_incremental_backup(self, backup_id: str) -> Dict[str, Any]:
         """
         증분 백업을 생성합니다.
         
+        온라인 스냅샷을 청크 단위로 해시하여 부모 백업과 달라진 청크만 매니페스트에 기록하고,
+        청크 저장소에 없는 내용만 압축해 저장합니다. 체인이 없거나 chain_max_length에 도달하면
+        모든 청크를 기록하는 새 기준 백업을 만듭니다.
+        
         Args:
-            backup_file: 백업 파일 경로
+            backup_id: 백업 ID (타임스탬프)
             
         Returns:
-            bool: 생성 성공 여부
+            Dict[str, Any]: 저장한 매니페스트
         """
-        try:
-            # 마지막 백업 이후 변경된 테이블만 백업
-            if not self.last_backup_info:
-                # 마지막 백업 정보가 없으면 전체 백업
-                shutil.copy2(self.db_path, backup_file)
-                return True
+        manifests = self._load_manifests()
+        parent = manifests[-1] if manifests else None
+        if parent is not None and parent['depth'] >= self.chain_max_length:
+            parent = None
+        
+        with self._database_snapshot() as snapshot:
+            page_size = self._snapshot_page_size(snapshot)
+            chunk_size = page_size * max(1, self.chain_chunk_kb * 1024 // page_size)
+            if parent is not None and (parent['page_size'] != page_size or parent['chunk_size'] != chunk_size):
+                # 페이지 크기가 바뀌면 청크 경계가 달라지므로 새 기준 백업
+                parent = None
+            
+            parent_chunks = self._resolve_chunk_map(parent) if parent is not None else {}
+            hasher = hashlib.sha256()
+            changes = {}
+            size = 0
+            chunk_count = 0
+            new_chunks = 0
+            stored_bytes = 0
+            
+            for index, chunk in enumerate(self._iter_snapshot(snapshot, chunk_size)):
+                hasher.update(chunk)
+                size += len(chunk)
+                chunk_count += 1
+                
+                digest = hashlib.sha256(chunk).hexdigest()
+                if parent_chunks.get(index) == digest:
+                    continue
+                
+                changes[str(index)] = digest
+                written = self._store_chunk(digest, chunk)
+                if written:
+                    new_chunks += 1
+                    stored_bytes += written
+        
+        manifest = {
+            'id': backup_id,
+            'parent': parent['id'] if parent else None,
+            'base': parent['base'] if parent else backup_id,
+            'depth': parent['depth'] + 1 if parent else 0,
+            'timestamp': datetime.now().isoformat(),
+            'page_size': page_size,
+            'chunk_size': chunk_size,
+            'chunk_count': chunk_count,
+            'size': size,
+            'checksum': hasher.hexdigest(),
+            'chunks': changes,
+            'new_chunks': new_chunks,
+            'stored_bytes': stored_bytes
+        }
+        
+        manifest_path = self._manifest_path(backup_id)
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temp_path, manifest_path)
+        
+        return manifest
+    
+    def _chain_dir(self, *parts: str) -> str:
+        """
+        증분 백업 체인 디렉토리 경로를 반환합니다.
+        
+        Args:
+            *parts: 하위 경로
             
-            # 소스 데이터베이스 연결
-            src_conn = sqlite3.connect(self.db_path)
-            src_cursor = src_conn.cursor()
+        Returns:
+            str: 디렉토리 경로
+        """
+        path = os.path.join(self.db_backup_dir, self.CHAIN_DIR_NAME, *parts)
+        os.makedirs(path, exist_ok=True)
+        return path
+    
+    def _manifest_path(self, backup_id: str) -> str:
+        """
+        매니페스트 파일 경로를 반환합니다.
+        
+        Args:
+            backup_id: 백업 ID
             
-            # 대상 데이터베이스 생성
-            dst_conn = sqlite3.connect(backup_file)
-            dst_cursor = dst_conn.cursor()
+        Returns:
+            str: 매니페스트 파일 경로
+        """
+        return os.path.join(self._chain_dir('manifests'), f"{backup_id}.json")
+    
+    def _chunk_path(self, digest: str) -> str:
+        """
+        청크 파일 경로를 반환합니다. (해시 앞 두 글자로 디렉토리 분산)
+        
+        Args:
+            digest: 청크 SHA-256 해시
             
-            # 테이블 목록 조회
-            src_cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in src_cursor.fetchall()]
+        Returns:
+            str: 청크 파일 경로
+        """
+        return os.path.join(self.db_backup_dir, self.CHAIN_DIR_NAME, 'chunks', digest[:2], digest)
+    
+    def _is_manifest(self, backup_file: str) -> bool:
+        """
+        백업 파일이 증분 백업 체인 매니페스트인지 확인합니다.
+        
+        Args:
+            backup_file: 백업 파일 경로
             
-            # 마지막 백업 시간
-            last_backup_time = datetime.fromisoformat(self.last_backup_info['timestamp'])
+        Returns:
+            bool: 매니페스트 여부
+        """
+        manifest_dir = os.path.join(self.db_backup_dir, self.CHAIN_DIR_NAME, 'manifests')
+        return backup_file.endswith('.json') and os.path.dirname(os.path.abspath(backup_file)) == os.path.abspath(manifest_dir)
+    
+    def _load_manifest(self, manifest_path: str) -> Dict[str, Any]:
+        """
+        매니페스트를 로드합니다.
+        
+        Args:
+            manifest_path: 매니페스트 파일 경로
             
-            for table in tables:
-                try:
-                    # 테이블 스키마 복사
-                    src_cursor.execute(f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table}'")
-                    schema = src_cursor.fetchone()[0]
-                    dst_cursor.execute(schema)
-                    
-                    # 변경된 데이터 확인
-                    if 'updated_at' in schema:
-                        # updated_at 열이 있는 경우
-                        src_cursor.execute(f"SELECT * FROM {table} WHERE updated_at >= ?", 
-                                          (last_backup_time.strftime('%Y-%m-%d %H:%M:%S'),))
-                    else:
-                        # 모든 데이터 복사
-                        src_cursor.execute(f"SELECT * FROM {table}")
-                    
-                    rows = src_cursor.fetchall()
-                    
-                    if rows:
-                        # 열 이름 가져오기
-                        columns = [column[0] for column in src_cursor.description]
-                        placeholders = ', '.join(['?' for _ in columns])
-                        columns_str = ', '.join(columns)
-                        
-                        # 데이터 삽입
-                        dst_cursor.executemany(
-                            f"INSERT OR REPLACE INTO {table} ({columns_str}) VALUES ({placeholders})",
-                            rows
-                        )
-                        
-                        logger.debug(f"테이블 '{table}' 증분 백업 완료: {len(rows)}행")
-                    
-                except Exception as e:
-                    logger.error(f"테이블 '{table}' 증분 백업 중 오류 발생: {e}")
+        Returns:
+            Dict[str, Any]: 매니페스트
+        """
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _load_manifests(self) -> List[Dict[str, Any]]:
+        """
+        모든 매니페스트를 오래된 순으로 로드합니다.
+        
+        Returns:
+            List[Dict[str, Any]]: 매니페스트 목록
+        """
+        manifest_dir = self._chain_dir('manifests')
+        manifests = [
+            self._load_manifest(os.path.join(manifest_dir, item))
+            for item in os.listdir(manifest_dir)
+            if item.endswith('.json')
+        ]
+        manifests.sort(key=lambda manifest: (manifest['timestamp'], manifest['id']))
+        return manifests
+    
+    def _resolve_chunk_map(self, manifest: Dict[str, Any]) -> Dict[int, str]:
+        """
+        기준 백업부터 부모 포인터를 따라 체인을 재생하여 청크 목록을 만듭니다.
+        
+        Args:
+            manifest: 마지막 매니페스트
+            
+        Returns:
+            Dict[int, str]: 청크 인덱스별 해시
+        """
+        chain = [manifest]
+        while chain[-1]['parent'] is not None:
+            chain.append(self._load_manifest(self._manifest_path(chain[-1]['parent'])))
+        
+        chunk_map: Dict[int, str] = {}
+        for item in reversed(chain):
+            chunk_map.update((int(index), digest) for index, digest in item['chunks'].items())
+            # 데이터베이스가 줄어든 경우(VACUUM 등) 뒤쪽 청크 제거
+            for index in [index for index in chunk_map if index >= item['chunk_count']]:
+                del chunk_map[index]
+        
+        return chunk_map
+    
+    def _store_chunk(self, digest: str, chunk) -> int:
+        """
+        청크를 압축해 저장합니다. 같은 해시의 청크가 이미 있으면 저장하지 않습니다.
+        
+        Args:
+            digest: 청크 SHA-256 해시
+            chunk: 청크 데이터
             
-            # 변경사항 저장
-            dst_conn.commit()
+        Returns:
+            int: 새로 저장한 바이트 수 (이미 있으면 0)
+        """
+        chunk_path = self._chunk_path(digest)
+        if os.path.exists(chunk_path):
+            return 0
+        
+        os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+        data = zlib.compress(chunk)
+        temp_path = f"{chunk_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, chunk_path)
+        return len(data)
+    
+    def _assemble_chain(self, manifest: Dict[str, Any], output_file: Optional[str]) -> str:
+        """
+        체인의 청크를 순서대로 읽어 스냅샷을 재조립하고 체크섬을 검증합니다.
+        
+        Args:
+            manifest: 복원할 매니페스트
+            output_file: 기록할 파일 경로 (None: 검증만 수행)
             
-            # 연결 종료
-            src_conn.close()
-            dst_conn.close()
+        Returns:
+            str: 검증된 스냅샷 체크섬 (실패 시 빈 문자열)
+        """
+        chunk_map = self._resolve_chunk_map(manifest)
+        if len(chunk_map) != manifest['chunk_count']:
+            logger.error(f"백업 체인에 빠진 청크가 있습니다: {manifest['id']}")
+            return ""
+        
+        hasher = hashlib.sha256()
+        output = open(output_file, 'wb') if output_file else None
+        try:
+            for index in range(manifest['chunk_count']):
+                digest = chunk_map[index]
+                with open(self._chunk_path(digest), 'rb') as f:
+                    chunk = zlib.decompress(f.read())
+                
+                if hashlib.sha256(chunk).hexdigest() != digest:
+                    logger.error(f"손상된 청크: {digest}")
+                    return ""
+                
+                hasher.update(chunk)
+                if output:
+                    output.write(chunk)
+        finally:
+            if output:
+                output.close()
+        
+        checksum = hasher.hexdigest()
+        if checksum != manifest['checksum']:
+            logger.error(f"백업 체인 체크섬 검증 실패: {manifest['id']}")
+            return ""
+        
+        return checksum
+    
+    def _restore_chain(self, manifest: Dict[str, Any]) -> bool:
+        """
+        백업 체인을 재생하여 데이터베이스를 복원합니다.
+        
+        재조립한 스냅샷을 검증한 뒤 온라인 백업 API로 현재 데이터베이스에 덮어써서
+        열려 있는 다른 연결도 복원된 내용을 보게 합니다.
+        
+        Args:
+            manifest: 복원할 매니페스트
+            
+        Returns:
+            bool: 복원 성공 여부
+        """
+        temp_file = os.path.join(self._temp_dir(), f"restore_{manifest['id']}.db")
+        try:
+            if not self._assemble_chain(manifest, temp_file):
+                return False
+            
+            src_conn = sqlite3.connect(temp_file)
+            dst_conn = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                src_conn.backup(dst_conn, pages=self.backup_step_pages, sleep=self.backup_step_sleep_ms / 1000)
+            finally:
+                dst_conn.close()
+                src_conn.close()
             
+            logger.info(f"백업 체인 복원 완료: {manifest['id']} (기준 백업: {manifest['base']}, 단계: {manifest['depth']})")
             return True
             
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
+    def _prune_backup_chains(self) -> None:
+        """
+        최근 max_backup_chains개 체인만 남기고, 어떤 매니페스트도 참조하지 않는 청크를 삭제합니다.
+        """
+        try:
+            manifests = self._load_manifests()
+            bases = []
+            for manifest in manifests:
+                if manifest['base'] not in bases:
+                    bases.append(manifest['base'])
+            
+            expired = set(bases[:-self.max_backup_chains]) if len(bases) > self.max_backup_chains else set()
+            if not expired:
+                return
+            
+            referenced = set()
+            for manifest in manifests:
+                if manifest['base'] in expired:
+                    os.remove(self._manifest_path(manifest['id']))
+                    logger.debug(f"오래된 백업 체인 매니페스트 삭제: {manifest['id']}")
+                else:
+                    referenced.update(manifest['chunks'].values())
+            
+            chunk_dir = self._chain_dir('chunks')
+            for prefix in os.listdir(chunk_dir):
+                for digest in os.listdir(os.path.join(chunk_dir, prefix)):
+                    if digest not in referenced:
+                        os.remove(os.path.join(chunk_dir, prefix, digest))
+                
         except Exception as e:
-            logger.error(f"증분 백업 생성 중 오류 발생: {e}")
-            return False
+            logger.error(f"백업 체인 정리 중 오류 발생: {e}")
     
-    def _compress_backup(self, backup_file: str) -> str:
+    def _temp_dir(self) -> str:
         """
-        백업 파일을 압축합니다.
+        백업 임시 디렉토리를 반환합니다.
+        
+        Returns:
+            str: 임시 디렉토리 경로
+        """
+        temp_dir = os.path.join(self.backup_dir, 'temp')
+        os.makedirs(temp_dir, exist_ok=True)
+        return temp_dir
+    
+    def _online_backup(self, dst_conn: sqlite3.Connection) -> None:
+        """
+        SQLite 온라인 백업 API로 데이터베이스를 복사합니다.
+        
+        backup_step_pages 페이지씩 복사하고 단계 사이에 잠금을 풀어 쓰기 작업을 막지 않습니다.
+        복사 도중 다른 연결이 쓰면 SQLite가 백업을 다시 시작하므로 항상 일관된 스냅샷이 됩니다.
         
         Args:
-            backup_file: 백업 파일 경로
+            dst_conn: 복사 대상 데이터베이스 연결
+        """
+        src_conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            src_conn.backup(
+                dst_conn,
+                pages=self.backup_step_pages,
+                sleep=self.backup_step_sleep_ms / 1000
+            )
+        finally:
+            src_conn.close()
+    
+    def _archive_snapshot(self, zip_file: str, member_name: str) -> str:
+        """
+        데이터베이스 스냅샷을 압축 파일에 기록합니다.
+        
+        작은 데이터베이스는 메모리로 스냅샷을 떠서 디스크에는 압축 파일만 기록하고,
+        snapshot_memory_limit_mb보다 크면 임시 파일로 스냅샷을 뜬 뒤 스트리밍합니다.
+        
+        Args:
+            zip_file: 압축 파일 경로
+            member_name: 압축 파일 안의 데이터베이스 파일명
             
         Returns:
-            str: 압축 파일 경로
+            str: 압축 파일 체크섬
+        """
+        with self._database_snapshot() as snapshot:
+            return self._write_archive(zip_file, member_name, self._iter_snapshot(snapshot, self.ARCHIVE_CHUNK_SIZE))
+    
+    @contextmanager
+    def _database_snapshot(self):
+        """
+        온라인 백업 API로 일관된 데이터베이스 스냅샷을 만듭니다.
+        
+        snapshot_memory_limit_mb 이하이면 메모리에 직렬화한 바이트를, 넘거나 직렬화를 지원하지 않는
+        Python(3.10 이하)이면 임시 파일 경로를 제공하고, 블록을 벗어나면 임시 파일을 삭제합니다.
+        
+        Yields:
+            Union[memoryview, str]: 스냅샷 바이트 또는 임시 파일 경로
         """
+        if _SQLITE_CAN_SERIALIZE and os.path.getsize(self.db_path) <= self.snapshot_memory_limit_mb * 1024 * 1024:
+            dst_conn = sqlite3.connect(':memory:')
+            try:
+                self._online_backup(dst_conn)
+                data = memoryview(dst_conn.serialize())
+            finally:
+                dst_conn.close()
+            yield data
+            return
+        
+        temp_file = os.path.join(self._temp_dir(), f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.db")
         try:
-            zip_file = f"{backup_file}.zip"
+            dst_conn = sqlite3.connect(temp_file)
+            try:
+                self._online_backup(dst_conn)
+            finally:
+                dst_conn.close()
+            yield temp_file
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
+    def _iter_snapshot(self, snapshot: Union[memoryview, str], chunk_size: int):
+        """
+        스냅샷을 청크 단위로 읽습니다.
+        
+        Args:
+            snapshot: 스냅샷 바이트 또는 파일 경로
+            chunk_size: 청크 크기
             
-            with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                zipf.write(backup_file, os.path.basename(backup_file))
+        Yields:
+            bytes: 스냅샷 청크
+        """
+        if isinstance(snapshot, memoryview):
+            for offset in range(0, len(snapshot), chunk_size):
+                yield snapshot[offset:offset + chunk_size]
+            return
+        
+        with open(snapshot, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                yield chunk
+    
+    def _snapshot_page_size(self, snapshot: Union[memoryview, str]) -> int:
+        """
+        스냅샷 헤더에서 페이지 크기를 읽습니다.
+        
+        Args:
+            snapshot: 스냅샷 바이트 또는 파일 경로
             
-            logger.debug(f"백업 파일 압축 완료: {zip_file}")
-            return zip_file
+        Returns:
+            int: 페이지 크기 (바이트)
+        """
+        if isinstance(snapshot, memoryview):
+            header = bytes(snapshot[:100])
+        else:
+            with open(snapshot, 'rb') as f:
+                header = f.read(100)
+        
+        if len(header) < 18:
+            # 빈 데이터베이스
+            return 4096
+        
+        # 헤더 16~17바이트 (빅엔디언, 1은 65536을 의미)
+        page_size = int.from_bytes(header[16:18], 'big')
+        return 65536 if page_size == 1 else page_size
+    
+    def _write_archive(self, zip_file: str, member_name: str, chunks) -> str:
+        """
+        청크를 압축하여 한 번에 기록하고, 기록하는 바이트로 체크섬을 계산합니다.
+        
+        Args:
+            zip_file: 압축 파일 경로
+            member_name: 압축 파일 안의 파일명
+            chunks: 기록할 바이트 청크
             
-        except Exception as e:
-            logger.error(f"백업 파일 압축 중 오류 발생: {e}")
-            return ""
+        Returns:
+            str: 압축 파일 체크섬 (체크섬 파일도 함께 저장)
+        """
+        try:
+            with open(zip_file, 'wb') as raw:
+                writer = _HashingWriter(raw)
+                with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                    with zipf.open(member_name, 'w', force_zip64=True) as member:
+                        for chunk in chunks:
+                            member.write(chunk)
+        except Exception:
+            if os.path.exists(zip_file):
+                os.remove(zip_file)
+            raise
+        
+        checksum = writer.hexdigest()
+        
+        # 체크섬 파일 저장
+        with open(f"{zip_file}.checksum", 'w') as f:
+            f.write(checksum)
+        
+        logger.debug(f"백업 압축 파일 기록 완료: {zip_file} ({writer.position} bytes, 체크섬: {checksum})")
+        return checksum
     
     def _extract_backup(self, zip_file: str) -> str:
         """
@@ -980,6 +1480,7 @@ def main():
     parser.add_argument('--file', '-f', help='파일 경로')
     parser.add_argument('--format', choices=['csv', 'json'], default='csv', help='내보내기/가져오기 형식')
     parser.add_argument('--table', help='테이블 이름')
+    parser.add_argument('--at', help='증분 백업 체인에서 복원할 시각 (ISO 형식, 예: 2024-01-31T23:00:00)')
     parser.add_argument('--verbose', '-v', action='store_true', help='상세 출력')
     
     args = parser.parse_args()
@@ -1003,6 +1504,13 @@ def main():
             print("데이터베이스 백업 실패")
     
     elif args.action == 'restore-db':
+        if args.at:
+            if backup_manager.restore_to_point_in_time(args.at):
+                print(f"데이터베이스 시점 복원 완료: {args.at}")
+            else:
+                print("데이터베이스 시점 복원 실패")
+            return
+        
         if not args.file:
             backups = backup_manager.list_backups()
             if not backups:
@@ -1103,6 +1611,15 @@ def main():
         else:
             print("  사용 가능한 데이터베이스 백업이 없습니다.")
         
+        print("\n증분 백업 체인 목록:")
+        chain_backups = backup_manager.list_backups('chain')
+        
+        if chain_backups:
+            for i, backup in enumerate(chain_backups, 1):
+                print(f"{i}. {backup['filename']} ({backup['timestamp']}, {backup['type']}, 기준: {backup['base']})")
+        else:
+            print("  사용 가능한 증분 백업이 없습니다.")
+        
         print("\n설정 백업 목록:")
         config_backups = backup_manager.list_backups('config')
         
@@ -12,11 +12,18 @@ import time
 import json
 import pickle
 import hashlib
+import sqlite3
+import zlib
 import logging
 import functools
+import heapq
+import math
+import random
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union, Callable, Tuple
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Union, Callable, Tuple
 from pathlib import Path
 
 # 현재 디렉토리를 모듈 경로에 추가
@@ -28,6 +35,12 @@ if parent_dir not in sys.path:
 from src.logging_system import get_logger
 from src.config_manager import ConfigManager
 from src.performance_monitor import profile_function, measure_time
+from src.cache_tags import TagStamp, tag_versions, invalidate_tags
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # 로거 설정
 logger = get_logger('cache')
@@ -90,27 +103,121 @@ class CacheEntry:
             'is_expired': self.is_expired()
         }
 
+class _MemoryEntry:
+    """
+    메모리 캐시 내부 항목
+
+    시간은 단조 시계(time.monotonic) 기준이며, size는 max_bytes가 설정된 경우에만 계산합니다.
+    """
+    
+    __slots__ = ('value', 'expires_at', 'size', 'created_at', 'access_count', 'tags')
+    
+    def __init__(self, value: Any, expires_at: Optional[float], size: int, created_at: float, tags: Tuple[str, ...] = ()):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.created_at = created_at
+        self.access_count = 0
+        self.tags = tags
+
+
+class _CacheStripe:
+    """
+    메모리 캐시 분할 영역
+
+    키 해시로 나눈 영역마다 별도의 잠금, LRU 순서(OrderedDict), 만료 힙, 태그 인덱스, 카운터를 둡니다.
+    """
+    
+    __slots__ = (
+        'lock', 'entries', 'expiry_heap', 'tag_index', 'sequence', 'bytes', 'max_items', 'max_bytes',
+        'hits', 'misses', 'evictions', 'expirations'
+    )
+    
+    def __init__(self, max_items: int, max_bytes: Optional[int]):
+        self.lock = threading.Lock()
+        self.entries: 'OrderedDict[str, _MemoryEntry]' = OrderedDict()
+        self.expiry_heap: List[Tuple[float, int, str, _MemoryEntry]] = []
+        self.tag_index: Dict[str, set] = {}
+        self.sequence = 0
+        self.bytes = 0
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+def _estimate_size(value: Any) -> int:
+    """
+    캐시 값의 크기(바이트) 추정
+    
+    Args:
+        value: 캐시 값
+        
+    Returns:
+        int: 문자열/바이트는 객체 크기, 그 외에는 pickle 직렬화 크기
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return sys.getsizeof(value)
+    try:
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
 class MemoryCache:
     """
     메모리 캐시 클래스
     
     메모리에 데이터를 캐싱합니다.
+    OrderedDict 기반 LRU로 조회/저장/제거가 모두 O(1)이며, 만료 시각은 힙으로 관리해
+    공간이 필요할 때 만료된 항목부터 정리합니다. 항목 수가 많으면 키 해시로 영역을 나눠
+    영역별 잠금을 사용하므로(이때 LRU 순서와 용량 제한은 영역 단위) 스레드 간 경합이 줄어듭니다.
     """
     
-    def __init__(self, max_size: int = 1000, default_ttl: int = None):
+    # 영역 하나가 가질 최소 항목 수 (작은 캐시는 나누지 않아 전역 LRU 순서 유지)
+    MIN_ITEMS_PER_STRIPE = 1024
+    
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = None,
+        max_bytes: int = None,
+        stripes: int = 16,
+        size_of: Callable[[Any], int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
         """
         메모리 캐시 초기화
         
         Args:
             max_size: 최대 항목 수
             default_ttl: 기본 유효 시간 (초)
+            max_bytes: 최대 크기 (바이트, None이면 제한 없음)
+            stripes: 최대 잠금 영역 수
+            size_of: 값 크기 계산 함수 (기본값: pickle 직렬화 크기)
+            clock: 만료 확인용 시계 함수 (테스트용)
         """
-        self.cache = {}
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self.lock = threading.RLock()
+        self.max_bytes = max_bytes
+        self._size_of = size_of or _estimate_size
+        self._clock = clock
+        
+        stripe_count = max(1, min(stripes, max_size // self.MIN_ITEMS_PER_STRIPE))
+        per_stripe_items = -(-max_size // stripe_count)
+        per_stripe_bytes = -(-max_bytes // stripe_count) if max_bytes else None
+        self._stripes = [_CacheStripe(per_stripe_items, per_stripe_bytes) for _ in range(stripe_count)]
+    
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self._stripes)
+    
+    def _stripe(self, key: str) -> _CacheStripe:
+        """키가 속한 영역"""
+        stripes = self._stripes
+        return stripes[hash(key) % len(stripes)] if len(stripes) > 1 else stripes[0]
     
-    @profile_function
     def get(self, key: str, default: Any = None) -> Any:
         """
         캐시 값 조회
@@ -122,24 +229,27 @@ class MemoryCache:
         Returns:
             Any: 캐시 값 또는 기본값
         """
-        with self.lock:
-            if key not in self.cache:
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is None:
+                stripe.misses += 1
                 return default
             
-            entry = self.cache[key]
-            
             # 만료 확인
-            if entry.is_expired():
-                del self.cache[key]
+            if entry.expires_at is not None and entry.expires_at <= self._clock():
+                self._discard(stripe, key)
+                stripe.expirations += 1
+                stripe.misses += 1
                 return default
             
-            # 접근 기록 업데이트
-            entry.access()
-            
+            # LRU 순서 및 접근 기록 업데이트
+            stripe.entries.move_to_end(key)
+            entry.access_count += 1
+            stripe.hits += 1
             return entry.value
     
-    @profile_function
-    def set(self, key: str, value: Any, ttl: int = None) -> None:
+    def set(self, key: str, value: Any, ttl: int = None, tags: Iterable[str] = None) -> None:
         """
         캐시 값 설정
         
@@ -147,21 +257,40 @@ class MemoryCache:
             key: 캐시 키
             value: 캐시 값
             ttl: 유효 시간 (초)
+            tags: 태그 목록 (delete_tag로 함께 삭제)
         """
-        with self.lock:
-            # 캐시 크기 확인
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                self._evict()
+        # TTL 설정
+        if ttl is None:
+            ttl = self.default_ttl
+        
+        now = self._clock()
+        expires_at = now + ttl if ttl is not None else None
+        size = self._size_of(value) if self.max_bytes else 0
+        entry = _MemoryEntry(value, expires_at, size, now, tuple(set(tags)) if tags else ())
+        
+        stripe = self._stripe(key)
+        with stripe.lock:
+            self._discard(stripe, key)
             
-            # TTL 설정
-            if ttl is None:
-                ttl = self.default_ttl
+            # 영역 용량보다 큰 값은 다른 항목을 모두 밀어내므로 저장하지 않음
+            if stripe.max_bytes is not None and size > stripe.max_bytes:
+                logger.debug(f"캐시 용량보다 큰 값은 저장하지 않습니다: {key} ({size} bytes)")
+                return
             
-            # 캐시 항목 생성
-            entry = CacheEntry(key, value, ttl)
-            self.cache[key] = entry
+            stripe.entries[key] = entry
+            stripe.bytes += size
+            for tag in entry.tags:
+                stripe.tag_index.setdefault(tag, set()).add(key)
+            
+            if expires_at is not None:
+                stripe.sequence += 1
+                heapq.heappush(stripe.expiry_heap, (expires_at, stripe.sequence, key, entry))
+            
+            if len(stripe.entries) > stripe.max_items or (
+                stripe.max_bytes is not None and stripe.bytes > stripe.max_bytes
+            ):
+                self._evict(stripe, now)
     
-    @profile_function
     def delete(self, key: str) -> bool:
         """
         캐시 항목 삭제
@@ -172,91 +301,171 @@ class MemoryCache:
         Returns:
             bool: 삭제 성공 여부
         """
-        with self.lock:
-            if key in self.cache:
-                del self.cache[key]
-                return True
-            return False
+        stripe = self._stripe(key)
+        with stripe.lock:
+            return self._discard(stripe, key)
+    
+    def delete_tag(self, tag: str) -> int:
+        """
+        태그가 붙은 항목 삭제 (태그 인덱스 사용)
+        
+        Args:
+            tag: 태그
+            
+        Returns:
+            int: 삭제된 항목 수
+        """
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key in list(stripe.tag_index.get(tag, ())):
+                    removed += self._discard(stripe, key)
+        return removed
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        키가 접두사로 시작하는 항목 삭제 (전체 키 확인)
+        
+        Args:
+            prefix: 키 접두사
+            
+        Returns:
+            int: 삭제된 항목 수
+        """
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key in [key for key in stripe.entries if key.startswith(prefix)]:
+                    removed += self._discard(stripe, key)
+        return removed
     
-    @profile_function
     def clear(self) -> None:
         """
-        캐시 전체 삭제
+        캐시 전체 삭제 (통계는 유지)
         """
-        with self.lock:
-            self.cache.clear()
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.expiry_heap.clear()
+                stripe.tag_index.clear()
+                stripe.bytes = 0
+    
+    def reset_stats(self) -> None:
+        """
+        히트/미스/제거 카운터 초기화
+        """
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.hits = stripe.misses = stripe.evictions = stripe.expirations = 0
     
-    @profile_function
     def get_stats(self) -> Dict[str, Any]:
         """
         캐시 통계 조회
         
         Returns:
-            Dict[str, Any]: 캐시 통계
+            Dict[str, Any]: 캐시 통계 (hit_rate/miss_rate는 실제 조회 결과 기준 %)
         """
-        with self.lock:
-            # 만료된 항목 제거
-            self._remove_expired()
-            
-            # 통계 계산
-            total_items = len(self.cache)
-            
-            if total_items == 0:
-                return {
-                    'total_items': 0,
-                    'hit_rate': 0,
-                    'miss_rate': 0,
-                    'utilization': 0,
-                    'avg_access_count': 0,
-                    'oldest_item_age': 0,
-                    'newest_item_age': 0
-                }
-            
-            total_access = sum(entry.access_count for entry in self.cache.values())
-            
-            # 항목 나이 계산
-            now = datetime.now()
-            oldest = min(self.cache.values(), key=lambda e: e.created_at)
-            newest = max(self.cache.values(), key=lambda e: e.created_at)
-            oldest_age = (now - oldest.created_at).total_seconds()
-            newest_age = (now - newest.created_at).total_seconds()
-            
-            return {
-                'total_items': total_items,
-                'hit_rate': total_access / (total_access + 1) * 100,  # 히트율 (%)
-                'miss_rate': 100 - (total_access / (total_access + 1) * 100),  # 미스율 (%)
-                'utilization': total_items / self.max_size * 100,  # 사용률 (%)
-                'avg_access_count': total_access / total_items,  # 평균 접근 횟수
-                'oldest_item_age': oldest_age,  # 가장 오래된 항목 나이 (초)
-                'newest_item_age': newest_age  # 가장 최근 항목 나이 (초)
-            }
+        now = self._clock()
+        totals = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+        total_items = total_bytes = total_access = 0
+        oldest = newest = None
+        
+        for stripe in self._stripes:
+            with stripe.lock:
+                # 만료된 항목 제거
+                self._remove_expired(stripe, now)
+                
+                for name in totals:
+                    totals[name] += getattr(stripe, name)
+                total_items += len(stripe.entries)
+                total_bytes += stripe.bytes
+                
+                for entry in stripe.entries.values():
+                    total_access += entry.access_count
+                    oldest = entry.created_at if oldest is None else min(oldest, entry.created_at)
+                    newest = entry.created_at if newest is None else max(newest, entry.created_at)
+        
+        lookups = totals['hits'] + totals['misses']
+        hit_rate = totals['hits'] / lookups * 100 if lookups else 0
+        
+        return {
+            'total_items': total_items,
+            'total_bytes': total_bytes,
+            **totals,
+            'hit_rate': hit_rate,  # 히트율 (%)
+            'miss_rate': 100 - hit_rate if lookups else 0,  # 미스율 (%)
+            'utilization': total_items / self.max_size * 100 if self.max_size else 0,  # 사용률 (%)
+            'bytes_utilization': total_bytes / self.max_bytes * 100 if self.max_bytes else None,
+            'avg_access_count': total_access / total_items if total_items else 0,  # 평균 접근 횟수
+            'oldest_item_age': now - oldest if oldest is not None else 0,  # 가장 오래된 항목 나이 (초)
+            'newest_item_age': now - newest if newest is not None else 0,  # 가장 최근 항목 나이 (초)
+            'stripes': len(self._stripes)
+        }
     
-    def _evict(self) -> None:
+    def _discard(self, stripe: _CacheStripe, key: str) -> bool:
         """
-        캐시 항목 제거
+        항목 제거 (만료 힙 항목은 꺼낼 때 무시)
+        
+        Returns:
+            bool: 제거 여부
         """
-        # 만료된 항목 제거
-        if self._remove_expired() > 0:
-            return
+        entry = stripe.entries.pop(key, None)
+        if entry is None:
+            return False
+        self._release(stripe, key, entry)
+        return True
+    
+    def _release(self, stripe: _CacheStripe, key: str, entry: _MemoryEntry) -> None:
+        """
+        제거된 항목의 크기와 태그 인덱스 정리
+        """
+        stripe.bytes -= entry.size
+        for tag in entry.tags:
+            keys = stripe.tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del stripe.tag_index[tag]
+    
+    def _evict(self, stripe: _CacheStripe, now: float) -> None:
+        """
+        용량을 넘은 영역에서 만료된 항목, 그다음 가장 오래 접근하지 않은 항목 순으로 제거
+        """
+        self._remove_expired(stripe, now)
         
-        # LRU 정책: 가장 오래 접근하지 않은 항목 제거
-        if self.cache:
-            oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k].last_accessed)
-            del self.cache[oldest_key]
+        entries = stripe.entries
+        while entries and (
+            len(entries) > stripe.max_items
+            or (stripe.max_bytes is not None and stripe.bytes > stripe.max_bytes)
+        ):
+            key, entry = entries.popitem(last=False)
+            self._release(stripe, key, entry)
+            stripe.evictions += 1
     
-    def _remove_expired(self) -> int:
+    def _remove_expired(self, stripe: _CacheStripe, now: float) -> int:
         """
-        만료된 항목 제거
+        만료 힙에서 만료 시각이 지난 항목을 꺼내 제거
         
         Returns:
             int: 제거된 항목 수
         """
-        expired_keys = [k for k, v in self.cache.items() if v.is_expired()]
+        heap = stripe.expiry_heap
+        removed = 0
+        
+        while heap and heap[0][0] <= now:
+            _, _, key, entry = heapq.heappop(heap)
+            # 이미 덮어쓰였거나 삭제된 항목의 힙 기록은 무시
+            if stripe.entries.get(key) is entry:
+                self._discard(stripe, key)
+                stripe.expirations += 1
+                removed += 1
         
-        for key in expired_keys:
-            del self.cache[key]
+        # 덮어쓰기로 쌓인 무효 기록이 많으면 힙 재구성
+        if len(heap) > 2 * len(stripe.entries) + 64:
+            stripe.expiry_heap = [item for item in heap if stripe.entries.get(item[2]) is item[3]]
+            heapq.heapify(stripe.expiry_heap)
         
-        return len(expired_keys)
+        return removed
 
 class DiskCache:
     """
@@ -287,6 +496,9 @@ class DiskCache:
         self.default_ttl = default_ttl
         self.lock = threading.RLock()
         
+        # 태그 -> 키 인덱스 (처음 필요할 때 캐시 파일에서 한 번 구성)
+        self._tag_index: Optional[Dict[str, set]] = None
+        
         # 캐시 디렉토리 생성
         os.makedirs(self.cache_dir, exist_ok=True)
     
@@ -331,7 +543,7 @@ class DiskCache:
                 return default
     
     @profile_function
-    def set(self, key: str, value: Any, ttl: int = None) -> None:
+    def set(self, key: str, value: Any, ttl: int = None, tags: Iterable[str] = None) -> None:
         """
         캐시 값 설정
         
@@ -339,6 +551,7 @@ class DiskCache:
             key: 캐시 키
             value: 캐시 값
             ttl: 유효 시간 (초)
+            tags: 태그 목록 (delete_tag로 함께 삭제)
         """
         with self.lock:
             cache_file = self._get_cache_file(key)
@@ -354,7 +567,8 @@ class DiskCache:
                 'created_at': datetime.now(),
                 'last_accessed': datetime.now(),
                 'access_count': 0,
-                'ttl': ttl
+                'ttl': ttl,
+                'tags': sorted(set(tags)) if tags else []
             }
             
             try:
@@ -362,6 +576,11 @@ class DiskCache:
                     pickle.dump(entry_data, f)
             except Exception as e:
                 logger.error(f"캐시 파일 쓰기 오류: {e}")
+                return
+            
+            if self._tag_index is not None:
+                for tag in entry_data['tags']:
+                    self._tag_index.setdefault(tag, set()).add(key)
     
     @profile_function
     def delete(self, key: str) -> bool:
@@ -386,12 +605,46 @@ class DiskCache:
             
             return False
     
+    def delete_tag(self, tag: str) -> int:
+        """
+        태그가 붙은 항목 삭제 (태그 인덱스 사용)
+        
+        Args:
+            tag: 태그
+            
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self.lock:
+            if self._tag_index is None:
+                self._tag_index = self._build_tag_index()
+            
+            keys = self._tag_index.pop(tag, set())
+            return sum(1 for key in keys if self.delete(key))
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        키가 접두사로 시작하는 항목 삭제
+        
+        파일 이름이 키 해시이므로 모든 캐시 파일을 읽어 키를 확인합니다.
+        
+        Args:
+            prefix: 키 접두사
+            
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self.lock:
+            keys = [key for key, _ in self._iter_entries() if key.startswith(prefix)]
+            return sum(1 for key in keys if self.delete(key))
+    
     @profile_function
     def clear(self) -> None:
         """
         캐시 전체 삭제
         """
         with self.lock:
+            self._tag_index = None
             try:
                 for file in os.listdir(self.cache_dir):
                     file_path = os.path.join(self.cache_dir, file)
@@ -456,6 +709,33 @@ class DiskCache:
                 'newest_item_age': newest_age
             }
     
+    def _iter_entries(self):
+        """
+        캐시 파일의 (키, 태그 목록) 순회 (읽을 수 없는 파일은 건너뜀)
+        """
+        for file in os.listdir(self.cache_dir):
+            if not file.endswith('.cache'):
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, file), 'rb') as f:
+                    entry_data = pickle.load(f)
+                yield entry_data['key'], entry_data.get('tags', [])
+            except Exception:
+                continue
+    
+    def _build_tag_index(self) -> Dict[str, set]:
+        """
+        캐시 파일에서 태그 -> 키 인덱스 구성
+        
+        Returns:
+            Dict[str, set]: 태그별 키 집합
+        """
+        index: Dict[str, set] = {}
+        for key, tags in self._iter_entries():
+            for tag in tags:
+                index.setdefault(tag, set()).add(key)
+        return index
+    
     def _get_cache_file(self, key: str) -> str:
         """
         캐시 파일 경로 조회
@@ -518,12 +798,429 @@ class DiskCache:
                 except Exception:
                     pass
         
-        return removed_countclass Cac
-heManager:
+        return removed_count
+
+
+class SqliteDiskCache:
+    """
+    SQLite 기반 디스크 캐시 클래스
+    
+    모든 항목을 파일 하나(cache.sqlite3)에 저장합니다. 조회 시 파일을 다시 쓰지 않고
+    접근 기록은 메모리에 모아 일정 개수/간격마다 한 번에 반영하며, 만료 시각 인덱스로
+    만료 항목을 전체 스캔 없이 정리합니다. 값은 선택적으로 zlib/zstd로 압축하고,
+    태그는 별도 테이블(cache_tags)에 색인합니다.
+    """
+    
+    DB_FILENAME = 'cache.sqlite3'
+    
+    # 압축 방식 코드 (DB에 저장되므로 값 변경 금지)
+    CODEC_NONE = 0
+    CODEC_ZLIB = 1
+    CODEC_ZSTD = 2
+    
+    _SCHEMA = [
+        """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            codec INTEGER NOT NULL DEFAULT 0,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL,
+            last_accessed REAL NOT NULL,
+            access_count INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at) WHERE expires_at IS NOT NULL",
+        """
+        CREATE TABLE IF NOT EXISTS cache_tags (
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (tag, key)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags (key)",
+    ]
+    
+    def __init__(
+        self,
+        cache_dir: str = None,
+        default_ttl: int = None,
+        config_manager: ConfigManager = None,
+        compression: str = None,
+        compress_threshold: int = 1024,
+        access_flush_size: int = 256,
+        access_flush_interval: float = 5.0,
+        sweep_interval: float = 300.0,
+        mmap_size: int = 64 * 1024 * 1024
+    ):
+        """
+        SQLite 디스크 캐시 초기화
+        
+        Args:
+            cache_dir: 캐시 디렉토리
+            default_ttl: 기본 유효 시간 (초)
+            config_manager: 설정 관리자
+            compression: 압축 방식 ('zlib', 'zstd' 또는 None)
+            compress_threshold: 압축할 최소 직렬화 크기 (바이트)
+            access_flush_size: 접근 기록을 반영할 누적 조회 수
+            access_flush_interval: 접근 기록 반영 최대 간격 (초)
+            sweep_interval: 만료 항목 정리 간격 (초)
+            mmap_size: SQLite 메모리 매핑 크기 (바이트, 0이면 사용 안 함)
+        """
+        self.config_manager = config_manager or ConfigManager()
+        
+        # 캐시 디렉토리 설정
+        if cache_dir is None:
+            cache_dir = self.config_manager.get_config_value('system.cache.disk_cache_dir')
+            
+            if cache_dir is None:
+                cache_dir = os.path.join(parent_dir, 'cache')
+        
+        if compression == 'zstd' and zstandard is None:
+            logger.warning("zstandard 패키지가 없어 zlib 압축을 사용합니다.")
+            compression = 'zlib'
+        if compression not in (None, 'zlib', 'zstd'):
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+        
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.access_flush_size = access_flush_size
+        self.access_flush_interval = access_flush_interval
+        self.sweep_interval = sweep_interval
+        self.lock = threading.RLock()
+        
+        # 조회 시 쌓아 두는 접근 기록 {키: (마지막 접근 시각, 누적 횟수)}
+        self._pending_access: Dict[str, Tuple[float, int]] = {}
+        self._last_flush = time.time()
+        self._last_sweep = 0.0
+        
+        # 캐시 디렉토리 생성
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.db_path = os.path.join(self.cache_dir, self.DB_FILENAME)
+        
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        if mmap_size:
+            self._connection.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        
+        with self.lock, self._connection:
+            for statement in self._SCHEMA:
+                self._connection.execute(statement)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        캐시 값 조회 (접근 기록은 나중에 한 번에 반영)
+        
+        Args:
+            key: 캐시 키
+            default: 기본값
+        
+        Returns:
+            Any: 캐시 값 또는 기본값
+        """
+        with self.lock:
+            row = self._connection.execute(
+                "SELECT value, codec, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None:
+                return default
+            
+            value, codec, expires_at = row
+            now = time.time()
+            
+            # 만료 확인
+            if expires_at is not None and expires_at <= now:
+                self.delete(key)
+                return default
+            
+            try:
+                result = pickle.loads(self._decompress(value, codec))
+            except Exception as e:
+                logger.error(f"캐시 항목 읽기 오류: {e}")
+                return default
+            
+            # 접근 기록 누적
+            _, count = self._pending_access.get(key, (now, 0))
+            self._pending_access[key] = (now, count + 1)
+            if (len(self._pending_access) >= self.access_flush_size
+                    or now - self._last_flush >= self.access_flush_interval):
+                self._flush_access()
+            
+            return result
+    
+    def set(self, key: str, value: Any, ttl: int = None, tags: Iterable[str] = None) -> None:
+        """
+        캐시 값 설정
+        
+        Args:
+            key: 캐시 키
+            value: 캐시 값
+            ttl: 유효 시간 (초)
+            tags: 태그 목록 (delete_tag로 함께 삭제)
+        """
+        # TTL 설정
+        if ttl is None:
+            ttl = self.default_ttl
+        
+        try:
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.error(f"캐시 값 직렬화 오류: {e}")
+            return
+        
+        size = len(payload)
+        payload, codec = self._compress(payload)
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        
+        with self.lock:
+            try:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO cache_entries "
+                        "(key, value, codec, size, created_at, expires_at, last_accessed, access_count) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                        (key, payload, codec, size, now, expires_at, now)
+                    )
+                    self._connection.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+                    if tags:
+                        self._connection.executemany(
+                            "INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)",
+                            [(tag, key) for tag in set(tags)]
+                        )
+            except sqlite3.Error as e:
+                logger.error(f"캐시 항목 쓰기 오류: {e}")
+                return
+            
+            self._pending_access.pop(key, None)
+            
+            # 주기적으로 만료 항목 정리
+            if now - self._last_sweep >= self.sweep_interval:
+                self._remove_expired()
+    
+    def delete(self, key: str) -> bool:
+        """
+        캐시 항목 삭제
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            bool: 삭제 성공 여부
+        """
+        with self.lock:
+            return self._delete_keys([key]) > 0
+    
+    def delete_tag(self, tag: str) -> int:
+        """
+        태그가 붙은 항목 삭제 (태그 인덱스 사용)
+        
+        Args:
+            tag: 태그
+            
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self.lock:
+            keys = [row[0] for row in self._connection.execute(
+                "SELECT key FROM cache_tags WHERE tag = ?", (tag,)
+            )]
+            return self._delete_keys(keys)
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        키가 접두사로 시작하는 항목 삭제 (키 인덱스 범위 검색)
+        
+        Args:
+            prefix: 키 접두사
+            
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self.lock:
+            keys = [row[0] for row in self._connection.execute(
+                "SELECT key FROM cache_entries WHERE key >= ? AND key < ?", (prefix, prefix + '\U0010ffff')
+            )]
+            return self._delete_keys(keys)
+    
+    def clear(self) -> None:
+        """
+        캐시 전체 삭제
+        """
+        with self.lock:
+            self._pending_access.clear()
+            with self._connection:
+                self._connection.execute("DELETE FROM cache_entries")
+                self._connection.execute("DELETE FROM cache_tags")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+        
+        Returns:
+            Dict[str, Any]: 캐시 통계 (total_size_bytes는 압축 후 저장 크기)
+        """
+        with self.lock:
+            self._flush_access()
+            self._remove_expired()
+            
+            total_items, stored_size, raw_size, total_access, oldest, newest = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(access_count), 0), MIN(created_at), MAX(created_at) FROM cache_entries"
+            ).fetchone()
+        
+        now = time.time()
+        return {
+            'backend': 'sqlite',
+            'total_items': total_items,
+            'total_size_bytes': stored_size,
+            'uncompressed_size_bytes': raw_size,
+            'avg_item_size_bytes': stored_size / total_items if total_items else 0,
+            'avg_access_count': total_access / total_items if total_items else 0,
+            'oldest_item_age': now - oldest if oldest is not None else 0,
+            'newest_item_age': now - newest if newest is not None else 0,
+            'compression': self.compression
+        }
+    
+    def close(self) -> None:
+        """
+        남은 접근 기록을 반영하고 연결 종료
+        """
+        with self.lock:
+            self._flush_access()
+            self._connection.close()
+    
+    def _compress(self, payload: bytes) -> Tuple[bytes, int]:
+        """
+        설정된 방식으로 압축 (임계값보다 작거나 압축 효과가 없으면 원본 유지)
+        
+        Returns:
+            Tuple[bytes, int]: (저장할 데이터, 압축 방식 코드)
+        """
+        if self.compression is None or len(payload) < self.compress_threshold:
+            return payload, self.CODEC_NONE
+        
+        if self.compression == 'zstd':
+            compressed, codec = zstandard.ZstdCompressor().compress(payload), self.CODEC_ZSTD
+        else:
+            compressed, codec = zlib.compress(payload, 6), self.CODEC_ZLIB
+        
+        if len(compressed) >= len(payload):
+            return payload, self.CODEC_NONE
+        return compressed, codec
+    
+    def _decompress(self, payload: bytes, codec: int) -> bytes:
+        """
+        저장된 압축 방식 코드에 따라 압축 해제
+        
+        Raises:
+            ValueError: 해제할 수 없는 압축 방식인 경우
+        """
+        if codec == self.CODEC_NONE:
+            return payload
+        if codec == self.CODEC_ZLIB:
+            return zlib.decompress(payload)
+        if codec == self.CODEC_ZSTD and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompress(payload)
+        raise ValueError(f"압축 방식을 해제할 수 없습니다: {codec}")
+    
+    def _flush_access(self) -> None:
+        """
+        누적된 접근 기록을 한 트랜잭션으로 반영
+        """
+        self._last_flush = time.time()
+        if not self._pending_access:
+            return
+        
+        updates = [(accessed, count, key) for key, (accessed, count) in self._pending_access.items()]
+        self._pending_access.clear()
+        
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "UPDATE cache_entries SET last_accessed = ?, access_count = access_count + ? WHERE key = ?",
+                    updates
+                )
+        except sqlite3.Error as e:
+            logger.error(f"캐시 접근 기록 반영 오류: {e}")
+    
+    def _delete_keys(self, keys: List[str]) -> int:
+        """
+        항목과 태그 색인을 한 트랜잭션으로 삭제
+        
+        Returns:
+            int: 삭제된 항목 수
+        """
+        if not keys:
+            return 0
+        
+        params = [(key,) for key in keys]
+        for key in keys:
+            self._pending_access.pop(key, None)
+        
+        with self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany("DELETE FROM cache_entries WHERE key = ?", params)
+            removed = self._connection.total_changes - before
+            self._connection.executemany("DELETE FROM cache_tags WHERE key = ?", params)
+        return removed
+    
+    def _remove_expired(self) -> int:
+        """
+        만료된 항목 제거 (만료 시각 인덱스 사용)
+        
+        Returns:
+            int: 제거된 항목 수
+        """
+        now = time.time()
+        self._last_sweep = now
+        
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM cache_tags WHERE key IN "
+                "(SELECT key FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?)", (now,)
+            )
+            cursor = self._connection.execute(
+                "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+            )
+        return cursor.rowcount
+
+
+# 캐시 미스 표시용 (None도 캐시 값으로 저장할 수 있도록)
+_MISSING = object()
+
+
+class _TaggedValue(NamedTuple):
+    """태그가 붙은 캐시 값 (저장 시점의 태그 세대 스탬프 포함)"""
+    value: Any
+    stamp: TagStamp
+
+
+class _ComputedValue(NamedTuple):
+    """get_or_compute로 저장된 값 (논리적 만료 시각과 계산 소요 시간 포함)"""
+    value: Any
+    expires_at: float
+    delta: float
+
+
+class CacheManager:
     """
     캐시 관리자 클래스
     
     메모리 캐시와 디스크 캐시를 통합 관리합니다.
+    태그가 붙은 항목은 저장 시점의 태그 세대 스탬프를 함께 저장하고, 조회 시 세대가 바뀌었으면
+    미스로 처리합니다. 태그 무효화 시 디스크 캐시는 태그 인덱스로 해당 항목을 바로 삭제하고,
+    메모리 캐시는 세대 비교로 지연 삭제합니다.
+    
+    get_or_compute는 키별 진행 중 계산(Future)을 공유해 동시에 미스가 나도 한 번만 계산하고,
+    만료 직후에는 디스크 캐시에 남아 있는 이전 값을 반환하면서 백그라운드에서 갱신합니다
+    (stale-while-revalidate). 만료 전에는 계산 시간에 비례한 확률로 미리 갱신해
+    여러 항목이 같은 시각에 만료되어 한꺼번에 다시 계산되는 것을 막습니다.
     """
     
     def __init__(self, config_manager: ConfigManager = None):
@@ -539,17 +1236,52 @@ heManager:
         self.memory_cache_enabled = self.config_manager.get_config_value('system.cache.memory_cache_enabled', True)
         self.disk_cache_enabled = self.config_manager.get_config_value('system.cache.disk_cache_enabled', True)
         self.memory_cache_size = self.config_manager.get_config_value('system.cache.memory_cache_size', 1000)
+        self.memory_cache_max_bytes = self.config_manager.get_config_value('system.cache.memory_cache_max_bytes')
         self.default_ttl = self.config_manager.get_config_value('system.cache.default_ttl', 3600)  # 1시간
         self.disk_cache_dir = self.config_manager.get_config_value('system.cache.disk_cache_dir')
+        self.stale_ttl = self.config_manager.get_config_value('system.cache.stale_ttl', 0)
+        self.refresh_workers = self.config_manager.get_config_value('system.cache.refresh_workers', 2)
+        
+        # 키별 진행 중 계산 (single-flight)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._compute_stats = {'computed': 0, 'coalesced': 0, 'stale_served': 0, 'early_refreshes': 0, 'refresh_errors': 0}
         
         # 캐시 초기화
-        self.memory_cache = MemoryCache(self.memory_cache_size, self.default_ttl) if self.memory_cache_enabled else None
-        self.disk_cache = DiskCache(self.disk_cache_dir, self.default_ttl, self.config_manager) if self.disk_cache_enabled else None
+        self.memory_cache = MemoryCache(
+            self.memory_cache_size, self.default_ttl, max_bytes=self.memory_cache_max_bytes
+        ) if self.memory_cache_enabled else None
+        self.disk_cache = self._create_disk_cache() if self.disk_cache_enabled else None
+        
+        # 태그 무효화 시 디스크 캐시 항목 정리 (재시작 후 세대 번호가 초기화되어도 안전하도록)
+        tag_versions.add_listener(self._on_tags_invalidated)
         
         logger.info(f"캐시 관리자 초기화 완료 (메모리 캐시: {'활성화' if self.memory_cache_enabled else '비활성화'}, "
                    f"디스크 캐시: {'활성화' if self.disk_cache_enabled else '비활성화'})")
     
-    @profile_function
+    def _create_disk_cache(self) -> Union[DiskCache, SqliteDiskCache]:
+        """
+        설정(system.cache.disk_cache_backend)에 따른 디스크 캐시 생성
+        
+        Returns:
+            Union[DiskCache, SqliteDiskCache]: 'files'(기본값)이면 항목별 파일, 'sqlite'이면 단일 SQLite 파일
+        
+        Raises:
+            ValueError: 알 수 없는 백엔드인 경우
+        """
+        backend = self.config_manager.get_config_value('system.cache.disk_cache_backend', 'files')
+        
+        if backend == 'files':
+            return DiskCache(self.disk_cache_dir, self.default_ttl, self.config_manager)
+        if backend == 'sqlite':
+            return SqliteDiskCache(
+                self.disk_cache_dir, self.default_ttl, self.config_manager,
+                compression=self.config_manager.get_config_value('system.cache.disk_cache_compression'),
+                compress_threshold=self.config_manager.get_config_value('system.cache.disk_cache_compress_threshold', 1024)
+            )
+        raise ValueError(f"알 수 없는 디스크 캐시 백엔드입니다: {backend}")
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         캐시 값 조회
@@ -559,27 +1291,43 @@ heManager:
             default: 기본값
             
         Returns:
-            Any: 캐시 값 또는 기본값
+            Any: 캐시 값 또는 기본값 (None으로 저장된 값도 히트로 처리, 갱신 대기 중인 값은 미스)
+        """
+        value = self._lookup(key)
+        if isinstance(value, _ComputedValue):
+            return value.value if time.time() < value.expires_at else default
+        return default if value is _MISSING else value
+    
+    def _lookup(self, key: str) -> Any:
+        """
+        메모리 캐시, 디스크 캐시 순으로 조회 (디스크 히트는 메모리 캐시로 승격)
+        
+        Returns:
+            Any: 태그 확인 후의 저장 값 (_ComputedValue는 그대로) 또는 _MISSING
         """
         # 메모리 캐시 조회
         if self.memory_cache_enabled:
-            value = self.memory_cache.get(key)
-            if value is not None:
+            value = self._unwrap(self.memory_cache, key, self.memory_cache.get(key, _MISSING))
+            if value is not _MISSING:
                 return value
         
         # 디스크 캐시 조회
         if self.disk_cache_enabled:
-            value = self.disk_cache.get(key)
-            if value is not None:
-                # 메모리 캐시에 저장
-                if self.memory_cache_enabled:
-                    self.memory_cache.set(key, value)
+            stored = self.disk_cache.get(key, _MISSING)
+            value = self._unwrap(self.disk_cache, key, stored)
+            if value is not _MISSING:
+                # 메모리 캐시에 저장 (갱신 대기 중인 값은 디스크에만 둠)
+                ttl = None
+                if isinstance(value, _ComputedValue):
+                    ttl = value.expires_at - time.time()
+                if self.memory_cache_enabled and (ttl is None or ttl > 0):
+                    tags = [tag for tag, _ in stored.stamp] if isinstance(stored, _TaggedValue) else None
+                    self.memory_cache.set(key, stored, ttl, tags=tags)
                 return value
         
-        return default
+        return _MISSING
     
-    @profile_function
-    def set(self, key: str, value: Any, ttl: int = None) -> None:
+    def set(self, key: str, value: Any, ttl: int = None, tags: Iterable[str] = None) -> None:
         """
         캐시 값 설정
         
@@ -587,14 +1335,193 @@ heManager:
             key: 캐시 키
             value: 캐시 값
             ttl: 유효 시간 (초)
+            tags: 태그 목록 (예: table:transactions, transactions:2024-01, rules:category)
+        """
+        self._store(key, value, ttl, ttl, tags)
+    
+    def _store(self, key: str, value: Any, memory_ttl: Optional[float], disk_ttl: Optional[float],
+               tags: Optional[Iterable[str]], stamp: Optional[TagStamp] = None) -> None:
         """
+        계층별 유효 시간으로 값 저장 (태그가 있으면 세대 스탬프를 붙임)
+        
+        계산한 값은 계산을 시작하기 전에 찍은 stamp를 넘겨, 계산 중 무효화된 값이 새 세대로 저장되지 않게 합니다.
+        """
+        if tags:
+            tags = sorted(set(tags))
+            value = _TaggedValue(value, stamp if stamp is not None else tag_versions.stamp(tags))
+        
         # 메모리 캐시 저장
         if self.memory_cache_enabled:
-            self.memory_cache.set(key, value, ttl)
+            self.memory_cache.set(key, value, memory_ttl, tags=tags)
         
         # 디스크 캐시 저장
         if self.disk_cache_enabled:
-            self.disk_cache.set(key, value, ttl)
+            self.disk_cache.set(key, value, disk_ttl, tags=tags)
+    
+    def get_or_compute(self, key: str, fn: Callable[[], Any], ttl: float = None, tags: Iterable[str] = None,
+                       stale_ttl: float = None, beta: float = 1.0) -> Any:
+        """
+        캐시 값을 반환하거나 한 번만 계산해 저장
+        
+        같은 키를 동시에 요청한 호출자들은 먼저 도착한 호출자의 계산 결과(또는 예외)를 함께 받습니다.
+        유효 시간이 지난 뒤 stale_ttl 동안은 이전 값을 반환하고 백그라운드에서 다시 계산하며,
+        유효 시간 안에서도 만료가 가까울수록, 계산이 오래 걸릴수록 높은 확률로 미리 갱신합니다
+        (now + delta * beta * -ln(rand) >= 만료 시각).
+        
+        Args:
+            key: 캐시 키
+            fn: 값 계산 함수 (인자 없음)
+            ttl: 유효 시간 (초, 기본값: 설정의 default_ttl)
+            tags: 태그 목록
+            stale_ttl: 만료 후 이전 값을 반환할 수 있는 시간 (초, 기본값: 설정의 stale_ttl)
+            beta: 조기 갱신 강도 (0이면 조기 갱신하지 않음)
+            
+        Returns:
+            Any: 캐시 값 또는 계산 결과
+            
+        Raises:
+            Exception: 캐시 값이 없고 fn이 예외를 발생시킨 경우 (대기 중이던 호출자에게도 전달)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        
+        stored = self._lookup(key)
+        if isinstance(stored, _ComputedValue):
+            now = time.time()
+            if now < stored.expires_at:
+                if beta > 0 and now - stored.delta * beta * math.log(1.0 - random.random()) >= stored.expires_at:
+                    if self._refresh_in_background(key, fn, ttl, tags, stale_ttl):
+                        self._compute_stats['early_refreshes'] += 1
+                return stored.value
+            if now < stored.expires_at + stale_ttl:
+                self._compute_stats['stale_served'] += 1
+                self._refresh_in_background(key, fn, ttl, tags, stale_ttl)
+                return stored.value
+        elif stored is not _MISSING:
+            # set()으로 직접 저장된 값
+            return stored
+        
+        future, leader = self._join_flight(key)
+        if not leader:
+            self._compute_stats['coalesced'] += 1
+            return future.result()
+        return self._run_flight(key, future, fn, ttl, tags, stale_ttl)
+    
+    def _join_flight(self, key: str) -> Tuple[Future, bool]:
+        """
+        키의 진행 중 계산에 참여
+        
+        Returns:
+            Tuple[Future, bool]: (계산 결과 Future, 직접 계산해야 하는지 여부)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = self._inflight[key] = Future()
+            return future, True
+    
+    def _run_flight(self, key: str, future: Future, fn: Callable[[], Any], ttl: float,
+                    tags: Optional[Iterable[str]], stale_ttl: float) -> Any:
+        """
+        값을 계산해 저장하고 대기 중인 호출자에게 결과 전달
+        """
+        try:
+            # 계산 중 태그가 무효화되면 저장한 값이 바로 낡은 값으로 판정되도록 계산 전에 세대 스탬프를 찍음
+            stamp = tag_versions.stamp(tags) if tags else None
+            started = time.perf_counter()
+            value = fn()
+            delta = time.perf_counter() - started
+            
+            # 메모리 캐시는 유효 시간까지, 디스크 캐시는 이전 값 반환 기간까지 보관
+            stored = _ComputedValue(value, time.time() + ttl, delta)
+            memory_ttl = ttl if self.disk_cache_enabled else ttl + stale_ttl
+            self._store(key, stored, memory_ttl, ttl + stale_ttl, tags, stamp)
+            self._compute_stats['computed'] += 1
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _refresh_in_background(self, key: str, fn: Callable[[], Any], ttl: float,
+                               tags: Optional[Iterable[str]], stale_ttl: float) -> bool:
+        """
+        백그라운드 갱신 시작 (이미 진행 중이면 무시)
+        
+        Returns:
+            bool: 새로 갱신을 시작했는지 여부
+        """
+        future, leader = self._join_flight(key)
+        if not leader:
+            return False
+        
+        with self._inflight_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers, thread_name_prefix='cache-refresh'
+                )
+            executor = self._refresh_executor
+        
+        def refresh():
+            try:
+                self._run_flight(key, future, fn, ttl, tags, stale_ttl)
+            except Exception as e:
+                self._compute_stats['refresh_errors'] += 1
+                logger.warning(f"캐시 백그라운드 갱신 실패 ({key}): {e}")
+        
+        executor.submit(refresh)
+        logger.debug(f"캐시 백그라운드 갱신 시작: {key}")
+        return True
+    
+    def invalidate_tags(self, *tags: str) -> None:
+        """
+        태그가 붙은 항목 무효화 (태그 세대 번호 증가)
+        
+        Args:
+            *tags: 무효화할 태그
+        """
+        invalidate_tags(*tags)
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        키가 접두사로 시작하는 항목 삭제
+        
+        Args:
+            prefix: 키 접두사
+            
+        Returns:
+            int: 삭제된 항목 수 (계층별 합계)
+        """
+        removed = 0
+        if self.memory_cache_enabled:
+            removed += self.memory_cache.delete_prefix(prefix)
+        if self.disk_cache_enabled:
+            removed += self.disk_cache.delete_prefix(prefix)
+        return removed
+    
+    def _unwrap(self, tier: Any, key: str, stored: Any) -> Any:
+        """
+        태그 값이면 세대를 확인해 원래 값 반환 (무효화된 항목은 삭제 후 미스)
+        """
+        if not isinstance(stored, _TaggedValue):
+            return stored
+        if tag_versions.is_current(stored.stamp):
+            return stored.value
+        tier.delete(key)
+        return _MISSING
+    
+    def _on_tags_invalidated(self, tags: Tuple[str, ...]) -> None:
+        """
+        태그 무효화 리스너: 디스크 캐시의 태그 항목 삭제
+        """
+        if self.disk_cache_enabled and self.disk_cache is not None:
+            for tag in tags:
+                self.disk_cache.delete_tag(tag)
     
     @profile_function
     def delete(self, key: str) -> bool:
@@ -652,17 +1579,24 @@ heManager:
         if self.disk_cache_enabled:
             stats['disk'] = self.disk_cache.get_stats()
         
+        # get_or_compute 통계
+        stats['compute'] = dict(self._compute_stats, in_flight=len(self._inflight))
+        
         return stats
 
-def cached(ttl: int = None, key_prefix: str = None):
+def cached(ttl: int = None, key_prefix: str = None, tags: Union[Iterable[str], Callable[..., Iterable[str]]] = None,
+           stale_ttl: int = None):
     """
     캐시 데코레이터
     
-    함수 결과를 캐싱합니다.
+    함수 결과를 캐싱합니다. 같은 인자로 동시에 호출되면 함수는 한 번만 실행됩니다
+    (CacheManager.get_or_compute).
     
     Args:
         ttl: 유효 시간 (초)
         key_prefix: 캐시 키 접두사
+        tags: 결과에 붙일 태그 목록 또는 함수 인자로 태그 목록을 만드는 함수
+        stale_ttl: 만료 후 이전 값을 반환하며 백그라운드에서 갱신하는 시간 (초)
         
     Returns:
         Callable: 데코레이터 함수
@@ -676,31 +1610,23 @@ def cached(ttl: int = None, key_prefix: str = None):
             # 캐시 키 생성
             cache_key = _generate_cache_key(func, key_prefix, args, kwargs)
             
-            # 캐시 조회
-            cached_result = cache_manager.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"캐시 히트: {cache_key}")
-                return cached_result
-            
-            # 함수 실행
-            result = func(*args, **kwargs)
-            
-            # 캐시 저장
-            cache_manager.set(cache_key, result, ttl)
-            logger.debug(f"캐시 미스: {cache_key}")
-            
-            return result
+            # 캐시 조회 또는 함수 실행 (동시 미스는 한 번만 실행)
+            return cache_manager.get_or_compute(
+                cache_key, lambda: func(*args, **kwargs), ttl,
+                tags=_resolve_tags(tags, args, kwargs), stale_ttl=stale_ttl
+            )
         return wrapper
     return decorator
 
-def invalidate_cache(key_pattern: str = None):
+def invalidate_cache(key_pattern: str = None, tags: Union[Iterable[str], Callable[..., Iterable[str]]] = None):
     """
     캐시 무효화 데코레이터
     
     함수 실행 후 캐시를 무효화합니다.
     
     Args:
-        key_pattern: 캐시 키 패턴
+        key_pattern: 캐시 키 패턴 (태그와 패턴이 모두 없으면 전체 캐시)
+        tags: 무효화할 태그 목록 또는 함수 인자로 태그 목록을 만드는 함수
         
     Returns:
         Callable: 데코레이터 함수
@@ -711,14 +1637,34 @@ def invalidate_cache(key_pattern: str = None):
             # 함수 실행
             result = func(*args, **kwargs)
             
-            # 캐시 무효화
-            if key_pattern:
+            # 캐시 무효화 (태그는 세대 번호만 증가)
+            if tags is not None:
+                invalidate_tags(*_resolve_tags(tags, args, kwargs))
+            if key_pattern or tags is None:
                 invalidate_cache_by_pattern(key_pattern)
             
             return result
         return wrapper
     return decorator
 
+def _resolve_tags(tags: Union[Iterable[str], Callable[..., Iterable[str]], None], args: tuple, kwargs: dict) -> List[str]:
+    """
+    데코레이터 태그 인자를 태그 목록으로 변환
+    
+    Args:
+        tags: 태그 목록 또는 함수 인자로 태그 목록을 만드는 함수
+        args: 위치 인자
+        kwargs: 키워드 인자
+        
+    Returns:
+        List[str]: 태그 목록
+    """
+    if tags is None:
+        return []
+    if callable(tags):
+        tags = tags(*args, **kwargs)
+    return [tags] if isinstance(tags, str) else list(tags)
+
 def _generate_cache_key(func: Callable, prefix: str = None, args: tuple = None, kwargs: dict = None) -> str:
     """
     캐시 키 생성
@@ -749,24 +1695,25 @@ def _generate_cache_key(func: Callable, prefix: str = None, args: tuple = None,
     # 키 결합
     return ":".join(str(p) for p in key_parts)
 
-def invalidate_cache_by_pattern(pattern: str) -> int:
+def invalidate_cache_by_pattern(pattern: Optional[str]) -> int:
     """
     패턴으로 캐시 무효화
     
     Args:
-        pattern: 캐시 키 패턴
+        pattern: 캐시 키 접두사 (끝의 '*'는 무시, None이면 전체 캐시)
         
     Returns:
-        int: 무효화된 항목 수
+        int: 무효화된 항목 수 (전체 삭제 시 0)
     """
     # 캐시 관리자 가져오기
     cache_manager = get_cache_manager()
     
-    # TODO: 패턴 기반 캐시 무효화 구현
-    # 현재는 전체 캐시 삭제
-    cache_manager.clear()
+    prefix = (pattern or '').rstrip('*')
+    if not prefix:
+        cache_manager.clear()
+        return 0
     
-    return 0
+    return cache_manager.delete_prefix(prefix)
 
 # 전역 캐시 관리자 인스턴스
 _cache_manager = None
@@ -822,7 +1769,8 @@ def main():
             memory_stats = stats['memory']
             print("\n메모리 캐시:")
             print(f"  총 항목 수: {memory_stats['total_items']}")
-            print(f"  히트율: {memory_stats['hit_rate']:.2f}%")
+            print(f"  히트율: {memory_stats['hit_rate']:.2f}% (히트 {memory_stats['hits']}, 미스 {memory_stats['misses']})")
+            print(f"  제거: {memory_stats['evictions']} (만료 {memory_stats['expirations']})")
             print(f"  사용률: {memory_stats['utilization']:.2f}%")
             print(f"  평균 접근 횟수: {memory_stats['avg_access_count']:.2f}")
         
@@ -873,4 +1821,4 @@ def main():
             print("캐시 항목을 찾을 수 없습니다.")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+캐시 태그 세대 관리
+
+캐시 항목에 붙이는 태그(테이블, 월, 규칙 유형 등)별로 세대 번호를 관리합니다.
+항목은 저장할 때의 태그 세대 번호를 함께 저장하고, 조회 시 현재 세대와 다르면 무효로 봅니다.
+따라서 태그 무효화는 해당 태그의 번호를 하나 올리는 O(1) 연산입니다.
+
+저장소 계층에서도 가볍게 가져다 쓸 수 있도록 다른 src 모듈에 의존하지 않습니다.
+"""
+
+import logging
+import threading
+import weakref
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 태그 세대 스탬프 ((태그, 세대 번호), ...)
+TagStamp = Tuple[Tuple[str, int], ...]
+
+
+class TagVersions:
+    """
+    태그별 세대 번호 관리 클래스
+    
+    무효화 시 등록된 리스너(예: 디스크 캐시의 태그 인덱스 정리)를 호출합니다.
+    """
+    
+    def __init__(self):
+        """
+        태그 세대 관리자 초기화
+        """
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[weakref.ReferenceType] = []
+    
+    def version(self, tag: str) -> int:
+        """
+        태그의 현재 세대 번호
+        
+        Args:
+            tag: 태그
+        
+        Returns:
+            int: 세대 번호 (무효화된 적이 없으면 0)
+        """
+        return self._versions.get(tag, 0)
+    
+    def stamp(self, tags: Iterable[str]) -> TagStamp:
+        """
+        태그 목록의 현재 세대 스탬프 생성
+        
+        Args:
+            tags: 태그 목록
+        
+        Returns:
+            TagStamp: 정렬된 (태그, 세대 번호) 튜플
+        """
+        versions = self._versions
+        return tuple((tag, versions.get(tag, 0)) for tag in sorted(set(tags)))
+    
+    def is_current(self, stamp: TagStamp) -> bool:
+        """
+        스탬프가 현재 세대인지 확인
+        
+        Args:
+            stamp: 저장 시점의 세대 스탬프
+        
+        Returns:
+            bool: 모든 태그가 저장 이후 무효화되지 않았으면 True
+        """
+        versions = self._versions
+        return all(versions.get(tag, 0) == version for tag, version in stamp)
+    
+    def bump(self, tags: Iterable[str]) -> None:
+        """
+        태그 세대 번호 증가 (무효화)
+        
+        Args:
+            tags: 무효화할 태그 목록
+        """
+        tags = tuple(sorted(set(tags)))
+        if not tags:
+            return
+        
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+            listeners = [ref() for ref in self._listeners]
+            self._listeners = [ref for ref, listener in zip(self._listeners, listeners) if listener is not None]
+        
+        logger.debug(f"캐시 태그 무효화: {', '.join(tags)}")
+        
+        for listener in listeners:
+            if listener is None:
+                continue
+            try:
+                listener(tags)
+            except Exception as e:
+                logger.error(f"캐시 태그 무효화 리스너 오류: {e}")
+    
+    def add_listener(self, listener: Callable[[Tuple[str, ...]], None]) -> None:
+        """
+        무효화 리스너 등록 (약한 참조로 보관)
+        
+        Args:
+            listener: 무효화된 태그 튜플을 받는 함수 또는 바운드 메서드
+        """
+        ref = weakref.WeakMethod(listener) if hasattr(listener, '__self__') else weakref.ref(listener)
+        with self._lock:
+            self._listeners.append(ref)
+    
+    def reset(self) -> None:
+        """
+        모든 세대 번호 초기화 (테스트용)
+        """
+        with self._lock:
+            self._versions.clear()
+
+
+# 전역 태그 세대 관리자
+tag_versions = TagVersions()
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    태그가 붙은 캐시 항목 무효화
+    
+    Args:
+        *tags: 무효화할 태그
+    """
+    tag_versions.bump(tag for tag in tags if tag)
+
+
+def table_tag(table: str) -> str:
+    """
+    테이블 전체 태그 (예: table:transactions)
+    
+    Args:
+        table: 테이블 이름
+    
+    Returns:
+        str: 태그
+    """
+    return f"table:{table}"
+
+
+def month_tag(table: str, value: Union[date, datetime, str]) -> str:
+    """
+    테이블의 월 단위 태그 (예: transactions:2024-01)
+    
+    Args:
+        table: 테이블 이름
+        value: 날짜 또는 ISO 형식 날짜 문자열
+    
+    Returns:
+        str: 태그
+    """
+    text = value.isoformat() if isinstance(value, (date, datetime)) else str(value)
+    return f"{table}:{text[:7]}"
+
+
+def rule_type_tag(rule_type: str) -> str:
+    """
+    분류 규칙 유형 태그 (예: rules:category)
+    
+    Args:
+        rule_type: 규칙 유형
+    
+    Returns:
+        str: 태그
+    """
+    return f"rules:{rule_type}"
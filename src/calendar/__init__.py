@@ -5,12 +5,16 @@ from .logging_config import setup_logging
 setup_logging()
 
 # 모듈 임포트
-from .models import CalendarEvent
+from .models import CalendarEvent, EventTimes
 from .interfaces import CalendarProvider
 from .auth import GoogleAuthService
 from .service import CalendarService
+from .event_cache import CalendarEventCache
+from .recurrence import RecurrenceExpander
+from .formatting import format_event_for_display
 from .factory import CalendarServiceFactory
 from .utils import retry, measure_performance, format_error_message
+from .metrics import MetricsRegistry, get_metrics_registry
 from .exceptions import (
     CalendarServiceError,
     AuthenticationError,
@@ -32,14 +36,20 @@ from .providers.google import GoogleCalendarProvider
 
 __all__ = [
     'CalendarEvent',
+    'EventTimes',
     'CalendarProvider',
     'CalendarService',
+    'CalendarEventCache',
+    'RecurrenceExpander',
+    'format_event_for_display',
     'CalendarServiceFactory',
     'GoogleAuthService',
     'GoogleCalendarProvider',
     'retry',
     'measure_performance',
     'format_error_message',
+    'MetricsRegistry',
+    'get_metrics_registry',
     'CalendarServiceError',
     'AuthenticationError',
     'TokenExpiredError',
@@ -15,6 +15,7 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.errors import HttpError
 
 from ..config import BASE_DIR
+from ..google_client import credential_cache
 from .utils import retry, format_error_message
 from .exceptions import (
     AuthenticationError,
@@ -67,6 +68,13 @@ class GoogleAuthService:
             NetworkError: 네트워크 연결 문제 발생 시
             PermissionDeniedError: 권한 부족 시
         """
+        # 프로세스 전역 캐시의 자격 증명 재사용 (만료가 가까우면 미리 갱신)
+        if not force_refresh:
+            cached = credential_cache.get(self.token_path, self.scopes, on_refresh=self._save_token)
+            if cached:
+                self._credentials = cached
+                return cached
+        
         # 이미 유효한 자격 증명이 있고 강제 갱신이 아니면 캐시된 자격 증명 반환
         if self._credentials and self._credentials.valid and not force_refresh:
             return self._credentials
@@ -105,6 +113,7 @@ class GoogleAuthService:
                 self._save_token(creds)
             
             self._credentials = creds
+            credential_cache.put(self.token_path, self.scopes, creds)
             return creds
             
         except HttpError as e:
@@ -207,6 +216,7 @@ class GoogleAuthService:
                 logger.info(f"토큰 파일 삭제 중: {self.token_path}")
                 os.remove(self.token_path)
                 self._credentials = None
+                credential_cache.invalidate(self.token_path)
                 logger.info("토큰이 성공적으로 취소되었습니다.")
                 print("토큰이 성공적으로 취소되었습니다.")
                 return True
@@ -0,0 +1,270 @@
+"""
+캘린더 이벤트 로컬 캐시
+
+이 모듈은 syncToken 기반 증분 동기화로 채워지는 메모리 이벤트 저장소를 제공합니다.
+기간 조회는 API 호출 없이 구간 트리 인덱스에서 처리하고,
+반복 일정은 원본만 저장한 뒤 조회 기간마다 로컬에서 전개합니다.
+생성/수정/삭제 결과는 즉시 캐시에 반영(write-through)합니다.
+"""
+import heapq
+import logging
+import threading
+import time
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .models import CalendarEvent
+from .interval_index import IntervalIndex
+from .recurrence import RecurrenceExpander
+from .utils import to_timestamp
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class CalendarEventCache:
+    """
+    syncToken 증분 동기화 기반 캘린더 이벤트 캐시
+    
+    마지막 동기화 후 max_staleness초가 지나면 다음 조회 시 증분 동기화를 먼저 수행합니다.
+    제공자는 sync_events(sync_token) 메서드를 지원해야 합니다.
+    """
+    
+    def __init__(
+        self,
+        provider,
+        max_staleness: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_expanded_windows: int = 128
+    ):
+        """
+        CalendarEventCache 초기화
+        
+        Args:
+            provider: sync_events를 지원하는 캘린더 제공자
+            max_staleness: 동기화 없이 캐시를 사용할 최대 시간(초)
+            clock: 경과 시간 측정 함수 (테스트용)
+            max_expanded_windows: 반복 일정 전개 결과를 캐시할 최대 조회 기간 수
+        """
+        self.provider = provider
+        self.max_staleness = max_staleness
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        
+        self._events: Dict[str, CalendarEvent] = {}
+        self._index: IntervalIndex[str] = IntervalIndex()
+        self._recurrences = RecurrenceExpander(max_windows=max_expanded_windows)
+        
+        self._sync_token: Optional[str] = None
+        self._last_sync: Optional[float] = None
+        self._stats = {'queries': 0, 'syncs': 0, 'full_syncs': 0}
+    
+    @property
+    def is_stale(self) -> bool:
+        """동기화가 필요한지 여부"""
+        return self._last_sync is None or self._clock() - self._last_sync > self.max_staleness
+    
+    def list_events(self, start_time: str, end_time: str) -> List[CalendarEvent]:
+        """
+        지정된 기간과 겹치는 이벤트를 캐시에서 조회합니다.
+        
+        반복 일정은 기간 안의 인스턴스로 전개하여 함께 반환합니다.
+        
+        Args:
+            start_time: 조회 시작 시간 (ISO 8601 형식)
+            end_time: 조회 종료 시간 (ISO 8601 형식)
+        
+        Returns:
+            시작 시간 순으로 정렬된 CalendarEvent 복사본 리스트
+        
+        Raises:
+            CalendarServiceError: 동기화 실패 시
+        """
+        self.ensure_fresh()
+        
+        range_start = to_timestamp(start_time)
+        range_end = to_timestamp(end_time)
+        
+        with self._lock:
+            self._stats['queries'] += 1
+            single = (
+                (start, self._events[event_id])
+                for start, _, event_id in self._index.overlapping(range_start, range_end)
+            )
+            recurring = (
+                (start, occurrence)
+                for start, _, occurrence in self._recurrences.expand(range_start, range_end)
+            )
+            return [
+                replace(event)
+                for _, event in heapq.merge(single, recurring, key=lambda item: item[0])
+            ]
+    
+    def count_events(self, start_time: str, end_time: str) -> int:
+        """
+        지정된 기간과 겹치는 이벤트 수를 캐시에서 계산합니다 (이벤트 복사 없음).
+        
+        Args:
+            start_time: 조회 시작 시간 (ISO 8601 형식)
+            end_time: 조회 종료 시간 (ISO 8601 형식)
+        
+        Returns:
+            반복 일정 인스턴스를 포함한 이벤트 수
+        
+        Raises:
+            CalendarServiceError: 동기화 실패 시
+        """
+        self.ensure_fresh()
+        
+        range_start = to_timestamp(start_time)
+        range_end = to_timestamp(end_time)
+        
+        with self._lock:
+            self._stats['queries'] += 1
+            return (
+                len(self._index.overlapping(range_start, range_end))
+                + len(self._recurrences.expand(range_start, range_end))
+            )
+    
+    def get_event(self, event_id: str) -> Optional[CalendarEvent]:
+        """
+        캐시에서 이벤트를 조회합니다.
+        
+        Args:
+            event_id: 조회할 이벤트 ID (반복 일정 인스턴스 ID 포함)
+        
+        Returns:
+            CalendarEvent 복사본 또는 None (캐시에 없는 경우)
+        """
+        self.ensure_fresh()
+        
+        with self._lock:
+            self._stats['queries'] += 1
+            event = self._events.get(event_id) or self._recurrences.get_instance(event_id)
+            return replace(event) if event else None
+    
+    def ensure_fresh(self) -> None:
+        """허용된 시간이 지났으면 증분 동기화를 수행합니다."""
+        if not self.is_stale:
+            return
+        
+        with self._sync_lock:
+            # 대기하는 동안 다른 스레드가 동기화했을 수 있음
+            if self.is_stale:
+                self._sync()
+    
+    def refresh(self) -> None:
+        """허용 시간과 관계없이 즉시 증분 동기화를 수행합니다."""
+        with self._sync_lock:
+            self._sync()
+    
+    def invalidate(self) -> None:
+        """캐시와 syncToken을 비워 다음 조회 시 전체 동기화하도록 합니다."""
+        with self._lock:
+            self._clear()
+            self._sync_token = None
+            self._last_sync = None
+    
+    def put(self, event: CalendarEvent) -> None:
+        """
+        생성/수정된 이벤트를 캐시에 반영합니다 (write-through).
+        
+        Args:
+            event: 제공자가 반환한 이벤트
+        """
+        if not event or not event.id:
+            return
+        
+        with self._lock:
+            self._upsert(event)
+    
+    def remove(self, event_id: str) -> None:
+        """
+        삭제된 이벤트를 캐시에서 제거합니다 (write-through).
+        
+        Args:
+            event_id: 삭제된 이벤트 ID
+        """
+        with self._lock:
+            if event_id in self._events:
+                self._remove(event_id)
+            else:
+                # 반복 일정의 인스턴스 하나만 삭제한 경우
+                self._recurrences.exclude_instance(event_id)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 상태를 반환합니다.
+        
+        Returns:
+            이벤트 수, 조회/동기화 횟수, 마지막 동기화 경과 시간 등
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                'event_count': len(self._events),
+                'last_sync_age': None if self._last_sync is None else self._clock() - self._last_sync,
+                'max_staleness': self.max_staleness,
+                'recurrence': self._recurrences.get_stats()
+            }
+    
+    def _sync(self) -> None:
+        """제공자에서 변경분을 받아 캐시에 적용합니다."""
+        result = self.provider.sync_events(self._sync_token)
+        
+        with self._lock:
+            if result.full_sync:
+                self._clear()
+                self._stats['full_syncs'] += 1
+            
+            for event in result.events:
+                self._upsert(event)
+            for event_id in result.deleted_ids:
+                self._remove(event_id)
+            for master_id, original_start in result.cancelled_occurrences:
+                self._recurrences.add_exception(master_id, original_start)
+            
+            self._sync_token = result.next_sync_token
+            self._last_sync = self._clock()
+            self._stats['syncs'] += 1
+        
+        logger.debug(
+            f"캘린더 캐시 동기화: 변경 {len(result.events)}개, 삭제 {len(result.deleted_ids)}개, "
+            f"전체 {len(self._events)}개"
+        )
+    
+    def _upsert(self, event: CalendarEvent) -> None:
+        """이벤트를 저장하고 시작 시간 인덱스를 갱신합니다."""
+        # 반복 일정 원본은 인덱스 대신 전개기에 보관 (해석할 수 없는 규칙이면 단일 이벤트로 취급)
+        if event.is_recurring and self._recurrences.add(event):
+            self._events[event.id] = replace(event)
+            self._index.remove(event.id)
+            return
+        
+        # 수정된 인스턴스는 별도 이벤트로 저장하고 원래 인스턴스는 전개에서 제외
+        if event.recurring_event_id and event.original_start_time:
+            self._recurrences.add_exception(event.recurring_event_id, event.original_start_time)
+        
+        try:
+            span = event.times
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"캐시할 수 없는 이벤트 시간 형식: ID={event.id}, {e}")
+            self._remove(event.id)
+            return
+        
+        self._recurrences.remove(event.id)
+        self._events[event.id] = replace(event)
+        self._index.add(event.id, span[0], span[1])
+    
+    def _remove(self, event_id: str) -> None:
+        """이벤트와 인덱스 항목을 제거합니다."""
+        self._events.pop(event_id, None)
+        self._index.remove(event_id)
+        self._recurrences.remove(event_id)
+    
+    def _clear(self) -> None:
+        """저장된 이벤트와 인덱스를 모두 비웁니다."""
+        self._events.clear()
+        self._index.clear()
+        self._recurrences.clear()
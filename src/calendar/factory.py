@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, Type
 
 from .interfaces import CalendarProvider
 from .service import CalendarService
+from .event_cache import CalendarEventCache
 from .auth import GoogleAuthService
 from .providers.google import GoogleCalendarProvider
 from ..config import CALENDAR_CONFIG
@@ -105,7 +106,32 @@ class CalendarServiceFactory:
         logger.info("캘린더 서비스 생성")
         
         # 서비스 인스턴스 생성 및 반환
-        return CalendarService(provider)
+        return CalendarService(provider, event_cache=cls.create_event_cache(provider))
+    
+    @classmethod
+    def create_event_cache(cls, provider: CalendarProvider) -> Optional[CalendarEventCache]:
+        """
+        설정에 기반하여 로컬 이벤트 캐시를 생성합니다.
+        
+        Args:
+            provider: 캐시를 채울 캘린더 제공자
+            
+        Returns:
+            CalendarEventCache 인스턴스 또는 None (비활성화되었거나 제공자가 동기화를 지원하지 않는 경우)
+        """
+        cache_config = CALENDAR_CONFIG.get("cache", {})
+        if not cache_config.get("enabled", False):
+            return None
+        
+        if not hasattr(provider, "sync_events"):
+            logger.info("캘린더 프로바이더가 증분 동기화를 지원하지 않아 이벤트 캐시를 사용하지 않습니다")
+            return None
+        
+        return CalendarEventCache(
+            provider,
+            max_staleness=cache_config.get("max_staleness_seconds", 60),
+            max_expanded_windows=cache_config.get("max_expanded_windows", 128)
+        )
     
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[CalendarProvider]) -> None:
@@ -0,0 +1,98 @@
+"""
+캘린더 이벤트 표시 형식 변환
+
+이 모듈은 CalendarEvent를 사용자 친화적인 딕셔너리로 변환합니다.
+시간 표시 문자열은 (시작, 종료, 종일 여부)별로, 날짜 표시 문자열은 날짜별로 한 번만 만들고,
+strftime 대신 문자열 조합을 사용합니다. 개수나 다음 일정처럼 표시가 필요 없는 조회는
+CalendarEvent.times의 타임스탬프만 사용하면 됩니다.
+"""
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict
+
+from .models import CalendarEvent
+
+# 표시용 한국 시간대 (UTC+9)
+KST = timezone(timedelta(hours=9))
+
+
+@lru_cache(maxsize=8192)
+def _day_label(ordinal: int) -> str:
+    """날짜 표시 문자열 (예: 2024년 01월 05일)"""
+    return date.fromordinal(ordinal).strftime("%Y년 %m월 %d일")
+
+
+def _date_label(value: date) -> str:
+    """날짜/시간 값의 날짜 표시 문자열 (같은 날짜는 한 번만 변환)"""
+    return _day_label(value.toordinal())
+
+
+@lru_cache(maxsize=65536)
+def format_event_time(start_time: str, end_time: str, all_day: bool) -> str:
+    """
+    이벤트 시간 표시 문자열을 만듭니다.
+    
+    Args:
+        start_time: 시작 시간 (ISO 8601 형식)
+        end_time: 종료 시간 (ISO 8601 형식)
+        all_day: 종일 이벤트 여부
+    
+    Returns:
+        "2024년 01월 01일 10:00 ~ 11:00" 형식의 문자열 (파싱할 수 없으면 원본 값)
+    """
+    try:
+        if all_day:
+            start_label = _date_label(date.fromisoformat(start_time[:10]))
+            end_label = _date_label(date.fromisoformat(end_time[:10]))
+            if start_label == end_label:
+                return f"{start_label} (종일)"
+            return f"{start_label} ~ {end_label} (종일)"
+        
+        # 한국 시간으로 변환 (시간대 정보가 없으면 로컬 시간으로 해석)
+        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00')).astimezone(KST)
+        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00')).astimezone(KST)
+        start_label = _date_label(start_dt)
+        end_label = _date_label(end_dt)
+        start_clock = f"{start_dt.hour:02d}:{start_dt.minute:02d}"
+        end_clock = f"{end_dt.hour:02d}:{end_dt.minute:02d}"
+        
+        # 같은 날짜인 경우 날짜는 한 번만 표시
+        if start_label == end_label:
+            return f"{start_label} {start_clock} ~ {end_clock}"
+        return f"{start_label} {start_clock} ~ {end_label} {end_clock}"
+    except (ValueError, TypeError, AttributeError, OverflowError, OSError):
+        # 시간 파싱 오류 시 원본 값 사용
+        return f"{start_time} ~ {end_time}"
+
+
+def format_event_for_display(event: CalendarEvent) -> Dict[str, Any]:
+    """
+    CalendarEvent 객체를 사용자 친화적인 형식으로 변환합니다.
+    
+    Args:
+        event: 변환할 CalendarEvent 객체
+    
+    Returns:
+        사용자 친화적인 형식의 딕셔너리
+    """
+    try:
+        time_str = format_event_time(event.start_time, event.end_time, event.all_day)
+    except TypeError:
+        # 해시할 수 없는 값이 들어온 경우
+        time_str = f"{event.start_time} ~ {event.end_time}"
+    
+    formatted = {
+        "id": event.id,
+        "제목": event.summary,
+        "시간": time_str,
+        "종일 일정": event.all_day
+    }
+    
+    if event.description:
+        formatted["설명"] = event.description
+    
+    if event.location:
+        formatted["위치"] = event.location
+    
+    return formatted
+
@@ -0,0 +1,188 @@
+"""
+구간 트리 인덱스
+
+이 모듈은 일정 충돌 확인과 빈 시간 탐색에 사용하는 중심점 기반 구간 트리(centered interval tree)를 제공합니다.
+구간은 반열린 구간 [start, end)로 다루며, 겹침 조회는 O(log n + k)에 처리됩니다.
+"""
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+
+Interval = Tuple[float, float, K]
+
+
+class _Node(Generic[K]):
+    """구간 트리 노드 (중심점을 포함하는 구간들을 시작/종료 순으로 보관)"""
+    
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+    
+    def __init__(self, center: float, intervals: List[Interval]):
+        self.center = center
+        self.by_start = intervals
+        self.by_end = sorted(intervals, key=lambda interval: interval[1], reverse=True)
+        self.left: Optional['_Node[K]'] = None
+        self.right: Optional['_Node[K]'] = None
+
+
+def _build(intervals: List[Interval]) -> Optional[_Node]:
+    """시작 시간 순으로 정렬된 구간 목록으로 트리 생성"""
+    if not intervals:
+        return None
+    
+    # 시작 시간의 중앙값을 중심점으로 사용 (해당 구간은 항상 중심점을 포함하므로 노드가 비지 않음)
+    center = intervals[len(intervals) // 2][0]
+    
+    left, middle, right = [], [], []
+    for interval in intervals:
+        if interval[1] <= center:
+            left.append(interval)
+        elif interval[0] > center:
+            right.append(interval)
+        else:
+            middle.append(interval)
+    
+    # 분할 후에도 각 목록은 시작 시간 순서를 유지함
+    node = _Node(center, middle)
+    node.left = _build(left)
+    node.right = _build(right)
+    return node
+
+
+class IntervalIndex(Generic[K]):
+    """
+    반열린 구간 [start, end)를 키(이벤트 ID 등)로 관리하는 구간 트리 인덱스
+    
+    변경 후 첫 조회 시 트리를 다시 만들며(O(n log n)), 이후 조회는 O(log n + k)입니다.
+    길이가 0 이하인 구간은 어떤 구간과도 겹치지 않으므로 인덱스에 넣지 않습니다.
+    """
+    
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        """
+        IntervalIndex 초기화
+        
+        Args:
+            intervals: (시작, 종료, 키) 튜플 목록
+        """
+        self._spans: Dict[K, Tuple[float, float]] = {}
+        self._root: Optional[_Node] = None
+        self._dirty = False
+        
+        for start, end, key in intervals:
+            self.add(key, start, end)
+    
+    def __len__(self) -> int:
+        return len(self._spans)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._spans
+    
+    def add(self, key: K, start: float, end: float) -> None:
+        """
+        구간 추가 (같은 키가 있으면 교체)
+        
+        Args:
+            key: 구간 키
+            start: 구간 시작
+            end: 구간 종료 (포함하지 않음)
+        """
+        self._spans.pop(key, None)
+        if end > start:
+            self._spans[key] = (start, end)
+        self._dirty = True
+    
+    def remove(self, key: K) -> None:
+        """
+        키에 해당하는 구간 제거
+        
+        Args:
+            key: 제거할 구간 키
+        """
+        if self._spans.pop(key, None) is not None:
+            self._dirty = True
+    
+    def clear(self) -> None:
+        """모든 구간 제거"""
+        self._spans.clear()
+        self._root = None
+        self._dirty = False
+    
+    def overlapping(self, start: float, end: float) -> List[Interval]:
+        """
+        [start, end)와 겹치는 구간 조회
+        
+        Args:
+            start: 조회 구간 시작
+            end: 조회 구간 종료 (포함하지 않음)
+        
+        Returns:
+            시작 시간 순으로 정렬된 (시작, 종료, 키) 튜플 목록
+        """
+        if end <= start:
+            return []
+        
+        if self._dirty:
+            intervals = sorted(
+                ((span[0], span[1], key) for key, span in self._spans.items()),
+                key=lambda interval: interval[0]
+            )
+            self._root = _build(intervals)
+            self._dirty = False
+        
+        result: List[Interval] = []
+        stack = [self._root]
+        
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            
+            if end <= node.center:
+                # 노드 구간은 모두 중심점 이후에 끝나므로 시작이 end 이전인지만 확인
+                for interval in node.by_start:
+                    if interval[0] >= end:
+                        break
+                    result.append(interval)
+                stack.append(node.left)
+            elif start > node.center:
+                # 노드 구간은 모두 중심점 이전에 시작하므로 종료가 start 이후인지만 확인
+                for interval in node.by_end:
+                    if interval[1] <= start:
+                        break
+                    result.append(interval)
+                stack.append(node.right)
+            else:
+                # 조회 구간이 중심점을 포함하면 노드 구간은 모두 겹침
+                result.extend(node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+        
+        result.sort(key=lambda interval: interval[0])
+        return result
+    
+    def free_slots(self, start: float, end: float, min_duration: float = 0.0) -> List[Tuple[float, float]]:
+        """
+        [start, end) 안에서 어떤 구간과도 겹치지 않는 빈 구간 조회
+        
+        Args:
+            start: 조회 구간 시작
+            end: 조회 구간 종료 (포함하지 않음)
+            min_duration: 반환할 빈 구간의 최소 길이
+        
+        Returns:
+            (시작, 종료) 튜플 목록
+        """
+        slots = []
+        cursor = start
+        
+        # 겹치는 구간은 시작 순으로 정렬되어 있으므로 한 번 훑으며 병합
+        for busy_start, busy_end, _ in self.overlapping(start, end):
+            if busy_start > cursor and busy_start - cursor >= min_duration:
+                slots.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            if cursor >= end:
+                break
+        
+        if end > cursor and end - cursor >= min_duration:
+            slots.append((cursor, end))
+        
+        return slots
@@ -0,0 +1,319 @@
+"""
+캘린더 서비스 성능 지표 저장소
+
+이 모듈은 호출 수와 관계없이 메모리 사용량이 고정된 함수별 성능 지표를 제공합니다.
+실행 시간은 HDR 방식의 로그-선형 히스토그램(2의 거듭제곱 구간마다 32개 하위 구간, 상대 오차 약 3%)에 누적하여
+p50/p95/p99를 계산하고, 최근 구간 통계는 고정 개수의 시간 슬롯으로 집계합니다.
+"""
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# 히스토그램 설정 (마이크로초 단위 기록)
+SUB_BUCKET_COUNT = 32
+_SUB_BUCKET_BITS = SUB_BUCKET_COUNT.bit_length() - 1
+MAX_TRACKABLE_MICROS = 1 << 36  # 약 19시간, 그 이상은 최대 구간에 기록
+
+# 최근 구간 통계 설정
+WINDOW_SLOT_SECONDS = 60
+WINDOW_SLOTS = 5
+RECENT_CALLS = 10
+
+
+def _bucket_index(micros: int) -> int:
+    """마이크로초 값을 히스토그램 구간 번호로 변환"""
+    if micros < SUB_BUCKET_COUNT:
+        return micros
+    shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+    return SUB_BUCKET_COUNT + shift * SUB_BUCKET_COUNT + ((micros >> shift) - SUB_BUCKET_COUNT)
+
+
+def _bucket_midpoint(index: int) -> float:
+    """히스토그램 구간의 대표값(중간값, 마이크로초)"""
+    if index < SUB_BUCKET_COUNT:
+        return float(index)
+    shift, offset = divmod(index - SUB_BUCKET_COUNT, SUB_BUCKET_COUNT)
+    lower = (SUB_BUCKET_COUNT + offset) << shift
+    return lower + ((1 << shift) - 1) / 2
+
+
+class LatencyHistogram:
+    """
+    고정 메모리 실행 시간 히스토그램
+    
+    구간 수는 최대 약 1,000개로 제한되며, 기록은 O(1), 백분위 계산은 사용 중인 구간 수에 비례합니다.
+    """
+    
+    __slots__ = ('_counts', 'count', 'total', 'min', 'max')
+    
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+    
+    def record(self, seconds: float) -> None:
+        """
+        실행 시간 기록
+        
+        Args:
+            seconds: 실행 시간(초)
+        """
+        micros = min(max(int(seconds * 1_000_000), 0), MAX_TRACKABLE_MICROS)
+        index = _bucket_index(micros)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+    
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        백분위 실행 시간 계산
+        
+        Args:
+            percent: 백분위 (0~100)
+        
+        Returns:
+            실행 시간(초) 또는 None (기록이 없는 경우)
+        """
+        if not self.count:
+            return None
+        
+        rank = max(1, int(round(percent / 100 * self.count)))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                value = _bucket_midpoint(index) / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+    
+    def reset(self) -> None:
+        """기록 초기화"""
+        self._counts.clear()
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+
+class RollingWindow:
+    """최근 slots * slot_seconds초 동안의 호출 수/실패 수/실행 시간을 고정 슬롯으로 집계"""
+    
+    __slots__ = ('slot_seconds', '_slots', '_clock')
+    
+    def __init__(
+        self,
+        slot_seconds: int = WINDOW_SLOT_SECONDS,
+        slots: int = WINDOW_SLOTS,
+        clock: Callable[[], float] = time.time
+    ):
+        self.slot_seconds = slot_seconds
+        self._slots: Deque[List[float]] = deque(maxlen=slots)  # [슬롯 시작, 호출 수, 실패 수, 실행 시간 합]
+        self._clock = clock
+    
+    def record(self, seconds: float, success: bool) -> None:
+        """
+        호출 결과 기록
+        
+        Args:
+            seconds: 실행 시간(초)
+            success: 성공 여부
+        """
+        slot_start = self._clock() // self.slot_seconds * self.slot_seconds
+        if not self._slots or self._slots[-1][0] != slot_start:
+            self._slots.append([slot_start, 0, 0, 0.0])
+        
+        slot = self._slots[-1]
+        slot[1] += 1
+        slot[2] += 0 if success else 1
+        slot[3] += seconds
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        최근 구간 통계
+        
+        Returns:
+            구간 길이, 호출 수, 분당 호출 수, 성공률, 평균 실행 시간
+        """
+        window_seconds = self.slot_seconds * self._slots.maxlen
+        oldest = self._clock() - window_seconds
+        calls = failures = 0
+        total = 0.0
+        
+        for slot_start, slot_calls, slot_failures, slot_total in self._slots:
+            if slot_start + self.slot_seconds > oldest:
+                calls += slot_calls
+                failures += slot_failures
+                total += slot_total
+        
+        return {
+            'window_seconds': window_seconds,
+            'call_count': int(calls),
+            'calls_per_minute': calls / (window_seconds / 60),
+            'success_rate': (calls - failures) / calls * 100 if calls else None,
+            'avg_time': total / calls if calls else None
+        }
+    
+    def reset(self) -> None:
+        """기록 초기화"""
+        self._slots.clear()
+
+
+class FunctionMetrics:
+    """함수 하나의 누적 카운터, 히스토그램, 최근 구간 통계"""
+    
+    __slots__ = ('name', 'histogram', 'window', 'error_count', 'recent_calls')
+    
+    def __init__(self, name: str, clock: Callable[[], float] = time.time):
+        self.name = name
+        self.histogram = LatencyHistogram()
+        self.window = RollingWindow(clock=clock)
+        self.error_count = 0
+        self.recent_calls: Deque[Dict[str, Any]] = deque(maxlen=RECENT_CALLS)
+    
+    def record(self, seconds: float, success: bool, error: Optional[str] = None) -> None:
+        """호출 결과 기록"""
+        self.histogram.record(seconds)
+        self.window.record(seconds, success)
+        if not success:
+            self.error_count += 1
+        self.recent_calls.append({
+            'timestamp': datetime.now(),
+            'execution_time': seconds,
+            'success': success,
+            'error': error
+        })
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 통계
+        
+        Returns:
+            호출 수, 성공률, 평균/최소/최대/p50/p95/p99 실행 시간, 최근 구간 통계, 최근 호출
+        """
+        histogram = self.histogram
+        if not histogram.count:
+            return {'function': self.name, 'call_count': 0}
+        
+        return {
+            'function': self.name,
+            'call_count': histogram.count,
+            'error_count': self.error_count,
+            'success_rate': (histogram.count - self.error_count) / histogram.count * 100,
+            'avg_time': histogram.total / histogram.count,
+            'min_time': histogram.min,
+            'max_time': histogram.max,
+            'p50': histogram.percentile(50),
+            'p95': histogram.percentile(95),
+            'p99': histogram.percentile(99),
+            'recent': self.window.summary(),
+            'recent_calls': list(self.recent_calls)
+        }
+    
+    def reset(self) -> None:
+        """기록 초기화"""
+        self.histogram.reset()
+        self.window.reset()
+        self.error_count = 0
+        self.recent_calls.clear()
+
+
+class MetricsRegistry:
+    """함수별 성능 지표를 보관하는 스레드 안전 저장소"""
+    
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """
+        MetricsRegistry 초기화
+        
+        Args:
+            clock: 최근 구간 통계용 시계 함수 (테스트용)
+        """
+        self._metrics: Dict[str, FunctionMetrics] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+    
+    def record(self, name: str, seconds: float, success: bool = True, error: Optional[str] = None) -> None:
+        """
+        호출 결과 기록
+        
+        Args:
+            name: 함수명
+            seconds: 실행 시간(초)
+            success: 성공 여부
+            error: 오류 메시지 (실패한 경우)
+        """
+        with self._lock:
+            metrics = self._metrics.get(name)
+            if metrics is None:
+                metrics = self._metrics[name] = FunctionMetrics(name, self._clock)
+            metrics.record(seconds, success, error)
+    
+    def snapshot(self, name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        통계 조회
+        
+        Args:
+            name: 특정 함수의 통계만 조회할 경우 함수명 (None이면 전체)
+        
+        Returns:
+            함수 통계 딕셔너리 (name 지정 시), 또는 함수명별 통계 딕셔너리
+        """
+        with self._lock:
+            if name is not None:
+                metrics = self._metrics.get(name)
+                return metrics.snapshot() if metrics else {}
+            return {key: metrics.snapshot() for key, metrics in self._metrics.items()}
+    
+    def reset(self, name: Optional[str] = None) -> None:
+        """
+        통계 초기화
+        
+        Args:
+            name: 특정 함수의 통계만 초기화할 경우 함수명 (None이면 전체)
+        """
+        with self._lock:
+            if name is None:
+                self._metrics.clear()
+            elif name in self._metrics:
+                self._metrics[name].reset()
+    
+    def export(self, file_path: Optional[str] = None) -> str:
+        """
+        함수별 통계를 JSON으로 내보내기
+        
+        Args:
+            file_path: 저장할 파일 경로 (None이면 문자열만 반환)
+        
+        Returns:
+            JSON 문자열
+        """
+        data = {
+            'exported_at': datetime.now().isoformat(),
+            'functions': self.snapshot()
+        }
+        content = json.dumps(data, ensure_ascii=False, indent=2, default=str)
+        
+        if file_path:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        
+        return content
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    프로세스 전역 성능 지표 저장소를 반환합니다.
+    
+    Returns:
+        MetricsRegistry 인스턴스
+    """
+    return _registry
@@ -1,10 +1,48 @@
 """
 캘린더 이벤트 데이터 모델
 """
-from dataclasses import dataclass
-from typing import Optional
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
+class EventTimes(NamedTuple):
+    """한 번만 파싱해 두는 이벤트 시간 (POSIX 타임스탬프, 종일 여부)"""
+    
+    start: float
+    end: float
+    all_day: bool
+
+
+@lru_cache(maxsize=65536)
+def parse_event_times(start_time: str, end_time: str, all_day: bool) -> EventTimes:
+    """
+    이벤트 시작/종료 시간 문자열을 타임스탬프로 변환합니다.
+    
+    같은 문자열은 다시 파싱하지 않으므로 캐시 복사본이나 반복 조회에서도 비용이 한 번만 듭니다.
+    시간대 정보가 없는 값(종일 이벤트 날짜 포함)은 로컬 시간으로 해석합니다.
+    
+    Args:
+        start_time: 시작 시간 (ISO 8601 형식)
+        end_time: 종료 시간 (ISO 8601 형식)
+        all_day: 종일 이벤트 여부
+    
+    Returns:
+        EventTimes
+    
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    return EventTimes(
+        datetime.fromisoformat(start_time.replace('Z', '+00:00')).timestamp(),
+        datetime.fromisoformat(end_time.replace('Z', '+00:00')).timestamp(),
+        all_day
+    )
+
 
 @dataclass
 class CalendarEvent:
@@ -17,6 +55,25 @@ class CalendarEvent:
     start_time: str = ""
     end_time: str = ""
     all_day: bool = False
+    time_zone: Optional[str] = None  # IANA 시간대 (반복 일정 전개에 사용)
+    recurrence: Optional[List[str]] = None  # 반복 일정 원본의 RRULE/EXDATE/RDATE 목록
+    recurring_event_id: Optional[str] = None  # 반복 일정 인스턴스의 원본 이벤트 ID
+    original_start_time: Optional[str] = None  # 반복 일정 인스턴스의 원래 시작 시간
+    
+    @property
+    def times(self) -> EventTimes:
+        """
+        시작/종료 타임스탬프 (문자열별로 한 번만 파싱)
+        
+        Raises:
+            ValueError: 시간 형식이 올바르지 않은 경우
+        """
+        return parse_event_times(self.start_time, self.end_time, self.all_day)
+    
+    @property
+    def is_recurring(self) -> bool:
+        """반복 규칙을 가진 원본(master) 이벤트인지 여부"""
+        return bool(self.recurrence)
     
     def __post_init__(self):
         """데이터 검증"""
@@ -45,6 +102,9 @@ class CalendarEvent:
         # summary가 없는 경우 기본값 제공
         summary = google_event.get('summary', '') or '제목 없음'
         
+        # 반복 일정 예외(수정된 인스턴스)의 원래 시작 시간
+        original_start = google_event.get('originalStartTime', {})
+        
         return cls(
             id=google_event.get('id'),
             summary=summary,
@@ -52,9 +112,36 @@ class CalendarEvent:
             location=google_event.get('location'),
             start_time=start_time,
             end_time=end_time,
-            all_day=all_day
+            all_day=all_day,
+            time_zone=start.get('timeZone'),
+            recurrence=google_event.get('recurrence') or None,
+            recurring_event_id=google_event.get('recurringEventId'),
+            original_start_time=original_start.get('date') or original_start.get('dateTime')
         )
     
+    @classmethod
+    def from_google_events(cls, google_events: Iterable[dict]) -> List['CalendarEvent']:
+        """
+        Google Calendar API 응답 항목들을 한 번에 CalendarEvent로 변환
+        
+        변환할 수 없는 항목은 경고를 남기고 건너뜁니다.
+        
+        Args:
+            google_events: Google Calendar API 이벤트 항목들
+        
+        Returns:
+            CalendarEvent 리스트
+        """
+        convert = cls.from_google_event
+        events = []
+        append = events.append
+        for google_event in google_events:
+            try:
+                append(convert(google_event))
+            except ValueError as e:
+                logger.warning(f"이벤트 변환 중 오류 발생: {e}")
+        return events
+    
     def to_google_event(self) -> dict:
         """CalendarEvent를 Google Calendar API 형식으로 변환"""
         event = {
@@ -82,4 +169,19 @@ class CalendarEvent:
                 'timeZone': 'Asia/Seoul'  # 한국 시간대
             }
         
-        return event
\ No newline at end of file
+        if self.recurrence:
+            event['recurrence'] = list(self.recurrence)
+        
+        return event
+
+
+@dataclass
+class CalendarSyncResult:
+    """syncToken 기반 동기화 결과를 나타내는 데이터 클래스"""
+    
+    events: List[CalendarEvent] = field(default_factory=list)
+    deleted_ids: List[str] = field(default_factory=list)
+    # 취소된 반복 일정 인스턴스: (원본 이벤트 ID, 원래 시작 시간)
+    cancelled_occurrences: List[Tuple[str, str]] = field(default_factory=list)
+    next_sync_token: Optional[str] = None
+    full_sync: bool = False  # True면 events가 캘린더 전체 이벤트
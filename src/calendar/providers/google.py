@@ -3,18 +3,22 @@ Google Calendar Provider 구현
 
 이 모듈은 Google Calendar API를 사용하여 캘린더 이벤트를 관리하는 제공자 클래스를 제공합니다.
 """
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import datetime
 import logging
+import time
 from datetime import timezone
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from ..interfaces import CalendarProvider
-from ..models import CalendarEvent
+from ..models import CalendarEvent, CalendarSyncResult
 from ..auth import GoogleAuthService
-from ..utils import retry, measure_performance, format_error_message, batch_execute, _service_pool
+from ..utils import retry, measure_performance, format_error_message, _service_pool
+from ...google_client import build_service
+from ...api_rate_limiter import (
+    ApiRateLimiter, CircuitOpenError, get_rate_limiter, get_retry_after, rate_limited_request_builder
+)
 from ..exceptions import (
     CalendarServiceError,
     EventNotFoundError,
@@ -31,6 +35,12 @@ from ..exceptions import (
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# Google 배치 요청 하나에 담는 최대 요청 수 (Calendar API 권장 상한)
+GOOGLE_BATCH_SIZE = 50
+
+# 배치 하위 요청 중 다시 시도할 오류
+_RETRYABLE_BATCH_ERRORS = (NetworkError, APIQuotaExceededError, RateLimitError, ServerError)
+
 
 class GoogleCalendarProvider(CalendarProvider):
     """Google Calendar API를 사용하는 캘린더 제공자 구현"""
@@ -39,7 +49,8 @@ class GoogleCalendarProvider(CalendarProvider):
         self,
         auth_service: GoogleAuthService = None,
         calendar_id: str = "primary",
-        use_service_pool: bool = True
+        use_service_pool: bool = True,
+        rate_limiter: Optional[ApiRateLimiter] = None
     ):
         """
         GoogleCalendarProvider 초기화
@@ -48,10 +59,12 @@ class GoogleCalendarProvider(CalendarProvider):
             auth_service: Google 인증 서비스 인스턴스
             calendar_id: 사용할 캘린더 ID (기본값: "primary")
             use_service_pool: 서비스 객체 풀 사용 여부 (기본값: True)
+            rate_limiter: API 속도 제한기 (기본값: 프로세스 전역 "calendar" 제한기)
         """
         self.auth_service = auth_service or GoogleAuthService()
         self.calendar_id = calendar_id
         self.use_service_pool = use_service_pool
+        self.rate_limiter = rate_limiter or get_rate_limiter("calendar")
         self._service = None
         self._service_key = f"google_calendar_{calendar_id}"
     
@@ -69,17 +82,28 @@ class GoogleCalendarProvider(CalendarProvider):
         if self.use_service_pool:
             # 서비스 객체 풀 사용
             def create_service():
-                creds = self.auth_service.get_credentials()
-                return build("calendar", "v3", credentials=creds)
+                return self._build_service()
             
             return _service_pool.get_service(self._service_key, create_service)
         else:
             # 기존 방식 (인스턴스별 캐싱)
             if not self._service:
-                creds = self.auth_service.get_credentials()
-                self._service = build("calendar", "v3", credentials=creds)
+                self._service = self._build_service()
             return self._service
     
+    def _build_service(self):
+        """
+        캐시된 디스커버리 문서와 공유 HTTP 연결로, 속도 제한기를 거쳐 요청을 실행하는 서비스 객체를 생성합니다.
+        
+        재시도는 메서드의 @retry가 담당하므로 요청 단위로는 한 번만 시도합니다.
+        """
+        creds = self.auth_service.get_credentials()
+        return build_service(
+            "calendar", "v3",
+            credentials=creds,
+            requestBuilder=rate_limited_request_builder(self.rate_limiter, max_tries=1)
+        )
+    
     @retry(max_tries=3, delay=1.0, backoff_factor=2.0)
     @measure_performance
     def list_events(self, start_time: str, end_time: str) -> List[CalendarEvent]:
@@ -115,16 +139,8 @@ class GoogleCalendarProvider(CalendarProvider):
                     pageToken=page_token
                 ).execute()
                 
-                items = events_result.get("items", [])
-                
-                # Google API 응답을 CalendarEvent 객체로 변환
-                for item in items:
-                    try:
-                        event = CalendarEvent.from_google_event(item)
-                        all_events.append(event)
-                    except ValueError as e:
-                        # 개별 이벤트 변환 오류는 건너뛰고 계속 진행
-                        logger.warning(f"이벤트 변환 중 오류 발생: {e}")
+                # Google API 응답을 CalendarEvent 객체로 일괄 변환 (변환 오류 항목은 건너뜀)
+                all_events.extend(CalendarEvent.from_google_events(events_result.get("items", [])))
                 
                 # 다음 페이지가 있는지 확인
                 page_token = events_result.get('nextPageToken')
@@ -141,6 +157,93 @@ class GoogleCalendarProvider(CalendarProvider):
             logger.error(f"이벤트 목록 조회 실패: {error_msg}")
             raise CalendarServiceError(error_msg, e)
     
+    @retry(max_tries=3, delay=1.0, backoff_factor=2.0)
+    @measure_performance
+    def sync_events(self, sync_token: Optional[str] = None) -> CalendarSyncResult:
+        """
+        syncToken을 사용해 마지막 동기화 이후 변경된 이벤트만 조회합니다.
+        
+        sync_token이 없거나 만료된 경우(410 Gone) 전체 동기화를 수행합니다.
+        
+        Args:
+            sync_token: 이전 동기화에서 받은 nextSyncToken (선택 사항)
+            
+        Returns:
+            변경/삭제된 이벤트와 다음 syncToken을 담은 동기화 결과
+            
+        Raises:
+            CalendarServiceError: 동기화 실패 시
+        """
+        try:
+            service = self._get_service()
+            
+            try:
+                return self._fetch_sync_pages(service, sync_token)
+            except HttpError as e:
+                if sync_token and e.status_code == 410:
+                    logger.info("동기화 토큰이 만료되어 전체 동기화를 수행합니다")
+                    return self._fetch_sync_pages(service, None)
+                raise
+            
+        except HttpError as e:
+            self._handle_http_error(e, "이벤트 동기화 중 오류가 발생했습니다")
+        except Exception as e:
+            error_msg = format_error_message(e, "이벤트 동기화 중 예상치 못한 오류가 발생했습니다")
+            logger.error(f"이벤트 동기화 실패: {error_msg}")
+            raise CalendarServiceError(error_msg, e)
+    
+    def _fetch_sync_pages(self, service, sync_token: Optional[str]) -> CalendarSyncResult:
+        """
+        동기화 요청의 모든 페이지를 가져옵니다.
+        
+        Args:
+            service: Google Calendar API 서비스 객체
+            sync_token: 증분 동기화 토큰 (None이면 전체 동기화)
+            
+        Returns:
+            동기화 결과
+        """
+        result = CalendarSyncResult(full_sync=sync_token is None)
+        page_token = None
+        
+        logger.info(f"캘린더 이벤트 {'전체' if sync_token is None else '증분'} 동기화 시작")
+        
+        while True:
+            # 반복 일정은 원본(master)과 예외 인스턴스만 받고 전개는 로컬에서 수행
+            params = {
+                "calendarId": self.calendar_id,
+                "singleEvents": False,
+                "pageToken": page_token
+            }
+            # syncToken은 timeMin/timeMax/orderBy와 함께 사용할 수 없음
+            if sync_token:
+                params["syncToken"] = sync_token
+            
+            events_result = service.events().list(**params).execute()
+            
+            active_items = []
+            for item in events_result.get("items", []):
+                if item.get("status") != "cancelled":
+                    active_items.append(item)
+                    continue
+                result.deleted_ids.append(item.get("id"))
+                original_start = item.get("originalStartTime", {})
+                original_start = original_start.get("date") or original_start.get("dateTime")
+                if item.get("recurringEventId") and original_start:
+                    result.cancelled_occurrences.append((item["recurringEventId"], original_start))
+            
+            result.events.extend(CalendarEvent.from_google_events(active_items))
+            
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                result.next_sync_token = events_result.get("nextSyncToken")
+                break
+        
+        logger.info(
+            f"캘린더 이벤트 동기화 완료: 변경 {len(result.events)}개, 삭제 {len(result.deleted_ids)}개"
+        )
+        return result
+    
     @retry(max_tries=3, delay=1.0, backoff_factor=2.0)
     @measure_performance
     def create_event(self, event: CalendarEvent) -> CalendarEvent:
@@ -359,15 +462,10 @@ class GoogleCalendarProvider(CalendarProvider):
             TimeoutError: 요청 시간 초과 시
             CalendarServiceError: 기타 오류
         """
-        # 응답 헤더에서 Retry-After 값 추출
-        retry_after = None
-        if hasattr(error, 'resp') and hasattr(error.resp, 'headers'):
-            retry_after_header = error.resp.headers.get('Retry-After')
-            if retry_after_header:
-                try:
-                    retry_after = int(retry_after_header)
-                except (ValueError, TypeError):
-                    pass
+        # 응답 헤더에서 Retry-After 값 추출 (httplib2 응답은 헤더 딕셔너리 자체)
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            retry_after = int(retry_after)
         
         error_reason = None
         if hasattr(error, 'reason'):
@@ -404,32 +502,33 @@ class GoogleCalendarProvider(CalendarProvider):
     def create_events_batch(
         self,
         events: List[CalendarEvent],
-        batch_size: int = 10
+        batch_size: int = GOOGLE_BATCH_SIZE
     ) -> List[Optional[CalendarEvent]]:
         """
-        여러 이벤트를 배치로 생성합니다.
+        여러 이벤트를 Google 배치 요청으로 생성합니다.
         
         Args:
             events: 생성할 이벤트들의 리스트
-            batch_size: 배치 크기 (기본값: 10)
+            batch_size: 배치 요청 하나에 담을 요청 수 (최대 50)
             
         Returns:
             생성된 이벤트들의 리스트 (실패한 경우 None)
         """
         logger.info(f"배치 이벤트 생성 시작: {len(events)}개 이벤트")
         
-        def create_single_event(event: CalendarEvent) -> Optional[CalendarEvent]:
+        bodies = []
+        for event in events:
             try:
-                return self.create_event(event)
-            except Exception as e:
-                logger.error(f"배치 이벤트 생성 실패: {e}")
-                return None
+                bodies.append(event.to_google_event())
+            except (ValueError, AttributeError) as e:
+                logger.error(f"배치 이벤트 생성 실패: 이벤트 데이터가 올바르지 않습니다: {e}")
+                bodies.append(None)
+        
+        def build_request(service, body):
+            return service.events().insert(calendarId=self.calendar_id, body=body)
         
-        results = batch_execute(
-            create_single_event,
-            events,
-            batch_size=batch_size,
-            delay_between_batches=0.2  # API 속도 제한 방지
+        results = self._run_event_batch(
+            bodies, build_request, batch_size, "생성"
         )
         
         success_count = sum(1 for r in results if r is not None)
@@ -441,33 +540,37 @@ class GoogleCalendarProvider(CalendarProvider):
     def update_events_batch(
         self,
         event_updates: List[tuple],  # (event_id, CalendarEvent) 튜플들
-        batch_size: int = 10
+        batch_size: int = GOOGLE_BATCH_SIZE
     ) -> List[Optional[CalendarEvent]]:
         """
-        여러 이벤트를 배치로 수정합니다.
+        여러 이벤트를 Google 배치 요청으로 수정합니다.
+        
+        개별 수정과 달리 사전 존재 확인 없이 수정 요청을 보내며,
+        존재하지 않는 이벤트는 404 응답으로 실패 처리됩니다.
         
         Args:
             event_updates: (event_id, CalendarEvent) 튜플들의 리스트
-            batch_size: 배치 크기 (기본값: 10)
+            batch_size: 배치 요청 하나에 담을 요청 수 (최대 50)
             
         Returns:
             수정된 이벤트들의 리스트 (실패한 경우 None)
         """
         logger.info(f"배치 이벤트 수정 시작: {len(event_updates)}개 이벤트")
         
-        def update_single_event(update_tuple: tuple) -> Optional[CalendarEvent]:
+        updates = []
+        for event_id, event in event_updates:
             try:
-                event_id, event = update_tuple
-                return self.update_event(event_id, event)
-            except Exception as e:
-                logger.error(f"배치 이벤트 수정 실패: {e}")
-                return None
+                updates.append((event_id, event.to_google_event()))
+            except (ValueError, AttributeError) as e:
+                logger.error(f"배치 이벤트 수정 실패: 이벤트 데이터가 올바르지 않습니다: {e}")
+                updates.append(None)
+        
+        def build_request(service, update):
+            event_id, body = update
+            return service.events().update(calendarId=self.calendar_id, eventId=event_id, body=body)
         
-        results = batch_execute(
-            update_single_event,
-            event_updates,
-            batch_size=batch_size,
-            delay_between_batches=0.2
+        results = self._run_event_batch(
+            updates, build_request, batch_size, "수정"
         )
         
         success_count = sum(1 for r in results if r is not None)
@@ -479,33 +582,27 @@ class GoogleCalendarProvider(CalendarProvider):
     def delete_events_batch(
         self,
         event_ids: List[str],
-        batch_size: int = 10
+        batch_size: int = GOOGLE_BATCH_SIZE
     ) -> List[bool]:
         """
-        여러 이벤트를 배치로 삭제합니다.
+        여러 이벤트를 Google 배치 요청으로 삭제합니다.
         
         Args:
             event_ids: 삭제할 이벤트 ID들의 리스트
-            batch_size: 배치 크기 (기본값: 10)
+            batch_size: 배치 요청 하나에 담을 요청 수 (최대 50)
             
         Returns:
             각 이벤트의 삭제 성공 여부 리스트
         """
         logger.info(f"배치 이벤트 삭제 시작: {len(event_ids)}개 이벤트")
         
-        def delete_single_event(event_id: str) -> bool:
-            try:
-                return self.delete_event(event_id)
-            except Exception as e:
-                logger.error(f"배치 이벤트 삭제 실패: {e}")
-                return False
-        
-        results = batch_execute(
-            delete_single_event,
-            event_ids,
-            batch_size=batch_size,
-            delay_between_batches=0.2
-        )
+        def build_request(service, event_id):
+            return service.events().delete(calendarId=self.calendar_id, eventId=event_id)
+        
+        _, errors = self.execute_batch(event_ids, build_request, batch_size)
+        self._log_batch_errors(errors, "삭제")
+        
+        results = [index not in errors for index in range(len(event_ids))]
         
         success_count = sum(1 for r in results if r)
         logger.info(f"배치 이벤트 삭제 완료: {success_count}/{len(event_ids)}개 성공")
@@ -516,39 +613,190 @@ class GoogleCalendarProvider(CalendarProvider):
     def get_events_batch(
         self,
         event_ids: List[str],
-        batch_size: int = 10
+        batch_size: int = GOOGLE_BATCH_SIZE
     ) -> List[Optional[CalendarEvent]]:
         """
-        여러 이벤트를 배치로 조회합니다.
+        여러 이벤트를 Google 배치 요청으로 조회합니다.
         
         Args:
             event_ids: 조회할 이벤트 ID들의 리스트
-            batch_size: 배치 크기 (기본값: 10)
+            batch_size: 배치 요청 하나에 담을 요청 수 (최대 50)
             
         Returns:
-            조회된 이벤트들의 리스트 (실패한 경우 None)
+            조회된 이벤트들의 리스트 (실패하거나 존재하지 않는 경우 None)
         """
         logger.info(f"배치 이벤트 조회 시작: {len(event_ids)}개 이벤트")
         
-        def get_single_event(event_id: str) -> Optional[CalendarEvent]:
-            try:
-                return self.get_event(event_id)
-            except Exception as e:
-                logger.error(f"배치 이벤트 조회 실패: {e}")
-                return None
+        def build_request(service, event_id):
+            return service.events().get(calendarId=self.calendar_id, eventId=event_id)
         
-        results = batch_execute(
-            get_single_event,
-            event_ids,
-            batch_size=batch_size,
-            delay_between_batches=0.1  # 조회는 더 빠르게
+        responses, errors = self.execute_batch(event_ids, build_request, batch_size)
+        
+        # 존재하지 않는 이벤트는 단건 조회와 같이 오류 없이 None으로 처리
+        missing = {index for index, error in errors.items() if isinstance(error, EventNotFoundError)}
+        self._log_batch_errors(
+            {index: error for index, error in errors.items() if index not in missing}, "조회"
         )
+        results = self._to_events(responses, errors)
         
         success_count = sum(1 for r in results if r is not None)
         logger.info(f"배치 이벤트 조회 완료: {success_count}/{len(event_ids)}개 성공")
         
         return results
     
+    def execute_batch(
+        self,
+        items: List[Any],
+        build_request: Callable[[Any, Any], Any],
+        batch_size: int = GOOGLE_BATCH_SIZE,
+        max_tries: int = 3,
+        delay: float = 1.0,
+        backoff_factor: float = 2.0
+    ) -> Tuple[List[Any], Dict[int, CalendarServiceError]]:
+        """
+        항목별 API 요청을 Google 배치 HTTP 요청으로 묶어 실행합니다.
+        
+        요청은 최대 50개씩 하나의 HTTP 요청으로 전송되며, 개별 요청의 오류는
+        기존 예외 클래스로 변환됩니다. 재시도 가능한 오류(네트워크, 할당량, 속도 제한, 서버 오류)가
+        발생한 요청만 모아 지수 백오프 후 다시 전송합니다.
+        
+        Args:
+            items: 요청을 만들 항목들의 리스트 (None인 항목은 건너뜀)
+            build_request: (service, item)을 받아 실행 전 API 요청 객체를 반환하는 함수
+            batch_size: 배치 요청 하나에 담을 요청 수 (최대 50)
+            max_tries: 실패한 요청의 최대 시도 횟수 (기본값: 3)
+            delay: 첫 재시도 전 대기 시간(초) (기본값: 1.0)
+            backoff_factor: 대기 시간 증가 계수 (기본값: 2.0)
+            
+        Returns:
+            (항목 순서의 응답 리스트, 실패한 항목 인덱스별 예외) 튜플
+        """
+        batch_size = max(1, min(batch_size, GOOGLE_BATCH_SIZE))
+        responses: List[Any] = [None] * len(items)
+        errors: Dict[int, CalendarServiceError] = {}
+        pending = [index for index, item in enumerate(items) if item is not None]
+        
+        if not pending:
+            return responses, errors
+        
+        service = self._get_service()
+        current_delay = delay
+        
+        for attempt in range(1, max_tries + 1):
+            for chunk_start in range(0, len(pending), batch_size):
+                chunk = pending[chunk_start:chunk_start + batch_size]
+                self._execute_batch_chunk(service, items, chunk, build_request, responses, errors)
+            
+            pending = [
+                index for index in pending
+                if isinstance(errors.get(index), _RETRYABLE_BATCH_ERRORS)
+            ]
+            if not pending or attempt >= max_tries:
+                break
+            
+            # Retry-After 헤더가 있으면 그 값을 우선 적용
+            retry_after = max((getattr(errors[index], 'retry_after', None) or 0) for index in pending)
+            wait_time = max(current_delay, retry_after)
+            logger.warning(
+                f"배치 요청 중 {len(pending)}개 실패, {attempt}/{max_tries}번째 시도, "
+                f"{wait_time:.2f}초 후 실패한 요청만 재시도합니다."
+            )
+            time.sleep(wait_time)
+            current_delay *= backoff_factor
+        
+        return responses, errors
+    
+    def _execute_batch_chunk(
+        self,
+        service,
+        items: List[Any],
+        chunk: List[int],
+        build_request: Callable[[Any, Any], Any],
+        responses: List[Any],
+        errors: Dict[int, CalendarServiceError]
+    ) -> None:
+        """배치 HTTP 요청 하나를 실행하고 항목별 응답/오류를 기록합니다."""
+        def callback(request_id, response, exception):
+            index = int(request_id)
+            self.rate_limiter.record_response(exception)
+            if exception is None:
+                responses[index] = response
+                errors.pop(index, None)
+            else:
+                errors[index] = self._map_batch_error(exception)
+        
+        batch = service.new_batch_http_request(callback=callback)
+        for index in chunk:
+            batch.add(build_request(service, items[index]), request_id=str(index))
+        
+        try:
+            # Google은 배치 안의 하위 요청을 각각 할당량에 반영하므로 요청 수만큼 토큰 사용
+            self.rate_limiter.acquire(len(chunk))
+            batch.execute()
+        except Exception as e:
+            # 토큰을 얻은 뒤 실패했으면 결과를 기록해 서킷 브레이커의 시험 요청을 정리
+            if not isinstance(e, CircuitOpenError):
+                self.rate_limiter.record_response(e)
+            
+            # 배치 요청 자체가 실패하면 포함된 모든 요청을 같은 오류로 처리
+            error = self._map_batch_error(e)
+            logger.error(f"배치 요청 실패 ({len(chunk)}개 요청): {error}")
+            for index in chunk:
+                errors[index] = error
+    
+    def _map_batch_error(self, error: Exception) -> CalendarServiceError:
+        """배치 하위 요청의 오류를 캘린더 서비스 예외로 변환합니다."""
+        if isinstance(error, CalendarServiceError):
+            return error
+        if isinstance(error, HttpError):
+            try:
+                self._handle_http_error(error, "배치 요청 처리 중 오류가 발생했습니다")
+            except CalendarServiceError as mapped:
+                return mapped
+        if isinstance(error, (ConnectionError, OSError)):
+            return NetworkError(format_error_message(error, "네트워크 연결에 문제가 발생했습니다"), error)
+        return CalendarServiceError(format_error_message(error, "배치 요청 처리 중 오류가 발생했습니다"), error)
+    
+    def _run_event_batch(
+        self,
+        items: List[Any],
+        build_request: Callable[[Any, Any], Any],
+        batch_size: int,
+        action: str
+    ) -> List[Optional[CalendarEvent]]:
+        """이벤트를 반환하는 배치 요청을 실행하고 응답을 CalendarEvent로 변환합니다."""
+        responses, errors = self.execute_batch(items, build_request, batch_size)
+        self._log_batch_errors(errors, action)
+        return self._to_events(responses, errors)
+    
+    def _to_events(
+        self,
+        responses: List[Any],
+        errors: Dict[int, CalendarServiceError]
+    ) -> List[Optional[CalendarEvent]]:
+        """배치 응답을 CalendarEvent 리스트로 변환합니다 (실패한 경우 None)."""
+        results: List[Optional[CalendarEvent]] = []
+        for index, response in enumerate(responses):
+            if index in errors or not response:
+                results.append(None)
+                continue
+            try:
+                results.append(CalendarEvent.from_google_event(response))
+            except ValueError as e:
+                logger.warning(f"이벤트 변환 중 오류 발생: {e}")
+                results.append(None)
+        return results
+    
+    def _log_batch_errors(
+        self,
+        errors: Dict[int, CalendarServiceError],
+        action: str
+    ) -> None:
+        """배치 하위 요청의 실패를 항목별로 기록합니다."""
+        for index in sorted(errors):
+            error = errors[index]
+            logger.error(f"배치 {action} 실패 (항목 {index}): {type(error).__name__}: {error}")
+    
     def get_service_pool_stats(self) -> dict:
         """
         서비스 객체 풀의 현재 상태를 반환합니다.
@@ -0,0 +1,381 @@
+"""
+반복 일정 전개 엔진
+
+이 모듈은 반복 일정 원본(master)을 한 번만 저장하고 조회 기간마다 RRULE/EXDATE/RDATE를 로컬에서 전개합니다.
+취소되거나 수정된 인스턴스(예외)는 전개 결과에서 제외하며, 전개한 기간은 LRU 방식으로 캐시합니다.
+전개한 인스턴스 ID는 Google Calendar 형식({원본 ID}_{UTC 시작 시각})을 따르므로 그대로 수정/삭제 요청에 사용할 수 있습니다.
+"""
+import logging
+import math
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from dateutil.rrule import rrulestr
+
+from .models import CalendarEvent
+from .interval_index import IntervalIndex
+from .utils import to_timestamp
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# (시작 타임스탬프, 종료 타임스탬프, 인스턴스)
+Occurrence = Tuple[float, float, CalendarEvent]
+
+_UNTIL_PATTERN = re.compile(r'UNTIL=(\d{8})(T\d{6})?(Z?)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _zone(name: Optional[str]) -> Optional[tzinfo]:
+    """IANA 시간대 이름을 tzinfo로 변환 (알 수 없으면 None)"""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"알 수 없는 시간대: {name}")
+        return None
+
+
+def _parse_datetime(value: str, all_day: bool, zone: Optional[tzinfo]) -> datetime:
+    """
+    이벤트 시간 문자열을 전개 기준 datetime으로 변환
+    
+    종일 일정은 시간대 없는 자정 값(로컬 시간), 시간 지정 일정은 이벤트 시간대의 값으로 변환합니다.
+    """
+    if all_day:
+        return datetime.combine(date.fromisoformat(value[:10]), time())
+    
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        # 시간대 정보가 없으면 to_timestamp와 같이 로컬 시간으로 해석
+        dt = dt.astimezone()
+    return dt.astimezone(zone) if zone else dt
+
+
+def _normalize_until(line: str, dtstart: datetime) -> str:
+    """
+    RRULE의 UNTIL 값을 시작 시간의 시간대 유무에 맞춥니다.
+    
+    dateutil은 시간대가 있는 시작 시간에는 UTC UNTIL만, 시간대 없는 시작 시간에는 시간대 없는 UNTIL만 허용합니다.
+    """
+    if not line.upper().startswith(('RRULE', 'EXRULE')):
+        return line
+    
+    def convert(match: 're.Match') -> str:
+        day, clock, utc = match.group(1), match.group(2), match.group(3)
+        if dtstart.tzinfo is None and utc:
+            until = datetime.strptime(day + (clock or 'T000000'), '%Y%m%dT%H%M%S')
+            until = until.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+            return f"UNTIL={until:%Y%m%dT%H%M%S}"
+        if dtstart.tzinfo is not None and not utc:
+            # 날짜만 있는 UNTIL은 해당 날짜의 끝까지 포함
+            until = datetime.strptime(day + (clock or 'T235959'), '%Y%m%dT%H%M%S')
+            until = until.replace(tzinfo=dtstart.tzinfo).astimezone(timezone.utc)
+            return f"UNTIL={until:%Y%m%dT%H%M%SZ}"
+        return match.group(0)
+    
+    return _UNTIL_PATTERN.sub(convert, line)
+
+
+def _is_finite(recurrence: List[str]) -> bool:
+    """모든 RRULE에 COUNT 또는 UNTIL이 있는지 (전개 결과가 유한한지)"""
+    for line in recurrence:
+        upper = line.upper()
+        if upper.startswith('RRULE') and 'COUNT=' not in upper and 'UNTIL=' not in upper:
+            return False
+    return True
+
+
+class _Series:
+    """전개 준비를 마친 반복 일정 원본"""
+    
+    __slots__ = ('master', 'rules', 'duration', 'first_start', 'span_end')
+    
+    def __init__(self, master: CalendarEvent):
+        zone = None if master.all_day else _zone(master.time_zone)
+        dtstart = _parse_datetime(master.start_time, master.all_day, zone)
+        dtend = _parse_datetime(master.end_time, master.all_day, zone)
+        
+        self.master = master
+        self.duration = dtend - dtstart
+        self.rules = rrulestr(
+            "\n".join(_normalize_until(line, dtstart) for line in master.recurrence),
+            dtstart=dtstart,
+            forceset=True
+        )
+        
+        # 시간대가 섞인 EXDATE/RDATE 등은 순회할 때 오류가 나므로 등록 시점에 확인
+        first = next(iter(self.rules), None)
+        self.first_start = first.timestamp() if first else None
+        
+        self.span_end = math.inf
+        if first and _is_finite(master.recurrence):
+            last = first
+            for last in self.rules:
+                pass
+            self.span_end = (last + self.duration).timestamp()
+            if not self.duration:
+                # 길이가 0인 마지막 인스턴스도 구간 색인에서 조회되도록 끝을 조금 늘림
+                self.span_end = math.nextafter(self.span_end, math.inf)
+    
+    def occurrences(self, start: float, end: float) -> List[datetime]:
+        """[start, end)와 겹치는 인스턴스 시작 시간 목록 (길이가 0인 인스턴스는 start에 시작해도 포함)"""
+        after = self._to_rule_time(start) - self.duration
+        before = self._to_rule_time(end)
+        return [
+            occurrence for occurrence in self.rules.between(after, before, inc=True)
+            if occurrence < before and (occurrence > after or not self.duration)
+        ]
+    
+    def _to_rule_time(self, timestamp: float) -> datetime:
+        """타임스탬프를 전개 기준 시간대의 datetime으로 변환"""
+        if self.master.all_day:
+            return datetime.fromtimestamp(timestamp)
+        return datetime.fromtimestamp(timestamp, timezone.utc)
+    
+    def instance(self, occurrence_start: datetime) -> CalendarEvent:
+        """인스턴스 시작 시간으로 CalendarEvent 생성"""
+        master = self.master
+        occurrence_end = occurrence_start + self.duration
+        
+        if master.all_day:
+            start_time = occurrence_start.date().isoformat()
+            end_time = occurrence_end.date().isoformat()
+            suffix = f"{occurrence_start:%Y%m%d}"
+        else:
+            start_time = occurrence_start.isoformat()
+            end_time = occurrence_end.isoformat()
+            suffix = f"{occurrence_start.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+        
+        return CalendarEvent(
+            id=f"{master.id}_{suffix}",
+            summary=master.summary,
+            description=master.description,
+            location=master.location,
+            start_time=start_time,
+            end_time=end_time,
+            all_day=master.all_day,
+            time_zone=master.time_zone,
+            recurring_event_id=master.id,
+            original_start_time=start_time
+        )
+
+
+class RecurrenceExpander:
+    """
+    반복 일정 원본 저장소 및 기간별 전개기
+    
+    원본은 ID별로 한 번만 보관하고, 조회 시 구간 트리로 기간과 겹치는 원본만 골라 전개합니다.
+    예외(취소/수정된 인스턴스)는 (원본 ID, 원래 시작 시각)으로 보관하며 원본보다 먼저 등록되어도 적용됩니다.
+    원본이나 예외가 바뀌면 전개 결과 캐시를 모두 비웁니다.
+    """
+    
+    def __init__(self, max_windows: int = 128):
+        """
+        RecurrenceExpander 초기화
+        
+        Args:
+            max_windows: 전개 결과를 캐시할 최대 조회 기간 수
+        """
+        self.max_windows = max_windows
+        self._lock = threading.RLock()
+        
+        self._series: Dict[str, _Series] = {}
+        self._spans: IntervalIndex[str] = IntervalIndex()
+        self._exceptions: Dict[str, Set[float]] = {}
+        
+        self._windows: 'OrderedDict[Tuple[float, float], List[Occurrence]]' = OrderedDict()
+        self._stats = {'expansions': 0, 'window_hits': 0, 'window_misses': 0}
+    
+    def __len__(self) -> int:
+        return len(self._series)
+    
+    def __contains__(self, master_id: object) -> bool:
+        return master_id in self._series
+    
+    def add(self, master: CalendarEvent) -> bool:
+        """
+        반복 일정 원본 추가 (같은 ID가 있으면 교체)
+        
+        Args:
+            master: recurrence가 있는 원본 이벤트
+        
+        Returns:
+            등록 여부 (반복 규칙을 해석할 수 없으면 False)
+        """
+        if not master.id or not master.recurrence:
+            return False
+        
+        try:
+            series = _Series(master)
+        except (ValueError, TypeError, OverflowError) as e:
+            logger.warning(f"반복 규칙을 해석할 수 없는 이벤트: ID={master.id}, {e}")
+            self.remove(master.id)
+            return False
+        
+        with self._lock:
+            self._series[master.id] = series
+            if series.first_start is None:
+                self._spans.remove(master.id)
+            else:
+                self._spans.add(master.id, series.first_start, series.span_end)
+            self._windows.clear()
+        return True
+    
+    def remove(self, master_id: str) -> bool:
+        """
+        반복 일정 원본과 예외 제거
+        
+        Args:
+            master_id: 원본 이벤트 ID
+        
+        Returns:
+            원본이 있었는지 여부
+        """
+        with self._lock:
+            removed = self._series.pop(master_id, None) is not None
+            had_exceptions = self._exceptions.pop(master_id, None) is not None
+            if removed or had_exceptions:
+                self._spans.remove(master_id)
+                self._windows.clear()
+            return removed
+    
+    def add_exception(self, master_id: str, original_start: str) -> None:
+        """
+        전개에서 제외할 인스턴스 등록 (취소되었거나 별도 이벤트로 수정된 인스턴스)
+        
+        Args:
+            master_id: 원본 이벤트 ID
+            original_start: 인스턴스의 원래 시작 시간 (ISO 8601 형식)
+        """
+        try:
+            key = to_timestamp(original_start)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"반복 일정 예외의 시작 시간 형식 오류: ID={master_id}, {e}")
+            return
+        
+        with self._lock:
+            self._exceptions.setdefault(master_id, set()).add(key)
+            self._windows.clear()
+    
+    def exclude_instance(self, instance_id: str) -> bool:
+        """
+        인스턴스 ID로 전개에서 제외할 인스턴스 등록 (로컬에서 삭제한 인스턴스 반영)
+        
+        Args:
+            instance_id: 전개된 인스턴스 ID
+        
+        Returns:
+            제외 여부 (해당 인스턴스가 없으면 False)
+        """
+        occurrence = self.get_instance(instance_id)
+        if occurrence is None:
+            return False
+        self.add_exception(occurrence.recurring_event_id, occurrence.original_start_time)
+        return True
+    
+    def clear(self) -> None:
+        """모든 원본, 예외, 전개 결과 제거"""
+        with self._lock:
+            self._series.clear()
+            self._spans.clear()
+            self._exceptions.clear()
+            self._windows.clear()
+    
+    def expand(self, start: float, end: float) -> List[Occurrence]:
+        """
+        [start, end)와 겹치는 인스턴스 전개
+        
+        Args:
+            start: 조회 구간 시작 타임스탬프
+            end: 조회 구간 종료 타임스탬프 (포함하지 않음)
+        
+        Returns:
+            시작 시간 순으로 정렬된 (시작, 종료, 인스턴스) 튜플 목록
+        """
+        key = (start, end)
+        with self._lock:
+            cached = self._windows.get(key)
+            if cached is not None:
+                self._windows.move_to_end(key)
+                self._stats['window_hits'] += 1
+                return list(cached)
+            
+            self._stats['window_misses'] += 1
+            occurrences: List[Occurrence] = []
+            for _, _, master_id in self._spans.overlapping(start, end):
+                occurrences.extend(self._expand_series(master_id, start, end))
+            occurrences.sort(key=lambda occurrence: occurrence[0])
+            
+            self._windows[key] = occurrences
+            if len(self._windows) > self.max_windows:
+                self._windows.popitem(last=False)
+            return list(occurrences)
+    
+    def get_instance(self, instance_id: str) -> Optional[CalendarEvent]:
+        """
+        인스턴스 ID로 전개된 인스턴스 조회
+        
+        Args:
+            instance_id: {원본 ID}_{YYYYMMDD} 또는 {원본 ID}_{YYYYMMDDTHHMMSSZ} 형식의 ID
+        
+        Returns:
+            CalendarEvent 또는 None (원본이 없거나 예외로 제외된 인스턴스인 경우)
+        """
+        master_id, _, suffix = instance_id.rpartition('_')
+        with self._lock:
+            series = self._series.get(master_id)
+            if series is None:
+                return None
+            
+            try:
+                if series.master.all_day:
+                    timestamp = datetime.strptime(suffix, '%Y%m%d').timestamp()
+                else:
+                    timestamp = datetime.strptime(suffix, '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc).timestamp()
+            except ValueError:
+                return None
+            
+            for occurrence_start, _, occurrence in self._expand_series(master_id, timestamp, timestamp + 1):
+                if occurrence_start == timestamp:
+                    return occurrence
+            return None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        전개기 상태
+        
+        Returns:
+            원본 수, 예외 수, 캐시된 기간 수, 전개/캐시 적중 횟수
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                'series': len(self._series),
+                'exceptions': sum(len(starts) for starts in self._exceptions.values()),
+                'cached_windows': len(self._windows)
+            }
+    
+    def _expand_series(self, master_id: str, start: float, end: float) -> List[Occurrence]:
+        """원본 하나를 기간에 맞게 전개하고 예외를 제외합니다."""
+        series = self._series[master_id]
+        excluded = self._exceptions.get(master_id, ())
+        self._stats['expansions'] += 1
+        
+        occurrences = []
+        for occurrence_start in series.occurrences(start, end):
+            timestamp = occurrence_start.timestamp()
+            if timestamp in excluded:
+                continue
+            occurrences.append((
+                timestamp,
+                (occurrence_start + series.duration).timestamp(),
+                series.instance(occurrence_start)
+            ))
+        return occurrences
@@ -5,16 +5,21 @@
 """
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Tuple
 
 from .interfaces import CalendarProvider
 from .models import CalendarEvent
-from .utils import measure_performance, retry, format_error_message, get_performance_stats, check_performance_threshold
+from .event_cache import CalendarEventCache
+from .interval_index import IntervalIndex
+from .utils import measure_performance, retry, format_error_message, to_timestamp
+from .metrics import get_metrics_registry
+from .formatting import KST, format_event_for_display
 from .exceptions import (
     CalendarServiceError,
     EventNotFoundError,
     InvalidEventDataError
 )
+from ..api_rate_limiter import get_rate_limiter_metrics
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -27,14 +32,16 @@ class CalendarService:
     이 클래스는 캘린더 제공자를 추상화하고 사용자 친화적인 인터페이스를 제공합니다.
     """
     
-    def __init__(self, provider: CalendarProvider):
+    def __init__(self, provider: CalendarProvider, event_cache: Optional[CalendarEventCache] = None):
         """
         CalendarService 초기화
         
         Args:
             provider: 사용할 캘린더 제공자 인스턴스
+            event_cache: 기간/상세 조회에 사용할 로컬 이벤트 캐시 (선택 사항)
         """
         self.provider = provider
+        self.event_cache = event_cache
     
     @measure_performance
     def get_events_for_period(
@@ -64,7 +71,10 @@ class CalendarService:
             
             logger.info(f"기간 내 이벤트 조회: {start_time} ~ {end_time}")
             
-            events = self.provider.list_events(start_time, end_time)
+            if self.event_cache:
+                events = self.event_cache.list_events(start_time, end_time)
+            else:
+                events = self.provider.list_events(start_time, end_time)
             
             if format_response:
                 return [self._format_event_for_display(event) for event in events]
@@ -118,6 +128,78 @@ class CalendarService:
         
         return self.get_events_for_period(now, end_date, format_response)
     
+    @measure_performance
+    def count_events_for_period(
+        self,
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime]
+    ) -> int:
+        """
+        특정 기간의 이벤트 수를 조회합니다 (이벤트 변환/형식 변환 없음).
+        
+        Args:
+            start_date: 조회 시작 날짜 (ISO 8601 문자열 또는 datetime 객체)
+            end_date: 조회 종료 날짜 (ISO 8601 문자열 또는 datetime 객체)
+            
+        Returns:
+            이벤트 수
+            
+        Raises:
+            CalendarServiceError: 조회 실패 시
+        """
+        try:
+            start_time = self._format_datetime(start_date)
+            end_time = self._format_datetime(end_date)
+            
+            if self.event_cache:
+                return self.event_cache.count_events(start_time, end_time)
+            return len(self.provider.list_events(start_time, end_time))
+            
+        except Exception as e:
+            error_msg = format_error_message(e, "이벤트 수 조회 중 오류가 발생했습니다")
+            logger.error(f"이벤트 수 조회 실패: {error_msg}")
+            raise CalendarServiceError(error_msg, e)
+    
+    @measure_performance
+    def get_next_event(
+        self,
+        days: int = 7,
+        format_response: bool = True
+    ) -> Union[Optional[CalendarEvent], Optional[Dict[str, Any]]]:
+        """
+        지금 이후 가장 먼저 시작하는 이벤트를 조회합니다 (진행 중인 이벤트 제외).
+        
+        해당 이벤트 하나만 형식을 변환합니다.
+        
+        Args:
+            days: 조회할 일수 (기본값: 7)
+            format_response: 응답을 사용자 친화적인 형식으로 변환할지 여부
+            
+        Returns:
+            CalendarEvent 객체 또는 사용자 친화적인 형식의 딕셔너리, 이벤트가 없으면 None
+            
+        Raises:
+            CalendarServiceError: 조회 실패 시
+        """
+        now = datetime.now().astimezone()
+        events = self.get_events_for_period(now, now + timedelta(days=days), format_response=False)
+        
+        now_timestamp = now.timestamp()
+        upcoming = []
+        for event in events:
+            try:
+                start = event.times.start
+            except (ValueError, TypeError, AttributeError):
+                continue
+            if start >= now_timestamp:
+                upcoming.append((start, event))
+        
+        if not upcoming:
+            return None
+        
+        next_event = min(upcoming, key=lambda item: item[0])[1]
+        return self._format_event_for_display(next_event) if format_response else next_event
+    
     @measure_performance
     def create_new_event(
         self,
@@ -172,6 +254,7 @@ class CalendarService:
             
             # 제공자를 통해 이벤트 생성
             created_event = self.provider.create_event(event)
+            self._cache_events([created_event])
             
             if format_response:
                 return self._format_event_for_display(created_event)
@@ -254,6 +337,7 @@ class CalendarService:
             
             # 제공자를 통해 이벤트 수정
             updated_event = self.provider.update_event(event_id, existing_event)
+            self._cache_events([updated_event])
             
             if format_response:
                 return self._format_event_for_display(updated_event)
@@ -287,7 +371,10 @@ class CalendarService:
         """
         try:
             logger.info(f"이벤트 삭제: ID={event_id}")
-            return self.provider.delete_event(event_id)
+            deleted = self.provider.delete_event(event_id)
+            if deleted:
+                self._uncache_events([event_id])
+            return deleted
         except EventNotFoundError:
             raise
         except Exception as e:
@@ -317,7 +404,9 @@ class CalendarService:
         try:
             logger.info(f"이벤트 상세 조회: ID={event_id}")
             
-            event = self.provider.get_event(event_id)
+            event = self.event_cache.get_event(event_id) if self.event_cache else None
+            if not event:
+                event = self.provider.get_event(event_id)
             
             if not event:
                 return None
@@ -331,6 +420,186 @@ class CalendarService:
             logger.error(f"이벤트 상세 조회 실패: {error_msg}")
             raise CalendarServiceError(error_msg, e)
     
+    @measure_performance
+    def find_conflicts(
+        self,
+        start_time: Union[str, datetime],
+        end_time: Union[str, datetime],
+        exclude_event_id: Optional[str] = None,
+        include_all_day: bool = False,
+        format_response: bool = True
+    ) -> Union[List[CalendarEvent], List[Dict[str, Any]]]:
+        """
+        지정된 시간과 겹치는 기존 일정을 조회합니다.
+        
+        Args:
+            start_time: 확인할 시작 시간 (ISO 8601 문자열 또는 datetime 객체)
+            end_time: 확인할 종료 시간 (ISO 8601 문자열 또는 datetime 객체)
+            exclude_event_id: 충돌 대상에서 제외할 이벤트 ID (수정 중인 일정 등)
+            include_all_day: 종일 일정도 충돌로 볼지 여부
+            format_response: 응답을 사용자 친화적인 형식으로 변환할지 여부
+            
+        Returns:
+            겹치는 CalendarEvent 객체 리스트 또는 사용자 친화적인 형식의 딕셔너리 리스트
+            
+        Raises:
+            CalendarServiceError: 조회 실패 시
+        """
+        try:
+            events, index = self._build_busy_index(start_time, end_time, include_all_day, exclude_event_id)
+            conflicts = [
+                events[position]
+                for _, _, position in index.overlapping(to_timestamp(start_time), to_timestamp(end_time))
+            ]
+            
+            if conflicts:
+                logger.info(f"겹치는 일정 {len(conflicts)}개 발견")
+            
+            if format_response:
+                return [self._format_event_for_display(event) for event in conflicts]
+            return conflicts
+            
+        except Exception as e:
+            error_msg = format_error_message(e, "일정 충돌 확인 중 오류가 발생했습니다")
+            logger.error(f"일정 충돌 확인 실패: {error_msg}")
+            raise CalendarServiceError(error_msg, e)
+    
+    @measure_performance
+    def find_free_slots(
+        self,
+        start_time: Union[str, datetime],
+        end_time: Union[str, datetime],
+        min_duration_minutes: int = 30,
+        include_all_day: bool = False,
+        format_response: bool = True
+    ) -> Union[List[Tuple[datetime, datetime]], List[Dict[str, Any]]]:
+        """
+        지정된 기간에서 일정이 없는 빈 시간대를 조회합니다.
+        
+        Args:
+            start_time: 조회 시작 시간 (ISO 8601 문자열 또는 datetime 객체)
+            end_time: 조회 종료 시간 (ISO 8601 문자열 또는 datetime 객체)
+            min_duration_minutes: 빈 시간대의 최소 길이(분)
+            include_all_day: 종일 일정도 바쁜 시간으로 볼지 여부
+            format_response: 응답을 사용자 친화적인 형식으로 변환할지 여부
+            
+        Returns:
+            (시작, 종료) datetime 튜플 리스트 또는 사용자 친화적인 형식의 딕셔너리 리스트
+            
+        Raises:
+            CalendarServiceError: 조회 실패 시
+        """
+        try:
+            _, index = self._build_busy_index(start_time, end_time, include_all_day)
+            slots = [
+                (datetime.fromtimestamp(slot_start, KST), datetime.fromtimestamp(slot_end, KST))
+                for slot_start, slot_end in index.free_slots(
+                    to_timestamp(start_time), to_timestamp(end_time), min_duration_minutes * 60
+                )
+            ]
+            
+            if format_response:
+                return [self._format_slot_for_display(slot_start, slot_end) for slot_start, slot_end in slots]
+            return slots
+            
+        except Exception as e:
+            error_msg = format_error_message(e, "빈 시간 조회 중 오류가 발생했습니다")
+            logger.error(f"빈 시간 조회 실패: {error_msg}")
+            raise CalendarServiceError(error_msg, e)
+    
+    def _build_busy_index(
+        self,
+        start_time: Union[str, datetime],
+        end_time: Union[str, datetime],
+        include_all_day: bool,
+        exclude_event_id: Optional[str] = None
+    ) -> Tuple[List[CalendarEvent], IntervalIndex]:
+        """
+        기간 내 일정으로 구간 인덱스를 만듭니다.
+        
+        Args:
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+            include_all_day: 종일 일정 포함 여부
+            exclude_event_id: 제외할 이벤트 ID
+            
+        Returns:
+            (이벤트 리스트, 이벤트 리스트 위치를 키로 하는 구간 인덱스)
+        """
+        start_str = self._format_datetime(start_time)
+        end_str = self._format_datetime(end_time)
+        
+        if self.event_cache:
+            events = self.event_cache.list_events(start_str, end_str)
+        else:
+            events = self.provider.list_events(start_str, end_str)
+        
+        events = [
+            event for event in events
+            if (include_all_day or not event.all_day) and event.id != exclude_event_id
+        ]
+        
+        index = IntervalIndex()
+        for position, event in enumerate(events):
+            try:
+                times = event.times
+                index.add(position, times.start, times.end)
+            except (ValueError, TypeError):
+                logger.warning(f"시간 형식을 해석할 수 없는 일정은 제외합니다: ID={event.id}")
+        
+        return events, index
+    
+    def _format_slot_for_display(self, slot_start: datetime, slot_end: datetime) -> Dict[str, Any]:
+        """
+        빈 시간대를 사용자 친화적인 형식으로 변환합니다.
+        
+        Args:
+            slot_start: 빈 시간대 시작
+            slot_end: 빈 시간대 종료
+            
+        Returns:
+            사용자 친화적인 형식의 딕셔너리
+        """
+        start_date = slot_start.strftime("%Y년 %m월 %d일")
+        end_date = slot_end.strftime("%Y년 %m월 %d일")
+        
+        if start_date == end_date:
+            time_str = f"{start_date} {slot_start.strftime('%H:%M')} ~ {slot_end.strftime('%H:%M')}"
+        else:
+            time_str = f"{start_date} {slot_start.strftime('%H:%M')} ~ {end_date} {slot_end.strftime('%H:%M')}"
+        
+        return {
+            "시간": time_str,
+            "길이(분)": int((slot_end - slot_start).total_seconds() // 60)
+        }
+    
+    def _cache_events(self, events: List[Optional[CalendarEvent]]) -> None:
+        """
+        생성/수정된 이벤트를 로컬 캐시에 반영합니다 (write-through).
+        
+        Args:
+            events: 제공자가 반환한 이벤트 리스트 (실패한 항목은 None)
+        """
+        if not self.event_cache:
+            return
+        
+        for event in events:
+            if event:
+                self.event_cache.put(event)
+    
+    def _uncache_events(self, event_ids: List[str]) -> None:
+        """
+        삭제된 이벤트를 로컬 캐시에서 제거합니다 (write-through).
+        
+        Args:
+            event_ids: 삭제된 이벤트 ID 리스트
+        """
+        if not self.event_cache:
+            return
+        
+        for event_id in event_ids:
+            self.event_cache.remove(event_id)
+    
     def _format_datetime(self, dt: Union[str, datetime]) -> str:
         """
         datetime 객체를 ISO 8601 문자열로 변환합니다.
@@ -357,68 +626,14 @@ class CalendarService:
         Returns:
             사용자 친화적인 형식의 딕셔너리
         """
-        # 시작 시간과 종료 시간 파싱
-        try:
-            if event.all_day:
-                # 종일 이벤트인 경우 날짜만 파싱
-                start_dt = datetime.fromisoformat(event.start_time).date()
-                end_dt = datetime.fromisoformat(event.end_time).date()
-                
-                start_formatted = start_dt.strftime("%Y년 %m월 %d일")
-                end_formatted = end_dt.strftime("%Y년 %m월 %d일")
-                
-                # 종일 이벤트 표시
-                time_str = f"{start_formatted} (종일)"
-                if start_dt != end_dt:
-                    time_str = f"{start_formatted} ~ {end_formatted} (종일)"
-            else:
-                # 일반 이벤트인 경우 날짜와 시간 모두 파싱
-                start_dt = datetime.fromisoformat(event.start_time.replace('Z', '+00:00'))
-                end_dt = datetime.fromisoformat(event.end_time.replace('Z', '+00:00'))
-                
-                # 한국 시간으로 변환 (UTC+9)
-                from datetime import timezone
-                kr_tz = timezone(timedelta(hours=9))
-                start_dt = start_dt.astimezone(kr_tz)
-                end_dt = end_dt.astimezone(kr_tz)
-                
-                # 날짜와 시간 포맷팅
-                start_date = start_dt.strftime("%Y년 %m월 %d일")
-                start_time = start_dt.strftime("%H:%M")
-                end_date = end_dt.strftime("%Y년 %m월 %d일")
-                end_time = end_dt.strftime("%H:%M")
-                
-                # 같은 날짜인 경우 날짜는 한 번만 표시
-                if start_date == end_date:
-                    time_str = f"{start_date} {start_time} ~ {end_time}"
-                else:
-                    time_str = f"{start_date} {start_time} ~ {end_date} {end_time}"
-        except (ValueError, TypeError):
-            # 시간 파싱 오류 시 원본 값 사용
-            time_str = f"{event.start_time} ~ {event.end_time}"
-        
-        # 사용자 친화적인 형식으로 변환
-        formatted = {
-            "id": event.id,
-            "제목": event.summary,
-            "시간": time_str,
-            "종일 일정": event.all_day
-        }
-        
-        if event.description:
-            formatted["설명"] = event.description
-        
-        if event.location:
-            formatted["위치"] = event.location
-        
-        return formatted
+        return format_event_for_display(event)
     
     # 배치 처리 메서드들
     @measure_performance
     def create_events_batch(
         self,
         events_data: List[Dict[str, Any]],
-        batch_size: int = 10,
+        batch_size: int = 50,
         format_response: bool = True
     ) -> List[Optional[Union[CalendarEvent, Dict[str, Any]]]]:
         """
@@ -426,7 +641,7 @@ class CalendarService:
         
         Args:
             events_data: 생성할 이벤트 데이터들의 리스트
-            batch_size: 배치 크기 (기본값: 10)
+            batch_size: 배치 크기 (기본값: 50)
             format_response: 응답을 사용자 친화적인 형식으로 변환할지 여부
             
         Returns:
@@ -472,6 +687,8 @@ class CalendarService:
                         logger.error(f"개별 이벤트 생성 실패: {e}")
                         results.append(None)
             
+            self._cache_events(results)
+            
             # 응답 포맷팅
             if format_response:
                 formatted_results = []
@@ -493,7 +710,7 @@ class CalendarService:
     def update_events_batch(
         self,
         event_updates: List[Dict[str, Any]],
-        batch_size: int = 10,
+        batch_size: int = 50,
         format_response: bool = True
     ) -> List[Optional[Union[CalendarEvent, Dict[str, Any]]]]:
         """
@@ -501,7 +718,7 @@ class CalendarService:
         
         Args:
             event_updates: 수정할 이벤트 정보들의 리스트 (각각 'id' 키 포함)
-            batch_size: 배치 크기 (기본값: 10)
+            batch_size: 배치 크기 (기본값: 50)
             format_response: 응답을 사용자 친화적인 형식으로 변환할지 여부
             
         Returns:
@@ -513,6 +730,18 @@ class CalendarService:
         try:
             logger.info(f"배치 이벤트 수정 시작: {len(event_updates)}개 이벤트")
             
+            # 기존 이벤트를 미리 조회 (제공자가 지원하면 배치 요청 사용, 실패하면 개별 조회로 대체)
+            event_ids = [data.get('id') for data in event_updates if data.get('id')]
+            existing_events = None
+            if hasattr(self.provider, 'get_events_batch'):
+                try:
+                    fetched = self.provider.get_events_batch(event_ids, batch_size)
+                    if len(fetched) != len(event_ids):
+                        raise ValueError(f"조회 결과 수가 요청 수와 다릅니다: {len(fetched)}/{len(event_ids)}")
+                    existing_events = dict(zip(event_ids, fetched))
+                except Exception as e:
+                    logger.warning(f"배치 이벤트 조회 실패, 개별 조회로 대체합니다: {e}")
+            
             # 수정 데이터를 (event_id, CalendarEvent) 튜플로 변환
             update_tuples = []
             for data in event_updates:
@@ -523,7 +752,10 @@ class CalendarService:
                         continue
                     
                     # 기존 이벤트 조회
-                    existing_event = self.provider.get_event(event_id)
+                    if existing_events is not None:
+                        existing_event = existing_events.get(event_id)
+                    else:
+                        existing_event = self.provider.get_event(event_id)
                     if not existing_event:
                         logger.error(f"이벤트를 찾을 수 없습니다: {event_id}")
                         continue
@@ -562,6 +794,8 @@ class CalendarService:
                         logger.error(f"개별 이벤트 수정 실패: {e}")
                         results.append(None)
             
+            self._cache_events(results)
+            
             # 응답 포맷팅
             if format_response:
                 formatted_results = []
@@ -583,14 +817,14 @@ class CalendarService:
     def delete_events_batch(
         self,
         event_ids: List[str],
-        batch_size: int = 10
+        batch_size: int = 50
     ) -> List[bool]:
         """
         여러 이벤트를 배치로 삭제합니다.
         
         Args:
             event_ids: 삭제할 이벤트 ID들의 리스트
-            batch_size: 배치 크기 (기본값: 10)
+            batch_size: 배치 크기 (기본값: 50)
             
         Returns:
             각 이벤트의 삭제 성공 여부 리스트
@@ -615,6 +849,8 @@ class CalendarService:
                         logger.error(f"개별 이벤트 삭제 실패: {e}")
                         results.append(False)
             
+            self._uncache_events([event_id for event_id, deleted in zip(event_ids, results) if deleted])
+            
             return results
             
         except Exception as e:
@@ -630,7 +866,7 @@ class CalendarService:
         Returns:
             성능 통계 보고서
         """
-        stats = get_performance_stats()
+        stats = get_metrics_registry().snapshot()
         
         # 캘린더 관련 함수들만 필터링
         calendar_stats = {}
@@ -638,14 +874,23 @@ class CalendarService:
             if any(keyword in func_name.lower() for keyword in ['event', 'calendar', 'list', 'create', 'update', 'delete']):
                 calendar_stats[func_name] = func_stats
         
-        # 성능 경고 확인
+        # 성능 경고 확인 (평균과 꼬리 지연 시간)
         warnings = []
-        for func_name in calendar_stats:
-            if check_performance_threshold(func_name, 3.0):
+        for func_name, func_stats in calendar_stats.items():
+            if func_stats.get('avg_time', 0) > 3.0:
                 warnings.append(f"{func_name} 함수의 평균 실행 시간이 3초를 초과합니다.")
+            elif (func_stats.get('p95') or 0) > 5.0:
+                warnings.append(f"{func_name} 함수의 p95 실행 시간이 {func_stats['p95']:.2f}초입니다.")
+        
+        # API 속도 제한/서킷 브레이커 상태
+        rate_limits = get_rate_limiter_metrics()
+        for name, metrics in rate_limits.items():
+            if metrics['circuit_state'] != 'closed':
+                warnings.append(f"{name} API 서킷 브레이커가 {metrics['circuit_state']} 상태입니다.")
         
         return {
             'performance_stats': calendar_stats,
+            'rate_limits': rate_limits,
             'warnings': warnings,
             'total_functions': len(calendar_stats),
             'report_time': datetime.now().isoformat()
@@ -8,7 +8,6 @@ import random
 import functools
 import logging
 import threading
-from collections import defaultdict, deque
 from typing import Type, Callable, Any, List, Union, Optional, Dict
 from datetime import datetime, timedelta
 
@@ -17,14 +16,13 @@ from .exceptions import (
     NetworkError,
     APIQuotaExceededError
 )
+from .metrics import get_metrics_registry
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
-# 성능 모니터링을 위한 전역 변수들
-_performance_stats = defaultdict(list)
-_performance_lock = threading.Lock()
-_performance_history = defaultdict(lambda: deque(maxlen=100))  # 최근 100개 기록만 유지
+# 성능 지표 저장소 (함수별 고정 메모리 히스토그램)
+_metrics_registry = get_metrics_registry()
 
 
 def retry(
@@ -77,6 +75,11 @@ def retry(
                     if jitter > 0:
                         wait_time = wait_time * (1 + random.uniform(-jitter, jitter))
 
+                    # 서버가 Retry-After를 지정한 경우 그보다 먼저 재시도하지 않음
+                    retry_after = getattr(e, 'retry_after', None)
+                    if retry_after:
+                        wait_time = max(wait_time, float(retry_after))
+
                     # 로그 메시지
                     logger.warning(
                         f"{func.__name__} 실행 중 오류 발생: {e}. "
@@ -126,6 +129,26 @@ def format_error_message(error: Exception, default_message: str = "오류가 발
     return f"{default_message}: {str(error)}"
 
 
+def to_timestamp(value: Union[str, datetime]) -> float:
+    """
+    ISO 8601 날짜/시간 문자열을 타임스탬프로 변환합니다.
+
+    시간대 정보가 없는 값(종일 이벤트 날짜 포함)은 로컬 시간으로 해석합니다.
+
+    Args:
+        value: ISO 8601 형식 문자열 또는 datetime 객체
+
+    Returns:
+        POSIX 타임스탬프
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
 def measure_performance(func: Callable) -> Callable:
     """
     함수 실행 시간을 측정하고 성능 통계를 수집하는 데코레이터
@@ -138,34 +161,26 @@ def measure_performance(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+        start_time = time.perf_counter()
+        success = False
+        error = None
         
         try:
             result = func(*args, **kwargs)
             success = True
-            error = None
         except Exception as e:
-            success = False
             error = str(e)
             raise
         finally:
-            end_time = time.time()
-            execution_time = end_time - start_time
+            execution_time = time.perf_counter() - start_time
+            func_name = func.__name__
             
-            # 성능 통계 수집
-            with _performance_lock:
-                func_name = func.__name__
-                _performance_stats[func_name].append({
-                    'timestamp': datetime.now(),
-                    'execution_time': execution_time,
-                    'success': success,
-                    'error': error
-                })
-                _performance_history[func_name].append(execution_time)
+            # 성능 통계 수집 (고정 메모리)
+            _metrics_registry.record(func_name, execution_time, success, error)
             
-            # 로그 기록
-            status = "성공" if success else "실패"
-            logger.info(f"{func_name} 실행 시간: {execution_time:.4f}초 ({status})")
+            if logger.isEnabledFor(logging.DEBUG):
+                status = "성공" if success else "실패"
+                logger.debug(f"{func_name} 실행 시간: {execution_time:.4f}초 ({status})")
             
             # 성능 경고 (5초 이상 소요 시)
             if execution_time > 5.0:
@@ -184,48 +199,9 @@ def get_performance_stats(func_name: Optional[str] = None) -> Dict[str, Any]:
         func_name: 특정 함수의 통계만 조회할 경우 함수명 (None이면 전체)
         
     Returns:
-        성능 통계 딕셔너리
+        성능 통계 딕셔너리 (호출 수, 성공률, 평균/최소/최대/p50/p95/p99 실행 시간, 최근 구간 통계, 최근 10개 호출)
     """
-    with _performance_lock:
-        if func_name:
-            if func_name not in _performance_stats:
-                return {}
-            
-            stats = _performance_stats[func_name]
-            history = list(_performance_history[func_name])
-            
-            if not history:
-                return {'function': func_name, 'call_count': 0}
-            
-            return {
-                'function': func_name,
-                'call_count': len(stats),
-                'avg_time': sum(history) / len(history),
-                'min_time': min(history),
-                'max_time': max(history),
-                'success_rate': sum(1 for s in stats if s['success']) / len(stats) * 100,
-                'recent_calls': stats[-10:]  # 최근 10개 호출
-            }
-        else:
-            # 전체 통계
-            result = {}
-            for func_name_key in _performance_stats:
-                stats = _performance_stats[func_name_key]
-                history = list(_performance_history[func_name_key])
-                
-                if not history:
-                    result[func_name_key] = {'function': func_name_key, 'call_count': 0}
-                else:
-                    result[func_name_key] = {
-                        'function': func_name_key,
-                        'call_count': len(stats),
-                        'avg_time': sum(history) / len(history),
-                        'min_time': min(history),
-                        'max_time': max(history),
-                        'success_rate': sum(1 for s in stats if s['success']) / len(stats) * 100,
-                        'recent_calls': stats[-10:]  # 최근 10개 호출
-                    }
-            return result
+    return _metrics_registry.snapshot(func_name)
 
 
 def reset_performance_stats(func_name: Optional[str] = None) -> None:
@@ -235,14 +211,7 @@ def reset_performance_stats(func_name: Optional[str] = None) -> None:
     Args:
         func_name: 특정 함수의 통계만 초기화할 경우 함수명 (None이면 전체)
     """
-    with _performance_lock:
-        if func_name:
-            if func_name in _performance_stats:
-                _performance_stats[func_name].clear()
-                _performance_history[func_name].clear()
-        else:
-            _performance_stats.clear()
-            _performance_history.clear()
+    _metrics_registry.reset(func_name)
 
 
 def check_performance_threshold(func_name: str, threshold: float = 3.0) -> bool:
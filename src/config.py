@@ -19,6 +19,9 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_FILE_NAME = os.getenv("DB_FILE_NAME", "personal_data.db")
 DB_PATH = os.path.join(BASE_DIR, DB_FILE_NAME)
 
+# 사용자 확인 요청 저장소(SQLite) 파일 경로
+CONFIRMATION_DB_PATH = os.getenv("CONFIRMATION_DB_PATH", os.path.join(BASE_DIR, "confirmations.db"))
+
 # --- Google OAuth 설정 ---
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
@@ -43,5 +46,46 @@ CALENDAR_CONFIG = {
         
         # 요청할 권한 범위
         "scopes": ["https://www.googleapis.com/auth/calendar"]
+    },
+    
+    # 로컬 이벤트 캐시 설정 (syncToken 증분 동기화)
+    "cache": {
+        # 기간/상세 조회를 로컬 캐시에서 처리할지 여부
+        "enabled": True,
+        
+        # 동기화 없이 캐시를 사용할 최대 시간(초)
+        "max_staleness_seconds": 60,
+        
+        # 반복 일정 전개 결과를 캐시할 최대 조회 기간 수
+        "max_expanded_windows": 128
     }
-}
\ No newline at end of file
+}
+
+# --- Google API 클라이언트 설정 ---
+# Gmail/캘린더 클라이언트가 함께 사용하는 시작 시간 최적화 설정
+GOOGLE_CLIENT_CONFIG = {
+    # 디스커버리 문서 디스크 캐시 경로
+    "discovery_cache_dir": os.path.join(BASE_DIR, "cache", "discovery"),
+    
+    # 디스커버리 문서 캐시 유효 기간(초)
+    "discovery_cache_ttl_seconds": 7 * 24 * 3600,
+    
+    # 만료 몇 초 전에 자격 증명을 미리 갱신할지
+    "credential_refresh_margin_seconds": 300,
+    
+    # 공유 HTTP 연결의 요청 제한 시간(초)
+    "http_timeout_seconds": 60
+}
+
+# --- 요청 추적 설정 ---
+# 쿼리 한 건이 에이전트 → 도구 → 저장소 → SQL로 이어지는 구간을 기록하는 설정
+TRACING_CONFIG = {
+    # 요청 추적 사용 여부 (환경변수 TRACE_ENABLED=1)
+    "enabled": os.getenv("TRACE_ENABLED", "0").lower() in ("1", "true", "yes"),
+    
+    # 끝난 구간을 바로 기록할 JSON Lines 파일 경로
+    "jsonl_path": os.path.join(BASE_DIR, "logs", "traces.jsonl"),
+    
+    # 쿼리마다 Chrome trace 형식 파일을 저장할 디렉토리
+    "chrome_trace_dir": os.path.join(BASE_DIR, "logs", "traces")
+}
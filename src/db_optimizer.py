@@ -23,6 +23,8 @@ if parent_dir not in sys.path:
 from src.logging_system import get_logger
 from src.config_manager import ConfigManager
 from src.performance_monitor import profile_function, measure_time
+from src.statement_profiler import load_statement_profile
+from src.index_advisor import IndexAdvisor, parse_query_shape
 
 # 로거 설정
 logger = get_logger('db_optimizer')
@@ -163,21 +165,17 @@ class DatabaseOptimizer:
                 analysis = {
                     'query': query,
                     'plan': plan,
-                    'uses_index': any('USING INDEX' in row['detail'] for row in plan),
-                    'table_scan': any('SCAN TABLE' in row['detail'] for row in plan),
+                    'uses_index': any('INDEX' in row['detail'].split() for row in plan),
+                    'table_scan': any(self._scanned_table(row['detail']) for row in plan),
                     'recommendations': []
                 }
                 
                 # 테이블 스캔 감지
                 if analysis['table_scan'] and not analysis['uses_index']:
-                    # 테이블 이름 추출
-                    table_names = []
-                    for row in plan:
-                        if 'SCAN TABLE' in row['detail']:
-                            parts = row['detail'].split()
-                            table_idx = parts.index('TABLE') + 1
-                            if table_idx < len(parts):
-                                table_names.append(parts[table_idx])
+                    # 테이블 이름 추출 (SQLite 3.36 이후는 'SCAN 테이블', 이전은 'SCAN TABLE 테이블')
+                    table_names = [
+                        table for table in (self._scanned_table(row['detail']) for row in plan) if table
+                    ]
                     
                     # WHERE 절 조건 추출
                     where_columns = self._extract_where_columns(query)
@@ -198,10 +196,15 @@ class DatabaseOptimizer:
             return {'query': query, 'error': str(e)}
     
     @profile_function
-    def recommend_indexes(self) -> List[Dict[str, Any]]:
+    def recommend_indexes(self, statements: Union[List[Dict[str, Any]], str] = None) -> List[Dict[str, Any]]:
         """
         인덱스 추천
         
+        Args:
+            statements: 문장 프로파일 (QueryProfiler.get_statement_stats(include_samples=True) 결과 또는
+                export_statement_stats()로 저장한 파일 경로). 지정하면 실제로 전체 스캔이 발생한
+                느린 문장의 WHERE 열을 총 지연 시간 순으로 먼저 추천합니다.
+        
         Returns:
             List[Dict[str, Any]]: 추천 인덱스 목록
         """
@@ -213,6 +216,17 @@ class DatabaseOptimizer:
                 # 추천 인덱스 목록
                 recommendations = []
                 
+                # 실행 기록 기반 추천
+                if statements:
+                    if isinstance(statements, str):
+                        statements = load_statement_profile(statements)
+                    recommendations.extend(self._recommend_from_statements(statements, schema_info))
+                recommended = {(rec['table'], rec['column']) for rec in recommendations}
+                
+                # 외래 키 조회용 연결 (테이블마다 새로 열지 않음)
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+                
                 # 테이블별 분석
                 for table_name, table_info in schema_info['tables'].items():
                     # 기존 인덱스 열
@@ -222,14 +236,13 @@ class DatabaseOptimizer:
                             existing_index_columns.add(column)
                     
                     # 외래 키 열 확인
-                    cursor = sqlite3.connect(self.db_path).cursor()
                     cursor.execute(f"PRAGMA foreign_key_list({table_name})")
                     foreign_keys = cursor.fetchall()
                     
                     # 외래 키 열에 인덱스 추천
                     for fk in foreign_keys:
                         column = fk[3]  # 외래 키 열 이름
-                        if column not in existing_index_columns:
+                        if column not in existing_index_columns and (table_name, column) not in recommended:
                             recommendations.append({
                                 'table': table_name,
                                 'column': column,
@@ -245,8 +258,8 @@ class DatabaseOptimizer:
                         if column_name in existing_index_columns:
                             continue
                         
-                        # 기본 키는 제외
-                        if column['pk']:
+                        # 기본 키와 실행 기록으로 이미 추천한 열은 제외
+                        if column['pk'] or (table_name, column_name) in recommended:
                             continue
                         
                         # 특정 패턴의 열에 인덱스 추천
@@ -262,12 +275,109 @@ class DatabaseOptimizer:
                                 'sql': f"CREATE INDEX idx_{table_name}_{column_name} ON {table_name}({column_name});"
                             })
                 
+                conn.close()
+                
                 return recommendations
                 
         except Exception as e:
             logger.error(f"인덱스 추천 중 오류 발생: {e}")
             return []
     
+    def _recommend_from_statements(self, statements: List[Dict[str, Any]],
+                                   schema_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        문장 프로파일의 실행 계획에서 전체 스캔 테이블의 WHERE 열 인덱스 추천
+        
+        Args:
+            statements: 문장 통계 목록 (fingerprint, sample, count, total_ms, plan)
+            schema_info: analyze_schema() 결과
+            
+        Returns:
+            List[Dict[str, Any]]: 총 지연 시간 내림차순 추천 인덱스 목록
+        """
+        candidates: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
+        for statement in statements:
+            scanned_tables = [
+                self._scanned_table(row.get('detail', '')) for row in statement.get('plan') or []
+            ]
+            scanned_tables = [table for table in scanned_tables if table in schema_info['tables']]
+            if not scanned_tables:
+                continue
+            
+            where_columns = self._extract_where_columns(statement.get('sample') or statement.get('fingerprint', ''))
+            for table in scanned_tables:
+                table_info = schema_info['tables'][table]
+                columns = {column['name'].lower(): column for column in table_info['columns']}
+                indexed = {name.lower() for index in table_info['indexes'] for name in index['columns'] if name}
+                
+                for where_column in where_columns:
+                    column = columns.get(where_column.lower())
+                    if column is None or column['pk'] or column['name'].lower() in indexed:
+                        continue
+                    
+                    candidate = candidates.setdefault((table, column['name']), {
+                        'table': table,
+                        'column': column['name'],
+                        'reason': '실행 계획 전체 스캔',
+                        'sql': f"CREATE INDEX idx_{table}_{column['name']} ON {table}({column['name']});",
+                        'statements': [],
+                        'count': 0,
+                        'total_ms': 0.0
+                    })
+                    candidate['statements'].append(statement.get('fingerprint'))
+                    candidate['count'] += statement.get('count', 0)
+                    candidate['total_ms'] += statement.get('total_ms', 0.0)
+        
+        recommendations = sorted(candidates.values(), key=lambda rec: rec['total_ms'], reverse=True)
+        for rec in recommendations:
+            rec['reason'] = f"실행 계획 전체 스캔 ({rec['count']}회, 총 {rec['total_ms']:.1f}ms)"
+        return recommendations
+    
+    @staticmethod
+    def _scanned_table(detail: str) -> Optional[str]:
+        """
+        실행 계획 행에서 인덱스 없이 전체 스캔하는 테이블 이름 추출
+        
+        Args:
+            detail: 실행 계획 설명 (예: 'SCAN transactions', 'SCAN TABLE transactions')
+            
+        Returns:
+            Optional[str]: 테이블 이름 (전체 스캔이 아니면 None)
+        """
+        parts = detail.split()
+        if len(parts) < 2 or parts[0] != 'SCAN' or 'INDEX' in parts:
+            return None
+        return parts[2] if parts[1] == 'TABLE' and len(parts) > 2 else parts[1]
+    
+    @profile_function
+    def advise_indexes(self, workload: Union[List[Dict[str, Any]], List[str], str], max_indexes: int = 5,
+                       repeat: int = 5) -> Dict[str, Any]:
+        """
+        워크로드 기반 인덱스 추천 및 효과 측정
+        
+        실행된 문장의 실행 계획에서 전체 스캔을 찾아 복합/커버링 인덱스 후보를 만들고,
+        데이터베이스 복사본에서 후보별 전후 지연 시간을 측정해 워크로드 비용을 가장 많이 줄이는
+        인덱스부터 추천합니다. 원본 데이터베이스는 변경하지 않습니다.
+        
+        Args:
+            workload: 문장 프로파일 파일 경로, 문장 통계 목록(QueryProfiler.get_statement_stats(include_samples=True)),
+                또는 SQL 문자열 목록
+            max_indexes: 최대 추천 인덱스 수
+            repeat: 문장별 측정 반복 횟수
+            
+        Returns:
+            Dict[str, Any]: baseline_ms, optimized_ms, estimated_speedup(예상 워크로드 속도 향상 배수),
+                recommendations, statements, candidates_evaluated (실패 시 error)
+        """
+        try:
+            with measure_time('advise_indexes'):
+                advisor = IndexAdvisor(self.db_path, repeat=repeat)
+                return advisor.advise(workload, max_indexes=max_indexes)
+        except Exception as e:
+            logger.error(f"워크로드 인덱스 추천 중 오류 발생: {e}")
+            return {'error': str(e)}
+    
     @profile_function
     def create_index(self, table: str, columns: List[str], unique: bool = False) -> bool:
         """
@@ -456,49 +566,13 @@ class DatabaseOptimizer:
             query: SQL 쿼리
             
         Returns:
-            List[str]: WHERE 절 조건 열 목록
+            List[str]: 인덱스로 찾을 수 있는 WHERE/JOIN 조건 열 목록 (동등 비교 열, 범위 비교 열 순)
         """
-        # 간단한 WHERE 절 파싱
-        query = query.upper()
-        where_idx = query.find('WHERE')
-        
-        if where_idx == -1:
-            return []
-        
-        where_clause = query[where_idx + 5:]
-        
-        # ORDER BY, GROUP BY, LIMIT 등 제거
-        for keyword in ['ORDER BY', 'GROUP BY', 'LIMIT', 'HAVING']:
-            keyword_idx = where_clause.find(keyword)
-            if keyword_idx != -1:
-                where_clause = where_clause[:keyword_idx]
-        
-        # 조건 분리
-        conditions = []
-        
-        # AND, OR로 분리
-        for operator in ['AND', 'OR']:
-            if operator in where_clause:
-                parts = where_clause.split(operator)
-                conditions.extend(parts)
-                where_clause = ""
-        
-        if where_clause:
-            conditions.append(where_clause)
-        
-        # 열 이름 추출
+        shape = parse_query_shape(query)
         columns = []
-        for condition in conditions:
-            # 비교 연산자로 분리
-            for operator in ['=', '>', '<', '>=', '<=', '<>', 'LIKE', 'IN', 'BETWEEN']:
-                if operator in condition:
-                    column = condition.split(operator)[0].strip()
-                    # 테이블 이름 제거
-                    if '.' in column:
-                        column = column.split('.')[1]
-                    columns.append(column)
-                    break
-        
+        for _, column in shape.equality + shape.ranges:
+            if column not in columns:
+                columns.append(column)
         return columns
 
 def main():
@@ -510,7 +584,7 @@ def main():
     parser = argparse.ArgumentParser(description='데이터베이스 최적화 도구')
     
     parser.add_argument('--action', '-a', choices=[
-        'analyze', 'optimize', 'recommend-indexes', 'create-index', 'drop-index', 'analyze-query'
+        'analyze', 'optimize', 'recommend-indexes', 'advise-indexes', 'create-index', 'drop-index', 'analyze-query'
     ], default='analyze', help='수행할 작업')
     
     parser.add_argument('--db-path', help='데이터베이스 파일 경로')
@@ -520,6 +594,8 @@ def main():
     parser.add_argument('--unique', action='store_true', help='고유 인덱스 생성')
     parser.add_argument('--query', help='SQL 쿼리')
     parser.add_argument('--log-file', help='로그 파일 경로')
+    parser.add_argument('--statements', help='문장 프로파일 파일 경로 (recommend-indexes, advise-indexes에서 사용)')
+    parser.add_argument('--max-indexes', type=int, default=5, help='최대 추천 인덱스 수 (advise-indexes)')
     parser.add_argument('--output', '-o', help='출력 파일 경로')
     parser.add_argument('--verbose', '-v', action='store_true', help='상세 출력')
     
@@ -549,7 +625,7 @@ def main():
     
     elif args.action == 'recommend-indexes':
         # 인덱스 추천
-        recommendations = optimizer.recommend_indexes()
+        recommendations = optimizer.recommend_indexes(args.statements)
         
         if recommendations:
             print("추천 인덱스:")
@@ -562,6 +638,29 @@ def main():
         if args.output:
             optimizer.save_analysis({'recommendations': recommendations}, args.output)
     
+    elif args.action == 'advise-indexes':
+        # 워크로드 기반 인덱스 추천
+        if not args.statements:
+            print("문장 프로파일 파일 경로(--statements)를 지정해야 합니다.")
+            return
+        
+        report = optimizer.advise_indexes(args.statements, max_indexes=args.max_indexes)
+        
+        if 'error' in report:
+            print(f"인덱스 추천 오류: {report['error']}")
+        elif report['recommendations']:
+            print("추천 인덱스:")
+            for i, rec in enumerate(report['recommendations'], 1):
+                print(f"{i}. 테이블: {rec['table']}, 열: {rec['column']}, 이유: {rec['reason']}")
+                print(f"   SQL: {rec['sql']}")
+            print(f"예상 워크로드 속도 향상: {report['estimated_speedup']:.2f}배 "
+                  f"({report['baseline_ms']:.1f}ms → {report['optimized_ms']:.1f}ms)")
+        else:
+            print("추천할 인덱스가 없습니다.")
+        
+        if args.output:
+            optimizer.save_analysis(report, args.output)
+    
     elif args.action == 'create-index':
         # 인덱스 생성
         if not args.table or not args.columns:
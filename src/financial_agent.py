@@ -38,6 +38,7 @@ from src.exceptions import (
     DatabaseError, ConfigError, BackupError
 )
 from src.response_formatter import format_response, handle_agent_error, extract_insights
+from src.tracing import KIND_AGENT, KIND_LLM, KIND_TOOL, span, traced
 from config import GOOGLE_API_KEY, LLM_MODEL_NAME
 
 # 로거 설정
@@ -96,6 +97,7 @@ FINANCIAL_TOOLS = {
     "get_settings": get_settings,
 }
 
+@traced(kind=KIND_AGENT)
 def run_financial_agent(query: str, context: dict) -> str:
     """
     금융 관련 쿼리를 처리하는 에이전트를 실행합니다.
@@ -166,6 +168,9 @@ def run_financial_agent(query: str, context: dict) -> str:
         get_settings,
     ]
 
+    # 도구 호출이 요청 추적에 도구 구간으로 남도록 감쌉니다 (추적이 꺼져 있으면 그대로 호출)
+    tools_for_llm = [traced(kind=KIND_TOOL)(tool) for tool in tools_for_llm]
+
     try:
         model = genai.GenerativeModel(model_name=LLM_MODEL_NAME, tools=tools_for_llm)
         chat = model.start_chat(enable_automatic_function_calling=True)
@@ -253,7 +258,8 @@ def run_financial_agent(query: str, context: dict) -> str:
         print("LLM에게 계획 및 실행을 요청합니다...")
         
         # send_message가 자동으로 도구를 호출하고 결과를 다시 LLM에게 보내 최종 답변을 생성합니다.
-        response = chat.send_message(prompt)
+        with span('llm.send_message', KIND_LLM, model=LLM_MODEL_NAME, prompt_chars=len(prompt)):
+            response = chat.send_message(prompt)
         logger.info("LLM 응답 수신 완료")
         return response.text
         
@@ -5,7 +5,10 @@
 LLM 에이전트가 호출할 수 있는 지출/수입 분석 및 리포트 관련 도구 함수들을 제공합니다.
 """
 
+import functools
+import inspect
 import logging
+import threading
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Dict, Any, List, Optional, Union
@@ -17,20 +20,60 @@ from src.analyzers.trend_analyzer import TrendAnalyzer
 from src.analyzers.income_analyzer import IncomeAnalyzer
 from src.analyzers.comparison_analyzer import ComparisonAnalyzer
 from src.analyzers.integrated_analyzer import IntegratedAnalyzer
+from src.analyzers.result_cache import analysis_result_cache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 스레드별 거래 저장소 (SQLite 연결은 만든 스레드에서만 쓸 수 있음)
+_repositories = threading.local()
+
 # 데이터베이스 연결 및 저장소 초기화
 def _get_transaction_repository() -> TransactionRepository:
     """
     TransactionRepository 인스턴스를 반환합니다.
     
+    스레드마다 처음 한 번만 연결과 테이블 확인을 하고 이후 호출에서는 같은 저장소를 재사용합니다.
+    
     Returns:
         TransactionRepository: 거래 저장소 인스턴스
     """
-    db_connection = DatabaseConnection()
-    return TransactionRepository(db_connection)
+    repository = getattr(_repositories, 'transactions', None)
+    if repository is None:
+        db_connection = DatabaseConnection()
+        repository = _repositories.transactions = TransactionRepository(db_connection)
+    return repository
+
+def _memoize_tool(func):
+    """
+    분석 도구 결과 메모이제이션 데코레이터
+    
+    거래 데이터 버전과 (기본값을 채운) 인자가 같으면 저장된 결과를 반환합니다.
+    오류 결과는 저장하지 않습니다.
+    
+    Args:
+        func: 분석 도구 함수
+        
+    Returns:
+        Callable: 래핑된 함수
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            bound = signature.bind(*args, **kwargs)
+            repo = _get_transaction_repository()
+        except Exception:
+            return func(*args, **kwargs)
+        
+        bound.apply_defaults()
+        return analysis_result_cache.get_or_compute(
+            repo, f"tool:{func.__name__}", (), dict(bound.arguments),
+            lambda: func(*args, **kwargs),
+            is_cacheable=lambda result: isinstance(result, dict) and 'error' not in result
+        )
+    return wrapper
 
 def _parse_date(date_str: Optional[str]) -> Optional[date]:
     """
@@ -99,6 +142,7 @@ def _prepare_chart_data(data: List[Dict[str, Any]], chart_type: str) -> Dict[str
             "data": data
         }
 
+@_memoize_tool
 def analyze_expenses(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
@@ -224,6 +268,7 @@ def analyze_expenses(
             "chart": {"type": "raw", "data": []}
         }
 
+@_memoize_tool
 def analyze_income(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
@@ -341,6 +386,7 @@ def analyze_income(
             "chart": {"type": "raw", "data": []}
         }
 
+@_memoize_tool
 def compare_periods(
     period1_start: str,
     period1_end: str,
@@ -456,6 +502,7 @@ def compare_periods(
             "chart": {"type": "raw", "data": []}
         }
 
+@_memoize_tool
 def analyze_trends(
     months: int = 6,
     transaction_type: str = "expense",
@@ -790,6 +837,7 @@ def compare_income_expense(
             "chart": {"type": "raw", "data": []}
         }
 
+@_memoize_tool
 def get_financial_summary(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None
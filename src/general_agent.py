@@ -4,13 +4,14 @@ import logging
 import google.generativeai as genai
 
 from tools import (
-    list_calendar_events, create_google_calendar_event, update_google_calendar_event, 
+    list_calendar_events, check_calendar_availability, create_google_calendar_event, update_google_calendar_event, 
     delete_google_calendar_event, web_search, create_calendar_events_batch, 
     delete_calendar_events_batch, get_calendar_performance_report, optimize_calendar_performance
 )
 from config import GOOGLE_API_KEY, LLM_MODEL_NAME
 from src.calendar.logging_config import setup_logging
 import src.calendar.exceptions
+from src.tracing import KIND_AGENT, KIND_LLM, KIND_TOOL, span, traced
 
 # 로깅 설정
 setup_logging()
@@ -20,6 +21,7 @@ logger = logging.getLogger(__name__)
 AVAILABLE_TOOLS = {
     # 캘린더 관련 도구
     "list_calendar_events": list_calendar_events,
+    "check_calendar_availability": check_calendar_availability,
     "create_google_calendar_event": create_google_calendar_event,
     "update_google_calendar_event": update_google_calendar_event,
     "delete_google_calendar_event": delete_google_calendar_event,
@@ -36,6 +38,7 @@ AVAILABLE_TOOLS = {
     "web_search": web_search,
 }
 
+@traced(kind=KIND_AGENT)
 def run_general_agent(query: str, context: dict) -> str:
     """네이티브 Tool-Calling으로 일반 작업을 처리합니다."""
     print("--- 일반 업무팀(General Agent) 작동 시작 (네이티브 방식) ---")
@@ -47,6 +50,7 @@ def run_general_agent(query: str, context: dict) -> str:
     tools_for_llm = [
         # 캘린더 관련 도구
         list_calendar_events,
+        check_calendar_availability,
         create_google_calendar_event,
         update_google_calendar_event,
         delete_google_calendar_event,
@@ -63,6 +67,9 @@ def run_general_agent(query: str, context: dict) -> str:
         web_search,
     ]
 
+    # 도구 호출이 요청 추적에 도구 구간으로 남도록 감쌉니다 (추적이 꺼져 있으면 그대로 호출)
+    tools_for_llm = [traced(kind=KIND_TOOL)(tool) for tool in tools_for_llm]
+
     try:
         model = genai.GenerativeModel(model_name=LLM_MODEL_NAME, tools=tools_for_llm)
         chat = model.start_chat(enable_automatic_function_calling=True)
@@ -107,7 +114,8 @@ def run_general_agent(query: str, context: dict) -> str:
         print("LLM에게 계획 및 실행을 요청합니다...")
         
         # send_message가 자동으로 도구를 호출하고 결과를 다시 LLM에게 보내 최종 답변을 생성합니다.
-        response = chat.send_message(prompt)
+        with span('llm.send_message', KIND_LLM, model=LLM_MODEL_NAME, prompt_chars=len(prompt)):
+            response = chat.send_message(prompt)
         logger.info("LLM 응답 수신 완료")
         return response.text
         
@@ -0,0 +1,91 @@
+"""
+첨부 파일 해시 인덱스
+
+저장 디렉토리별로 첨부 파일의 SHA-256 해시와 파일 경로를 JSON 파일에 기록하여
+같은 내용의 첨부 파일을 다시 저장하거나 수집하지 않도록 합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+ATTACHMENT_INDEX_FILENAME = ".attachment_index.json"
+
+
+class AttachmentHashIndex:
+    """저장 디렉토리의 첨부 파일 해시 인덱스"""
+    
+    _lock = threading.Lock()
+    
+    def __init__(self, save_path: str):
+        """
+        AttachmentHashIndex 초기화
+        
+        Args:
+            save_path: 첨부 파일 저장 디렉토리
+        """
+        self.save_path = save_path
+        self.index_path = os.path.join(save_path, ATTACHMENT_INDEX_FILENAME)
+    
+    def get(self, sha256: str) -> Optional[str]:
+        """
+        해시에 해당하는 저장된 파일 경로 조회
+        
+        파일이 삭제된 경우 인덱스에서 제거하고 None을 반환합니다.
+        
+        Args:
+            sha256: 첨부 파일 SHA-256 해시 (16진수)
+        
+        Returns:
+            저장된 파일 경로 또는 None
+        """
+        with self._lock:
+            entries = self._load()
+            filename = entries.get(sha256)
+            if filename is None:
+                return None
+            
+            file_path = os.path.join(self.save_path, filename)
+            if os.path.exists(file_path):
+                return file_path
+            
+            del entries[sha256]
+            self._save(entries)
+            return None
+    
+    def add(self, sha256: str, file_path: str) -> None:
+        """
+        해시와 파일 경로 기록
+        
+        Args:
+            sha256: 첨부 파일 SHA-256 해시 (16진수)
+            file_path: 저장된 파일 경로
+        """
+        with self._lock:
+            entries = self._load()
+            entries[sha256] = os.path.basename(file_path)
+            self._save(entries)
+    
+    def _load(self) -> Dict[str, str]:
+        """인덱스 파일 읽기"""
+        if not os.path.exists(self.index_path):
+            return {}
+        
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"첨부 파일 인덱스를 읽을 수 없어 새로 만듭니다: {str(e)}")
+            return {}
+    
+    def _save(self, entries: Dict[str, str]) -> None:
+        """인덱스 파일 쓰기 (임시 파일 교체 방식)"""
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.index_path)
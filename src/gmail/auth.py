@@ -14,7 +14,10 @@ import logging
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build, Resource
+from googleapiclient.discovery import Resource
+
+from ..api_rate_limiter import get_rate_limiter, rate_limited_request_builder
+from ..google_client import build_service, credential_cache
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -58,6 +61,13 @@ class GmailAuthService:
             FileNotFoundError: 인증 정보 파일이 없는 경우
             ValueError: 인증 정보가 유효하지 않은 경우
         """
+        # 프로세스 전역 캐시의 자격 증명 재사용 (만료가 가까우면 미리 갱신)
+        if not force_refresh:
+            cached = credential_cache.get(self.token_path, self.scopes, on_refresh=self._save_token)
+            if cached:
+                self._credentials = cached
+                return cached
+        
         if self._credentials and not force_refresh:
             if self._credentials.valid:
                 return self._credentials
@@ -81,11 +91,13 @@ class GmailAuthService:
                 self._save_token(self._credentials)
             
             if self._credentials.valid:
+                credential_cache.put(self.token_path, self.scopes, self._credentials)
                 return self._credentials
         
         # 새로운 인증 플로우 시작
         logger.info("새로운 인증 플로우를 시작합니다.")
         self._credentials = self._start_auth_flow()
+        credential_cache.put(self.token_path, self.scopes, self._credentials)
         return self._credentials
     
     def _start_auth_flow(self) -> Credentials:
@@ -155,6 +167,7 @@ class GmailAuthService:
                 
                 self._credentials = None
                 self._service = None
+                credential_cache.invalidate(self.token_path)
                 logger.info("토큰이 취소되었습니다.")
                 return True
             except Exception as e:
@@ -164,6 +177,7 @@ class GmailAuthService:
         # 토큰 파일만 삭제
         if os.path.exists(self.token_path):
             os.remove(self.token_path)
+            credential_cache.invalidate(self.token_path)
             logger.info("토큰 파일이 삭제되었습니다.")
             return True
         
@@ -199,5 +213,10 @@ class GmailAuthService:
         if not creds or not creds.valid:
             raise ValueError("유효한 인증 정보가 없습니다. 먼저 인증을 수행하세요.")
         
-        self._service = build('gmail', 'v1', credentials=creds)
+        # 모든 요청이 프로세스 전역 "gmail" 속도 제한기와 서킷 브레이커를 거치도록 설정
+        self._service = build_service(
+            'gmail', 'v1',
+            credentials=creds,
+            requestBuilder=rate_limited_request_builder(get_rate_limiter('gmail'))
+        )
         return self._service
\ No newline at end of file
@@ -5,48 +5,45 @@
 """
 
 import logging
-import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Callable, Mapping
 
-from .models import ExtractedEventInfo
+from ..config import CONFIRMATION_DB_PATH
+from .models import ExtractedEventInfo, ConfirmationRequest
+from .confirmation_store import ConfirmationStore
 from .exceptions import NotificationError
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class ConfirmationRequest:
-    """사용자 확인 요청을 나타내는 데이터 클래스"""
-    
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    email_id: str = ""
-    email_subject: str = ""
-    event_info: ExtractedEventInfo = field(default_factory=ExtractedEventInfo)
-    confidence_score: float = 0.0
-    confidence_breakdown: Dict[str, float] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-    expires_at: datetime = field(default_factory=lambda: datetime.now() + timedelta(hours=24))
-    status: str = "pending"  # pending, confirmed, rejected, expired
-    response_data: Optional[Dict[str, Any]] = None
-    callback_function: Optional[Callable] = None
-
-
 class ConfirmationService:
     """사용자 확인 요청 서비스 클래스"""
     
-    def __init__(self, notification_handlers: Optional[List[Callable]] = None):
+    def __init__(
+        self,
+        notification_handlers: Optional[List[Callable]] = None,
+        store: Optional[ConfirmationStore] = None
+    ):
         """
         ConfirmationService 초기화
         
         Args:
             notification_handlers: 알림 처리 함수들의 리스트
+            store: 확인 요청 저장소 (기본값: 설정의 CONFIRMATION_DB_PATH 파일 저장소)
         """
         self.notification_handlers = notification_handlers or []
-        self.pending_requests: Dict[str, ConfirmationRequest] = {}
-        self.completed_requests: Dict[str, ConfirmationRequest] = {}
+        self.store = store or ConfirmationStore(CONFIRMATION_DB_PATH)
+    
+    @property
+    def pending_requests(self) -> Mapping:
+        """대기 중인 확인 요청 (요청 ID -> 요청) 읽기 전용 뷰"""
+        return self.store.pending_requests
+    
+    @property
+    def completed_requests(self) -> Mapping:
+        """완료된 확인 요청 (요청 ID -> 요청) 읽기 전용 뷰"""
+        return self.store.completed_requests
     
     def request_confirmation(
         self,
@@ -87,7 +84,7 @@ class ConfirmationService:
             )
             
             # 요청 저장
-            self.pending_requests[request.id] = request
+            self.store.add(request)
             
             # 알림 발송
             self._send_confirmation_notification(request)
@@ -197,13 +194,7 @@ class ConfirmationService:
         Returns:
             확인 요청 객체 또는 None
         """
-        # 대기 중인 요청에서 먼저 찾기
-        request = self.pending_requests.get(request_id)
-        if request:
-            return request
-        
-        # 완료된 요청에서 찾기
-        return self.completed_requests.get(request_id)
+        return self.store.get(request_id)
     
     def get_pending_requests(self, email_id: Optional[str] = None) -> List[ConfirmationRequest]:
         """
@@ -215,15 +206,10 @@ class ConfirmationService:
         Returns:
             대기 중인 확인 요청 목록
         """
-        requests = list(self.pending_requests.values())
-        
-        if email_id:
-            requests = [req for req in requests if req.email_id == email_id]
-        
         # 만료된 요청 정리
         self._cleanup_expired_requests()
         
-        return requests
+        return self.store.find_pending(email_id or None)
     
     def get_confirmation_status(self, request_id: str) -> Dict[str, Any]:
         """
@@ -381,27 +367,17 @@ class ConfirmationService:
         Args:
             request_id: 이동할 요청 ID
         """
-        if request_id in self.pending_requests:
-            request = self.pending_requests.pop(request_id)
-            self.completed_requests[request_id] = request
+        request = self.store.get(request_id)
+        if request is not None and request_id in self.pending_requests:
+            self.store.complete(request)
             logger.info(f"요청을 완료된 요청으로 이동: 요청 ID={request_id}")
     
     def _cleanup_expired_requests(self) -> None:
-        """만료된 요청들을 정리"""
-        current_time = datetime.now()
-        expired_request_ids = []
-        
-        for request_id, request in self.pending_requests.items():
-            if current_time > request.expires_at:
-                request.status = "expired"
-                expired_request_ids.append(request_id)
-        
-        # 만료된 요청들을 완료된 요청으로 이동
-        for request_id in expired_request_ids:
-            self._move_to_completed(request_id)
+        """만료된 요청들을 정리 (만료 시각 힙에서 지난 항목만 꺼냄)"""
+        expired_requests = self.store.pop_expired(datetime.now())
         
-        if expired_request_ids:
-            logger.info(f"만료된 요청 {len(expired_request_ids)}개를 정리했습니다.")
+        if expired_requests:
+            logger.info(f"만료된 요청 {len(expired_requests)}개를 정리했습니다.")
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -414,15 +390,14 @@ class ConfirmationService:
         self._cleanup_expired_requests()
         
         # 완료된 요청들의 상태별 통계
-        completed_stats = {}
-        for request in self.completed_requests.values():
-            status = request.status
-            completed_stats[status] = completed_stats.get(status, 0) + 1
+        completed_stats = self.store.count_by_status()
+        pending_count = completed_stats.pop('pending', 0)
+        completed_count = sum(completed_stats.values())
         
         return {
-            'pending_requests': len(self.pending_requests),
-            'completed_requests': len(self.completed_requests),
+            'pending_requests': pending_count,
+            'completed_requests': completed_count,
             'completed_by_status': completed_stats,
-            'total_requests': len(self.pending_requests) + len(self.completed_requests),
+            'total_requests': pending_count + completed_count,
             'statistics_time': datetime.now().isoformat()
         }
\ No newline at end of file
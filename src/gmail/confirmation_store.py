@@ -0,0 +1,325 @@
+"""
+확인 요청 저장소
+
+사용자 확인 요청을 인덱스가 있는 SQLite 테이블에 저장하고,
+만료 시각을 힙으로 관리하여 전체 스캔 없이 만료 요청을 정리합니다.
+"""
+
+import heapq
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .models import ConfirmationRequest, ExtractedEventInfo
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+PENDING_STATUS = "pending"
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS confirmation_requests (
+        id TEXT PRIMARY KEY,
+        email_id TEXT NOT NULL,
+        email_subject TEXT,
+        event_info TEXT,
+        confidence_score REAL,
+        confidence_breakdown TEXT,
+        created_at TEXT NOT NULL,
+        expires_at TEXT NOT NULL,
+        status TEXT NOT NULL,
+        response_data TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_confirmation_requests_status ON confirmation_requests (status)",
+    "CREATE INDEX IF NOT EXISTS idx_confirmation_requests_email_id ON confirmation_requests (email_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_confirmation_requests_expires_at ON confirmation_requests (status, expires_at)",
+]
+
+
+class _RequestView(Mapping):
+    """상태 조건에 맞는 확인 요청을 딕셔너리처럼 조회하는 읽기 전용 뷰"""
+    
+    def __init__(self, store: 'ConfirmationStore', pending: bool):
+        self._store = store
+        self._pending = pending
+    
+    def __getitem__(self, request_id: str) -> ConfirmationRequest:
+        request = self._store.get(request_id)
+        if request is None or (request.status == PENDING_STATUS) != self._pending:
+            raise KeyError(request_id)
+        return request
+    
+    def __contains__(self, request_id: object) -> bool:
+        return self._store.has_request(str(request_id), self._pending)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.list_ids(self._pending))
+    
+    def __len__(self) -> int:
+        return self._store.count(self._pending)
+    
+    def values(self) -> List[ConfirmationRequest]:
+        return self._store.list_requests(self._pending)
+
+
+class ConfirmationStore:
+    """
+    SQLite 기반 확인 요청 저장소
+    
+    대기 중인 요청은 콜백 함수를 유지해야 하므로 메모리에도 보관하고,
+    완료된 요청은 SQLite에만 저장하여 장시간 실행 시에도 메모리 사용량이 늘지 않도록 합니다.
+    """
+    
+    def __init__(self, db_path: str = ":memory:"):
+        """
+        ConfirmationStore 초기화
+        
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로 (기본값: 메모리 DB)
+        """
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._pending: Dict[str, ConfirmationRequest] = {}
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        
+        with self._lock, self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+        
+        self._load_pending_requests()
+        
+        self.pending_requests = _RequestView(self, pending=True)
+        self.completed_requests = _RequestView(self, pending=False)
+    
+    def add(self, request: ConfirmationRequest) -> None:
+        """
+        새 확인 요청 저장
+        
+        Args:
+            request: 저장할 확인 요청
+        """
+        with self._lock:
+            self._write(request)
+            if request.status == PENDING_STATUS:
+                self._pending[request.id] = request
+                heapq.heappush(self._expiry_heap, (request.expires_at, request.id))
+    
+    def complete(self, request: ConfirmationRequest) -> None:
+        """
+        요청 상태/응답을 저장하고 대기 목록에서 제거
+        
+        Args:
+            request: 상태가 갱신된 확인 요청
+        """
+        with self._lock:
+            self._write(request)
+            self._pending.pop(request.id, None)
+    
+    def get(self, request_id: str) -> Optional[ConfirmationRequest]:
+        """
+        확인 요청 조회
+        
+        Args:
+            request_id: 확인 요청 ID
+        
+        Returns:
+            확인 요청 객체 또는 None
+        """
+        with self._lock:
+            request = self._pending.get(request_id)
+            if request is not None:
+                return request
+            
+            row = self._connection.execute(
+                "SELECT * FROM confirmation_requests WHERE id = ?", (request_id,)
+            ).fetchone()
+            return self._from_row(row) if row else None
+    
+    def has_request(self, request_id: str, pending: bool) -> bool:
+        """
+        상태 조건에 맞는 요청 존재 여부 확인
+        
+        Args:
+            request_id: 확인 요청 ID
+            pending: True면 대기 중인 요청, False면 완료된 요청에서 확인
+        
+        Returns:
+            존재 여부
+        """
+        with self._lock:
+            if pending:
+                return request_id in self._pending
+            
+            row = self._connection.execute(
+                "SELECT 1 FROM confirmation_requests WHERE id = ? AND status != ?",
+                (request_id, PENDING_STATUS)
+            ).fetchone()
+            return row is not None
+    
+    def find_pending(self, email_id: Optional[str] = None) -> List[ConfirmationRequest]:
+        """
+        대기 중인 요청 조회 (email_id 인덱스 사용)
+        
+        Args:
+            email_id: 특정 이메일 ID로 필터링 (선택 사항)
+        
+        Returns:
+            생성 순으로 정렬된 대기 중인 요청 목록
+        """
+        with self._lock:
+            if email_id is None:
+                return list(self._pending.values())
+            
+            rows = self._connection.execute(
+                "SELECT id FROM confirmation_requests WHERE email_id = ? AND status = ? ORDER BY created_at",
+                (email_id, PENDING_STATUS)
+            ).fetchall()
+            return [self._pending[row[0]] for row in rows if row[0] in self._pending]
+    
+    def list_ids(self, pending: bool) -> List[str]:
+        """상태 조건에 맞는 요청 ID 목록"""
+        with self._lock:
+            if pending:
+                return list(self._pending)
+            
+            rows = self._connection.execute(
+                "SELECT id FROM confirmation_requests WHERE status != ? ORDER BY created_at",
+                (PENDING_STATUS,)
+            ).fetchall()
+            return [row[0] for row in rows]
+    
+    def list_requests(self, pending: bool) -> List[ConfirmationRequest]:
+        """상태 조건에 맞는 요청 목록"""
+        with self._lock:
+            if pending:
+                return list(self._pending.values())
+            
+            rows = self._connection.execute(
+                "SELECT * FROM confirmation_requests WHERE status != ? ORDER BY created_at",
+                (PENDING_STATUS,)
+            ).fetchall()
+            return [self._from_row(row) for row in rows]
+    
+    def count(self, pending: bool) -> int:
+        """상태 조건에 맞는 요청 수"""
+        with self._lock:
+            if pending:
+                return len(self._pending)
+            
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM confirmation_requests WHERE status != ?", (PENDING_STATUS,)
+            ).fetchone()
+            return row[0]
+    
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        상태별 요청 수 (status 인덱스 사용)
+        
+        Returns:
+            상태별 요청 수
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM confirmation_requests GROUP BY status"
+            ).fetchall()
+            return {status: count for status, count in rows}
+    
+    def pop_expired(self, now: datetime) -> List[ConfirmationRequest]:
+        """
+        만료 시각이 지난 대기 중인 요청을 힙에서 꺼내 만료 처리
+        
+        이미 처리된 요청의 힙 항목은 꺼낼 때 무시하므로(지연 삭제)
+        만료 요청 k개 정리에 O(k log n)만 소요됩니다.
+        
+        Args:
+            now: 기준 시각
+        
+        Returns:
+            만료 처리된 요청 목록
+        """
+        expired = []
+        
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                expires_at, request_id = heapq.heappop(self._expiry_heap)
+                request = self._pending.get(request_id)
+                if request is None or request.expires_at != expires_at:
+                    continue
+                
+                request.status = "expired"
+                self.complete(request)
+                expired.append(request)
+        
+        return expired
+    
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._connection.close()
+    
+    def _load_pending_requests(self) -> None:
+        """저장된 대기 중인 요청을 메모리와 만료 힙에 적재"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT * FROM confirmation_requests WHERE status = ? ORDER BY created_at",
+                (PENDING_STATUS,)
+            ).fetchall()
+            
+            for row in rows:
+                request = self._from_row(row)
+                self._pending[request.id] = request
+                self._expiry_heap.append((request.expires_at, request.id))
+            heapq.heapify(self._expiry_heap)
+        
+        if rows:
+            logger.info(f"저장된 대기 중인 확인 요청 {len(rows)}개를 불러왔습니다.")
+    
+    def _write(self, request: ConfirmationRequest) -> None:
+        """요청을 SQLite에 저장 (INSERT OR REPLACE)"""
+        with self._connection:
+            self._connection.execute(
+                """
+                INSERT OR REPLACE INTO confirmation_requests (
+                    id, email_id, email_subject, event_info, confidence_score,
+                    confidence_breakdown, created_at, expires_at, status, response_data
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    request.id,
+                    request.email_id,
+                    request.email_subject,
+                    json.dumps(request.event_info.to_dict(), ensure_ascii=False),
+                    request.confidence_score,
+                    json.dumps(request.confidence_breakdown, ensure_ascii=False),
+                    request.created_at.isoformat(),
+                    request.expires_at.isoformat(),
+                    request.status,
+                    json.dumps(request.response_data, ensure_ascii=False, default=str)
+                    if request.response_data is not None else None
+                )
+            )
+    
+    def _from_row(self, row: Tuple[Any, ...]) -> ConfirmationRequest:
+        """SQLite 행을 확인 요청 객체로 변환"""
+        (request_id, email_id, email_subject, event_info, confidence_score,
+         confidence_breakdown, created_at, expires_at, status, response_data) = row
+        
+        return ConfirmationRequest(
+            id=request_id,
+            email_id=email_id,
+            email_subject=email_subject or "",
+            event_info=ExtractedEventInfo.from_dict(json.loads(event_info)) if event_info else ExtractedEventInfo(),
+            confidence_score=confidence_score or 0.0,
+            confidence_breakdown=json.loads(confidence_breakdown) if confidence_breakdown else {},
+            created_at=datetime.fromisoformat(created_at),
+            expires_at=datetime.fromisoformat(expires_at),
+            status=status,
+            response_data=json.loads(response_data) if response_data else None
+        )
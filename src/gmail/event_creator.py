@@ -6,7 +6,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Union
 
 from ..calendar.service import CalendarService
 from ..calendar.models import CalendarEvent
@@ -58,6 +58,9 @@ class EventCreator:
         """
         일정 생성
         
+        기존 일정과 시간이 겹치면 결과에 충돌 일정을 표시하고,
+        require_confirmation이 True이면 생성 전에 사용자 확인을 요청합니다.
+        
         Args:
             event_info: 추출된 일정 정보
             email_id: 원본 이메일 ID
@@ -85,6 +88,14 @@ class EventCreator:
             # CalendarEvent 객체 생성
             calendar_event = self._create_calendar_event(event_info, email_id, email_subject)
             
+            # 기존 일정과의 충돌 확인
+            conflicts = self._find_conflicts(calendar_event)
+            if conflicts and require_confirmation:
+                logger.info(f"기존 일정 {len(conflicts)}개와 시간이 겹쳐 사용자 확인 요청")
+                return self._request_user_confirmation_via_service(
+                    event_info, email_id, email_subject, rule_id, conflicts=conflicts
+                )
+            
             # 캘린더에 일정 생성
             created_event = self.calendar_service.create_new_event(
                 summary=calendar_event.summary,
@@ -119,6 +130,7 @@ class EventCreator:
                 'event_data': created_event,
                 'confidence_score': event_info.overall_confidence,
                 'status': 'created',
+                'conflicts': [self._summarize_conflict(event) for event in conflicts],
                 'message': '일정이 성공적으로 생성되었습니다.'
             }
             
@@ -431,6 +443,48 @@ class EventCreator:
             all_day=event_info.all_day
         )
     
+    def _find_conflicts(self, calendar_event: CalendarEvent) -> List[CalendarEvent]:
+        """
+        생성할 일정과 시간이 겹치는 기존 일정 조회
+        
+        충돌 확인에 실패해도 일정 생성은 계속 진행할 수 있도록 빈 목록을 반환합니다.
+        
+        Args:
+            calendar_event: 생성할 일정
+            
+        Returns:
+            겹치는 기존 일정 목록 (종일 일정은 확인하지 않음)
+        """
+        if calendar_event.all_day:
+            return []
+        
+        try:
+            return self.calendar_service.find_conflicts(
+                calendar_event.start_time,
+                calendar_event.end_time,
+                format_response=False
+            )
+        except CalendarServiceError as e:
+            logger.warning(f"일정 충돌 확인 실패, 충돌 확인 없이 진행합니다: {e}")
+            return []
+    
+    def _summarize_conflict(self, event: CalendarEvent) -> Dict[str, Any]:
+        """
+        충돌 일정 요약
+        
+        Args:
+            event: 충돌 일정
+            
+        Returns:
+            ID, 제목, 시간 정보
+        """
+        return {
+            'id': event.id,
+            'summary': event.summary,
+            'start_time': event.start_time,
+            'end_time': event.end_time
+        }
+    
     def _create_event_description(
         self,
         original_description: Optional[str],
@@ -517,7 +571,8 @@ class EventCreator:
         event_info: ExtractedEventInfo,
         email_id: str,
         email_subject: str = "",
-        rule_id: Optional[int] = None
+        rule_id: Optional[int] = None,
+        conflicts: Optional[List[CalendarEvent]] = None
     ) -> Dict[str, Any]:
         """
         확인 서비스를 통한 사용자 확인 요청
@@ -527,6 +582,7 @@ class EventCreator:
             email_id: 이메일 ID
             email_subject: 이메일 제목
             rule_id: 규칙 ID
+            conflicts: 시간이 겹치는 기존 일정 목록 (선택 사항)
             
         Returns:
             확인 요청 결과
@@ -565,12 +621,18 @@ class EventCreator:
                 callback_function=confirmation_callback
             )
             
+            if conflicts:
+                message = f'기존 일정 {len(conflicts)}개와 시간이 겹쳐 사용자 확인이 필요합니다.'
+            else:
+                message = f'신뢰도가 낮아 사용자 확인이 필요합니다. (신뢰도: {event_info.overall_confidence:.2f})'
+            
             return {
                 'success': True,
                 'status': 'pending_confirmation',
                 'request_id': request_id,
                 'confidence_score': event_info.overall_confidence,
-                'message': f'신뢰도가 낮아 사용자 확인이 필요합니다. (신뢰도: {event_info.overall_confidence:.2f})',
+                'conflicts': [self._summarize_conflict(event) for event in conflicts or []],
+                'message': message,
                 'event_details': self.format_event_data(event_info)
             }
             
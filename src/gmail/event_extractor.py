@@ -7,47 +7,55 @@ import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import google.generativeai as genai
 from dateutil import parser as date_parser
 from dateutil.relativedelta import relativedelta
 
 from .models import ExtractedEventInfo, EmailMetadata
+from .event_prefilter import EventPreFilter, PreFilterRoute, KOREAN_DATE_PATTERNS, KOREAN_TIME_PATTERNS
 from ..config import GOOGLE_API_KEY
+from ..tracing import KIND_LLM, bind_context, span
 
 
 class EventExtractor:
     """이메일에서 일정 관련 정보를 추출하는 클래스"""
     
-    def __init__(self, model_name: str = "gemini-1.5-pro-latest"):
+    # 토큰 수 추정에 사용하는 문자/토큰 비율 (한국어 기준 보수적 추정)
+    CHARS_PER_TOKEN = 2
+    
+    def __init__(self, model_name: str = "gemini-1.5-pro-latest", model: Any = None,
+                 batch_size: int = 10, max_batch_tokens: int = 8000, max_concurrency: int = 2,
+                 prefilter: Optional[EventPreFilter] = None):
         """
         Args:
             model_name: 사용할 Gemini 모델명
+            model: generate_content()를 제공하는 모델 객체 (지정 시 Gemini 설정 생략)
+            batch_size: 일괄 추출 시 한 프롬프트에 담을 최대 이메일 수
+            max_batch_tokens: 일괄 추출 시 한 프롬프트의 최대 추정 토큰 수
+            max_concurrency: 일괄 추출 시 동시에 실행할 최대 LLM 호출 수
+            prefilter: LLM 호출 전에 이메일을 분류할 사전 필터 (None이면 모든 이메일을 LLM으로 추출)
         """
         self.logger = logging.getLogger(__name__)
         
         # Gemini API 설정
-        genai.configure(api_key=GOOGLE_API_KEY)
-        self.model = genai.GenerativeModel(model_name)
+        if model is None:
+            genai.configure(api_key=GOOGLE_API_KEY)
+            model = genai.GenerativeModel(model_name)
+        self.model = model
         
-        # 한국어 날짜/시간 패턴
-        self.korean_date_patterns = [
-            r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',
-            r'(\d{1,2})월\s*(\d{1,2})일',
-            r'(\d{1,2})/(\d{1,2})',
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',
-            r'(\d{1,2})-(\d{1,2})',
-        ]
+        # 일괄 추출 설정
+        self.batch_size = max(1, batch_size)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max(1, max_concurrency)
         
-        self.korean_time_patterns = [
-            r'(\d{1,2})시\s*(\d{1,2})분',
-            r'(\d{1,2})시',
-            r'오전\s*(\d{1,2})시\s*(\d{1,2})분',
-            r'오후\s*(\d{1,2})시\s*(\d{1,2})분',
-            r'오전\s*(\d{1,2})시',
-            r'오후\s*(\d{1,2})시',
-            r'(\d{1,2}):(\d{2})',
-        ]
+        # 사전 필터 설정
+        self.prefilter = prefilter
+        
+        # 한국어 날짜/시간 패턴
+        self.korean_date_patterns = list(KOREAN_DATE_PATTERNS)
+        self.korean_time_patterns = list(KOREAN_TIME_PATTERNS)
         
         # 위치 관련 키워드
         self.location_keywords = [
@@ -76,33 +84,17 @@ class EventExtractor:
         try:
             self.logger.info("이메일에서 일정 정보 추출 시작")
             
-            # Gemini를 사용한 구조화된 정보 추출
-            structured_info = self._extract_with_gemini(email_content, email_metadata)
-            
-            # 개별 정보 추출 및 검증
-            event_info = ExtractedEventInfo()
-            
-            # 제목 추출
-            event_info.summary = self._extract_summary(email_content, email_metadata, structured_info)
+            route = self._prefilter_route(email_content, email_metadata)
+            if route == PreFilterRoute.SKIP:
+                self.logger.info("일정 신호가 없어 일정 정보 추출 생략")
+                return ExtractedEventInfo()
             
-            # 날짜/시간 추출
-            start_time, end_time, all_day = self._extract_datetime(email_content, structured_info)
-            event_info.start_time = start_time
-            event_info.end_time = end_time
-            event_info.all_day = all_day
+            # Gemini를 사용한 구조화된 정보 추출 (패턴 매칭 전용이면 생략)
+            structured_info = {}
+            if route == PreFilterRoute.LLM:
+                structured_info = self._extract_with_gemini(email_content, email_metadata)
             
-            # 위치 정보 추출
-            event_info.location = self._extract_location(email_content, structured_info)
-            
-            # 참석자 정보 추출
-            event_info.participants = self._extract_participants(email_content, email_metadata, structured_info)
-            
-            # 설명 추출
-            event_info.description = self._extract_description(email_content, structured_info)
-            
-            # 신뢰도 점수 계산
-            event_info.confidence_scores = self._calculate_individual_confidence_scores(event_info, email_content)
-            event_info.overall_confidence = self._calculate_overall_confidence(event_info.confidence_scores)
+            event_info = self._build_event_info(email_content, email_metadata, structured_info)
             
             self.logger.info(f"일정 정보 추출 완료 - 전체 신뢰도: {event_info.overall_confidence:.2f}")
             return event_info
@@ -111,6 +103,110 @@ class EventExtractor:
             self.logger.error(f"일정 정보 추출 중 오류 발생: {str(e)}")
             return ExtractedEventInfo()
     
+    def extract_event_info_batch(self, emails: List[Tuple[str, Optional[EmailMetadata]]]) -> List[ExtractedEventInfo]:
+        """
+        여러 이메일에서 일정 정보를 일괄 추출
+        
+        이메일 여러 건을 하나의 프롬프트로 묶어 LLM 호출 횟수를 줄입니다.
+        일괄 응답을 파싱할 수 없거나 일부 이메일의 결과가 누락되면
+        해당 이메일은 단건 추출 방식으로 다시 처리합니다.
+        
+        Args:
+            emails: (이메일 내용, 이메일 메타데이터) 튜플 목록
+            
+        Returns:
+            입력 순서와 동일한 순서의 추출된 일정 정보 목록
+        """
+        if not emails:
+            return []
+        
+        self.logger.info(f"일괄 일정 정보 추출 시작 - 이메일 {len(emails)}건")
+        
+        items = [(f"email_{index}", content, metadata) for index, (content, metadata) in enumerate(emails)]
+        routes = {email_id: self._prefilter_route(content, metadata) for email_id, content, metadata in items}
+        
+        llm_items = [item for item in items if routes[item[0]] == PreFilterRoute.LLM]
+        batches = self._split_into_batches(llm_items)
+        
+        structured_by_id: Dict[str, Dict[str, Any]] = {}
+        if self.max_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+                # 작업 스레드의 LLM 구간이 현재 구간의 자식으로 남도록 컨텍스트를 전달
+                for batch_result in executor.map(bind_context(self._extract_batch_with_gemini), batches):
+                    structured_by_id.update(batch_result)
+        else:
+            for batch in batches:
+                structured_by_id.update(self._extract_batch_with_gemini(batch))
+        
+        results = []
+        for email_id, content, metadata in items:
+            if routes[email_id] == PreFilterRoute.SKIP:
+                results.append(ExtractedEventInfo())
+                continue
+            try:
+                results.append(self._build_event_info(content, metadata, structured_by_id.get(email_id, {})))
+            except Exception as e:
+                self.logger.error(f"일정 정보 추출 중 오류 발생 ({email_id}): {str(e)}")
+                results.append(ExtractedEventInfo())
+        
+        self.logger.info(f"일괄 일정 정보 추출 완료 - 이메일 {len(emails)}건, 배치 {len(batches)}개")
+        return results
+    
+    def _prefilter_route(self, email_content: str, email_metadata: EmailMetadata = None) -> PreFilterRoute:
+        """
+        사전 필터로 이메일 처리 경로 결정
+        
+        Args:
+            email_content: 이메일 내용
+            email_metadata: 이메일 메타데이터
+            
+        Returns:
+            처리 경로 (사전 필터가 없으면 항상 LLM)
+        """
+        if self.prefilter is None:
+            return PreFilterRoute.LLM
+        return self.prefilter.classify(email_content, email_metadata).route
+    
+    def _build_event_info(self, email_content: str, email_metadata: Optional[EmailMetadata],
+                          structured_info: Dict[str, Any]) -> ExtractedEventInfo:
+        """
+        구조화된 정보와 이메일 내용으로 일정 정보 구성
+        
+        Args:
+            email_content: 이메일 내용
+            email_metadata: 이메일 메타데이터
+            structured_info: Gemini에서 추출한 구조화된 정보
+            
+        Returns:
+            구성된 일정 정보
+        """
+        # 개별 정보 추출 및 검증
+        event_info = ExtractedEventInfo()
+            
+        # 제목 추출
+        event_info.summary = self._extract_summary(email_content, email_metadata, structured_info)
+        
+        # 날짜/시간 추출
+        start_time, end_time, all_day = self._extract_datetime(email_content, structured_info)
+        event_info.start_time = start_time
+        event_info.end_time = end_time
+        event_info.all_day = all_day
+        
+        # 위치 정보 추출
+        event_info.location = self._extract_location(email_content, structured_info)
+        
+        # 참석자 정보 추출
+        event_info.participants = self._extract_participants(email_content, email_metadata, structured_info)
+        
+        # 설명 추출
+        event_info.description = self._extract_description(email_content, structured_info)
+        
+        # 신뢰도 점수 계산
+        event_info.confidence_scores = self._calculate_individual_confidence_scores(event_info, email_content)
+        event_info.overall_confidence = self._calculate_overall_confidence(event_info.confidence_scores)
+        
+        return event_info
+    
     def _extract_with_gemini(self, email_content: str, email_metadata: EmailMetadata = None) -> Dict[str, Any]:
         """
         Gemini를 사용하여 구조화된 일정 정보 추출
@@ -127,7 +223,8 @@ class EventExtractor:
             prompt = self._build_extraction_prompt(email_content, email_metadata)
             
             # Gemini API 호출
-            response = self.model.generate_content(prompt)
+            with span('llm.generate_content', KIND_LLM, emails=1, prompt_chars=len(prompt)):
+                response = self.model.generate_content(prompt)
             
             # JSON 응답 파싱
             response_text = response.text.strip()
@@ -165,10 +262,7 @@ class EventExtractor:
         if email_metadata:
             metadata_info = f"""
 이메일 메타데이터:
-- 제목: {email_metadata.subject}
-- 발신자: {email_metadata.sender}
-- 수신자: {', '.join(email_metadata.recipients)}
-- 날짜: {email_metadata.date}
+{self._format_metadata(email_metadata)}
 """
         
         prompt = f"""
@@ -209,6 +303,202 @@ class EventExtractor:
         
         return prompt
     
+    def _format_metadata(self, email_metadata: EmailMetadata) -> str:
+        """
+        프롬프트에 포함할 이메일 메타데이터 문자열 구성
+        
+        Args:
+            email_metadata: 이메일 메타데이터
+            
+        Returns:
+            메타데이터 문자열
+        """
+        return (
+            f"- 제목: {email_metadata.subject}\n"
+            f"- 발신자: {email_metadata.sender}\n"
+            f"- 수신자: {', '.join(email_metadata.recipients)}\n"
+            f"- 날짜: {email_metadata.date}"
+        )
+    
+    def _estimate_tokens(self, email_content: str, email_metadata: EmailMetadata = None) -> int:
+        """
+        이메일 한 건이 프롬프트에서 차지할 토큰 수 추정
+        
+        Args:
+            email_content: 이메일 내용
+            email_metadata: 이메일 메타데이터
+            
+        Returns:
+            추정 토큰 수
+        """
+        length = len(email_content or "")
+        if email_metadata:
+            length += len(self._format_metadata(email_metadata))
+        return length // self.CHARS_PER_TOKEN + 1
+    
+    def _split_into_batches(self, items: List[Tuple[str, str, Optional[EmailMetadata]]]) -> List[List[Tuple[str, str, Optional[EmailMetadata]]]]:
+        """
+        배치 크기와 토큰 예산에 맞게 이메일을 배치로 분할
+        
+        토큰 예산을 혼자 초과하는 이메일은 단독 배치가 되어 단건 방식으로 처리됩니다.
+        
+        Args:
+            items: (이메일 ID, 이메일 내용, 이메일 메타데이터) 튜플 목록
+            
+        Returns:
+            배치 목록
+        """
+        batches = []
+        current_batch = []
+        current_tokens = 0
+        
+        for item in items:
+            tokens = self._estimate_tokens(item[1], item[2])
+            if current_batch and (len(current_batch) >= self.batch_size or
+                                  current_tokens + tokens > self.max_batch_tokens):
+                batches.append(current_batch)
+                current_batch = []
+                current_tokens = 0
+            current_batch.append(item)
+            current_tokens += tokens
+        
+        if current_batch:
+            batches.append(current_batch)
+        
+        return batches
+    
+    def _extract_batch_with_gemini(self, batch: List[Tuple[str, str, Optional[EmailMetadata]]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Gemini를 사용하여 배치 단위로 구조화된 일정 정보 추출
+        
+        Args:
+            batch: (이메일 ID, 이메일 내용, 이메일 메타데이터) 튜플 목록
+            
+        Returns:
+            이메일 ID별 구조화된 일정 정보
+        """
+        if len(batch) == 1:
+            email_id, content, metadata = batch[0]
+            return {email_id: self._extract_with_gemini(content, metadata)}
+        
+        parsed = None
+        try:
+            prompt = self._build_batch_extraction_prompt(batch)
+            with span('llm.generate_content', KIND_LLM, emails=len(batch), prompt_chars=len(prompt)):
+                response = self.model.generate_content(prompt)
+            parsed = self._parse_batch_response(response.text)
+        except Exception as e:
+            self.logger.warning(f"Gemini 일괄 추출 중 오류, 단건 추출로 대체: {str(e)}")
+        
+        if parsed is None:
+            parsed = {}
+        
+        results = {}
+        for email_id, content, metadata in batch:
+            if email_id in parsed:
+                results[email_id] = parsed[email_id]
+            else:
+                # 응답에서 누락된 이메일은 단건 방식으로 다시 추출
+                self.logger.debug(f"일괄 응답에 {email_id} 결과가 없어 단건 추출로 대체")
+                results[email_id] = self._extract_with_gemini(content, metadata)
+        
+        return results
+    
+    def _build_batch_extraction_prompt(self, batch: List[Tuple[str, str, Optional[EmailMetadata]]]) -> str:
+        """
+        여러 이메일의 일정 정보 추출을 위한 프롬프트 구성
+        
+        Args:
+            batch: (이메일 ID, 이메일 내용, 이메일 메타데이터) 튜플 목록
+            
+        Returns:
+            구성된 프롬프트
+        """
+        email_sections = []
+        for email_id, content, metadata in batch:
+            metadata_info = ""
+            if metadata:
+                metadata_info = f"이메일 메타데이터:\n{self._format_metadata(metadata)}\n"
+            email_sections.append(
+                f"<email id=\"{email_id}\">\n{metadata_info}이메일 내용:\n{content}\n</email>"
+            )
+        emails_text = "\n\n".join(email_sections)
+        
+        prompt = f"""
+다음 {len(batch)}개의 이메일 각각에서 일정/이벤트 관련 정보를 추출해주세요. 한국어 텍스트를 정확히 분석하여 구조화된 JSON 배열로 응답해주세요.
+
+{emails_text}
+
+각 이메일마다 배열 원소 하나씩, 다음 JSON 형식으로 응답해주세요:
+
+```json
+[
+    {{
+        "email_id": "이메일 id 속성 값 (예: email_0)",
+        "summary": "일정 제목 (회의명, 이벤트명 등)",
+        "start_time": "시작 날짜/시간 (ISO 8601 형식, 예: 2024-01-15T14:00:00)",
+        "end_time": "종료 날짜/시간 (ISO 8601 형식, 예: 2024-01-15T16:00:00)",
+        "location": "장소/위치 정보",
+        "description": "일정 설명/내용",
+        "participants": ["참석자1", "참석자2"],
+        "all_day": false,
+        "confidence": {{
+            "summary": 0.9,
+            "datetime": 0.8,
+            "location": 0.7,
+            "participants": 0.6
+        }}
+    }}
+]
+```
+
+주의사항:
+1. 모든 이메일에 대해 email_id를 그대로 포함한 원소를 하나씩 반환하세요
+2. 한국어 날짜/시간 표현을 정확히 인식하세요 (예: "내일 오후 2시", "다음주 월요일", "12월 15일 14시")
+3. 상대적 날짜 표현을 절대 날짜로 변환하세요
+4. 정보가 명확하지 않으면 confidence 점수를 낮게 설정하세요
+5. 일정과 관련없는 이메일이면 email_id를 제외한 모든 필드를 null 또는 빈 값으로 설정하세요
+6. 시간대는 한국 시간(KST)으로 가정하세요
+"""
+        
+        return prompt
+    
+    def _parse_batch_response(self, response_text: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        일괄 추출 응답(JSON 배열) 파싱
+        
+        Args:
+            response_text: Gemini 응답 텍스트
+            
+        Returns:
+            이메일 ID별 구조화된 정보 (파싱 실패 시 None)
+        """
+        response_text = (response_text or "").strip()
+        
+        # JSON 블록 추출
+        json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+        json_text = json_match.group(1) if json_match else response_text
+        
+        try:
+            entries = json.loads(json_text)
+        except json.JSONDecodeError:
+            self.logger.warning("Gemini 일괄 응답을 JSON으로 파싱할 수 없음")
+            return None
+        
+        if not isinstance(entries, list):
+            self.logger.warning("Gemini 일괄 응답이 JSON 배열이 아님")
+            return None
+        
+        results = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or not entry.get('email_id'):
+                continue
+            entry = dict(entry)
+            email_id = str(entry.pop('email_id'))
+            results[email_id] = entry
+        
+        return results
+    
     def _extract_summary(self, email_content: str, email_metadata: EmailMetadata, structured_info: Dict) -> str:
         """
         일정 제목 추출
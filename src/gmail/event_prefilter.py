@@ -0,0 +1,267 @@
+"""
+LLM 호출 전에 일정 신호가 없는 이메일을 걸러내는 EventPreFilter 클래스
+
+컴파일된 정규식과 발신자/라벨 규칙만으로 이메일을 분류하여
+일정 정보가 없는 이메일은 건너뛰고, 단순한 이메일은 패턴 매칭만으로 처리하며,
+나머지 이메일만 LLM 추출로 보냅니다.
+"""
+
+import re
+import logging
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+
+from .models import EmailMetadata
+
+
+# 한국어 날짜 패턴
+KOREAN_DATE_PATTERNS = [
+    r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',
+    r'(\d{1,2})월\s*(\d{1,2})일',
+    r'(\d{1,2})/(\d{1,2})',
+    r'(\d{4})-(\d{1,2})-(\d{1,2})',
+    r'(\d{1,2})-(\d{1,2})',
+]
+
+# 한국어 시간 패턴
+KOREAN_TIME_PATTERNS = [
+    r'(\d{1,2})시\s*(\d{1,2})분',
+    r'(\d{1,2})시',
+    r'오전\s*(\d{1,2})시\s*(\d{1,2})분',
+    r'오후\s*(\d{1,2})시\s*(\d{1,2})분',
+    r'오전\s*(\d{1,2})시',
+    r'오후\s*(\d{1,2})시',
+    r'(\d{1,2}):(\d{2})',
+]
+
+# 상대적 날짜 표현 (EventExtractor._parse_relative_date가 처리하는 표현 + 요일)
+RELATIVE_DATE_KEYWORDS = [
+    '오늘', '내일', '모레', '이번주', '다음주', '다음달',
+    '월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일',
+]
+
+# 일정 관련 키워드
+EVENT_KEYWORDS = [
+    '회의', '미팅', '만남', '약속', '모임', '세미나', '워크샵', '컨퍼런스', '발표',
+    '일정', '예약', '행사', '면접', '초대', '참석', '마감',
+    'meeting', 'invitation', 'appointment', 'schedule',
+]
+
+# 홍보성 발신자 패턴 (이메일 주소의 로컬 파트 기준)
+PROMOTIONAL_SENDER_PATTERN = r'(no-?reply|newsletter|news|marketing|promo|promotion|ad|ads|event-mail|mailer)'
+
+# 홍보성/무시 대상 Gmail 라벨
+PROMOTIONAL_LABELS = {'CATEGORY_PROMOTIONS', 'CATEGORY_SOCIAL', 'CATEGORY_FORUMS'}
+IGNORED_LABELS = {'SPAM', 'TRASH'}
+
+
+def _combine_patterns(patterns: Iterable[str]) -> str:
+    """여러 정규식을 하나의 선택(alternation) 패턴으로 결합"""
+    return '|'.join(f'(?:{pattern})' for pattern in patterns)
+
+
+_URL_REGEX = re.compile(r'https?://\S+|www\.\S+')
+_DATE_REGEX = re.compile(_combine_patterns(KOREAN_DATE_PATTERNS))
+_TIME_REGEX = re.compile(_combine_patterns(KOREAN_TIME_PATTERNS))
+_RELATIVE_DATE_REGEX = re.compile(_combine_patterns(map(re.escape, RELATIVE_DATE_KEYWORDS)))
+_EVENT_KEYWORD_REGEX = re.compile(_combine_patterns(map(re.escape, EVENT_KEYWORDS)), re.IGNORECASE)
+_PROMOTIONAL_SENDER_REGEX = re.compile(rf'(^|[^a-z]){PROMOTIONAL_SENDER_PATTERN}([^a-z]|$)', re.IGNORECASE)
+
+
+class PreFilterRoute(Enum):
+    """사전 필터 분류 결과"""
+    SKIP = "skip"
+    REGEX_ONLY = "regex_only"
+    LLM = "llm"
+
+
+@dataclass
+class PreFilterDecision:
+    """이메일 한 건에 대한 사전 필터 판단 결과"""
+
+    route: PreFilterRoute
+    reason: str
+    has_date: bool = False
+    has_time: bool = False
+    has_event_keyword: bool = False
+
+
+@dataclass
+class PreFilterMetrics:
+    """사전 필터 처리 통계"""
+
+    total: int = 0
+    routes: Dict[str, int] = field(default_factory=lambda: {route.value: 0 for route in PreFilterRoute})
+    reasons: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def llm_calls_saved(self) -> int:
+        """LLM 호출을 생략한 이메일 수"""
+        return self.total - self.routes[PreFilterRoute.LLM.value]
+
+    @property
+    def llm_call_savings_rate(self) -> float:
+        """LLM 호출 절감 비율"""
+        return self.llm_calls_saved / self.total if self.total else 0.0
+
+    def record(self, decision: PreFilterDecision) -> None:
+        """판단 결과 기록"""
+        self.total += 1
+        self.routes[decision.route.value] += 1
+        self.reasons[decision.reason] = self.reasons.get(decision.reason, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            'total': self.total,
+            'routes': dict(self.routes),
+            'reasons': dict(self.reasons),
+            'llm_calls_saved': self.llm_calls_saved,
+            'llm_call_savings_rate': self.llm_call_savings_rate
+        }
+
+
+class EventPreFilter:
+    """LLM 추출 전에 이메일의 일정 신호를 판단하는 규칙 기반 분류기"""
+
+    def __init__(self, regex_only_max_length: int = 200):
+        """
+        Args:
+            regex_only_max_length: 패턴 매칭만으로 처리할 이메일의 최대 길이 (0이면 비활성화)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.regex_only_max_length = regex_only_max_length
+        self._metrics = PreFilterMetrics()
+        self._lock = threading.Lock()
+
+    def classify(self, email_content: str, email_metadata: Optional[EmailMetadata] = None) -> PreFilterDecision:
+        """
+        이메일을 건너뛰기/패턴 매칭/LLM 추출 중 하나로 분류하고 통계에 기록
+
+        Args:
+            email_content: 이메일 내용
+            email_metadata: 이메일 메타데이터
+
+        Returns:
+            사전 필터 판단 결과
+        """
+        decision = self._route(email_content, email_metadata)
+
+        with self._lock:
+            self._metrics.record(decision)
+
+        self.logger.debug(f"사전 필터 판단: {decision.route.value} ({decision.reason})")
+        return decision
+
+    def _route(self, email_content: str, email_metadata: Optional[EmailMetadata] = None) -> PreFilterDecision:
+        """
+        통계 기록 없이 이메일 분류
+
+        Args:
+            email_content: 이메일 내용
+            email_metadata: 이메일 메타데이터
+
+        Returns:
+            사전 필터 판단 결과
+        """
+        email_content = email_content or ""
+        labels = set(email_metadata.labels) if email_metadata else set()
+
+        if labels & IGNORED_LABELS:
+            return PreFilterDecision(PreFilterRoute.SKIP, 'ignored_label')
+
+        # 제목에도 날짜가 들어 있는 경우가 많으므로 함께 검사하고, URL 안의 숫자는 제외
+        text = email_content
+        if email_metadata and email_metadata.subject:
+            text = f"{email_metadata.subject}\n{email_content}"
+        text = _URL_REGEX.sub(' ', text)
+
+        has_date = bool(_DATE_REGEX.search(text) or _RELATIVE_DATE_REGEX.search(text))
+        has_time = bool(_TIME_REGEX.search(text))
+        has_event_keyword = bool(_EVENT_KEYWORD_REGEX.search(text))
+
+        def decide(route: PreFilterRoute, reason: str) -> PreFilterDecision:
+            return PreFilterDecision(route, reason, has_date, has_time, has_event_keyword)
+
+        if not has_date and not (has_time and has_event_keyword):
+            return decide(PreFilterRoute.SKIP, 'no_date_signal')
+
+        if not has_event_keyword and self._is_promotional(email_metadata, labels):
+            return decide(PreFilterRoute.SKIP, 'promotional')
+
+        if (has_date and has_time and has_event_keyword and
+                len(email_content) <= self.regex_only_max_length):
+            return decide(PreFilterRoute.REGEX_ONLY, 'short_explicit')
+
+        return decide(PreFilterRoute.LLM, 'event_signal')
+
+    def _is_promotional(self, email_metadata: Optional[EmailMetadata], labels: set) -> bool:
+        """
+        발신자/라벨 기준 홍보성 이메일 여부 확인
+
+        Args:
+            email_metadata: 이메일 메타데이터
+            labels: 이메일 라벨 집합
+
+        Returns:
+            홍보성 이메일 여부
+        """
+        if labels & PROMOTIONAL_LABELS:
+            return True
+
+        if email_metadata and email_metadata.sender:
+            local_part = email_metadata.sender.rsplit('<', 1)[-1].split('@')[0]
+            return bool(_PROMOTIONAL_SENDER_REGEX.search(local_part))
+
+        return False
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        사전 필터 처리 통계 조회
+
+        Returns:
+            처리 통계
+        """
+        with self._lock:
+            return self._metrics.to_dict()
+
+    def reset_metrics(self) -> None:
+        """사전 필터 처리 통계 초기화"""
+        with self._lock:
+            self._metrics = PreFilterMetrics()
+
+    def evaluate(self, labeled_emails: Iterable[Tuple[str, Optional[EmailMetadata], bool]]) -> Dict[str, Any]:
+        """
+        라벨링된 이메일 코퍼스로 사전 필터의 LLM 호출 절감량과 재현율 평가
+
+        Args:
+            labeled_emails: (이메일 내용, 이메일 메타데이터, 일정 포함 여부) 튜플 목록
+
+        Returns:
+            평가 결과 (절감량, 재현율, 놓친 이메일 인덱스 등)
+        """
+        metrics = PreFilterMetrics()
+        event_count = 0
+        kept_event_count = 0
+        missed: List[int] = []
+
+        for index, (content, metadata, has_event) in enumerate(labeled_emails):
+            decision = self._route(content, metadata)
+            metrics.record(decision)
+
+            if has_event:
+                event_count += 1
+                if decision.route != PreFilterRoute.SKIP:
+                    kept_event_count += 1
+                else:
+                    missed.append(index)
+
+        result = metrics.to_dict()
+        result.update({
+            'event_emails': event_count,
+            'recall': kept_event_count / event_count if event_count else 1.0,
+            'missed_indices': missed
+        })
+        return result
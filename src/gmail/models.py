@@ -2,9 +2,10 @@
 이메일 캘린더 자동화를 위한 데이터 모델들
 """
 
+import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Any
 
 
 @dataclass
@@ -48,6 +49,41 @@ class ExtractedEventInfo:
             'confidence_scores': self.confidence_scores,
             'overall_confidence': self.overall_confidence
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExtractedEventInfo':
+        """딕셔너리에서 생성"""
+        start_time = data.get('start_time')
+        end_time = data.get('end_time')
+        
+        return cls(
+            summary=data.get('summary') or "",
+            start_time=datetime.fromisoformat(start_time) if isinstance(start_time, str) else start_time,
+            end_time=datetime.fromisoformat(end_time) if isinstance(end_time, str) else end_time,
+            location=data.get('location'),
+            description=data.get('description'),
+            participants=list(data.get('participants') or []),
+            all_day=data.get('all_day', False),
+            confidence_scores=dict(data.get('confidence_scores') or {}),
+            overall_confidence=data.get('overall_confidence', 0.0)
+        )
+
+
+@dataclass
+class ConfirmationRequest:
+    """사용자 확인 요청을 나타내는 데이터 클래스"""
+    
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    email_id: str = ""
+    email_subject: str = ""
+    event_info: ExtractedEventInfo = field(default_factory=ExtractedEventInfo)
+    confidence_score: float = 0.0
+    confidence_breakdown: Dict[str, float] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.now)
+    expires_at: datetime = field(default_factory=lambda: datetime.now() + timedelta(hours=24))
+    status: str = "pending"  # pending, confirmed, rejected, expired
+    response_data: Optional[Dict[str, Any]] = None
+    callback_function: Optional[Callable] = None
 
 
 @dataclass
@@ -101,4 +137,14 @@ class TodoItem:
     email_id: Optional[str] = None
     event_id: Optional[str] = None
     created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class AttachmentDownload:
+    """스트리밍 다운로드한 첨부 파일 정보를 나타내는 데이터 클래스"""
+    
+    file_path: str = ""
+    sha256: str = ""
+    size: int = 0
+    duplicate: bool = False  # 같은 해시의 파일이 이미 있어 저장을 건너뛴 경우
@@ -5,6 +5,7 @@
 """
 
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Callable
 from enum import Enum
@@ -29,18 +30,20 @@ class NotificationType(Enum):
 class NotificationService:
     """사용자에게 알림을 보내는 클래스"""
     
-    def __init__(self, email_service=None, console_output: bool = True):
+    def __init__(self, email_service=None, console_output: bool = True, history_size: int = 1000):
         """
         NotificationService 초기화
         
         Args:
             email_service: 이메일 발송 서비스 (선택 사항)
             console_output: 콘솔 출력 여부
+            history_size: 보관할 최대 알림 이력 수
         """
         self.email_service = email_service
         self.console_output = console_output
         self.notification_handlers: List[Callable] = []
-        self.notification_history: List[Dict[str, Any]] = []
+        # 고정 크기 링 버퍼: 가장 오래된 이력이 O(1)로 자동 제거됨
+        self.notification_history: deque = deque(maxlen=history_size)
     
     def notify_event_created(
         self,
@@ -267,15 +270,17 @@ class NotificationService:
         Returns:
             알림 이력 목록
         """
-        history = self.notification_history
+        history = []
         
-        # 유형별 필터링
-        if notification_type:
-            history = [n for n in history if n.get('type') == notification_type.value]
+        # 이력은 발송 순으로 쌓이므로 뒤에서부터 읽으면 최신 순 (정렬 불필요)
+        for notification in reversed(self.notification_history):
+            if len(history) >= limit:
+                break
+            if notification_type and notification.get('type') != notification_type.value:
+                continue
+            history.append(notification)
         
-        # 최신 순으로 정렬하고 제한
-        history = sorted(history, key=lambda x: x.get('timestamp', ''), reverse=True)
-        return history[:limit]
+        return history
     
     def clear_notification_history(self) -> None:
         """알림 이력 삭제"""
@@ -320,13 +325,9 @@ class NotificationService:
                     logger.error(f"이메일 알림 발송 중 오류: {e}")
                     success = False
             
-            # 이력에 추가
+            # 이력에 추가 (최대 개수를 넘으면 가장 오래된 이력이 제거됨)
             self.notification_history.append(notification_data)
             
-            # 이력 크기 제한 (최대 1000개)
-            if len(self.notification_history) > 1000:
-                self.notification_history = self.notification_history[-1000:]
-            
             return success
             
         except Exception as e:
@@ -5,12 +5,14 @@
 """
 
 import base64
+import binascii
 import email
+import hashlib
 import html
 import re
 import logging
 import os
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Union, Tuple
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -23,10 +25,276 @@ from googleapiclient.errors import HttpError
 from googleapiclient.discovery import Resource
 
 from .service import GmailServiceManager
+from .models import AttachmentDownload
+from .attachment_index import AttachmentHashIndex
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 첨부 파일 스트리밍 디코딩 단위 (base64 문자 수, 4의 배수)
+ATTACHMENT_CHUNK_SIZE = 64 * 1024
+
+# 텍스트 정제용 정규식 (모듈 로드 시 한 번만 컴파일)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_BLANK_LINES_PATTERN = re.compile(r"\n\s*\n")
+_SPACES_PATTERN = re.compile(r"[ \t]+")
+_LINE_START_SPACE_PATTERN = re.compile(r"\n ")
+_CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+_ZERO_WIDTH_PATTERN = re.compile(r'[\u200B-\u200D\uFEFF]')
+_LINE_SEPARATOR_PATTERN = re.compile(r'[\u2028\u2029]')
+
+# 서명 패턴: 가장 먼저 나타나는 서명 시작 위치부터 끝까지 제거
+_SIGNATURE_PATTERN = re.compile(
+    r"--\s*\n"  # -- 로 시작하는 서명
+    r"|Best regards"  # Best regards로 시작하는 서명
+    r"|Sincerely"  # Sincerely로 시작하는 서명
+    r"|감사합니다"  # 한국어 서명
+    r"|안녕히"  # 한국어 인사
+)
+
+# 인용문 패턴: 줄 단위로 한 번만 검사
+_QUOTED_LINE_PATTERN = re.compile(
+    r">"  # > 로 시작하는 인용문
+    r"|On .* wrote:"  # "On ... wrote:" 패턴
+    r"|.*님이 작성:"  # 한국어 인용문 패턴
+    r"|-----Original Message-----"  # 원본 메시지 구분선
+)
+
+
+# HTML 토크나이저: 스크립트/스타일 블록, 주석, 태그, 선언/처리 명령을 한 번의 스캔으로 찾음
+_HTML_TOKEN_PATTERN = re.compile(
+    r'<(?i:script|style)\b[^>]*>.*?(?:</(?i:script|style)\s*>|\Z)'  # 스크립트/스타일 (본문 제외)
+    r'|<!--.*?(?:-->|\Z)'  # 주석
+    r'|<(/?)([a-zA-Z][a-zA-Z0-9]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>'  # 시작/종료 태그 (한 글자 단위: 닫히지 않은 태그에서 역추적 폭증 방지)
+    r'|<[!?][^>]*>',  # DOCTYPE, 처리 명령 등
+    re.DOTALL
+)
+_HTML_ATTR_PATTERN = re.compile(r'([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+
+
+class _HTMLContentParser:
+    """
+    HTML을 한 번만 순회하며 텍스트, 링크, 이미지, 테이블, 구조화된 내용을 함께 추출하는 파서
+    
+    html.parser.HTMLParser와 같은 콜백 구조(handle_starttag/handle_endtag/handle_data)를 사용하지만,
+    토큰 분리는 미리 컴파일된 정규식 하나로 처리하여 HTMLParser보다 빠르게 동작합니다.
+    """
+    
+    BLOCK_TAGS = {'div', 'p', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr'}
+    HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+    ATTR_TAGS = {'a', 'img'}  # 속성 파싱이 필요한 태그
+    # 처리 대상 태그 (그 외 span, b, font 등은 텍스트만 통과)
+    TRACKED_TAGS = BLOCK_TAGS | {'a', 'img', 'ul', 'ol', 'table', 'td', 'th'}
+    
+    def __init__(self):
+        self.text_parts: List[str] = []
+        self.links: List[Dict[str, str]] = []
+        self.email_links: List[Dict[str, str]] = []
+        self.images: List[Dict[str, str]] = []
+        self.tables: List[Dict[str, Any]] = []
+        self.headings: List[Dict[str, Any]] = []
+        self.lists: List[Dict[str, Any]] = []
+        self.paragraphs: List[str] = []
+        
+        self._buffers: List[List[str]] = []  # 현재 텍스트를 수집 중인 버퍼들
+        self._link: Optional[Tuple[str, List[str]]] = None
+        self._heading: Optional[Tuple[int, List[str]]] = None
+        self._paragraph: Optional[List[str]] = None
+        self._list_stack: List[Dict[str, Any]] = []
+        self._table_stack: List[Dict[str, Any]] = []
+    
+    def feed(self, html_content: str) -> None:
+        """HTML 전체를 토큰 단위로 한 번 순회하며 콜백 호출"""
+        position = 0
+        tracked_tags = self.TRACKED_TAGS
+        
+        for match in _HTML_TOKEN_PATTERN.finditer(html_content):
+            start = match.start()
+            if start > position:
+                data = html_content[position:start]
+                self.handle_data(html.unescape(data) if '&' in data else data)
+            position = match.end()
+            
+            closing, tag, attr_text = match.group(1, 2, 3)
+            if tag is None:
+                continue  # 스크립트/스타일, 주석, DOCTYPE 등은 무시
+            
+            tag = tag.lower()
+            if tag not in tracked_tags:
+                continue
+            
+            if closing:
+                self.handle_endtag(tag)
+            else:
+                attrs = self._parse_attrs(attr_text) if tag in self.ATTR_TAGS else []
+                self.handle_starttag(tag, attrs)
+        
+        if position < len(html_content):
+            data = html_content[position:]
+            self.handle_data(html.unescape(data) if '&' in data else data)
+    
+    def _parse_attrs(self, attr_text: str) -> List[Tuple[str, Optional[str]]]:
+        attrs = []
+        for name, double_quoted, single_quoted, unquoted in _HTML_ATTR_PATTERN.findall(attr_text):
+            value = double_quoted or single_quoted or unquoted
+            attrs.append((name.lower(), html.unescape(value) if '&' in value else value))
+        return attrs
+    
+    @property
+    def text(self) -> str:
+        """태그가 제거된 원본 텍스트 (블록 요소는 줄바꿈으로 변환)"""
+        return "".join(self.text_parts)
+    
+    def _open_buffer(self) -> List[str]:
+        buffer: List[str] = []
+        self._buffers.append(buffer)
+        return buffer
+    
+    def _close_buffer(self, buffer: List[str]) -> str:
+        self._buffers = [b for b in self._buffers if b is not buffer]
+        return "".join(buffer).strip()
+    
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in self.BLOCK_TAGS:
+            self.text_parts.append("\n")
+        
+        if tag == 'a':
+            self._finish_link()
+            href = dict(attrs).get('href')
+            if href:
+                self._link = (href, self._open_buffer())
+        elif tag == 'img':
+            attr_map = dict(attrs)
+            if attr_map.get('src'):
+                self.images.append({
+                    "src": attr_map['src'],
+                    "alt": attr_map.get('alt') or "",
+                    "type": "image"
+                })
+        elif tag in self.HEADING_TAGS:
+            self._finish_heading()
+            self._heading = (int(tag[1]), self._open_buffer())
+        elif tag == 'p':
+            self._finish_paragraph()
+            self._paragraph = self._open_buffer()
+        elif tag in ('ul', 'ol'):
+            html_list = {"type": tag, "items": [], "item": None}
+            self.lists.append(html_list)
+            self._list_stack.append(html_list)
+        elif tag == 'li' and self._list_stack:
+            self._finish_list_item(self._list_stack[-1])
+            self._list_stack[-1]["item"] = self._open_buffer()
+        elif tag == 'table':
+            self._table_stack.append({"rows": [], "row": None, "cell": None})
+        elif tag == 'tr' and self._table_stack:
+            self._finish_table_row(self._table_stack[-1])
+            self._table_stack[-1]["row"] = []
+        elif tag in ('td', 'th') and self._table_stack:
+            table = self._table_stack[-1]
+            self._finish_table_cell(table)
+            if table["row"] is None:
+                table["row"] = []
+            table["cell"] = self._open_buffer()
+    
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.BLOCK_TAGS:
+            self.text_parts.append("\n")
+        
+        if tag == 'a':
+            self._finish_link()
+        elif tag in self.HEADING_TAGS:
+            self._finish_heading()
+        elif tag == 'p':
+            self._finish_paragraph()
+        elif tag in ('ul', 'ol') and self._list_stack:
+            self._finish_list_item(self._list_stack.pop())
+        elif tag == 'li' and self._list_stack:
+            self._finish_list_item(self._list_stack[-1])
+        elif tag == 'table' and self._table_stack:
+            self._finish_table(self._table_stack.pop())
+        elif tag == 'tr' and self._table_stack:
+            self._finish_table_row(self._table_stack[-1])
+        elif tag in ('td', 'th') and self._table_stack:
+            self._finish_table_cell(self._table_stack[-1])
+    
+    def handle_data(self, data: str) -> None:
+        self.text_parts.append(data)
+        for buffer in self._buffers:
+            buffer.append(data)
+    
+    def close(self) -> None:
+        """닫히지 않은 요소 정리"""
+        self._finish_link()
+        self._finish_heading()
+        self._finish_paragraph()
+        while self._list_stack:
+            self._finish_list_item(self._list_stack.pop())
+        while self._table_stack:
+            self._finish_table(self._table_stack.pop())
+    
+    def _finish_link(self) -> None:
+        if self._link is None:
+            return
+        
+        href, buffer = self._link
+        self._link = None
+        self.links.append({"url": href, "text": self._close_buffer(buffer), "type": "link"})
+        
+        if href.lower().startswith("mailto:"):
+            email_addr = href[len("mailto:"):]
+            self.email_links.append({"url": f"mailto:{email_addr}", "text": email_addr, "type": "email"})
+    
+    def _finish_heading(self) -> None:
+        if self._heading is None:
+            return
+        
+        level, buffer = self._heading
+        self._heading = None
+        self.headings.append({"level": level, "text": self._close_buffer(buffer)})
+    
+    def _finish_paragraph(self) -> None:
+        if self._paragraph is None:
+            return
+        
+        paragraph = self._close_buffer(self._paragraph)
+        self._paragraph = None
+        if paragraph:  # 빈 단락 제외
+            self.paragraphs.append(paragraph)
+    
+    def _finish_list_item(self, html_list: Dict[str, Any]) -> None:
+        if html_list["item"] is not None:
+            html_list["items"].append(self._close_buffer(html_list["item"]))
+            html_list["item"] = None
+    
+    def _finish_table_cell(self, table: Dict[str, Any]) -> None:
+        if table["cell"] is not None:
+            table["row"].append(self._close_buffer(table["cell"]))
+            table["cell"] = None
+    
+    def _finish_table_row(self, table: Dict[str, Any]) -> None:
+        self._finish_table_cell(table)
+        if table["row"]:
+            table["rows"].append(table["row"])
+        table["row"] = None
+    
+    def _finish_table(self, table: Dict[str, Any]) -> None:
+        self._finish_table_row(table)
+        if table["rows"]:
+            self.tables.append({
+                "rows": table["rows"],
+                "row_count": len(table["rows"]),
+                "col_count": len(table["rows"][0])
+            })
+    
+    def structured_content(self) -> Dict[str, Any]:
+        """제목, 목록, 단락 정보"""
+        return {
+            "headings": self.headings,
+            "lists": [{"type": html_list["type"], "items": html_list["items"]} for html_list in self.lists],
+            "paragraphs": self.paragraphs
+        }
+
+
 class EmailProcessor:
     """이메일 내용을 가져와 처리하는 클래스"""
     
@@ -497,7 +765,7 @@ class EmailProcessor:
                 return ""
             
             # HTML 태그 제거
-            text = re.sub(r"<[^>]+>", "", text)
+            text = _TAG_PATTERN.sub("", text)
             
             # HTML 엔티티 디코딩
             text = html.unescape(text)
@@ -506,9 +774,9 @@ class EmailProcessor:
             text = self._clean_special_characters(text)
             
             # 과도한 공백 및 줄바꿈 정리
-            text = re.sub(r"\n\s*\n", "\n\n", text)  # 연속된 빈 줄을 두 줄로 제한
-            text = re.sub(r"[ \t]+", " ", text)  # 연속된 공백을 하나로
-            text = re.sub(r"\n ", "\n", text)  # 줄 시작의 공백 제거
+            text = _BLANK_LINES_PATTERN.sub("\n\n", text)  # 연속된 빈 줄을 두 줄로 제한
+            text = _SPACES_PATTERN.sub(" ", text)  # 연속된 공백을 하나로
+            text = _LINE_START_SPACE_PATTERN.sub("\n", text)  # 줄 시작의 공백 제거
             
             # 앞뒤 공백 제거
             text = text.strip()
@@ -549,27 +817,15 @@ class EmailProcessor:
                     "raw_html": ""
                 }
             
-            # HTML에서 텍스트 추출 (개선된 방식)
-            text_content = self._extract_text_from_html(html_content)
-            
-            # 링크 추출 (개선된 방식)
-            links = self._extract_links_from_html(html_content)
-            
-            # 이미지 추출 (개선된 방식)
-            images = self._extract_images_from_html(html_content)
-            
-            # 테이블 추출
-            tables = self._extract_tables_from_html(html_content)
-            
-            # 구조화된 내용 추출 (제목, 목록 등)
-            structured_content = self._extract_structured_content(html_content)
+            # HTML을 한 번만 파싱하여 텍스트, 링크, 이미지, 테이블, 구조화된 내용을 함께 추출
+            parsed = self._parse_html(html_content)
             
             return {
-                "text": text_content,
-                "links": links,
-                "images": images,
-                "tables": tables,
-                "structured_content": structured_content,
+                "text": self._normalize_html_text(parsed.text),
+                "links": parsed.links + parsed.email_links,
+                "images": parsed.images,
+                "tables": parsed.tables,
+                "structured_content": parsed.structured_content(),
                 "raw_html": html_content
             }
             
@@ -646,17 +902,10 @@ class EmailProcessor:
             서명이 제거된 텍스트
         """
         try:
-            # 일반적인 서명 패턴 제거
-            patterns = [
-                r"--\s*\n.*$",  # -- 로 시작하는 서명
-                r"Best regards.*$",  # Best regards로 시작하는 서명
-                r"Sincerely.*$",  # Sincerely로 시작하는 서명
-                r"감사합니다.*$",  # 한국어 서명
-                r"안녕히.*$"  # 한국어 인사
-            ]
-            
-            for pattern in patterns:
-                text = re.sub(pattern, "", text, flags=re.MULTILINE | re.DOTALL)
+            # 가장 먼저 나타나는 서명 시작 위치부터 끝까지 제거
+            match = _SIGNATURE_PATTERN.search(text)
+            if match:
+                text = text[:match.start()]
             
             return text.strip()
             
@@ -675,27 +924,12 @@ class EmailProcessor:
             인용문이 제거된 텍스트
         """
         try:
-            # 일반적인 인용문 패턴 제거
-            patterns = [
-                r"^>.*$",  # > 로 시작하는 인용문
-                r"On .* wrote:.*$",  # "On ... wrote:" 패턴
-                r".*님이 작성:.*$",  # 한국어 인용문 패턴
-                r"-----Original Message-----.*$"  # 원본 메시지 구분선
+            # 인용문 줄 제거
+            filtered_lines = [
+                line for line in text.split("\n")
+                if not _QUOTED_LINE_PATTERN.match(line.strip())
             ]
             
-            lines = text.split("\n")
-            filtered_lines = []
-            
-            for line in lines:
-                is_quoted = False
-                for pattern in patterns:
-                    if re.match(pattern, line.strip(), re.MULTILINE | re.DOTALL):
-                        is_quoted = True
-                        break
-                
-                if not is_quoted:
-                    filtered_lines.append(line)
-            
             return "\n".join(filtered_lines).strip()
             
         except Exception as e:
@@ -714,11 +948,11 @@ class EmailProcessor:
         """
         try:
             # 제어 문자 제거 (탭과 줄바꿈 제외)
-            text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+            text = _CONTROL_CHARS_PATTERN.sub('', text)
             
             # 특수 유니코드 문자 정리
-            text = re.sub(r'[\u200B-\u200D\uFEFF]', '', text)  # 제로 폭 문자
-            text = re.sub(r'[\u2028\u2029]', '\n', text)  # 줄 구분자를 일반 줄바꿈으로
+            text = _ZERO_WIDTH_PATTERN.sub('', text)  # 제로 폭 문자
+            text = _LINE_SEPARATOR_PATTERN.sub('\n', text)  # 줄 구분자를 일반 줄바꿈으로
             
             # 이메일에서 자주 나타나는 특수 문자 정리
             text = text.replace('\r\n', '\n')  # Windows 줄바꿈을 Unix 스타일로
@@ -730,9 +964,40 @@ class EmailProcessor:
             logger.error(f"특수 문자 정제 중 오류 발생: {str(e)}")
             return text
     
+    def _parse_html(self, html_content: str) -> _HTMLContentParser:
+        """
+        HTML을 한 번 순회하여 파싱
+        
+        Args:
+            html_content: HTML 내용
+            
+        Returns:
+            파싱이 완료된 파서
+        """
+        parser = _HTMLContentParser()
+        parser.feed(html_content)
+        parser.close()
+        return parser
+    
+    def _normalize_html_text(self, text_content: str) -> str:
+        """
+        HTML에서 추출한 텍스트 정제
+        
+        Args:
+            text_content: 태그가 제거되고 엔티티가 디코딩된 텍스트
+            
+        Returns:
+            정제된 텍스트
+        """
+        text_content = self._clean_special_characters(text_content)
+        text_content = _BLANK_LINES_PATTERN.sub('\n\n', text_content)  # 연속된 빈 줄 정리
+        text_content = _SPACES_PATTERN.sub(' ', text_content)  # 연속된 공백 정리
+        
+        return text_content.strip()
+    
     def _extract_text_from_html(self, html_content: str) -> str:
         """
-        HTML에서 텍스트 추출 (개선된 방식)
+        HTML에서 텍스트 추출 (스크립트/스타일 제외, 블록 요소는 줄바꿈으로 변환)
         
         Args:
             html_content: HTML 내용
@@ -741,28 +1006,7 @@ class EmailProcessor:
             추출된 텍스트
         """
         try:
-            # 스크립트와 스타일 태그 제거
-            html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-            html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-            
-            # 블록 레벨 요소들을 줄바꿈으로 변환
-            block_elements = ['div', 'p', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr']
-            for element in block_elements:
-                html_content = re.sub(f'<{element}[^>]*>', '\n', html_content, flags=re.IGNORECASE)
-                html_content = re.sub(f'</{element}>', '\n', html_content, flags=re.IGNORECASE)
-            
-            # 나머지 HTML 태그 제거
-            text_content = re.sub(r'<[^>]+>', '', html_content)
-            
-            # HTML 엔티티 디코딩
-            text_content = html.unescape(text_content)
-            
-            # 텍스트 정제
-            text_content = self._clean_special_characters(text_content)
-            text_content = re.sub(r'\n\s*\n', '\n\n', text_content)  # 연속된 빈 줄 정리
-            text_content = re.sub(r'[ \t]+', ' ', text_content)  # 연속된 공백 정리
-            
-            return text_content.strip()
+            return self._normalize_html_text(self._parse_html(html_content).text)
             
         except Exception as e:
             logger.error(f"HTML 텍스트 추출 중 오류 발생: {str(e)}")
@@ -770,7 +1014,7 @@ class EmailProcessor:
     
     def _extract_links_from_html(self, html_content: str) -> List[Dict[str, str]]:
         """
-        HTML에서 링크 추출 (개선된 방식)
+        HTML에서 링크 추출 (mailto 링크는 이메일 항목으로도 추가)
         
         Args:
             html_content: HTML 내용
@@ -779,34 +1023,8 @@ class EmailProcessor:
             링크 정보 목록
         """
         try:
-            links = []
-            
-            # <a> 태그에서 링크 추출
-            link_pattern = r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>'
-            matches = re.findall(link_pattern, html_content, re.DOTALL | re.IGNORECASE)
-            
-            for url, text in matches:
-                # 링크 텍스트에서 HTML 태그 제거
-                clean_text = re.sub(r'<[^>]+>', '', text).strip()
-                
-                links.append({
-                    "url": url,
-                    "text": clean_text,
-                    "type": "link"
-                })
-            
-            # 이메일 주소 추출
-            email_pattern = r'mailto:([^"\'>\s]+)'
-            email_matches = re.findall(email_pattern, html_content, re.IGNORECASE)
-            
-            for email_addr in email_matches:
-                links.append({
-                    "url": f"mailto:{email_addr}",
-                    "text": email_addr,
-                    "type": "email"
-                })
-            
-            return links
+            parsed = self._parse_html(html_content)
+            return parsed.links + parsed.email_links
             
         except Exception as e:
             logger.error(f"HTML 링크 추출 중 오류 발생: {str(e)}")
@@ -814,7 +1032,7 @@ class EmailProcessor:
     
     def _extract_images_from_html(self, html_content: str) -> List[Dict[str, str]]:
         """
-        HTML에서 이미지 추출 (개선된 방식)
+        HTML에서 이미지 추출
         
         Args:
             html_content: HTML 내용
@@ -823,23 +1041,7 @@ class EmailProcessor:
             이미지 정보 목록
         """
         try:
-            images = []
-            
-            # <img> 태그에서 이미지 추출
-            img_pattern = r'<img[^>]*src=["\']([^"\']+)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>'
-            matches = re.findall(img_pattern, html_content, re.IGNORECASE)
-            
-            for match in matches:
-                src = match[0] if len(match) > 0 else ""
-                alt = match[1] if len(match) > 1 else ""
-                
-                images.append({
-                    "src": src,
-                    "alt": alt,
-                    "type": "image"
-                })
-            
-            return images
+            return self._parse_html(html_content).images
             
         except Exception as e:
             logger.error(f"HTML 이미지 추출 중 오류 발생: {str(e)}")
@@ -856,41 +1058,7 @@ class EmailProcessor:
             테이블 정보 목록
         """
         try:
-            tables = []
-            
-            # <table> 태그 찾기
-            table_pattern = r'<table[^>]*>(.*?)</table>'
-            table_matches = re.findall(table_pattern, html_content, re.DOTALL | re.IGNORECASE)
-            
-            for table_content in table_matches:
-                # 행 추출
-                row_pattern = r'<tr[^>]*>(.*?)</tr>'
-                rows = re.findall(row_pattern, table_content, re.DOTALL | re.IGNORECASE)
-                
-                table_data = []
-                for row in rows:
-                    # 셀 추출
-                    cell_pattern = r'<t[hd][^>]*>(.*?)</t[hd]>'
-                    cells = re.findall(cell_pattern, row, re.DOTALL | re.IGNORECASE)
-                    
-                    # 셀 텍스트 정제
-                    clean_cells = []
-                    for cell in cells:
-                        clean_cell = re.sub(r'<[^>]+>', '', cell).strip()
-                        clean_cell = html.unescape(clean_cell)
-                        clean_cells.append(clean_cell)
-                    
-                    if clean_cells:
-                        table_data.append(clean_cells)
-                
-                if table_data:
-                    tables.append({
-                        "rows": table_data,
-                        "row_count": len(table_data),
-                        "col_count": len(table_data[0]) if table_data else 0
-                    })
-            
-            return tables
+            return self._parse_html(html_content).tables
             
         except Exception as e:
             logger.error(f"HTML 테이블 추출 중 오류 발생: {str(e)}")
@@ -907,55 +1075,7 @@ class EmailProcessor:
             구조화된 내용 정보
         """
         try:
-            structured = {
-                "headings": [],
-                "lists": [],
-                "paragraphs": []
-            }
-            
-            # 제목 추출
-            heading_pattern = r'<h([1-6])[^>]*>(.*?)</h[1-6]>'
-            headings = re.findall(heading_pattern, html_content, re.DOTALL | re.IGNORECASE)
-            
-            for level, text in headings:
-                clean_text = re.sub(r'<[^>]+>', '', text).strip()
-                clean_text = html.unescape(clean_text)
-                structured["headings"].append({
-                    "level": int(level),
-                    "text": clean_text
-                })
-            
-            # 목록 추출
-            list_pattern = r'<(ul|ol)[^>]*>(.*?)</\1>'
-            lists = re.findall(list_pattern, html_content, re.DOTALL | re.IGNORECASE)
-            
-            for list_type, list_content in lists:
-                # 목록 항목 추출
-                item_pattern = r'<li[^>]*>(.*?)</li>'
-                items = re.findall(item_pattern, list_content, re.DOTALL | re.IGNORECASE)
-                
-                clean_items = []
-                for item in items:
-                    clean_item = re.sub(r'<[^>]+>', '', item).strip()
-                    clean_item = html.unescape(clean_item)
-                    clean_items.append(clean_item)
-                
-                structured["lists"].append({
-                    "type": list_type,
-                    "items": clean_items
-                })
-            
-            # 단락 추출
-            paragraph_pattern = r'<p[^>]*>(.*?)</p>'
-            paragraphs = re.findall(paragraph_pattern, html_content, re.DOTALL | re.IGNORECASE)
-            
-            for paragraph in paragraphs:
-                clean_paragraph = re.sub(r'<[^>]+>', '', paragraph).strip()
-                clean_paragraph = html.unescape(clean_paragraph)
-                if clean_paragraph:  # 빈 단락 제외
-                    structured["paragraphs"].append(clean_paragraph)
-            
-            return structured
+            return self._parse_html(html_content).structured_content()
             
         except Exception as e:
             logger.error(f"구조화된 내용 추출 중 오류 발생: {str(e)}")
@@ -1162,9 +1282,125 @@ class EmailProcessor:
             logger.error(f"첨부 파일 내용 가져오기 중 오류 발생: {str(error)}")
             return None
     
+    def iter_attachment_chunks(self, email_id: str, attachment_id: str,
+                               chunk_size: int = ATTACHMENT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        첨부 파일 내용을 청크 단위로 디코딩하며 반환
+        
+        Gmail API는 첨부 파일을 base64url 문자열 하나로 내려주므로, 문자열을 4의 배수
+        길이로 잘라 차례로 디코딩하여 디코딩된 전체 바이트를 한 번에 메모리에 올리지 않습니다.
+        
+        Args:
+            email_id: 이메일 ID
+            attachment_id: 첨부 파일 ID
+            chunk_size: 한 번에 디코딩할 base64 문자 수
+            
+        Yields:
+            디코딩된 첨부 파일 청크 (바이트)
+            
+        Raises:
+            HttpError: 첨부 파일 조회 실패 시
+            binascii.Error: base64 데이터가 손상된 경우
+        """
+        service = self._get_service()
+        
+        attachment = service.users().messages().attachments().get(
+            userId="me",
+            messageId=email_id,
+            id=attachment_id
+        ).execute()
+        
+        data = attachment.get("data", "")
+        step = max(4, chunk_size - chunk_size % 4)
+        
+        for start in range(0, len(data), step):
+            piece = data[start:start + step]
+            # 마지막 청크만 패딩이 생략되었을 수 있음
+            if len(piece) % 4:
+                piece += "=" * (-len(piece) % 4)
+            yield base64.urlsafe_b64decode(piece)
+    
+    def download_attachment(self, email_id: str, attachment_id: str, filename: str,
+                            save_path: str, skip_duplicates: bool = True,
+                            record_hash: bool = True) -> Optional[AttachmentDownload]:
+        """
+        첨부 파일을 청크 단위로 디스크에 쓰면서 SHA-256 해시 계산
+        
+        저장 디렉토리에 같은 해시의 파일이 이미 있으면 새 파일을 남기지 않고
+        기존 파일 정보를 중복으로 표시하여 반환합니다.
+        같은 이름의 다른 파일이 있으면 덮어쓰지 않고 해시를 붙인 파일명으로 저장하고,
+        같은 이름에 같은 내용이면(수집 실패 후 재시도 등 아직 기록되지 않은 파일) 그 파일을 재사용합니다.
+        
+        Args:
+            email_id: 이메일 ID
+            attachment_id: 첨부 파일 ID
+            filename: 파일명
+            save_path: 저장 경로
+            skip_duplicates: 같은 내용의 첨부 파일 저장 생략 여부
+            record_hash: 저장 후 바로 해시 인덱스에 기록할지 여부
+                (False이면 처리가 끝난 뒤 record_attachment로 기록)
+            
+        Returns:
+            다운로드 결과 또는 None (실패하거나 내용이 없는 경우)
+        """
+        os.makedirs(save_path, exist_ok=True)
+        
+        file_path = os.path.join(save_path, os.path.basename(filename))
+        temp_path = f"{file_path}.part"
+        digest = hashlib.sha256()
+        size = 0
+        
+        try:
+            with open(temp_path, "wb") as f:
+                for chunk in self.iter_attachment_chunks(email_id, attachment_id):
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+        except (HttpError, binascii.Error, OSError) as error:
+            logger.error(f"첨부 파일 다운로드 중 오류 발생: {str(error)}")
+            self._remove_file(temp_path)
+            return None
+        
+        if size == 0:
+            self._remove_file(temp_path)
+            return None
+        
+        sha256 = digest.hexdigest()
+        index = AttachmentHashIndex(save_path)
+        
+        existing_path = index.get(sha256) if skip_duplicates else None
+        if existing_path:
+            self._remove_file(temp_path)
+            logger.info(f"이미 저장된 첨부 파일이므로 건너뜁니다: {filename} ({existing_path})")
+            return AttachmentDownload(file_path=existing_path, sha256=sha256, size=size, duplicate=True)
+        
+        if os.path.exists(file_path) and not self._has_content(file_path, sha256, size):
+            # 같은 이름의 다른 파일을 덮어쓰면 그 파일을 가리키는 인덱스 항목이 틀어지므로 내용 주소 파일명 사용
+            stem, extension = os.path.splitext(os.path.basename(filename))
+            file_path = os.path.join(save_path, f"{stem}_{sha256[:12]}{extension}")
+        
+        # 같은 내용의 파일이 이미 있으면 그대로 교체되어 사본이 늘지 않음
+        os.replace(temp_path, file_path)
+        download = AttachmentDownload(file_path=file_path, sha256=sha256, size=size)
+        if record_hash:
+            self.record_attachment(save_path, download)
+        
+        logger.info(f"첨부 파일 저장 완료: {file_path} ({size} bytes)")
+        return download
+    
+    def record_attachment(self, save_path: str, download: AttachmentDownload) -> None:
+        """
+        내려받은 첨부 파일의 해시를 저장 디렉토리 인덱스에 기록
+        
+        Args:
+            save_path: 저장 경로
+            download: 다운로드 결과
+        """
+        AttachmentHashIndex(save_path).add(download.sha256, download.file_path)
+    
     def save_attachment(self, email_id: str, attachment_id: str, filename: str, save_path: str) -> bool:
         """
-        첨부 파일 저장
+        첨부 파일 저장 (청크 단위 스트리밍, 중복 내용은 저장 생략)
         
         Args:
             email_id: 이메일 ID
@@ -1176,26 +1412,32 @@ class EmailProcessor:
             성공 여부
         """
         try:
-            # 첨부 파일 내용 가져오기
-            content = self.get_attachment_content(email_id, attachment_id)
-            if not content:
-                return False
-            
-            # 저장 디렉토리 생성
-            os.makedirs(save_path, exist_ok=True)
-            
-            # 파일 저장
-            file_path = os.path.join(save_path, filename)
-            with open(file_path, "wb") as f:
-                f.write(content)
-            
-            logger.info(f"첨부 파일 저장 완료: {file_path}")
-            return True
+            return self.download_attachment(email_id, attachment_id, filename, save_path) is not None
             
         except Exception as e:
             logger.error(f"첨부 파일 저장 중 오류 발생: {str(e)}")
             return False
     
+    def _has_content(self, file_path: str, sha256: str, size: int) -> bool:
+        """파일 내용이 주어진 해시와 같은지 확인 (크기가 다르면 해시를 계산하지 않음)"""
+        try:
+            if os.path.getsize(file_path) != size:
+                return False
+            digest = hashlib.sha256()
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except OSError:
+            return False
+        return digest.hexdigest() == sha256
+    
+    def _remove_file(self, file_path: str) -> None:
+        """파일이 있으면 삭제"""
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+    
     def forward_email(self, email_id: str, recipients: List[str], message: Optional[str] = None) -> bool:
         """
         이메일 전달
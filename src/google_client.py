@@ -0,0 +1,411 @@
+"""
+Google API 클라이언트 시작 시간 최적화
+
+이 모듈은 Gmail/캘린더 클라이언트가 함께 사용하는 다음 기능을 제공합니다.
+
+- 디스커버리 문서 캐시: 파싱한 문서를 메모리에 보관하고 원본은 디스크에 저장하여
+  서비스 객체 생성 시 문서 로드/파싱을 반복하지 않습니다.
+- 자격 증명 캐시: 토큰 파일을 다시 읽지 않도록 자격 증명을 메모리에 보관하고,
+  만료 직전에 미리 갱신합니다.
+- 공유 HTTP 연결: 모든 클라이언트가 하나의 연결 풀을 사용합니다.
+  httplib2.Http는 스레드 안전하지 않으므로 스레드마다 연결을 하나씩 두고 API 간에 재사용합니다.
+- 요청 추적: 요청 추적이 켜져 있으면 각 API 요청 실행을 google_api 구간으로 기록합니다.
+"""
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import httplib2
+from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.http import HttpRequest
+
+from .config import GOOGLE_CLIENT_CONFIG
+from .tracing import KIND_GOOGLE_API, tracer
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DISCOVERY_URL = "https://www.googleapis.com/discovery/v1/apis/{api}/{version}/rest"
+
+
+class SharedHttp:
+    """
+    Gmail/캘린더 클라이언트가 함께 사용하는 HTTP 연결 풀
+    
+    호출한 스레드의 httplib2.Http로 요청을 전달하므로, 같은 스레드에서는
+    API와 관계없이 연결(keep-alive)을 재사용하고 스레드 간에는 연결을 공유하지 않습니다.
+    """
+    
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        SharedHttp 초기화
+        
+        Args:
+            timeout: 요청 제한 시간(초)
+        """
+        self.timeout = timeout if timeout is not None else GOOGLE_CLIENT_CONFIG["http_timeout_seconds"]
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections_created = 0
+    
+    def _http(self) -> httplib2.Http:
+        """현재 스레드의 연결 객체 (없으면 생성)"""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = httplib2.Http(timeout=self.timeout)
+            self._local.http = http
+            with self._lock:
+                self._connections_created += 1
+        return http
+    
+    def request(self, *args: Any, **kwargs: Any):
+        """현재 스레드의 연결로 요청 전송"""
+        return self._http().request(*args, **kwargs)
+    
+    def __getattr__(self, name: str) -> Any:
+        # redirect_codes, connections 등 나머지 속성은 현재 스레드의 연결 객체에서 조회
+        return getattr(self._http(), name)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        연결 풀 상태
+        
+        Returns:
+            생성된 스레드별 연결 수, 제한 시간
+        """
+        with self._lock:
+            return {'connections_created': self._connections_created, 'timeout': self.timeout}
+
+
+class DiscoveryDocumentCache:
+    """파싱한 디스커버리 문서를 메모리에, 원본 문서를 디스크에 캐시"""
+    
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None):
+        """
+        DiscoveryDocumentCache 초기화
+        
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (기본값: 설정값)
+            ttl: 디스크 캐시 유효 기간(초) (기본값: 설정값)
+        """
+        self.cache_dir = cache_dir or GOOGLE_CLIENT_CONFIG["discovery_cache_dir"]
+        self.ttl = ttl if ttl is not None else GOOGLE_CLIENT_CONFIG["discovery_cache_ttl_seconds"]
+        self._documents: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'static_loads': 0, 'network_loads': 0}
+    
+    def get(self, api: str, version: str, http: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        디스커버리 문서 조회 (메모리 → 디스크 → 라이브러리 내장 문서 → 네트워크 순)
+        
+        Args:
+            api: API 이름 (예: "calendar")
+            version: API 버전 (예: "v3")
+            http: 네트워크 조회에 사용할 HTTP 객체
+        
+        Returns:
+            파싱된 디스커버리 문서
+        
+        Raises:
+            ValueError: 문서를 찾을 수 없는 경우
+        """
+        key = (api, version)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._stats['memory_hits'] += 1
+                return document
+            
+            content = self._read_disk(api, version)
+            if content is not None:
+                self._stats['disk_hits'] += 1
+            else:
+                content = discovery_cache.get_static_doc(api, version)
+                if content is not None:
+                    self._stats['static_loads'] += 1
+                else:
+                    content = self._fetch(api, version, http)
+                    self._stats['network_loads'] += 1
+                self._write_disk(api, version, content)
+            
+            document = json.loads(content)
+            self._documents[key] = document
+            return document
+    
+    def clear(self, disk: bool = False) -> None:
+        """
+        캐시 비우기
+        
+        Args:
+            disk: 디스크 캐시 파일도 삭제할지 여부
+        """
+        with self._lock:
+            self._documents.clear()
+            if disk and os.path.isdir(self.cache_dir):
+                for name in os.listdir(self.cache_dir):
+                    if name.endswith('.json'):
+                        os.remove(os.path.join(self.cache_dir, name))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 사용 통계
+        
+        Returns:
+            메모리/디스크/내장 문서/네트워크 조회 횟수, 메모리에 보관한 문서 수
+        """
+        with self._lock:
+            return {**self._stats, 'documents': len(self._documents)}
+    
+    def _path(self, api: str, version: str) -> str:
+        return os.path.join(self.cache_dir, f"{api}.{version}.json")
+    
+    def _read_disk(self, api: str, version: str) -> Optional[str]:
+        """유효 기간 안의 디스크 캐시 문서 읽기"""
+        path = self._path(api, version)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_disk(self, api: str, version: str, content: str) -> None:
+        """디스크 캐시에 문서 저장 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(temp_path, self._path(api, version))
+        except OSError as e:
+            logger.warning(f"디스커버리 문서 캐시 저장 실패: {api} {version}, {e}")
+    
+    def _fetch(self, api: str, version: str, http: Optional[Any]) -> str:
+        """네트워크에서 디스커버리 문서 조회"""
+        url = DISCOVERY_URL.format(api=api, version=version)
+        logger.info(f"디스커버리 문서 다운로드: {url}")
+        resp, content = (http or _shared_http).request(url)
+        if int(resp.status) >= 400:
+            raise ValueError(f"디스커버리 문서를 가져올 수 없습니다: {api} {version} (HTTP {resp.status})")
+        return content.decode('utf-8') if isinstance(content, bytes) else content
+
+
+class CredentialCache:
+    """
+    토큰 파일별 자격 증명 메모리 캐시
+    
+    토큰 파일이 외부에서 바뀌면(수정 시각 변경) 캐시를 버리고,
+    만료 refresh_margin초 전부터는 조회 시 미리 갱신합니다.
+    갱신(네트워크 호출)은 토큰 파일별 잠금만 잡고 하므로 다른 토큰 파일 조회를 막지 않습니다.
+    """
+    
+    def __init__(self, refresh_margin: Optional[float] = None):
+        """
+        CredentialCache 초기화
+        
+        Args:
+            refresh_margin: 만료 몇 초 전에 갱신할지 (기본값: 설정값)
+        """
+        margin = refresh_margin if refresh_margin is not None else GOOGLE_CLIENT_CONFIG["credential_refresh_margin_seconds"]
+        self.refresh_margin = timedelta(seconds=margin)
+        self._entries: Dict[Tuple[str, Tuple[str, ...]], Tuple[Any, float]] = {}
+        self._refresh_locks: Dict[Tuple[str, Tuple[str, ...]], threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def get(
+        self,
+        token_path: str,
+        scopes: Optional[Iterable[str]] = None,
+        on_refresh: Optional[Callable[[Any], None]] = None
+    ) -> Optional[Any]:
+        """
+        캐시된 자격 증명 조회 (필요하면 미리 갱신)
+        
+        Args:
+            token_path: 토큰 파일 경로
+            scopes: 권한 범위
+            on_refresh: 갱신 후 호출할 함수 (토큰 저장 등)
+        
+        Returns:
+            유효한 Credentials 객체 또는 None
+        """
+        key = (token_path, tuple(scopes or ()))
+        with self._lock:
+            creds = self._lookup(key)
+            if creds is None or not self._needs_refresh(creds):
+                return creds if creds is not None and creds.valid else None
+            refresh_lock = self._refresh_locks.setdefault(key, threading.Lock())
+        
+        with refresh_lock:
+            # 기다리는 동안 다른 스레드가 갱신했거나 항목이 바뀌었으면 다시 조회
+            with self._lock:
+                current = self._lookup(key)
+                if current is not creds or not self._needs_refresh(current):
+                    return current if current is not None and current.valid else None
+            
+            try:
+                creds.refresh(Request())
+                if on_refresh:
+                    on_refresh(creds)
+                logger.info("만료가 가까운 자격 증명을 미리 갱신했습니다.")
+            except Exception as e:
+                logger.warning(f"자격 증명 사전 갱신 실패: {e}")
+            
+            mtime = _file_mtime(token_path)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry[0] is not creds:
+                    # 갱신 중에 무효화되었거나 다른 자격 증명으로 바뀜
+                    return creds if creds.valid else None
+                if mtime is None or not creds.valid:
+                    del self._entries[key]
+                    return None
+                self._entries[key] = (creds, mtime)
+            
+            return creds
+    
+    def _lookup(self, key: Tuple[str, Tuple[str, ...]]) -> Optional[Any]:
+        """
+        캐시 항목 조회 (토큰 파일이 바뀌었으면 항목 제거, self._lock을 잡고 호출)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        creds, mtime = entry
+        if _file_mtime(key[0]) != mtime:
+            del self._entries[key]
+            return None
+        return creds
+    
+    def put(self, token_path: str, scopes: Optional[Iterable[str]], creds: Any) -> None:
+        """
+        자격 증명 저장 (토큰 파일이 있을 때만)
+        
+        Args:
+            token_path: 토큰 파일 경로
+            scopes: 권한 범위
+            creds: 저장할 Credentials 객체
+        """
+        mtime = _file_mtime(token_path)
+        if mtime is None or creds is None:
+            return
+        with self._lock:
+            self._entries[(token_path, tuple(scopes or ()))] = (creds, mtime)
+    
+    def invalidate(self, token_path: Optional[str] = None) -> None:
+        """
+        캐시 제거
+        
+        Args:
+            token_path: 특정 토큰 파일의 항목만 제거할 경우 경로 (None이면 전체)
+        """
+        with self._lock:
+            if token_path is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == token_path]:
+                    del self._entries[key]
+    
+    def _needs_refresh(self, creds: Any) -> bool:
+        """갱신이 필요한지 확인 (만료되었거나 만료 임박)"""
+        if not getattr(creds, 'refresh_token', None):
+            return False
+        if not creds.valid:
+            return True
+        expiry = getattr(creds, 'expiry', None)
+        if not isinstance(expiry, datetime):
+            return False
+        # google-auth의 expiry는 시간대 없는 UTC 값
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return expiry - now < self.refresh_margin
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    """파일 수정 시각 (없으면 None)"""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+_shared_http = SharedHttp()
+discovery_documents = DiscoveryDocumentCache()
+credential_cache = CredentialCache()
+
+
+@functools.lru_cache(maxsize=None)
+def traced_request_builder(request_class: type) -> type:
+    """
+    execute()를 요청 추적 구간으로 감싼 요청 클래스를 만듭니다.
+    
+    속도 제한 대기와 재시도까지 한 구간에 포함되도록 주어진 요청 클래스를 상속합니다.
+    
+    Args:
+        request_class: HttpRequest 또는 그 하위 클래스
+    
+    Returns:
+        HttpRequest 하위 클래스 (같은 클래스에는 같은 결과를 반환)
+    """
+    class TracedHttpRequest(request_class):
+        """실행 시간이 요청 추적에 기록되는 Google API 요청"""
+        
+        def execute(self, *args, **kwargs):
+            if not tracer.enabled:
+                return super().execute(*args, **kwargs)
+            with tracer.span(f"google_api.{self.methodId}", KIND_GOOGLE_API,
+                             method=self.method, uri=self.uri.split('?', 1)[0]):
+                return super().execute(*args, **kwargs)
+    
+    TracedHttpRequest.__name__ = TracedHttpRequest.__qualname__ = f"Traced{request_class.__name__}"
+    return TracedHttpRequest
+
+
+def build_service(
+    service_name: str,
+    version: str,
+    credentials: Optional[Any] = None,
+    requestBuilder: Any = HttpRequest,
+    http: Optional[Any] = None
+):
+    """
+    캐시된 디스커버리 문서와 공유 HTTP 연결로 Google API 서비스 객체를 생성합니다.
+    
+    googleapiclient.discovery.build와 같은 이름의 인자를 받습니다.
+    요청 클래스는 요청 추적 구간을 남기도록 감쌉니다.
+    
+    Args:
+        service_name: API 이름 (예: "calendar")
+        version: API 버전 (예: "v3")
+        credentials: 인증 자격 증명
+        requestBuilder: 요청 클래스
+        http: 사용할 HTTP 객체 (기본값: 자격 증명을 적용한 공유 HTTP 연결)
+    
+    Returns:
+        Google API 서비스 객체
+    """
+    document = discovery_documents.get(service_name, version)
+    if http is None and credentials is not None:
+        http = AuthorizedHttp(credentials, http=_shared_http)
+    return build_from_document(document, http=http, requestBuilder=traced_request_builder(requestBuilder))
+
+
+def get_shared_http() -> SharedHttp:
+    """
+    Gmail/캘린더 클라이언트가 공유하는 HTTP 연결 풀을 반환합니다.
+    
+    Returns:
+        SharedHttp 인스턴스
+    """
+    return _shared_http
+
@@ -0,0 +1,794 @@
+# -*- coding: utf-8 -*-
+"""
+워크로드 기반 인덱스 추천
+
+실행된 SQL 문장(지문, 실행 횟수, 샘플 파라미터)을 입력으로 받아 EXPLAIN QUERY PLAN으로
+인덱스 없이 전체 스캔하는 테이블을 찾고, WHERE/JOIN 조건의 동등 비교 열 → 범위 비교 열 →
+ORDER BY 열 순서의 복합 인덱스와 조회하는 열까지 포함한 커버링 인덱스 후보를 만듭니다.
+
+후보는 데이터베이스 복사본에 하나씩 만들어 워크로드 문장을 실제로 다시 실행해 측정하고,
+워크로드 비용(실행 횟수 × 지연 시간)을 가장 많이 줄이는 인덱스부터 탐욕적으로 선택합니다.
+쓰기 문장은 세이브포인트 안에서 실행 후 되돌리므로 인덱스 유지 비용도 함께 반영됩니다.
+
+SQL은 토큰 단위로 분석하고, 문장이 읽는 테이블/열은 SQLite 권한 콜백으로 확인합니다.
+"""
+
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from src.statement_profiler import fingerprint_sql, load_statement_profile
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+|--[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<ident>"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])
+  | (?P<number>\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+  | (?P<param>\?\d*|[:@$]\w+)
+  | (?P<word>\w+)
+  | (?P<op><=|>=|<>|!=|==|\|\||.)
+""", re.VERBOSE | re.DOTALL)
+
+# 최상위 절 시작 키워드
+_CLAUSES = {'FROM', 'WHERE', 'GROUP', 'ORDER', 'LIMIT', 'HAVING', 'WINDOW', 'SET', 'VALUES', 'RETURNING'}
+
+# 복합 SELECT (첫 SELECT만 분석)
+_COMPOUND = {'UNION', 'EXCEPT', 'INTERSECT'}
+
+# FROM 절에서 테이블 별칭이 될 수 없는 키워드
+_FROM_KEYWORDS = {
+    'AS', 'ON', 'USING', 'JOIN', 'INNER', 'LEFT', 'RIGHT', 'FULL', 'OUTER', 'CROSS', 'NATURAL',
+    'INDEXED', 'NOT', 'BY'
+}
+_JOIN_WORDS = {'JOIN', 'INNER', 'LEFT', 'RIGHT', 'FULL', 'OUTER', 'CROSS', 'NATURAL'}
+
+# 열 이름으로 볼 수 없는 키워드
+_NON_COLUMNS = {'NOT', 'NULL', 'CASE', 'EXISTS', 'SELECT', 'TRUE', 'FALSE', 'CURRENT_DATE', 'CURRENT_TIME',
+                'CURRENT_TIMESTAMP', 'DISTINCT', 'ALL'}
+
+_EQUALITY_OPS = {'=', '==', 'IS', 'IN'}
+_RANGE_OPS = {'<', '>', '<=', '>=', 'BETWEEN'}
+_REVERSED_OPS = {'=': '=', '==': '=', '<': '>', '>': '<', '<=': '>=', '>=': '<='}
+
+# 읽기 전용 문장 (그대로 실행해 측정)
+_READ_ONLY = ('SELECT', 'WITH')
+
+
+class Token(NamedTuple):
+    """SQL 토큰 (종류, 원문, 대문자 원문)"""
+    kind: str
+    text: str
+    upper: str
+
+
+# 열 참조 (한정자(테이블/별칭) 또는 None, 열 이름)
+ColumnRef = Tuple[Optional[str], str]
+
+
+class QueryShape(NamedTuple):
+    """인덱스 후보 생성에 필요한 SQL 문장 구조"""
+    kind: str
+    tables: Dict[str, str]
+    equality: List[ColumnRef]
+    ranges: List[ColumnRef]
+    order_by: List[ColumnRef]
+    placeholders: int
+    named_params: List[str]
+
+
+class IndexCandidate(NamedTuple):
+    """인덱스 후보 (테이블, 열 순서, 커버링 여부)"""
+    table: str
+    columns: Tuple[str, ...]
+    covering: bool
+    
+    @property
+    def name(self) -> str:
+        """인덱스 이름 (DatabaseOptimizer.create_index와 같은 규칙)"""
+        return f"idx_{self.table}_{'_'.join(self.columns)}"
+    
+    @property
+    def sql(self) -> str:
+        """인덱스 생성 SQL"""
+        return f"CREATE INDEX {self.name} ON {self.table}({', '.join(self.columns)});"
+
+
+def tokenize(sql: str) -> List[Token]:
+    """
+    SQL 문장을 토큰으로 분리 (공백과 주석 제외)
+    
+    Args:
+        sql: SQL 문장
+    
+    Returns:
+        List[Token]: 토큰 목록 (따옴표로 감싼 식별자는 따옴표를 벗긴 ident 토큰)
+    """
+    tokens = []
+    for match in _TOKEN.finditer(sql):
+        kind = match.lastgroup
+        if kind == 'space':
+            continue
+        text = match.group()
+        if kind == 'ident':
+            text = text[1:-1].replace('""', '"')
+        tokens.append(Token(kind, text, text.upper()))
+    return tokens
+
+
+def _depths(tokens: Sequence[Token]) -> List[int]:
+    """
+    토큰별 괄호 깊이 (여는 괄호는 바깥 깊이로 계산)
+    """
+    depths = []
+    depth = 0
+    for token in tokens:
+        if token.text == ')':
+            depth -= 1
+        depths.append(depth)
+        if token.text == '(':
+            depth += 1
+    return depths
+
+
+def _is_name(token: Token) -> bool:
+    """
+    식별자로 쓸 수 있는 토큰인지 확인
+    """
+    return token.kind == 'ident' or (token.kind == 'word' and token.upper not in _NON_COLUMNS)
+
+
+def _column_ref(tokens: Sequence[Token], start: int) -> Tuple[Optional[ColumnRef], int]:
+    """
+    start 위치의 열 참조 (col 또는 qualifier.col) 해석
+    
+    Returns:
+        Tuple[Optional[ColumnRef], int]: (열 참조, 다음 위치). 열 참조가 아니면 (None, start)
+    """
+    if start >= len(tokens) or not _is_name(tokens[start]):
+        return None, start
+    
+    position = start + 1
+    if position + 1 < len(tokens) and tokens[position].text == '.' and _is_name(tokens[position + 1]):
+        ref = (tokens[start].text, tokens[position + 1].text)
+        position += 2
+    else:
+        ref = (None, tokens[start].text)
+    
+    # 함수 호출은 열 참조가 아님
+    if position < len(tokens) and tokens[position].text == '(':
+        return None, start
+    return ref, position
+
+
+def _split_top_level(tokens: Sequence[Token], separator: str) -> List[List[Token]]:
+    """
+    괄호 밖의 구분자(','/'AND')로 토큰 분리 (BETWEEN ... AND ...의 AND는 분리하지 않음)
+    """
+    parts: List[List[Token]] = [[]]
+    between = False
+    for token, depth in zip(tokens, _depths(tokens)):
+        if depth == 0 and token.upper == 'BETWEEN':
+            between = True
+        elif depth == 0 and token.upper == separator:
+            if separator == 'AND' and between:
+                between = False
+            else:
+                parts.append([])
+                continue
+        parts[-1].append(token)
+    return [part for part in parts if part]
+
+
+def _conjuncts(tokens: Sequence[Token]) -> List[List[Token]]:
+    """
+    조건식을 AND로 연결된 항으로 분리 (괄호로 감싼 AND 묶음은 펼침, 최상위 OR가 있으면 빈 목록)
+    """
+    depths = _depths(tokens)
+    if any(depth == 0 and token.upper == 'OR' for token, depth in zip(tokens, depths)):
+        return []
+    
+    conjuncts = []
+    for part in _split_top_level(tokens, 'AND'):
+        inner_depths = _depths(part)
+        wrapped = (
+            part[0].text == '(' and part[-1].text == ')'
+            and all(depth > 0 for depth in inner_depths[1:-1])
+        )
+        if wrapped:
+            conjuncts.extend(_conjuncts(part[1:-1]))
+        else:
+            conjuncts.append(part)
+    return conjuncts
+
+
+def _classify(conjunct: Sequence[Token]) -> Tuple[List[ColumnRef], List[ColumnRef]]:
+    """
+    조건 항에서 인덱스로 찾을 수 있는 열 추출
+    
+    Returns:
+        Tuple[List[ColumnRef], List[ColumnRef]]: (동등 비교 열, 범위 비교 열)
+    """
+    equality: List[ColumnRef] = []
+    ranges: List[ColumnRef] = []
+    
+    left, position = _column_ref(conjunct, 0)
+    if left is not None and position < len(conjunct):
+        op = conjunct[position].upper
+        if op == 'IS' and position + 1 < len(conjunct) and conjunct[position + 1].upper == 'NOT':
+            return equality, ranges
+        if op in _EQUALITY_OPS:
+            equality.append(left)
+            right, end = _column_ref(conjunct, position + 1)
+            if right is not None and end == len(conjunct) and op in ('=', '=='):
+                equality.append(right)  # 조인 조건은 양쪽 열 모두 후보
+        elif op in _RANGE_OPS:
+            ranges.append(left)
+        return equality, ranges
+    
+    # 값 op 열 형태 (예: ? <= transaction_date)
+    for position in range(len(conjunct) - 1, 0, -1):
+        right, end = _column_ref(conjunct, position)
+        if right is None or end != len(conjunct):
+            continue
+        op = _REVERSED_OPS.get(conjunct[position - 1].text)
+        if op == '=':
+            equality.append(right)
+        elif op is not None:
+            ranges.append(right)
+        break
+    return equality, ranges
+
+
+def _parse_tables(tokens: Sequence[Token]) -> Tuple[Dict[str, str], List[List[Token]], List[ColumnRef]]:
+    """
+    FROM 절(또는 UPDATE 대상) 해석
+    
+    Returns:
+        Tuple: (별칭/테이블 이름(소문자) → 테이블 이름, ON 조건 토큰 목록, USING 열 목록)
+    """
+    tables: Dict[str, str] = {}
+    on_clauses: List[List[Token]] = []
+    using: List[ColumnRef] = []
+    depths = _depths(tokens)
+    index = 0
+    expect_table = True
+    last_table: Optional[str] = None
+    
+    while index < len(tokens):
+        token, depth = tokens[index], depths[index]
+        if depth > 0:
+            index += 1
+            continue
+        
+        if token.text == '(':
+            # 서브쿼리/테이블 함수는 건너뜀
+            index += 1
+            while index < len(tokens) and depths[index] > 0:
+                index += 1
+            index += 1
+            expect_table, last_table = False, None
+            continue
+        
+        if token.text == ',' or token.upper in _JOIN_WORDS:
+            expect_table = True
+        elif token.upper == 'ON':
+            end = index + 1
+            while end < len(tokens) and not (
+                depths[end] == 0 and (tokens[end].text == ',' or tokens[end].upper in _JOIN_WORDS)
+            ):
+                end += 1
+            on_clauses.append(list(tokens[index + 1:end]))
+            index = end
+            continue
+        elif token.upper == 'USING' and index + 1 < len(tokens) and tokens[index + 1].text == '(':
+            end = index + 2
+            while end < len(tokens) and tokens[end].text != ')':
+                if _is_name(tokens[end]):
+                    using.append((None, tokens[end].text))
+                end += 1
+            index = end + 1
+            continue
+        elif token.upper == 'INDEXED':
+            index += 3  # INDEXED BY name
+            continue
+        elif _is_name(token) and token.upper not in _FROM_KEYWORDS:
+            if expect_table:
+                name = token.text
+                if index + 2 < len(tokens) and tokens[index + 1].text == '.':
+                    index += 2
+                    name = tokens[index].text  # schema.table
+                tables[name.lower()] = name
+                last_table, expect_table = name, False
+            elif last_table is not None:
+                tables[token.text.lower()] = last_table  # 별칭
+                last_table = None
+        index += 1
+    
+    return tables, on_clauses, using
+
+
+def _order_columns(tokens: Sequence[Token]) -> List[ColumnRef]:
+    """
+    ORDER BY 목록에서 인덱스 순서로 대신할 수 있는 열 목록 (표현식이 나오면 그 앞까지)
+    """
+    columns = []
+    for item in _split_top_level(tokens, ','):
+        ref, position = _column_ref(item, 0)
+        rest = {token.upper for token in item[position:]}
+        if ref is None or not rest <= {'ASC', 'DESC'}:
+            break
+        columns.append(ref)
+    return columns
+
+
+def parse_query_shape(sql: str) -> QueryShape:
+    """
+    SQL 문장에서 인덱스 후보 생성에 필요한 구조 추출
+    
+    최상위 문장만 분석합니다 (서브쿼리, 복합 SELECT의 두 번째 이후 SELECT는 무시).
+    
+    Args:
+        sql: SQL 문장
+    
+    Returns:
+        QueryShape: 문장 종류, 테이블 별칭, 동등/범위 비교 열, ORDER BY 열, 자리표시자 정보
+    """
+    tokens = tokenize(sql)
+    kind = tokens[0].upper if tokens else ''
+    
+    # 최상위 절별 토큰 분리
+    sections: Dict[str, List[Token]] = {'HEAD': []}
+    current = 'HEAD'
+    for token, depth in zip(tokens, _depths(tokens)):
+        if depth == 0 and token.kind == 'word':
+            if token.upper in _COMPOUND:
+                break
+            if token.upper in _CLAUSES and token.upper not in sections:
+                current = token.upper
+                sections[current] = []
+                continue
+        sections[current].append(token)
+    
+    if kind in ('INSERT', 'REPLACE'):
+        # INSERT [OR ...] INTO table: 인덱스 유지 비용 측정 대상
+        head = sections['HEAD']
+        into = next((index for index, token in enumerate(head) if token.upper == 'INTO'), None)
+        tables, on_clauses, using = {}, [], []
+        if into is not None and into + 1 < len(head) and _is_name(head[into + 1]):
+            name = head[into + 3].text if into + 3 < len(head) and head[into + 2].text == '.' else head[into + 1].text
+            tables[name.lower()] = name
+    elif kind == 'UPDATE':
+        head = [token for token in sections['HEAD'][1:] if token.upper not in ('OR', 'ROLLBACK', 'ABORT', 'REPLACE',
+                                                                                  'FAIL', 'IGNORE')]
+        tables, on_clauses, using = _parse_tables(head)
+    else:
+        tables, on_clauses, using = _parse_tables(sections.get('FROM', []))
+    
+    equality: List[ColumnRef] = list(using)
+    ranges: List[ColumnRef] = []
+    for condition in on_clauses + [sections.get('WHERE', [])]:
+        for conjunct in _conjuncts(condition):
+            conjunct_equality, conjunct_ranges = _classify(conjunct)
+            equality.extend(conjunct_equality)
+            ranges.extend(conjunct_ranges)
+    
+    order = sections.get('ORDER', [])
+    order_by = _order_columns(order[1:]) if order and order[0].upper == 'BY' else []
+    
+    params = [token.text for token in tokens if token.kind == 'param']
+    numbered = [int(text[1:]) for text in params if text.startswith('?') and len(text) > 1]
+    placeholders = max([params.count('?')] + numbered)
+    named_params = sorted({text[1:] for text in params if text[0] in ':@$'})
+    
+    return QueryShape(kind, tables, equality, ranges, order_by, placeholders, named_params)
+
+
+class IndexAdvisor:
+    """
+    워크로드 기반 인덱스 추천 클래스
+    
+    원본 데이터베이스는 읽기 전용으로 열어 복사본을 만들고, 인덱스 생성과 측정은 복사본에서만 합니다.
+    """
+    
+    def __init__(self, db_path: str, repeat: int = 5, max_index_columns: int = 6, min_gain: float = 0.05):
+        """
+        인덱스 추천기 초기화
+        
+        Args:
+            db_path: 데이터베이스 파일 경로
+            repeat: 문장별 측정 반복 횟수 (중앙값 사용)
+            max_index_columns: 인덱스 최대 열 수 (커버링 인덱스 포함)
+            min_gain: 인덱스를 채택할 최소 워크로드 비용 감소 비율
+        """
+        self.db_path = db_path
+        self.repeat = max(1, repeat)
+        self.max_index_columns = max_index_columns
+        self.min_gain = min_gain
+    
+    def load_workload(self, workload: Union[str, Iterable[Union[str, Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        워크로드 정규화
+        
+        Args:
+            workload: 문장 프로파일 파일 경로, SQL 문자열 목록, 또는 문장 딕셔너리 목록
+                (sql/sample, count(실행 횟수), params/sample_params). 원본 SQL이 없는 저장된 프로파일은
+                지문을 실행하고 파라미터는 NULL로 바인딩합니다.
+        
+        Returns:
+            List[Dict[str, Any]]: 지문별로 합친 문장 목록 (sql, fingerprint, weight, params)
+        """
+        if isinstance(workload, str):
+            workload = load_statement_profile(workload)
+        
+        statements: Dict[str, Dict[str, Any]] = {}
+        for item in workload:
+            if isinstance(item, str):
+                item = {'sql': item}
+            sql = item.get('sql') or item.get('sample')
+            if not sql and item.get('fingerprint'):
+                # 저장된 프로파일에는 지문만 있으므로 자리표시자 목록을 단일 자리표시자로 되돌려 실행
+                sql = item['fingerprint'].replace('(?+)', '(?)')
+            if not sql:
+                continue
+            
+            fingerprint = item.get('fingerprint') or fingerprint_sql(sql)
+            weight = item.get('count', item.get('weight', 1)) or 0
+            statement = statements.get(fingerprint)
+            if statement is None:
+                statements[fingerprint] = {
+                    'sql': sql,
+                    'fingerprint': fingerprint,
+                    'weight': weight,
+                    'params': item.get('params', item.get('sample_params'))
+                }
+            else:
+                statement['weight'] += weight
+        
+        return [statement for statement in statements.values() if statement['weight'] > 0]
+    
+    def advise(self, workload: Union[str, Iterable[Union[str, Dict[str, Any]]]], max_indexes: int = 5) -> Dict[str, Any]:
+        """
+        인덱스 추천 및 효과 측정
+        
+        Args:
+            workload: 워크로드 (load_workload 참고)
+            max_indexes: 최대 추천 인덱스 수
+        
+        Returns:
+            Dict[str, Any]: baseline_ms/optimized_ms(실행 횟수 가중 워크로드 비용), estimated_speedup,
+                recommendations(채택 순서, 인덱스별 비용 감소), statements(문장별 전후 지연 시간과 실행 계획),
+                candidates_evaluated
+        """
+        statements = self.load_workload(workload)
+        temp_dir = tempfile.mkdtemp(prefix='index_advisor_')
+        connection = self._copy_database(os.path.join(temp_dir, 'workload.db'))
+        try:
+            schema = self._load_schema(connection)
+            for statement in statements:
+                self._prepare(connection, statement, schema)
+            statements = [statement for statement in statements if statement['plan_before'] is not None]
+            
+            # 측정에 실패한 문장은 비용 0으로 보이지 않도록 비교 대상에서 제외
+            for statement in statements:
+                statement['before_ms'] = self._measure(connection, statement)
+            statements = [statement for statement in statements if statement['before_ms'] is not None]
+            
+            candidates = self._candidates(statements, schema)
+            latencies = {index: statement['before_ms'] for index, statement in enumerate(statements)}
+            baseline = self._workload_cost(statements, latencies)
+            
+            current = baseline
+            recommendations = []
+            evaluated = 0
+            while candidates and len(recommendations) < max_indexes:
+                best: Optional[Tuple[float, IndexCandidate, Dict[int, float]]] = None
+                for candidate in candidates:
+                    evaluated += 1
+                    trial = self._trial(connection, candidate, statements, latencies)
+                    cost = self._workload_cost(statements, trial)
+                    if best is None or cost < best[0]:
+                        best = (cost, candidate, trial)
+                
+                cost, candidate, trial = best
+                if current - cost <= current * self.min_gain:
+                    break
+                
+                connection.execute(candidate.sql.replace('CREATE INDEX', 'CREATE INDEX IF NOT EXISTS', 1))
+                affected = [statements[index]['fingerprint'] for index in trial if trial[index] < latencies[index]]
+                recommendations.append({
+                    'table': candidate.table,
+                    'column': ', '.join(candidate.columns),
+                    'columns': list(candidate.columns),
+                    'covering': candidate.covering,
+                    'reason': '워크로드 측정 ({}, 비용 {:.1f}ms → {:.1f}ms)'.format(
+                        '커버링 인덱스' if candidate.covering else '복합 인덱스', current, cost
+                    ),
+                    'sql': candidate.sql,
+                    'statements': affected,
+                    'gain_ms': current - cost,
+                    'workload_speedup': baseline / cost if cost else None
+                })
+                latencies, current = trial, cost
+                candidates = [
+                    other for other in candidates
+                    if other.table != candidate.table or candidate.columns[:len(other.columns)] != other.columns
+                ]
+            
+            for index, statement in enumerate(statements):
+                statement['after_ms'] = latencies[index]
+                statement['plan_after'] = self._explain(connection, statement)[0] if recommendations else statement['plan_before']
+            
+            return {
+                'baseline_ms': baseline,
+                'optimized_ms': current,
+                'estimated_speedup': baseline / current if current else None,
+                'recommendations': recommendations,
+                'statements': [self._statement_report(statement) for statement in statements],
+                'candidates_evaluated': evaluated
+            }
+        finally:
+            connection.close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def _copy_database(self, path: str) -> sqlite3.Connection:
+        """
+        SQLite 백업 API로 데이터베이스 복사본 생성
+        
+        Returns:
+            sqlite3.Connection: 복사본 연결 (자동 커밋 모드)
+        """
+        source = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        try:
+            connection = sqlite3.connect(path, isolation_level=None)
+            source.backup(connection)
+        finally:
+            source.close()
+        return connection
+    
+    @staticmethod
+    def _load_schema(connection: sqlite3.Connection) -> Dict[str, Dict[str, Any]]:
+        """
+        테이블별 열, 기본 키(rowid) 열, 기존 인덱스 열 조회
+        """
+        schema = {}
+        tables = [row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )]
+        for table in tables:
+            info = connection.execute(f'PRAGMA table_info("{table}")').fetchall()
+            indexes = []
+            for index in connection.execute(f'PRAGMA index_list("{table}")').fetchall():
+                columns = [row[2] for row in connection.execute(f'PRAGMA index_info("{index[1]}")')]
+                indexes.append(tuple(column.lower() for column in columns if column))
+            rowid = [row[1] for row in info if row[5] and row[2].upper() == 'INTEGER']
+            schema[table.lower()] = {
+                'name': table,
+                'columns': {row[1].lower(): row[1] for row in info},
+                'rowid': {column.lower() for column in rowid} if len(rowid) == 1 else set(),
+                'indexes': indexes
+            }
+        return schema
+    
+    def _params(self, statement: Dict[str, Any]) -> Union[Sequence[Any], Dict[str, Any]]:
+        """
+        측정에 사용할 파라미터 (샘플이 없거나 개수가 맞지 않으면 NULL)
+        """
+        shape: QueryShape = statement['shape']
+        params = statement.get('params')
+        if shape.named_params:
+            return params if isinstance(params, dict) else {name: None for name in shape.named_params}
+        if isinstance(params, (list, tuple)) and len(params) == shape.placeholders:
+            return tuple(params)
+        return (None,) * shape.placeholders
+    
+    def _explain(self, connection: sqlite3.Connection, statement: Dict[str, Any]) -> Tuple[Optional[List[str]], Dict[str, Set[str]]]:
+        """
+        실행 계획과 문장이 읽는 테이블별 열 조회
+        
+        Returns:
+            Tuple: (실행 계획 설명 목록 또는 None(분석 실패), 테이블(소문자) → 열(소문자) 집합)
+        """
+        reads: Dict[str, Set[str]] = {}
+        
+        def authorizer(action, table, column, database, trigger):
+            if action == sqlite3.SQLITE_READ and table and column and not trigger:
+                reads.setdefault(table.lower(), set()).add(column.lower())
+            return sqlite3.SQLITE_OK
+        
+        connection.set_authorizer(authorizer)
+        try:
+            rows = connection.execute(f"EXPLAIN QUERY PLAN {statement['sql']}", self._params(statement)).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"실행 계획 조회 실패, 추천 대상에서 제외합니다: {e}, 쿼리: {statement['fingerprint']}")
+            return None, reads
+        finally:
+            connection.set_authorizer(None)
+        return [row[3] for row in rows], reads
+    
+    def _prepare(self, connection: sqlite3.Connection, statement: Dict[str, Any], schema: Dict[str, Dict[str, Any]]) -> None:
+        """
+        문장 구조, 실행 계획, 전체 스캔 테이블 분석 결과를 statement에 저장
+        """
+        shape = parse_query_shape(statement['sql'])
+        statement['shape'] = shape
+        plan, reads = self._explain(connection, statement)
+        statement['plan_before'] = plan
+        statement['reads'] = reads
+        
+        scanned = set()
+        sorts = False
+        for detail in plan or []:
+            parts = detail.split()
+            if parts[:1] == ['SCAN'] and len(parts) > 1 and 'INDEX' not in parts:
+                name = parts[2] if parts[1] == 'TABLE' and len(parts) > 2 else parts[1]
+                table = shape.tables.get(name.lower(), name).lower()
+                if table in schema:
+                    scanned.add(table)
+            elif detail.startswith('USE TEMP B-TREE FOR ORDER BY'):
+                sorts = True
+        
+        # 정렬만 하는 단일 테이블 문장도 ORDER BY 인덱스 후보
+        if sorts and not scanned and len(set(shape.tables.values())) == 1:
+            table = next(iter(shape.tables.values())).lower()
+            if table in schema:
+                scanned.add(table)
+        
+        statement['scanned'] = scanned
+    
+    @staticmethod
+    def _resolve(ref: ColumnRef, shape: QueryShape, schema: Dict[str, Dict[str, Any]]) -> Optional[Tuple[str, str]]:
+        """
+        열 참조를 (테이블(소문자), 열 이름)으로 해석 (한정자가 없으면 열을 가진 테이블이 하나일 때만)
+        """
+        qualifier, column = ref
+        column_key = column.lower()
+        if qualifier is not None:
+            table = shape.tables.get(qualifier.lower(), qualifier).lower()
+            info = schema.get(table)
+            return (table, info['columns'][column_key]) if info and column_key in info['columns'] else None
+        
+        owners = [
+            table.lower() for table in set(shape.tables.values())
+            if table.lower() in schema and column_key in schema[table.lower()]['columns']
+        ]
+        if len(owners) != 1:
+            return None
+        return owners[0], schema[owners[0]]['columns'][column_key]
+    
+    def _candidates(self, statements: List[Dict[str, Any]], schema: Dict[str, Dict[str, Any]]) -> List[IndexCandidate]:
+        """
+        전체 스캔 테이블별 복합/커버링 인덱스 후보 생성
+        
+        열 순서: 동등 비교 열(문장에 나온 순서) → 첫 범위 비교 열 (없으면 ORDER BY 열)
+        """
+        candidates: List[IndexCandidate] = []
+        
+        def add(candidate: IndexCandidate) -> None:
+            if candidate not in candidates:
+                candidates.append(candidate)
+        
+        for statement in statements:
+            shape: QueryShape = statement['shape']
+            for table in sorted(statement['scanned']):
+                info = schema[table]
+                
+                def columns_of(refs: List[ColumnRef]) -> List[str]:
+                    resolved = [self._resolve(ref, shape, schema) for ref in refs]
+                    return [column for owner, column in filter(None, resolved) if owner == table]
+                
+                keys: List[str] = []
+                for column in columns_of(shape.equality):
+                    if column not in keys and column.lower() not in info['rowid']:
+                        keys.append(column)
+                ranges = [column for column in columns_of(shape.ranges) if column not in keys]
+                order_by = columns_of(shape.order_by)
+                if ranges and ranges[0].lower() not in info['rowid']:
+                    keys.append(ranges[0])
+                elif not ranges and order_by and len(order_by) == len(shape.order_by):
+                    keys.extend(column for column in order_by if column not in keys)
+                keys = keys[:self.max_index_columns]
+                if not keys:
+                    continue
+                
+                # 기존 인덱스가 같은 열 순서로 시작하면 제외
+                key_lower = tuple(column.lower() for column in keys)
+                if any(index[:len(key_lower)] == key_lower for index in info['indexes']):
+                    continue
+                
+                table_name = info['name']
+                add(IndexCandidate(table_name, tuple(keys), False))
+                
+                read_columns = statement['reads'].get(table, set())
+                extra = [
+                    column for key, column in info['columns'].items()
+                    if key in read_columns and key not in key_lower and key not in info['rowid']
+                ]
+                if extra and len(keys) + len(extra) <= self.max_index_columns:
+                    add(IndexCandidate(table_name, tuple(keys) + tuple(extra), True))
+        
+        return candidates
+    
+    def _measure(self, connection: sqlite3.Connection, statement: Dict[str, Any]) -> Optional[float]:
+        """
+        문장 지연 시간 측정 (밀리초, 반복 측정 중앙값, 실행 실패 시 None)
+        
+        쓰기 문장은 세이브포인트 안에서 실행하고 되돌립니다.
+        """
+        params = self._params(statement)
+        read_only = statement['shape'].kind in _READ_ONLY
+        samples = []
+        
+        try:
+            for attempt in range(self.repeat + 1):
+                if read_only:
+                    started = time.perf_counter()
+                    connection.execute(statement['sql'], params).fetchall()
+                    elapsed = time.perf_counter() - started
+                else:
+                    connection.execute("SAVEPOINT index_advisor")
+                    try:
+                        started = time.perf_counter()
+                        connection.execute(statement['sql'], params)
+                        elapsed = time.perf_counter() - started
+                    finally:
+                        connection.execute("ROLLBACK TO index_advisor")
+                        connection.execute("RELEASE index_advisor")
+                if attempt:  # 첫 실행은 캐시 준비용
+                    samples.append(elapsed * 1000)
+        except sqlite3.Error as e:
+            logger.warning(f"문장 측정 실패, 비교 대상에서 제외합니다: {e}, 쿼리: {statement['fingerprint']}")
+            return None
+        
+        return statistics.median(samples)
+    
+    def _trial(self, connection: sqlite3.Connection, candidate: IndexCandidate,
+               statements: List[Dict[str, Any]], latencies: Dict[int, float]) -> Dict[int, float]:
+        """
+        후보 인덱스를 임시로 만들어 해당 테이블을 사용하는 문장만 다시 측정
+        
+        Returns:
+            Dict[int, float]: 후보 인덱스가 있을 때의 문장별 지연 시간 (실행에 실패한 문장은 무한대라 채택되지 않음)
+        """
+        trial = dict(latencies)
+        table = candidate.table.lower()
+        columns = ', '.join(f'"{column}"' for column in candidate.columns)
+        connection.execute(f'CREATE INDEX "index_advisor_trial" ON "{candidate.table}"({columns})')
+        try:
+            for index, statement in enumerate(statements):
+                if table in statement['reads'] or table in {name.lower() for name in statement['shape'].tables.values()}:
+                    latency = self._measure(connection, statement)
+                    trial[index] = float('inf') if latency is None else latency
+        finally:
+            connection.execute('DROP INDEX "index_advisor_trial"')
+        return trial
+    
+    @staticmethod
+    def _workload_cost(statements: List[Dict[str, Any]], latencies: Dict[int, float]) -> float:
+        """
+        워크로드 비용 (실행 횟수 × 지연 시간 합계, 밀리초)
+        """
+        return sum(statement['weight'] * latencies[index] for index, statement in enumerate(statements))
+    
+    @staticmethod
+    def _statement_report(statement: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        문장별 결과 요약
+        """
+        return {
+            'fingerprint': statement['fingerprint'],
+            'weight': statement['weight'],
+            'full_scan_tables': sorted(statement['scanned']),
+            'before_ms': statement.get('before_ms'),
+            'after_ms': statement.get('after_ms'),
+            'plan_before': statement['plan_before'],
+            'plan_after': statement.get('plan_after')
+        }
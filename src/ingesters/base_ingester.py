@@ -115,6 +115,52 @@ class BaseIngester(ABC):
             logger.error(error_msg)
             raise ValueError(error_msg) from e
     
+    def ingest_email_attachments(self, email_processor, email_id: str, save_path: str) -> List[Dict[str, Any]]:
+        """
+        이메일에 첨부된 명세서 파일을 내려받아 수집합니다.
+        
+        지원하는 확장자의 첨부 파일만 청크 단위 스트리밍으로 저장하며,
+        이미 수집한 첨부 파일과 SHA-256 해시가 같으면 다시 수집하지 않습니다.
+        해시는 수집에 성공한 뒤에만 기록하므로 실패한 첨부 파일은 다음에 다시 시도합니다.
+        
+        Args:
+            email_processor: 첨부 파일 조회/다운로드에 사용할 EmailProcessor
+            email_id: 이메일 ID
+            save_path: 첨부 파일 저장 경로
+            
+        Returns:
+            List[Dict[str, Any]]: 새로 수집된 정규화된 거래 데이터 목록
+        """
+        email_content = email_processor.get_email_content(email_id)
+        if not email_content:
+            logger.warning(f"이메일 내용을 가져올 수 없습니다: {email_id}")
+            return []
+        
+        supported_types = {file_type.lower() for file_type in self.get_supported_file_types()}
+        transactions = []
+        
+        for attachment in email_processor.extract_attachments(email_content):
+            filename = attachment.get("filename", "")
+            file_type = Path(filename).suffix.lower().lstrip(".")
+            if file_type not in supported_types or not attachment.get("attachment_id"):
+                continue
+            
+            download = email_processor.download_attachment(
+                email_id, attachment["attachment_id"], filename, save_path, record_hash=False
+            )
+            if download is None:
+                logger.warning(f"첨부 파일을 내려받지 못했습니다: {filename}")
+                continue
+            
+            if download.duplicate:
+                logger.info(f"이미 수집한 첨부 파일입니다: {filename}")
+                continue
+            
+            transactions.extend(self.ingest(download.file_path))
+            email_processor.record_attachment(save_path, download)
+        
+        return transactions
+    
     def get_info(self) -> Dict[str, str]:
         """
         수집기 정보를 반환합니다.
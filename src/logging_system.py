@@ -4,16 +4,23 @@
 
 금융 거래 관리 시스템의 로깅 설정 및 유틸리티를 제공합니다.
 구조화된 로깅, 로그 레벨 관리, 로그 포맷팅 등의 기능을 지원합니다.
+
+비동기 모드(system.logging.async_enabled)에서는 호출 스레드가 레코드를 큐에 넣기만 하고,
+백그라운드 스레드가 레코드를 모아 포맷팅/직렬화와 파일 쓰기를 한 번에 처리합니다.
 """
 
 import os
 import sys
+import time
+import queue
+import atexit
 import logging
 import logging.handlers
 import json
+import threading
 import traceback
 from datetime import datetime
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 from pathlib import Path
 
 # 현재 디렉토리를 모듈 경로에 추가
@@ -203,6 +210,9 @@ class StructuredLogger(logging.Logger):
         
         super().error(msg, *args, **kwargs)
 
+# JSON 문자열 이스케이프 (C 구현, ensure_ascii=False와 같은 결과)
+_encode_json_string = json.encoder.encode_basestring
+
 class JsonFormatter(logging.Formatter):
     """
     JSON 로그 포맷터 클래스
@@ -220,40 +230,369 @@ class JsonFormatter(logging.Formatter):
             style: 포맷 스타일
         """
         super().__init__(fmt, datefmt, style)
+        # 컨텍스트/예외처럼 구조가 있는 값에만 사용하는 인코더 (직렬화할 수 없는 값은 문자열로)
+        self._encoder = json.JSONEncoder(ensure_ascii=False, check_circular=False, default=str)
+        # 같은 초의 타임스탬프 문자열 재사용 (초, 타임스탬프 앞부분)
+        self._time_cache: Tuple[int, str] = (-1, '')
+    
+    def formatTime(self, record, datefmt=None):
+        """
+        로그 시각 포맷팅 (기본 형식은 초 단위 문자열을 캐시하고 밀리초만 붙임)
+        
+        Args:
+            record: 로그 레코드
+            datefmt: 날짜 포맷
+            
+        Returns:
+            str: 포맷팅된 시각
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, prefix = self._time_cache
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
     
     def format(self, record):
         """
         로그 레코드 포맷팅
         
+        고정 필드는 문자열 이스케이프만 하여 직접 이어 붙이고,
+        컨텍스트와 예외 정보만 JSON 인코더로 직렬화합니다.
+        
         Args:
             record: 로그 레코드
             
         Returns:
             str: 포맷팅된 로그 메시지
         """
-        log_data = {
-            'timestamp': self.formatTime(record, self.datefmt),
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno
-        }
+        parts = [
+            '{"timestamp": ', _encode_json_string(self.formatTime(record, self.datefmt)),
+            ', "level": ', _encode_json_string(record.levelname),
+            ', "logger": ', _encode_json_string(record.name),
+            ', "message": ', _encode_json_string(record.getMessage()),
+            ', "module": ', _encode_json_string(record.module),
+            ', "function": ', _encode_json_string(record.funcName or ''),
+            ', "line": ', str(record.lineno)
+        ]
         
         # 예외 정보 추가
         if record.exc_info:
-            log_data['exception'] = {
+            parts.append(', "exception": ')
+            parts.append(self._encoder.encode({
                 'type': record.exc_info[0].__name__,
                 'message': str(record.exc_info[1]),
                 'traceback': traceback.format_exception(*record.exc_info)
-            }
+            }))
         
         # 컨텍스트 정보 추가
-        if hasattr(record, 'context') and record.context:
-            log_data['context'] = record.context
+        context = getattr(record, 'context', None)
+        if context:
+            parts.append(', "context": ')
+            parts.append(self._encoder.encode(context))
+        
+        parts.append('}')
+        return ''.join(parts)
+
+class RepeatedMessageFilter(logging.Filter):
+    """
+    반복 메시지 제한 필터 클래스
+    
+    같은 위치(로거, 레벨, 파일, 줄)에서 나온 레코드를 메시지 내용과 관계없이 window초마다 burst건까지만 통과시킵니다.
+    창이 바뀐 뒤 처음 통과하는 레코드에는 직전 창에서 생략된 건수를 덧붙입니다.
+    max_level보다 높은 레벨(기본: ERROR 이상)은 제한하지 않습니다.
+    여러 핸들러에 붙여도 레코드마다 한 번만 판단합니다.
+    """
+    
+    def __init__(self, window: float = 10.0, burst: int = 20, max_level: int = logging.WARNING,
+                 max_keys: int = 4096):
+        """
+        반복 메시지 제한 필터 초기화
+        
+        Args:
+            window: 제한 창 길이 (초)
+            burst: 창마다 통과시킬 최대 건수
+            max_level: 제한할 최고 레벨
+            max_keys: 추적할 최대 위치 수 (넘으면 오래된 창부터 정리)
+        """
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.max_level = max_level
+        self.max_keys = max_keys
+        self.suppressed_total = 0
+        # 위치별 [창 시작 시각, 창 안에서 본 건수, 생략 건수]
+        self._counters: Dict[tuple, List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        레코드 통과 여부 판단
+        
+        Args:
+            record: 로그 레코드
+            
+        Returns:
+            bool: 기록할 레코드이면 True
+        """
+        decided = getattr(record, '_repeat_allowed', None)
+        if decided is not None:
+            return decided
+        
+        allowed = True
+        if record.levelno <= self.max_level:
+            allowed = self._check(record)
+        record._repeat_allowed = allowed
+        return allowed
+    
+    def _check(self, record: logging.LogRecord) -> bool:
+        """
+        위치별 창 카운터 갱신
+        """
+        # f-string으로 만든 메시지는 매번 내용이 달라지므로 호출 위치만으로 구분
+        key = (record.name, record.levelno, record.pathname, record.lineno)
+        now = record.created
+        
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                if len(self._counters) >= self.max_keys:
+                    self._prune(now)
+                self._counters[key] = [now, 1, 0]
+                return True
+            
+            if now - counter[0] >= self.window:
+                suppressed = int(counter[2])
+                counter[0], counter[1], counter[2] = now, 1, 0
+                if suppressed:
+                    record.msg = f"{record.getMessage()} (직전 {self.window:g}초 동안 반복 {suppressed}건 생략)"
+                    record.args = None
+                return True
+            
+            counter[1] += 1
+            if counter[1] <= self.burst:
+                return True
+            
+            counter[2] += 1
+            self.suppressed_total += 1
+            return False
+    
+    def _prune(self, now: float) -> None:
+        """
+        창이 끝난 위치 카운터 정리 (모두 진행 중이면 전부 비움)
+        """
+        expired = [key for key, counter in self._counters.items() if now - counter[0] >= self.window]
+        for key in expired or list(self._counters):
+            del self._counters[key]
+
+class BatchEmitMixin:
+    """
+    레코드 묶음을 한 번에 쓰는 핸들러 믹스인
+    
+    묶음의 레코드를 모두 포맷팅한 뒤 한 번의 write와 flush로 기록합니다.
+    """
+    
+    def emit_batch(self, records: List[logging.LogRecord]) -> int:
+        """
+        레코드 묶음 기록
+        
+        Args:
+            records: 로그 레코드 목록
+            
+        Returns:
+            int: 기록한 레코드 수
+        """
+        lines = []
+        for record in records:
+            if record.levelno < self.level or not self.filter(record):
+                continue
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        
+        if not lines:
+            return 0
+        
+        text = ''.join(lines)
+        self.acquire()
+        try:
+            self._write_batch(text)
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+        return len(lines)
+    
+    def _write_batch(self, text: str) -> None:
+        """
+        포맷팅된 묶음 쓰기 (잠금을 잡은 상태에서 호출)
+        """
+        self.stream.write(text)
+        self.flush()
+
+class BatchStreamHandler(BatchEmitMixin, logging.StreamHandler):
+    """
+    묶음 쓰기를 지원하는 스트림(콘솔) 핸들러
+    """
+
+class BatchRotatingFileHandler(BatchEmitMixin, logging.handlers.RotatingFileHandler):
+    """
+    묶음 쓰기를 지원하는 크기 기반 순환 파일 핸들러
+    
+    묶음을 쓰기 전에 파일 크기를 확인하여 maxBytes를 넘게 되면 먼저 순환합니다.
+    """
+    
+    def _write_batch(self, text: str) -> None:
+        """
+        크기를 확인한 뒤 묶음 쓰기
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        
+        if self.maxBytes > 0:
+            size = len(text.encode(self.encoding or 'utf-8'))
+            position = self.stream.tell()
+            if position and position + size > self.maxBytes:
+                self.doRollover()
+        
+        self.stream.write(text)
+        self.flush()
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    호출 스레드에서 큐에 넣기만 하는 핸들러
+    
+    메시지 인자만 문자열로 합치고(이후 인자 객체가 바뀌어도 안전하도록) 포맷팅과 예외 traceback
+    문자열 변환은 백그라운드 스레드로 넘깁니다. 큐가 가득 차면 호출 스레드를 막지 않고 버린 건수만 셉니다.
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        """
+        비동기 큐 핸들러 초기화
+        
+        Args:
+            log_queue: 레코드를 넣을 큐
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        큐에 넣을 레코드 준비 (메시지 인자 병합)
+        
+        Args:
+            record: 로그 레코드
+            
+        Returns:
+            logging.LogRecord: 준비된 레코드
+        """
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        레코드를 큐에 넣기 (가득 차면 버림)
+        
+        Args:
+            record: 로그 레코드
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    큐의 레코드를 묶음으로 처리하는 리스너 클래스
+    
+    첫 레코드를 받은 뒤 flush_interval 동안 또는 batch_size건이 찰 때까지 더 모은 다음,
+    핸들러마다 묶음을 한 번에 기록합니다.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler, batch_size: int = 256,
+                 flush_interval: float = 0.2):
+        """
+        묶음 리스너 초기화
+        
+        Args:
+            log_queue: 레코드 큐
+            *handlers: 실제로 기록할 핸들러
+            batch_size: 묶음 최대 레코드 수
+            flush_interval: 첫 레코드 이후 묶음을 모으는 최대 시간 (초)
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.batches_written = 0
+        self.records_written = 0
+    
+    def _monitor(self) -> None:
+        """
+        백그라운드 스레드: 묶음 수집 후 기록 (센티널을 받으면 남은 묶음을 쓰고 종료)
+        """
+        log_queue = self.queue
+        has_task_done = hasattr(log_queue, 'task_done')
+        
+        while True:
+            record = log_queue.get()
+            batch = []
+            stop = record is self._sentinel
+            if not stop:
+                batch.append(record)
+            
+            deadline = time.monotonic() + self.flush_interval
+            while not stop and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    record = log_queue.get(timeout=remaining) if remaining > 0 else log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    batch.append(record)
+            
+            if batch:
+                self.handle_batch(batch)
+            
+            if has_task_done:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    log_queue.task_done()
+            
+            if stop:
+                break
+    
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        핸들러마다 묶음 기록 (묶음 쓰기를 지원하지 않는 핸들러는 한 건씩)
+        
+        Args:
+            records: 로그 레코드 목록
+        """
+        for handler in self.handlers:
+            emit_batch = getattr(handler, 'emit_batch', None)
+            if emit_batch is not None:
+                emit_batch(records)
+                continue
+            for record in records:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
         
-        return json.dumps(log_data, ensure_ascii=False)
+        self.batches_written += 1
+        self.records_written += len(records)
+    
+    def enqueue_sentinel(self) -> None:
+        """
+        종료 센티널 넣기 (큐가 가득 차 있어도 자리가 날 때까지 대기)
+        """
+        self.queue.put(self._sentinel)
+
 
 class LoggingSystem:
     """
@@ -280,6 +619,22 @@ class LoggingSystem:
         self.console_format = self._get_config('system.logging.console_format', DEFAULT_CONSOLE_FORMAT)
         self.json_logging = self._get_config('system.logging.json_format', False)
         
+        # 비동기 묶음 기록 설정
+        self.async_enabled = self._get_config('system.logging.async_enabled', False)
+        self.queue_size = self._get_config('system.logging.queue_size', 10000)
+        self.batch_size = self._get_config('system.logging.batch_size', 256)
+        self.flush_interval_ms = self._get_config('system.logging.flush_interval_ms', 200)
+        
+        # 반복 메시지 제한 설정 (기본: 비동기 모드에서만 사용)
+        self.rate_limit_enabled = self._get_config('system.logging.rate_limit.enabled', None)
+        self.rate_limit_window = self._get_config('system.logging.rate_limit.window_seconds', 10)
+        self.rate_limit_burst = self._get_config('system.logging.rate_limit.burst', 20)
+        
+        self.queue_handler: Optional[AsyncQueueHandler] = None
+        self.listener: Optional[BatchingQueueListener] = None
+        self.repeat_filter: Optional[RepeatedMessageFilter] = None
+        self._atexit_registered = False
+        
         # 로그 디렉토리 생성
         log_dir = os.path.dirname(self.log_file)
         os.makedirs(log_dir, exist_ok=True)
@@ -300,15 +655,23 @@ class LoggingSystem:
         """
         return self.config_manager.get_config_value(key, default)
     
-    def setup_logging(self, verbose: bool = False, log_file: str = None, module_levels: Dict[str, str] = None) -> None:
+    def setup_logging(self, verbose: bool = False, log_file: str = None, module_levels: Dict[str, str] = None,
+                      async_mode: bool = None) -> None:
         """
         로깅 설정
         
+        비동기 모드에서는 루트 로거에 큐 핸들러 하나만 두고, 콘솔/파일 핸들러는
+        백그라운드 리스너가 묶음으로 기록합니다.
+        
         Args:
             verbose: 상세 로깅 활성화 여부
             log_file: 로그 파일 경로
             module_levels: 모듈별 로그 레벨 설정
+            async_mode: 비동기 묶음 기록 여부 (None: 설정값 사용)
         """
+        if async_mode is None:
+            async_mode = self.async_enabled
+        
         # 루트 로거 설정
         root_logger = logging.getLogger()
         
@@ -316,12 +679,17 @@ class LoggingSystem:
         log_level = logging.DEBUG if verbose else LOG_LEVELS.get(self.log_level, logging.INFO)
         root_logger.setLevel(log_level)
         
-        # 기존 핸들러 제거
+        # 기존 리스너 종료 및 핸들러 제거
+        self.shutdown()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
+        # 반복 메시지 제한 필터
+        rate_limit = self.rate_limit_enabled if self.rate_limit_enabled is not None else async_mode
+        self.repeat_filter = RepeatedMessageFilter(self.rate_limit_window, self.rate_limit_burst) if rate_limit else None
+        
         # 콘솔 핸들러 추가
-        console_handler = logging.StreamHandler()
+        console_handler = BatchStreamHandler() if async_mode else logging.StreamHandler()
         console_handler.setLevel(log_level)
         
         if self.json_logging:
@@ -330,7 +698,6 @@ class LoggingSystem:
             console_formatter = logging.Formatter(self.console_format)
         
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
         
         # 파일 핸들러 추가
         file_path = log_file or self.log_file
@@ -340,7 +707,8 @@ class LoggingSystem:
         if log_dir:
             os.makedirs(log_dir, exist_ok=True)
         
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler_class = BatchRotatingFileHandler if async_mode else logging.handlers.RotatingFileHandler
+        file_handler = file_handler_class(
             file_path,
             maxBytes=self.max_size_mb * 1024 * 1024,
             backupCount=self.backup_count,
@@ -354,7 +722,30 @@ class LoggingSystem:
             file_formatter = logging.Formatter(self.log_format)
         
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        
+        if async_mode:
+            # 호출 스레드는 큐에 넣기만 하고, 포맷팅과 쓰기는 리스너 스레드에서 처리
+            log_queue = queue.Queue(maxsize=self.queue_size)
+            self.queue_handler = AsyncQueueHandler(log_queue)
+            if self.repeat_filter:
+                self.queue_handler.addFilter(self.repeat_filter)
+            root_logger.addHandler(self.queue_handler)
+            
+            self.listener = BatchingQueueListener(
+                log_queue, console_handler, file_handler,
+                batch_size=self.batch_size,
+                flush_interval=self.flush_interval_ms / 1000
+            )
+            self.listener.start()
+            
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+        else:
+            for handler in (console_handler, file_handler):
+                if self.repeat_filter:
+                    handler.addFilter(self.repeat_filter)
+                root_logger.addHandler(handler)
         
         # 모듈별 로그 레벨 설정
         if module_levels:
@@ -367,9 +758,63 @@ class LoggingSystem:
         system_logger.debug("로깅 시스템 설정 완료", context={
             'log_level': logging.getLevelName(log_level),
             'log_file': file_path,
-            'json_logging': self.json_logging
+            'json_logging': self.json_logging,
+            'async_mode': async_mode
         })
     
+    def flush(self) -> None:
+        """
+        비동기 모드에서 큐에 쌓인 레코드를 모두 기록할 때까지 대기
+        """
+        if self.listener is not None:
+            self.listener.queue.join()
+    
+    def shutdown(self) -> None:
+        """
+        비동기 리스너 종료 (남은 레코드를 모두 기록하고 핸들러를 닫음)
+        """
+        listener, self.listener = self.listener, None
+        if listener is None:
+            return
+        
+        root_logger = logging.getLogger()
+        if self.queue_handler is not None:
+            root_logger.removeHandler(self.queue_handler)
+            self.queue_handler = None
+        
+        if listener._thread is not None:
+            listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """
+        로그 파이프라인 통계 조회
+        
+        Returns:
+            Dict[str, Any]: 비동기 여부, 큐 길이, 버린 건수, 묶음 수, 반복 생략 건수
+        """
+        stats = {
+            'async': self.listener is not None,
+            'queued': 0,
+            'dropped': 0,
+            'batches': 0,
+            'records': 0,
+            'suppressed': self.repeat_filter.suppressed_total if self.repeat_filter else 0
+        }
+        
+        if self.listener is not None:
+            stats['queued'] = self.listener.queue.qsize()
+            stats['dropped'] = self.queue_handler.dropped if self.queue_handler else 0
+            stats['batches'] = self.listener.batches_written
+            stats['records'] = self.listener.records_written
+            stats['avg_batch_size'] = (
+                self.listener.records_written / self.listener.batches_written
+                if self.listener.batches_written else 0
+            )
+        
+        return stats
+    
     def get_logger(self, name: str) -> logging.Logger:
         """
         로거 가져오기
@@ -518,7 +963,8 @@ def get_logging_system() -> LoggingSystem:
     
     return _logging_system
 
-def setup_logging(verbose: bool = False, log_file: str = None, module_levels: Dict[str, str] = None) -> None:
+def setup_logging(verbose: bool = False, log_file: str = None, module_levels: Dict[str, str] = None,
+                  async_mode: bool = None) -> None:
     """
     로깅 설정
     
@@ -526,9 +972,10 @@ def setup_logging(verbose: bool = False, log_file: str = None, module_levels: Di
         verbose: 상세 로깅 활성화 여부
         log_file: 로그 파일 경로
         module_levels: 모듈별 로그 레벨 설정
+        async_mode: 비동기 묶음 기록 여부 (None: 설정값 사용)
     """
     logging_system = get_logging_system()
-    logging_system.setup_logging(verbose, log_file, module_levels)
+    logging_system.setup_logging(verbose, log_file, module_levels, async_mode)
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -607,4 +1054,18 @@ def clear_logs() -> None:
     로그 파일 정리
     """
     logging_system = get_logging_system()
-    logging_system.clear_logs()
\ No newline at end of file
+    logging_system.clear_logs()
+
+def flush_logs() -> None:
+    """
+    비동기 모드에서 큐에 쌓인 로그를 모두 기록할 때까지 대기
+    """
+    logging_system = get_logging_system()
+    logging_system.flush()
+
+def shutdown_logging() -> None:
+    """
+    비동기 로그 리스너 종료
+    """
+    logging_system = get_logging_system()
+    logging_system.shutdown()
@@ -27,6 +27,10 @@ if parent_dir not in sys.path:
 
 from src.logging_system import get_logger
 from src.config_manager import ConfigManager
+from src.statement_profiler import (
+    StatementProfiler, fingerprint_sql, enable_statement_profiling, disable_statement_profiling
+)
+from src.sampling_profiler import SamplingProfiler
 
 # 로거 설정
 logger = get_logger('performance')
@@ -36,6 +40,8 @@ class QueryProfiler:
     SQL 쿼리 프로파일링 클래스
     
     데이터베이스 쿼리의 실행 시간과 성능을 측정합니다.
+    활성화하면 문장 프로파일러를 전역으로 설치해 모든 DatabaseConnection의 SQL 문장이
+    지문별 지연 시간 히스토그램, 행 수, 느린 문장의 실행 계획과 함께 기록됩니다.
     """
     
     def __init__(self, db_path: str = None, config_manager: ConfigManager = None):
@@ -52,16 +58,28 @@ class QueryProfiler:
         self.enabled = self.config_manager.get_config_value('system.performance.query_profiling_enabled', False)
         self.log_slow_queries = self.config_manager.get_config_value('system.performance.log_slow_queries', True)
         self.slow_query_threshold = self.config_manager.get_config_value('system.performance.slow_query_threshold_ms', 100)
+        self.max_queries = self.config_manager.get_config_value('system.performance.max_profiled_queries', 500)
+        
+        # DatabaseConnection 문장 프로파일러
+        self.statement_profiler = StatementProfiler(
+            max_statements=self.max_queries,
+            slow_threshold_ms=self.slow_query_threshold,
+            capture_plans=self.config_manager.get_config_value('system.performance.capture_query_plans', True)
+        )
         
         # 프로파일링 결과 저장 경로
         self.profile_dir = os.path.join(parent_dir, 'profiles')
         os.makedirs(self.profile_dir, exist_ok=True)
+        
+        if self.enabled:
+            enable_statement_profiling(self.statement_profiler)
     
     def enable(self) -> None:
         """
         프로파일링 활성화
         """
         self.enabled = True
+        enable_statement_profiling(self.statement_profiler)
         logger.info("쿼리 프로파일링이 활성화되었습니다.")
     
     def disable(self) -> None:
@@ -69,6 +87,7 @@ class QueryProfiler:
         프로파일링 비활성화
         """
         self.enabled = False
+        disable_statement_profiling(self.statement_profiler)
         logger.info("쿼리 프로파일링이 비활성화되었습니다.")
     
     @contextmanager
@@ -98,17 +117,20 @@ class QueryProfiler:
             end_time = time.time()
             execution_time = (end_time - start_time) * 1000  # 밀리초 단위
             
-            # 쿼리 통계 업데이트
-            if normalized_query not in self.query_stats:
-                self.query_stats[normalized_query] = {
+            # 쿼리 통계 업데이트 (최근 사용 순서 유지, 최대 max_queries개)
+            stats = self.query_stats.pop(normalized_query, None)
+            if stats is None:
+                stats = {
                     'count': 0,
                     'total_time': 0,
                     'min_time': float('inf'),
                     'max_time': 0,
                     'avg_time': 0
                 }
+                while self.query_stats and len(self.query_stats) >= self.max_queries:
+                    del self.query_stats[next(iter(self.query_stats))]
+            self.query_stats[normalized_query] = stats
             
-            stats = self.query_stats[normalized_query]
             stats['count'] += 1
             stats['total_time'] += execution_time
             stats['min_time'] = min(stats['min_time'], execution_time)
@@ -176,7 +198,7 @@ class QueryProfiler:
         Returns:
             List[Tuple[str, Dict[str, Any]]]: 느린 쿼리 목록
         """
-        threshold = threshold_ms or self.slow_query_threshold
+        threshold = self.slow_query_threshold if threshold_ms is None else threshold_ms
         
         slow_queries = [
             (query, stats) for query, stats in self.query_stats.items()
@@ -193,8 +215,39 @@ class QueryProfiler:
         통계 초기화
         """
         self.query_stats = {}
+        self.statement_profiler.reset()
         logger.info("쿼리 통계가 초기화되었습니다.")
     
+    def get_statement_stats(self, include_samples: bool = False) -> List[Dict[str, Any]]:
+        """
+        DatabaseConnection 문장별 통계 조회
+        
+        Args:
+            include_samples: 원본 SQL과 파라미터 포함 여부 (recommend_indexes/advise_indexes에 바로 넘길 때만 사용)
+        
+        Returns:
+            List[Dict[str, Any]]: 총 지연 시간 내림차순 문장 통계 (지연 시간 히스토그램, 행 수, 실행 계획 포함)
+        """
+        return self.statement_profiler.get_stats(include_samples)
+    
+    def export_statement_stats(self, file_path: str = None) -> str:
+        """
+        문장별 통계를 profiles/에 저장 (DatabaseOptimizer.recommend_indexes 입력으로 사용 가능)
+        
+        Args:
+            file_path: 저장할 파일 경로
+            
+        Returns:
+            str: 저장된 파일 경로 (실패 시 빈 문자열)
+        """
+        try:
+            if file_path:
+                return self.statement_profiler.export(os.path.dirname(file_path) or '.', os.path.basename(file_path))
+            return self.statement_profiler.export(self.profile_dir)
+        except Exception as e:
+            logger.error(f"문장 통계 저장 중 오류 발생: {e}")
+            return ""
+    
     def save_stats(self, file_path: str = None) -> str:
         """
         통계 저장
@@ -278,8 +331,8 @@ class QueryProfiler:
         Returns:
             str: 정규화된 쿼리
         """
-        # 공백 정규화
-        query = ' '.join(query.split())
+        # 리터럴 제거 및 공백 정규화 (값만 다른 쿼리는 같은 항목으로 집계)
+        query = fingerprint_sql(query)
         
         # 대소문자 통일
         query = query.upper()
@@ -484,6 +537,7 @@ class PerformanceMonitor:
     성능 모니터링 클래스
     
     시스템 전반의 성능을 모니터링하고 최적화합니다.
+    profiling_mode가 'sampling'이면 함수/구간 계측을 건너뛰고 샘플링 프로파일러만 사용합니다.
     """
     
     def __init__(self, config_manager: ConfigManager = None):
@@ -497,6 +551,11 @@ class PerformanceMonitor:
         self.query_profiler = QueryProfiler(config_manager=self.config_manager)
         self.memory_profiler = MemoryProfiler(config_manager=self.config_manager)
         self.enabled = self.config_manager.get_config_value('system.performance.monitoring_enabled', False)
+        self.profiling_mode = self.config_manager.get_config_value('system.performance.profiling_mode', 'instrumented')
+        self.sampling_profiler = SamplingProfiler(
+            interval_ms=self.config_manager.get_config_value('system.performance.sampling_interval_ms', 10.0),
+            max_overhead=self.config_manager.get_config_value('system.performance.sampling_max_overhead', 0.02)
+        )
         self.timers = {}
         self.function_stats = {}
         
@@ -518,7 +577,12 @@ class PerformanceMonitor:
         if self.config_manager.get_config_value('system.performance.memory_profiling_enabled', False):
             self.memory_profiler.enable()
         
-        logger.info("성능 모니터링이 활성화되었습니다.")
+        # 샘플링 프로파일링 활성화
+        if (self.profiling_mode == 'sampling' or
+                self.config_manager.get_config_value('system.performance.sampling_enabled', False)):
+            self.sampling_profiler.start()
+        
+        logger.info(f"성능 모니터링이 활성화되었습니다. (모드: {self.profiling_mode})")
     
     def disable(self) -> None:
         """
@@ -527,6 +591,7 @@ class PerformanceMonitor:
         self.enabled = False
         self.query_profiler.disable()
         self.memory_profiler.disable()
+        self.sampling_profiler.stop()
         logger.info("성능 모니터링이 비활성화되었습니다.")
     
     @contextmanager
@@ -537,20 +602,19 @@ class PerformanceMonitor:
         Args:
             name: 측정 이름
         """
-        if not self.enabled:
+        if not self.enabled or self.profiling_mode == 'sampling':
             yield
             return
         
         # 시작 시간 기록
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # 코드 실행
             yield
         finally:
             # 종료 시간 기록
-            end_time = time.time()
-            execution_time = (end_time - start_time) * 1000  # 밀리초 단위
+            execution_time = (time.perf_counter_ns() - start_time) / 1e6  # 밀리초 단위
             
             # 타이머 통계 업데이트
             if name not in self.timers:
@@ -585,13 +649,13 @@ class PerformanceMonitor:
         def decorator(f):
             @functools.wraps(f)
             def wrapper(*args, **kwargs):
-                if not self.enabled:
+                if not self.enabled or self.profiling_mode == 'sampling':
                     return f(*args, **kwargs)
                 
                 profile_name = name or f.__qualname__
                 
                 # 시작 시간 기록
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 
                 try:
                     # 함수 실행
@@ -599,8 +663,7 @@ class PerformanceMonitor:
                     return result
                 finally:
                     # 종료 시간 기록
-                    end_time = time.time()
-                    execution_time = (end_time - start_time) * 1000  # 밀리초 단위
+                    execution_time = (time.perf_counter_ns() - start_time) / 1e6  # 밀리초 단위
                     
                     # 함수 통계 업데이트
                     if profile_name not in self.function_stats:
@@ -645,6 +708,65 @@ class PerformanceMonitor:
         """
         return self.function_stats
     
+    def start_sampling(self, interval_ms: float = None) -> bool:
+        """
+        샘플링 프로파일러 시작
+        
+        Args:
+            interval_ms: 샘플링 간격 (밀리초, 기본값: 설정값)
+            
+        Returns:
+            bool: 새로 시작했으면 True
+        """
+        if interval_ms is not None:
+            if self.sampling_profiler.running:
+                self.sampling_profiler.stop()
+            self.sampling_profiler.interval_ns = int(interval_ms * 1_000_000)
+            self.sampling_profiler.current_interval_ns = self.sampling_profiler.interval_ns
+        return self.sampling_profiler.start()
+    
+    def stop_sampling(self) -> bool:
+        """
+        샘플링 프로파일러 중지
+        
+        Returns:
+            bool: 실행 중이던 샘플링을 멈췄으면 True
+        """
+        return self.sampling_profiler.stop()
+    
+    def get_sampling_stats(self, limit: int = 20) -> Dict[str, Any]:
+        """
+        샘플링 통계 조회
+        
+        Args:
+            limit: 상위 함수 최대 개수
+            
+        Returns:
+            Dict[str, Any]: 샘플 수, 비용, 진입점별 집계, 상위 함수
+        """
+        return self.sampling_profiler.get_stats(limit)
+    
+    def export_flamegraph(self, file_path: str = None, by_entry_point: bool = False) -> str:
+        """
+        샘플링 결과를 flame graph용 collapsed stack 파일로 저장
+        
+        Args:
+            file_path: 저장할 파일 경로
+            by_entry_point: 스레드 대신 진입점별로 묶을지 여부
+            
+        Returns:
+            str: 저장된 파일 경로
+        """
+        if not file_path:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            file_path = os.path.join(self.profile_dir, f"flamegraph_{timestamp}.collapsed")
+        
+        try:
+            return self.sampling_profiler.export_collapsed(file_path, by_entry_point=by_entry_point)
+        except Exception as e:
+            logger.error(f"flame graph 저장 중 오류 발생: {e}")
+            return ""
+    
     def get_system_stats(self) -> Dict[str, Any]:
         """
         시스템 통계 조회
@@ -683,6 +805,7 @@ class PerformanceMonitor:
         self.timers = {}
         self.function_stats = {}
         self.query_profiler.reset_stats()
+        self.sampling_profiler.reset()
         self.memory_profiler.clear_snapshots()
         logger.info("성능 통계가 초기화되었습니다.")
     
@@ -707,6 +830,8 @@ class PerformanceMonitor:
                 'timers': self.timers,
                 'functions': self.function_stats,
                 'queries': self.query_profiler.get_stats(),
+                'statements': self.query_profiler.get_statement_stats(),
+                'sampling': self.sampling_profiler.get_stats(),
                 'system': self.get_system_stats()
             }
             
@@ -783,6 +908,7 @@ class PerformanceMonitor:
             'slow_queries': slow_queries,
             'top_memory_objects': top_memory_objects,
             'slow_functions': slow_functions,
+            'entry_points': self.sampling_profiler.entry_point_stats(),
             'recommendations': []
         }
         
@@ -954,4 +1080,31 @@ def disable_monitoring() -> None:
     모니터링 비활성화
     """
     monitor = get_performance_monitor()
-    monitor.disable()
\ No newline at end of file
+    monitor.disable()
+
+def start_sampling_profiler(interval_ms: float = None) -> bool:
+    """
+    샘플링 프로파일러 시작
+    
+    Args:
+        interval_ms: 샘플링 간격 (밀리초)
+        
+    Returns:
+        bool: 새로 시작했으면 True
+    """
+    monitor = get_performance_monitor()
+    return monitor.start_sampling(interval_ms)
+
+def stop_sampling_profiler(file_path: str = None) -> str:
+    """
+    샘플링 프로파일러 중지 후 flame graph 파일 저장
+    
+    Args:
+        file_path: 저장할 파일 경로
+        
+    Returns:
+        str: 저장된 파일 경로
+    """
+    monitor = get_performance_monitor()
+    monitor.stop_sampling()
+    return monitor.export_flamegraph(file_path)
\ No newline at end of file
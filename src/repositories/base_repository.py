@@ -5,9 +5,12 @@
 모든 Repository 클래스의 기본이 되는 추상 클래스로, CRUD 인터페이스를 정의합니다.
 """
 
+import inspect
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, TypeVar, Generic
 
+from src.tracing import KIND_REPOSITORY, traced
+
 # 제네릭 타입 변수 정의
 T = TypeVar('T')
 
@@ -18,8 +21,19 @@ class BaseRepository(Generic[T], ABC):
     
     모든 Repository 클래스의 기본이 되는 추상 클래스로, CRUD 인터페이스를 정의합니다.
     제네릭 타입 T를 사용하여 다양한 엔티티 타입을 지원합니다.
+    하위 클래스의 공개 메서드는 요청 추적(src.tracing)이 켜져 있을 때 저장소 구간으로 기록됩니다.
     """
     
+    def __init_subclass__(cls, **kwargs):
+        """
+        하위 클래스에서 정의한 공개 메서드를 저장소 구간(클래스명.메서드명)으로 감쌉니다.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.isfunction(value):
+                continue
+            setattr(cls, name, traced(f"{cls.__name__}.{name}", kind=KIND_REPOSITORY)(value))
+    
     @abstractmethod
     def create(self, entity: T) -> T:
         """
@@ -7,28 +7,59 @@ SQLite 데이터베이스 연결을 관리하고 트랜잭션 처리를 지원
 
 import sqlite3
 import logging
-from typing import Optional, Any, List, Dict, Tuple
+import functools
+from typing import Optional, Any, List, Dict, Tuple, Callable
 from contextlib import contextmanager
 import os
 
+from src.statement_profiler import StatementProfiler, fingerprint_sql, get_active_profiler
+from src.tracing import KIND_SQL, tracer
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+
+def _traced_sql(method: Callable) -> Callable:
+    """
+    추적이 켜져 있으면 쿼리 실행을 SQL 구간으로 기록하는 데코레이터
+    
+    값이 기록되지 않도록 문장은 지문(리터럴을 ?로 바꾼 형태)으로 남깁니다.
+    """
+    span_name = f"sql.{method.__name__}"
+    
+    @functools.wraps(method)
+    def wrapper(self, query: str, *args, **kwargs):
+        if not tracer.enabled:
+            return method(self, query, *args, **kwargs)
+        
+        with tracer.span(span_name, KIND_SQL, statement=fingerprint_sql(query),
+                         db=os.path.basename(self.db_path)) as span:
+            result = method(self, query, *args, **kwargs)
+            if isinstance(result, list):
+                span.set_attribute('rows', len(result))
+            return result
+    return wrapper
+
 class DatabaseConnection:
     """
     데이터베이스 연결 관리 클래스
     
     SQLite 데이터베이스 연결을 관리하고 트랜잭션 처리를 지원합니다.
+    프로파일러가 설정되어 있거나 전역 문장 프로파일링(enable_statement_profiling)이 켜져 있으면
+    execute, execute_many, fetch_one, fetch_all의 지연 시간과 행 수를 문장 지문별로 기록합니다.
+    요청 추적(src.tracing)이 켜져 있으면 같은 메서드가 SQL 구간을 남깁니다.
     """
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, profiler: Optional[StatementProfiler] = None):
         """
         데이터베이스 연결 객체 초기화
         
         Args:
             db_path: 데이터베이스 파일 경로
+            profiler: 이 연결 전용 문장 프로파일러 (기본값: 전역 프로파일러 사용)
         """
         self.db_path = db_path
+        self.profiler = profiler
         self._connection = None
         
         # 데이터베이스 파일 존재 여부 확인
@@ -87,6 +118,13 @@ class DatabaseConnection:
             logger.error(f"트랜잭션 실패, 롤백 수행: {e}")
             raise
     
+    def _get_profiler(self) -> Optional[StatementProfiler]:
+        """
+        사용할 문장 프로파일러 (연결 전용 프로파일러가 없으면 전역 프로파일러)
+        """
+        return self.profiler if self.profiler is not None else get_active_profiler()
+    
+    @_traced_sql
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """
         SQL 쿼리 실행
@@ -100,6 +138,23 @@ class DatabaseConnection:
             
         Raises:
             RuntimeError: 쿼리 실행 실패 시
+            
+        Note:
+            프로파일링 시 SELECT는 커서를 반환할 때까지의 시간만 측정됩니다.
+            행 읽기까지 측정하려면 fetch_one/fetch_all을 사용하세요.
+        """
+        profiler = self._get_profiler()
+        if profiler is None:
+            return self._execute(query, params)
+        
+        with profiler.measure(self.connect(), query, params) as measurement:
+            cursor = self._execute(query, params)
+            measurement.rows = max(cursor.rowcount, 0)
+        return cursor
+    
+    def _execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
+        """
+        SQL 쿼리 실행 (프로파일링 없음)
         """
         try:
             connection = self.connect()
@@ -108,6 +163,7 @@ class DatabaseConnection:
             logger.error(f"쿼리 실행 실패: {e}, 쿼리: {query}, 파라미터: {params}")
             raise RuntimeError(f"쿼리 실행 실패: {e}")
     
+    @_traced_sql
     def execute_many(self, query: str, params_list: List[tuple]) -> sqlite3.Cursor:
         """
         여러 파라미터로 SQL 쿼리 실행
@@ -122,13 +178,22 @@ class DatabaseConnection:
         Raises:
             RuntimeError: 쿼리 실행 실패 시
         """
+        profiler = self._get_profiler()
         try:
             connection = self.connect()
-            return connection.executemany(query, params_list)
+            if profiler is None:
+                return connection.executemany(query, params_list)
+            
+            params_list = list(params_list)
+            with profiler.measure(connection, query, params_list[0] if params_list else ()) as measurement:
+                cursor = connection.executemany(query, params_list)
+                measurement.rows = max(cursor.rowcount, 0)
+            return cursor
         except sqlite3.Error as e:
             logger.error(f"대량 쿼리 실행 실패: {e}, 쿼리: {query}")
             raise RuntimeError(f"대량 쿼리 실행 실패: {e}")
     
+    @_traced_sql
     def fetch_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
         """
         단일 레코드 조회
@@ -143,14 +208,20 @@ class DatabaseConnection:
         Raises:
             RuntimeError: 쿼리 실행 실패 시
         """
+        profiler = self._get_profiler()
         try:
-            cursor = self.execute(query, params)
-            row = cursor.fetchone()
+            if profiler is None:
+                row = self._execute(query, params).fetchone()
+            else:
+                with profiler.measure(self.connect(), query, params) as measurement:
+                    row = self._execute(query, params).fetchone()
+                    measurement.rows = 1 if row else 0
             return dict(row) if row else None
         except sqlite3.Error as e:
             logger.error(f"단일 레코드 조회 실패: {e}, 쿼리: {query}, 파라미터: {params}")
             raise RuntimeError(f"단일 레코드 조회 실패: {e}")
     
+    @_traced_sql
     def fetch_all(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """
         여러 레코드 조회
@@ -165,9 +236,15 @@ class DatabaseConnection:
         Raises:
             RuntimeError: 쿼리 실행 실패 시
         """
+        profiler = self._get_profiler()
         try:
-            cursor = self.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            if profiler is None:
+                return [dict(row) for row in self._execute(query, params).fetchall()]
+            
+            with profiler.measure(self.connect(), query, params) as measurement:
+                rows = self._execute(query, params).fetchall()
+                measurement.rows = len(rows)
+            return [dict(row) for row in rows]
         except sqlite3.Error as e:
             logger.error(f"다중 레코드 조회 실패: {e}, 쿼리: {query}, 파라미터: {params}")
             raise RuntimeError(f"다중 레코드 조회 실패: {e}")
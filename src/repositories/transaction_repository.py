@@ -8,8 +8,9 @@
 import logging
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 
+from src.cache_tags import invalidate_tags, month_tag, table_tag
 from src.models import Transaction
 from src.repositories.base_repository import BaseRepository
 from src.repositories.db_connection import DatabaseConnection
@@ -23,8 +24,11 @@ class TransactionRepository(BaseRepository[Transaction]):
     거래 Repository 클래스
     
     거래 데이터의 CRUD 작업을 처리합니다.
+    쓰기 작업 후에는 거래 테이블 태그와 변경된 거래의 월 태그가 붙은 캐시만 무효화합니다.
     """
     
+    TABLE_NAME = 'transactions'
+    
     def __init__(self, db_connection: DatabaseConnection):
         """
         거래 Repository 초기화
@@ -64,6 +68,24 @@ class TransactionRepository(BaseRepository[Transaction]):
         self.db.execute("CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date)")
         self.db.execute("CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(transaction_type)")
         self.db.execute("CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions(category)")
+        
+        # 데이터 버전 (거래 테이블이 바뀔 때마다 트리거로 증가, 분석 결과 캐시 키에 사용)
+        with self.db.transaction() as conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS data_versions (
+                table_name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+            """)
+            conn.execute("INSERT OR IGNORE INTO data_versions (table_name, version) VALUES ('transactions', 0)")
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_transactions_version_{event.lower()}
+                AFTER {event} ON transactions
+                BEGIN
+                    UPDATE data_versions SET version = version + 1 WHERE table_name = 'transactions';
+                END
+                """)
     
     def create(self, entity: Transaction) -> Transaction:
         """
@@ -115,10 +137,12 @@ class TransactionRepository(BaseRepository[Transaction]):
                 conn.execute(query, params)
                 entity.id = self.db.get_last_insert_id()
                 logger.info(f"거래 생성 완료: ID={entity.id}, 거래ID={entity.transaction_id}")
-                return entity
         except Exception as e:
             logger.error(f"거래 생성 실패: {e}")
             raise RuntimeError(f"거래 생성 실패: {e}")
+        
+        self._invalidate_cache(entity.transaction_date)
+        return entity
     
     def read(self, id: int) -> Optional[Transaction]:
         """
@@ -188,8 +212,9 @@ class TransactionRepository(BaseRepository[Transaction]):
         if entity.id is None:
             raise ValueError("업데이트할 거래의 ID가 없습니다")
         
-        # 존재 여부 확인
-        if not self.exists(entity.id):
+        # 존재 여부 확인 (이전 거래 월의 캐시도 무효화하기 위해 날짜 조회)
+        previous_date = self._get_transaction_date(entity.id)
+        if previous_date is None:
             raise ValueError(f"존재하지 않는 거래입니다: ID={entity.id}")
         
         query = """
@@ -232,10 +257,12 @@ class TransactionRepository(BaseRepository[Transaction]):
             with self.db.transaction() as conn:
                 conn.execute(query, params)
                 logger.info(f"거래 업데이트 완료: ID={entity.id}, 거래ID={entity.transaction_id}")
-                return entity
         except Exception as e:
             logger.error(f"거래 업데이트 실패 (ID={entity.id}): {e}")
             raise RuntimeError(f"거래 업데이트 실패: {e}")
+        
+        self._invalidate_cache(previous_date, entity.transaction_date)
+        return entity
     
     def delete(self, id: int) -> bool:
         """
@@ -254,16 +281,20 @@ class TransactionRepository(BaseRepository[Transaction]):
         
         try:
             with self.db.transaction() as conn:
+                row = conn.execute("SELECT transaction_date FROM transactions WHERE id = ?", (id,)).fetchone()
                 cursor = conn.execute(query, (id,))
                 success = cursor.rowcount > 0
                 if success:
                     logger.info(f"거래 삭제 완료: ID={id}")
                 else:
                     logger.warning(f"삭제할 거래를 찾을 수 없음: ID={id}")
-                return success
         except Exception as e:
             logger.error(f"거래 삭제 실패 (ID={id}): {e}")
             raise RuntimeError(f"거래 삭제 실패: {e}")
+        
+        if success:
+            self._invalidate_cache(row[0] if row else None)
+        return success
     
     def list(self, filters: Optional[Dict[str, Any]] = None) -> List[Transaction]:
         """
@@ -635,11 +666,65 @@ class TransactionRepository(BaseRepository[Transaction]):
                     created = self.read_by_transaction_id(entity.transaction_id)
                     if created:
                         created_transactions.append(created)
-                
-                return created_transactions
         except Exception as e:
             logger.error(f"일괄 거래 생성 실패: {e}")
             raise RuntimeError(f"일괄 거래 생성 실패: {e}")
+        
+        self._invalidate_cache(*(entity.transaction_date for entity in entities))
+        return created_transactions
+    
+    def get_data_version(self) -> int:
+        """
+        거래 테이블의 데이터 버전을 조회합니다.
+        
+        거래가 추가/수정/삭제될 때마다(다른 연결이나 직접 실행한 SQL 포함) 1씩 증가합니다.
+        
+        Returns:
+            int: 데이터 버전
+            
+        Raises:
+            RuntimeError: 데이터베이스 오류 발생 시
+        """
+        query = "SELECT version FROM data_versions WHERE table_name = 'transactions'"
+        
+        try:
+            result = self.db.fetch_one(query)
+            return result['version'] if result else 0
+        except Exception as e:
+            logger.error(f"데이터 버전 조회 실패: {e}")
+            raise RuntimeError(f"데이터 버전 조회 실패: {e}")
+    
+    def _get_transaction_date(self, id: int) -> Optional[str]:
+        """
+        거래 날짜를 조회합니다.
+        
+        Args:
+            id: 거래 ID
+            
+        Returns:
+            Optional[str]: 거래 날짜 (ISO 형식) 또는 None (없는 경우)
+            
+        Raises:
+            RuntimeError: 데이터베이스 오류 발생 시
+        """
+        query = "SELECT transaction_date FROM transactions WHERE id = ?"
+        
+        try:
+            result = self.db.fetch_one(query, (id,))
+            return result['transaction_date'] if result else None
+        except Exception as e:
+            logger.error(f"거래 날짜 조회 실패 (ID={id}): {e}")
+            raise RuntimeError(f"거래 날짜 조회 실패: {e}")
+    
+    def _invalidate_cache(self, *transaction_dates: Union[date, str, None]) -> None:
+        """
+        거래 테이블과 변경된 거래 월 태그의 캐시를 무효화합니다.
+        
+        Args:
+            *transaction_dates: 변경된 거래의 날짜
+        """
+        months = {month_tag(self.TABLE_NAME, value) for value in transaction_dates if value}
+        invalidate_tags(table_tag(self.TABLE_NAME), *months)
     
     def _find_existing_transaction_ids(self, transaction_ids: List[str]) -> List[str]:
         """
@@ -11,6 +11,7 @@ from decimal import Decimal, InvalidOperation
 from typing import List, Dict, Any, Optional, Tuple, Set, Callable
 from functools import lru_cache
 
+from src.cache_tags import invalidate_tags, rule_type_tag
 from src.models import ClassificationRule, Transaction
 from src.repositories.rule_repository import RuleRepository
 
@@ -297,7 +298,7 @@ class RuleEngine:
     
     def _invalidate_cache(self, rule_type: str) -> None:
         """
-        특정 유형의 규칙 캐시를 무효화합니다.
+        특정 유형의 규칙 캐시와 해당 유형 태그가 붙은 공용 캐시를 무효화합니다.
         
         Args:
             rule_type: 규칙 유형
@@ -306,6 +307,7 @@ class RuleEngine:
             del self._rule_cache[rule_type]
         if rule_type in self._cache_timestamp:
             del self._cache_timestamp[rule_type]
+        invalidate_tags(rule_type_tag(rule_type))
         logger.debug(f"규칙 캐시 무효화됨: 유형={rule_type}")
     
     def _get_active_rules_by_type(self, rule_type: str) -> List[ClassificationRule]:
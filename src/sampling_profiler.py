@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+"""
+샘플링 프로파일러
+
+백그라운드 스레드가 일정 간격으로 sys._current_frames()를 읽어 각 스레드의 호출 스택을 수집합니다.
+함수를 감싸지 않으므로 측정 대상 코드에는 비용이 없고, 샘플링 비용은 perf_counter_ns로 직접 측정해
+설정한 비율(기본 2%)을 넘지 않도록 샘플링 간격을 자동으로 늘립니다.
+
+수집한 스택은 flame graph 도구(flamegraph.pl, speedscope 등)가 읽는 collapsed stack 형식으로
+내보낼 수 있고, process_query, 금융 도구 함수, Gmail 감시 스레드 같은 진입점별로 시간을 집계합니다.
+진입점은 스택에 있는 코드 객체의 파일/함수 이름으로 판별하므로 진입점 함수에 별도 표시가 필요 없습니다.
+
+저장소 계층에서도 가볍게 가져다 쓸 수 있도록 다른 src 모듈에 의존하지 않습니다.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from datetime import datetime
+from fnmatch import fnmatchcase
+from inspect import CO_NESTED
+from types import CodeType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 기본 진입점 규칙 (라벨, 파일 경로 패턴, 함수 이름 패턴)
+# 라벨의 {function}은 함수 이름으로 바뀝니다. 밑줄로 시작하는 내부 함수는 도구로 보지 않습니다.
+# 다른 함수 안에서 정의된 함수(데코레이터 래퍼, 클로저, 람다)는 규칙과 관계없이 진입점이 아닙니다.
+DEFAULT_ENTRY_POINTS: Tuple[Tuple[str, str, str], ...] = (
+    ('process_query', '*/main.py', 'process_query'),
+    ('tool:{function}', '*/src/financial_tools/*.py', '[!_<]*'),
+    ('gmail_watcher', '*/src/gmail/service.py', '_watch_*'),
+    ('gmail_watcher', '*/src/gmail/service.py', '_process_email_queue'),
+)
+
+# 대기 중인 스레드로 보는 잎 함수 (파일 이름, 함수 이름)
+IDLE_FUNCTIONS = frozenset({
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('threading.py', 'join'),
+    ('queue.py', 'get'),
+    ('selectors.py', 'select'),
+    ('socket.py', 'accept'),
+    ('thread.py', '_worker'),
+})
+
+# 깊은 스택을 자른 자리에 넣는 표시
+_ELIDED = None
+
+
+class SamplingProfiler:
+    """
+    스택 샘플링 프로파일러 클래스
+    
+    스택은 (스레드 이름, 코드 객체 튜플) 키로 샘플 수와 경과 시간(ns)을 누적합니다.
+    각 샘플은 직전 샘플 이후 흐른 시간만큼의 가중치를 가지므로 간격이 늘어나도 시간 추정이 유지됩니다.
+    문자열 변환과 진입점 판별은 통계 조회나 내보내기 시점에만 수행합니다.
+    """
+    
+    def __init__(self, interval_ms: float = 10.0, max_overhead: float = 0.02, max_depth: int = 128,
+                 max_stacks: int = 20000, include_idle: bool = False,
+                 entry_points: Iterable[Tuple[str, str, str]] = DEFAULT_ENTRY_POINTS):
+        """
+        샘플링 프로파일러 초기화
+        
+        Args:
+            interval_ms: 기본 샘플링 간격 (밀리초)
+            max_overhead: 허용할 샘플링 비용 비율 (0.02 = 2%)
+            max_depth: 스택당 최대 프레임 수 (넘으면 잎 쪽과 뿌리 쪽 절반씩 보관)
+            max_stacks: 보관할 최대 고유 스택 수 (넘는 새 스택은 버린 샘플로 셈)
+            include_idle: 대기 중인 스레드(락/큐/select 대기)의 샘플 포함 여부
+            entry_points: 진입점 규칙 (라벨, 파일 경로 패턴, 함수 이름 패턴)
+        """
+        if interval_ms <= 0:
+            raise ValueError("샘플링 간격은 0보다 커야 합니다.")
+        if not 0 < max_overhead < 1:
+            raise ValueError("허용 비용 비율은 0과 1 사이여야 합니다.")
+        
+        self.interval_ns = int(interval_ms * 1_000_000)
+        self.max_overhead = max_overhead
+        self.max_depth = max(2, max_depth)
+        self.max_stacks = max_stacks
+        self.include_idle = include_idle
+        self.entry_points = tuple(entry_points)
+        
+        self._stacks: Dict[Tuple[str, Tuple[Optional[CodeType], ...]], List[int]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._thread_names: Dict[int, str] = {}
+        self._entry_labels: Dict[CodeType, Optional[str]] = {}
+        self._frame_labels: Dict[CodeType, str] = {}
+        self._reset_counters()
+    
+    def _reset_counters(self) -> None:
+        """
+        누적 카운터 초기화
+        """
+        self.samples = 0
+        self.idle_samples = 0
+        self.dropped_samples = 0
+        self.sampling_ns = 0
+        self.current_interval_ns = self.interval_ns
+        self._elapsed_ns = 0
+        self._started_ns: Optional[int] = None
+    
+    @property
+    def running(self) -> bool:
+        """
+        샘플링 스레드 실행 여부
+        """
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> bool:
+        """
+        샘플링 시작
+        
+        Returns:
+            bool: 새로 시작했으면 True (이미 실행 중이면 False)
+        """
+        if self.running:
+            return False
+        
+        self._stop_event.clear()
+        self._started_ns = time.perf_counter_ns()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        logger.info(f"샘플링 프로파일러 시작 (간격 {self.interval_ns / 1_000_000:g}ms)")
+        return True
+    
+    def stop(self, timeout: float = 1.0) -> bool:
+        """
+        샘플링 중지
+        
+        Args:
+            timeout: 스레드 종료 대기 시간 (초)
+        
+        Returns:
+            bool: 실행 중이던 샘플링을 멈췄으면 True
+        """
+        thread = self._thread
+        if thread is None:
+            return False
+        
+        self._stop_event.set()
+        thread.join(timeout)
+        self._thread = None
+        if self._started_ns is not None:
+            self._elapsed_ns += time.perf_counter_ns() - self._started_ns
+            self._started_ns = None
+        
+        logger.info(f"샘플링 프로파일러 중지 (샘플 {self.samples}개, 비용 {self.overhead * 100:.2f}%)")
+        return True
+    
+    def reset(self) -> None:
+        """
+        수집한 스택과 카운터 초기화 (실행 중이면 계속 샘플링)
+        """
+        with self._lock:
+            self._stacks.clear()
+            running = self._started_ns is not None
+            self._reset_counters()
+            if running:
+                self._started_ns = time.perf_counter_ns()
+    
+    def sample_once(self, weight_ns: int = None) -> int:
+        """
+        현재 모든 스레드의 스택을 한 번 샘플링
+        
+        Args:
+            weight_ns: 샘플 가중치 (기본값: 기본 샘플링 간격)
+        
+        Returns:
+            int: 기록한 스레드 스택 수
+        """
+        started = time.perf_counter_ns()
+        recorded = self._sample(self.interval_ns if weight_ns is None else weight_ns)
+        self.sampling_ns += time.perf_counter_ns() - started
+        return recorded
+    
+    @property
+    def overhead(self) -> float:
+        """
+        샘플링에 쓴 시간 비율 (샘플링 비용 / 실행 시간)
+        """
+        elapsed = self._elapsed_ns
+        if self._started_ns is not None:
+            elapsed += time.perf_counter_ns() - self._started_ns
+        return self.sampling_ns / elapsed if elapsed else 0.0
+    
+    def _run(self) -> None:
+        """
+        샘플링 루프 (백그라운드 스레드)
+        
+        샘플 한 번의 비용을 지수 이동 평균으로 추적하고, 비용 / 간격이 허용 비율을 넘지 않도록
+        간격을 늘립니다. 비용이 줄면 기본 간격으로 돌아옵니다.
+        """
+        average_cost = 0.0
+        last_ns = time.perf_counter_ns()
+        
+        while not self._stop_event.wait(self.current_interval_ns / 1e9):
+            started = time.perf_counter_ns()
+            try:
+                self._sample(started - last_ns)
+            except Exception as e:
+                logger.error(f"스택 샘플링 중 오류 발생: {e}")
+            finished = time.perf_counter_ns()
+            last_ns = started
+            
+            cost = finished - started
+            self.sampling_ns += cost
+            average_cost = cost if not average_cost else average_cost * 0.9 + cost * 0.1
+            self.current_interval_ns = max(self.interval_ns, int(average_cost / self.max_overhead))
+    
+    def _sample(self, weight_ns: int) -> int:
+        """
+        모든 스레드의 스택을 읽어 누적
+        
+        Args:
+            weight_ns: 샘플 가중치 (나노초)
+        
+        Returns:
+            int: 기록한 스레드 스택 수
+        """
+        own_ident = threading.get_ident()
+        frames = sys._current_frames()
+        max_depth = self.max_depth
+        recorded = 0
+        
+        with self._lock:
+            self.samples += 1
+            for ident, frame in frames.items():
+                if ident == own_ident:
+                    continue
+                
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                if len(codes) > max_depth:
+                    half = max_depth // 2
+                    codes = codes[:half] + [_ELIDED] + codes[-half:]
+                
+                if not self.include_idle and self._is_idle(codes[0]):
+                    self.idle_samples += 1
+                    continue
+                
+                key = (self._thread_name(ident), tuple(codes))
+                counts = self._stacks.get(key)
+                if counts is None:
+                    if len(self._stacks) >= self.max_stacks:
+                        self.dropped_samples += 1
+                        continue
+                    counts = self._stacks[key] = [0, 0]
+                counts[0] += 1
+                counts[1] += weight_ns
+                recorded += 1
+        
+        return recorded
+    
+    def _thread_name(self, ident: int) -> str:
+        """
+        스레드 이름 조회 (모르는 스레드가 나타날 때만 목록을 다시 읽음)
+        """
+        name = self._thread_names.get(ident)
+        if name is None:
+            self._thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            name = self._thread_names.setdefault(ident, f"thread-{ident}")
+        return name
+    
+    @staticmethod
+    def _is_idle(code: CodeType) -> bool:
+        """
+        잎 프레임이 대기 함수인지 확인
+        """
+        return (os.path.basename(code.co_filename), code.co_name) in IDLE_FUNCTIONS
+    
+    def _frame_label(self, code: Optional[CodeType]) -> str:
+        """
+        flame graph 프레임 이름 (모듈:함수)
+        """
+        if code is _ELIDED:
+            return '...'
+        label = self._frame_labels.get(code)
+        if label is None:
+            module = os.path.splitext(os.path.basename(code.co_filename))[0]
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = self._frame_labels[code] = f"{module}:{name}".replace(';', ',').replace(' ', '_')
+        return label
+    
+    def _entry_label(self, code: Optional[CodeType]) -> Optional[str]:
+        """
+        코드 객체가 진입점이면 진입점 라벨 반환
+        
+        _memoize_tool의 wrapper처럼 중첩 정의된 함수는 모든 도구가 같은 코드 객체를 공유하므로
+        제외하고, 그 아래에서 실행되는 원래 함수 프레임으로 판별합니다.
+        """
+        if code is _ELIDED:
+            return None
+        if code in self._entry_labels:
+            return self._entry_labels[code]
+        
+        path = code.co_filename.replace(os.sep, '/')
+        label = None
+        nested = '<locals>' in getattr(code, 'co_qualname', '') or code.co_flags & CO_NESTED
+        for entry_label, path_pattern, function_pattern in self.entry_points:
+            if not nested and fnmatchcase(path, path_pattern) and fnmatchcase(code.co_name, function_pattern):
+                label = entry_label.format(function=code.co_name)
+                break
+        self._entry_labels[code] = label
+        return label
+    
+    def _snapshot(self) -> List[Tuple[str, Tuple[Optional[CodeType], ...], int, int]]:
+        """
+        누적 스택 복사본 (스레드 이름, 코드 튜플, 샘플 수, 경과 시간 ns)
+        """
+        with self._lock:
+            return [(thread, codes, counts[0], counts[1]) for (thread, codes), counts in self._stacks.items()]
+    
+    def collapsed_stacks(self, by_entry_point: bool = False) -> List[str]:
+        """
+        collapsed stack 형식 줄 목록 (뿌리;...;잎 샘플수)
+        
+        Args:
+            by_entry_point: True면 스레드 이름 대신 가장 안쪽 진입점을 뿌리 프레임으로 사용
+        
+        Returns:
+            List[str]: 샘플 수 내림차순으로 정렬된 줄 목록
+        """
+        merged: Dict[str, int] = {}
+        for thread, codes, count, _ in self._snapshot():
+            if by_entry_point:
+                root = next((label for label in map(self._entry_label, codes) if label), '(other)')
+            else:
+                root = thread.replace(';', ',').replace(' ', '_')
+            line = ';'.join([root] + [self._frame_label(code) for code in reversed(codes)])
+            merged[line] = merged.get(line, 0) + count
+        
+        return [f"{line} {count}" for line, count in sorted(merged.items(), key=lambda item: -item[1])]
+    
+    def export_collapsed(self, file_path: str, by_entry_point: bool = False) -> str:
+        """
+        collapsed stack 파일 저장 (flamegraph.pl, speedscope 입력 형식)
+        
+        Args:
+            file_path: 저장할 파일 경로
+            by_entry_point: 진입점별로 묶을지 여부
+        
+        Returns:
+            str: 저장된 파일 경로
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for line in self.collapsed_stacks(by_entry_point=by_entry_point):
+                f.write(line + '\n')
+        
+        logger.info(f"flame graph 스택이 저장되었습니다: {file_path}")
+        return file_path
+    
+    def entry_point_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        진입점별 시간 집계
+        
+        self는 그 진입점이 가장 안쪽 진입점인 샘플(예: 도구 함수 안의 시간은 도구로),
+        inclusive는 스택 어딘가에 그 진입점이 있는 샘플입니다.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: 진입점별 samples, time_ms, inclusive_samples, inclusive_time_ms, percent
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        total = 0
+        
+        for _, codes, count, weight in self._snapshot():
+            total += count
+            labels = [label for label in map(self._entry_label, codes) if label]
+            if not labels:
+                continue
+            
+            for index, label in enumerate(dict.fromkeys(labels)):
+                stats = result.setdefault(label, {
+                    'samples': 0, 'time_ms': 0.0, 'inclusive_samples': 0, 'inclusive_time_ms': 0.0
+                })
+                stats['inclusive_samples'] += count
+                stats['inclusive_time_ms'] += weight / 1e6
+                if index == 0:
+                    stats['samples'] += count
+                    stats['time_ms'] += weight / 1e6
+        
+        for stats in result.values():
+            stats['percent'] = stats['inclusive_samples'] / total * 100 if total else 0.0
+        
+        return dict(sorted(result.items(), key=lambda item: -item[1]['inclusive_samples']))
+    
+    def top_functions(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        자기 시간(잎 프레임 기준)이 긴 함수 목록
+        
+        Args:
+            limit: 최대 개수
+        
+        Returns:
+            List[Dict[str, Any]]: function, samples, time_ms, percent
+        """
+        merged: Dict[str, List[int]] = {}
+        total = 0
+        for _, codes, count, weight in self._snapshot():
+            total += count
+            counts = merged.setdefault(self._frame_label(codes[0]), [0, 0])
+            counts[0] += count
+            counts[1] += weight
+        
+        ranked = sorted(merged.items(), key=lambda item: -item[1][0])[:limit]
+        return [
+            {
+                'function': label,
+                'samples': count,
+                'time_ms': weight / 1e6,
+                'percent': count / total * 100 if total else 0.0
+            }
+            for label, (count, weight) in ranked
+        ]
+    
+    def get_stats(self, limit: int = 20) -> Dict[str, Any]:
+        """
+        샘플링 통계 조회
+        
+        Args:
+            limit: 상위 함수 최대 개수
+        
+        Returns:
+            Dict[str, Any]: 샘플 수, 비용, 진입점별 집계, 상위 함수
+        """
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'running': self.running,
+            'interval_ms': self.interval_ns / 1e6,
+            'current_interval_ms': self.current_interval_ns / 1e6,
+            'samples': self.samples,
+            'idle_samples': self.idle_samples,
+            'dropped_samples': self.dropped_samples,
+            'unique_stacks': len(self._stacks),
+            'sampling_ms': self.sampling_ns / 1e6,
+            'overhead_percent': self.overhead * 100,
+            'entry_points': self.entry_point_stats(),
+            'top_functions': self.top_functions(limit)
+        }
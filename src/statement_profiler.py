@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+"""
+SQL 문장 프로파일러
+
+DatabaseConnection이 실행하는 SQL 문장을 지문(리터럴을 ?로 바꾼 정규화 SQL)별로 집계합니다.
+지문별로 실행 횟수, 지연 시간 히스토그램, 반환/변경 행 수를 기록하고,
+느린 문장은 처음 한 번 EXPLAIN QUERY PLAN 결과를 함께 저장합니다.
+집계 항목 수는 상한이 있어 오래 실행해도 메모리가 늘어나지 않습니다.
+
+저장소 계층에서 가져다 쓸 수 있도록 다른 src 모듈에 의존하지 않습니다.
+"""
+
+import bisect
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 버킷 상한 (밀리초, 마지막 버킷은 상한 없음)
+HISTOGRAM_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# EXPLAIN QUERY PLAN을 실행할 수 있는 문장 종류
+_EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_sql(query: str) -> str:
+    """
+    SQL 문장 지문 생성
+    
+    문자열/숫자 리터럴을 ?로 바꾸고, IN (?, ?, ...) 같은 자리표시자 목록을 (?+)로 합치고,
+    공백을 정리합니다. 값만 다른 문장은 같은 지문이 됩니다.
+    
+    Args:
+        query: SQL 문장
+    
+    Returns:
+        str: 지문
+    """
+    text = _STRING_LITERAL.sub('?', query)
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = _PLACEHOLDER_LIST.sub('(?+)', text)
+    return _WHITESPACE.sub(' ', text).strip().rstrip(';')
+
+
+class LatencyHistogram:
+    """
+    고정 버킷 지연 시간 히스토그램
+    
+    버킷 경계가 고정되어 있어 기록은 이진 탐색 한 번이고, 백분위수는 버킷 상한으로 추정합니다.
+    """
+    
+    __slots__ = ('counts', 'count', 'total_ms', 'min_ms', 'max_ms')
+    
+    def __init__(self):
+        """
+        히스토그램 초기화
+        """
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float('inf')
+        self.max_ms = 0.0
+    
+    def record(self, elapsed_ms: float) -> None:
+        """
+        지연 시간 기록
+        
+        Args:
+            elapsed_ms: 지연 시간 (밀리초)
+        """
+        self.counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms < self.min_ms:
+            self.min_ms = elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+    
+    def percentile(self, percent: float) -> float:
+        """
+        백분위수 추정
+        
+        Args:
+            percent: 백분위 (0~100)
+        
+        Returns:
+            float: 해당 백분위가 속한 버킷의 상한 (최댓값을 넘지 않음, 기록이 없으면 0)
+        """
+        if not self.count:
+            return 0.0
+        
+        rank = max(1, int(self.count * percent / 100 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = HISTOGRAM_BOUNDS_MS[index] if index < len(HISTOGRAM_BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        히스토그램 요약
+        
+        Returns:
+            Dict[str, Any]: 횟수, 합계/최소/최대/평균, p50/p95/p99, 버킷별 횟수 (0인 버킷 제외)
+        """
+        buckets = {}
+        for index, count in enumerate(self.counts):
+            if count:
+                label = f"<={HISTOGRAM_BOUNDS_MS[index]}" if index < len(HISTOGRAM_BOUNDS_MS) else f">{HISTOGRAM_BOUNDS_MS[-1]}"
+                buckets[label] = count
+        
+        return {
+            'count': self.count,
+            'total_ms': self.total_ms,
+            'min_ms': self.min_ms if self.count else 0.0,
+            'max_ms': self.max_ms,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'buckets': buckets
+        }
+
+
+class StatementStats:
+    """
+    지문별 SQL 문장 통계
+    """
+    
+    __slots__ = ('fingerprint', 'sample', 'sample_params', 'histogram', 'rows', 'errors', 'slow_count', 'plan',
+                 'last_executed')
+    
+    def __init__(self, fingerprint: str, sample: str, sample_params: Sequence[Any] = ()):
+        """
+        문장 통계 초기화
+        
+        Args:
+            fingerprint: 지문
+            sample: 처음 실행된 원본 SQL (실행 계획 분석용)
+            sample_params: 처음 실행된 파라미터 (인덱스 효과 측정 시 재실행용)
+        """
+        self.fingerprint = fingerprint
+        self.sample = sample
+        self.sample_params = sample_params
+        self.histogram = LatencyHistogram()
+        self.rows = 0
+        self.errors = 0
+        self.slow_count = 0
+        self.plan: Optional[List[Dict[str, Any]]] = None
+        self.last_executed = 0.0
+    
+    def to_dict(self, include_samples: bool = False) -> Dict[str, Any]:
+        """
+        통계 딕셔너리 변환
+        
+        Args:
+            include_samples: 원본 SQL과 파라미터 포함 여부 (거래 데이터가 담기므로 메모리 내 재실행에만 사용)
+        
+        Returns:
+            Dict[str, Any]: 지문, 지연 시간 요약, 행 수, 오류/느린 실행 횟수, 실행 계획 (요청 시 원본 SQL/파라미터)
+        """
+        latency = self.histogram.to_dict()
+        stats = {
+            'fingerprint': self.fingerprint,
+            'count': latency['count'],
+            'total_ms': latency['total_ms'],
+            'latency': latency,
+            'rows': self.rows,
+            'avg_rows': self.rows / latency['count'] if latency['count'] else 0.0,
+            'errors': self.errors,
+            'slow_count': self.slow_count,
+            'plan': self.plan,
+            'last_executed': datetime.fromtimestamp(self.last_executed).isoformat() if self.last_executed else None
+        }
+        if include_samples:
+            stats['sample'] = self.sample
+            stats['sample_params'] = _jsonable_params(self.sample_params)
+        return stats
+
+
+def _jsonable_params(params: Any) -> Any:
+    """
+    쿼리 파라미터를 JSON으로 저장할 수 있는 형태로 변환 (기본형이 아닌 값은 문자열)
+    """
+    def convert(value: Any) -> Any:
+        return value if value is None or isinstance(value, (int, float, str)) else str(value)
+    
+    if isinstance(params, dict):
+        return {str(key): convert(value) for key, value in params.items()}
+    return [convert(value) for value in params or ()]
+
+
+class _Measurement:
+    """measure() 블록에서 행 수를 전달받는 객체"""
+    
+    __slots__ = ('rows',)
+    
+    def __init__(self):
+        self.rows = 0
+
+
+class StatementProfiler:
+    """
+    SQL 문장 프로파일러 클래스
+    
+    지문별 통계를 LRU 순서로 최대 max_statements개까지 보관합니다.
+    slow_threshold_ms 이상 걸린 문장은 같은 연결에서 EXPLAIN QUERY PLAN을 한 번 실행해 저장합니다.
+    """
+    
+    def __init__(self, max_statements: int = 500, slow_threshold_ms: float = 100.0, capture_plans: bool = True):
+        """
+        문장 프로파일러 초기화
+        
+        Args:
+            max_statements: 보관할 최대 지문 수
+            slow_threshold_ms: 느린 문장 기준 (밀리초)
+            capture_plans: 느린 문장의 실행 계획 저장 여부
+        """
+        self.max_statements = max_statements
+        self.slow_threshold_ms = slow_threshold_ms
+        self.capture_plans = capture_plans
+        self._statements: 'OrderedDict[str, StatementStats]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+    
+    def __len__(self) -> int:
+        return len(self._statements)
+    
+    @contextmanager
+    def measure(self, connection: Optional[sqlite3.Connection], query: str,
+                params: Sequence[Any] = ()) -> Iterator[_Measurement]:
+        """
+        문장 실행 시간 측정 컨텍스트 매니저
+        
+        블록 안에서 measurement.rows에 반환/변경 행 수를 설정합니다. 예외가 발생하면 오류로 기록합니다.
+        
+        Args:
+            connection: 실행 계획 조회에 사용할 연결 (None이면 조회하지 않음)
+            query: SQL 문장
+            params: 쿼리 파라미터
+        
+        Yields:
+            _Measurement: 행 수 전달 객체
+        """
+        measurement = _Measurement()
+        started = time.perf_counter_ns()
+        try:
+            yield measurement
+        except Exception:
+            self.record(query, (time.perf_counter_ns() - started) / 1e6, params=params, error=True)
+            raise
+        self.record(query, (time.perf_counter_ns() - started) / 1e6, measurement.rows, connection, params)
+    
+    def record(self, query: str, elapsed_ms: float, rows: int = 0, connection: Optional[sqlite3.Connection] = None,
+               params: Sequence[Any] = (), error: bool = False) -> None:
+        """
+        문장 실행 기록
+        
+        Args:
+            query: SQL 문장
+            elapsed_ms: 지연 시간 (밀리초)
+            rows: 반환/변경 행 수
+            connection: 실행 계획 조회에 사용할 연결
+            params: 쿼리 파라미터 (실행 계획 조회용)
+            error: 실행 실패 여부
+        """
+        fingerprint = fingerprint_sql(query)
+        slow = elapsed_ms >= self.slow_threshold_ms
+        
+        with self._lock:
+            stats = self._statements.get(fingerprint)
+            if stats is None:
+                stats = self._statements[fingerprint] = StatementStats(fingerprint, query, params)
+                if len(self._statements) > self.max_statements:
+                    self._statements.popitem(last=False)
+                    self.evicted += 1
+            else:
+                self._statements.move_to_end(fingerprint)
+            
+            stats.histogram.record(elapsed_ms)
+            stats.last_executed = time.time()
+            if error:
+                stats.errors += 1
+                return
+            stats.rows += rows
+            if not slow:
+                return
+            stats.slow_count += 1
+            need_plan = self.capture_plans and stats.plan is None and connection is not None
+        
+        logger.warning(f"느린 SQL 문장: {elapsed_ms:.2f}ms, 쿼리: {fingerprint}")
+        if need_plan:
+            plan = self.explain(connection, query, params)
+            if plan is not None:
+                stats.plan = plan
+    
+    @staticmethod
+    def explain(connection: sqlite3.Connection, query: str, params: Sequence[Any] = ()) -> Optional[List[Dict[str, Any]]]:
+        """
+        EXPLAIN QUERY PLAN 실행
+        
+        Args:
+            connection: 데이터베이스 연결
+            query: SQL 문장
+            params: 쿼리 파라미터
+        
+        Returns:
+            Optional[List[Dict[str, Any]]]: 실행 계획 행 (id, parent, detail), 분석할 수 없는 문장이면 None
+        """
+        keyword = query.lstrip().split(None, 1)[0].upper() if query.strip() else ''
+        if keyword not in _EXPLAINABLE:
+            return None
+        
+        try:
+            rows = connection.execute(f"EXPLAIN QUERY PLAN {query}", tuple(params or ())).fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"실행 계획 조회 실패: {e}, 쿼리: {query}")
+            return None
+        return [{'id': row[0], 'parent': row[1], 'detail': row[3]} for row in rows]
+    
+    def get_stats(self, include_samples: bool = False) -> List[Dict[str, Any]]:
+        """
+        문장 통계 조회
+        
+        Args:
+            include_samples: 원본 SQL과 파라미터 포함 여부 (IndexAdvisor 재실행용, 저장하지 않음)
+        
+        Returns:
+            List[Dict[str, Any]]: 총 지연 시간 내림차순 문장 통계
+        """
+        with self._lock:
+            statements = [stats.to_dict(include_samples) for stats in self._statements.values()]
+        statements.sort(key=lambda item: item['total_ms'], reverse=True)
+        return statements
+    
+    def reset(self) -> None:
+        """
+        통계 초기화
+        """
+        with self._lock:
+            self._statements.clear()
+            self.evicted = 0
+    
+    def export(self, directory: str, file_name: str = None) -> str:
+        """
+        통계를 JSON 파일로 저장 (원본 SQL과 파라미터는 제외하고 지문만 저장)
+        
+        Args:
+            directory: 저장 디렉토리 (예: profiles/)
+            file_name: 파일 이름 (기본값: statement_profile_<시각>.json)
+        
+        Returns:
+            str: 저장된 파일 경로
+        """
+        os.makedirs(directory, exist_ok=True)
+        file_name = file_name or f"statement_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        file_path = os.path.join(directory, file_name)
+        
+        profile = {
+            'generated_at': datetime.now().isoformat(),
+            'slow_threshold_ms': self.slow_threshold_ms,
+            'evicted': self.evicted,
+            'statements': self.get_stats()
+        }
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(profile, f, ensure_ascii=False, indent=2)
+        
+        logger.info(f"SQL 문장 프로파일이 저장되었습니다: {file_path}")
+        return file_path
+
+
+def load_statement_profile(file_path: str) -> List[Dict[str, Any]]:
+    """
+    저장된 문장 프로파일 로드
+    
+    Args:
+        file_path: StatementProfiler.export()로 저장한 파일 경로
+    
+    Returns:
+        List[Dict[str, Any]]: 문장 통계 목록
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('statements', [])
+
+
+# 연결별 프로파일러가 없을 때 사용하는 전역 프로파일러 (None이면 비활성화)
+_active_profiler: Optional[StatementProfiler] = None
+
+
+def get_active_profiler() -> Optional[StatementProfiler]:
+    """
+    전역 문장 프로파일러 조회
+    
+    Returns:
+        Optional[StatementProfiler]: 활성화된 프로파일러 (비활성화 상태면 None)
+    """
+    return _active_profiler
+
+
+def enable_statement_profiling(profiler: StatementProfiler = None) -> StatementProfiler:
+    """
+    모든 DatabaseConnection의 문장 프로파일링 활성화
+    
+    Args:
+        profiler: 사용할 프로파일러 (기본값: 새 프로파일러)
+    
+    Returns:
+        StatementProfiler: 활성화된 프로파일러
+    """
+    global _active_profiler
+    _active_profiler = profiler if profiler is not None else StatementProfiler()
+    return _active_profiler
+
+
+def disable_statement_profiling(profiler: StatementProfiler = None) -> None:
+    """
+    전역 문장 프로파일링 비활성화
+    
+    Args:
+        profiler: 지정하면 이 프로파일러가 활성화된 경우에만 비활성화
+    """
+    global _active_profiler
+    if profiler is None or _active_profiler is profiler:
+        _active_profiler = None
@@ -53,6 +53,39 @@ def list_calendar_events(start_time: str, end_time: str) -> str:
         return f"캘린더 일정 조회 중 오류 발생: {e}"
 
 
+def check_calendar_availability(start_time: str, end_time: str, min_duration_minutes: int = 30) -> str:
+    """
+    지정된 기간의 일정 충돌 여부와 비어 있는 시간대를 확인합니다. "목요일 오후에 시간 있어?" 같은 질문에 사용합니다.
+
+    Args:
+        start_time (str): 확인할 시작 시간. 'YYYY-MM-DDTHH:MM:SS' 형식.
+        end_time (str): 확인할 종료 시간. 'YYYY-MM-DDTHH:MM:SS' 형식.
+        min_duration_minutes (int): 빈 시간대로 볼 최소 길이(분). 기본값 30분.
+    """
+    print(f"Tool 'check_calendar_availability' 실행: {start_time} ~ {end_time}")
+    try:
+        conflicts = _calendar_service.find_conflicts(start_time, end_time)
+        free_slots = _calendar_service.find_free_slots(start_time, end_time, min_duration_minutes)
+        
+        if not conflicts:
+            return "해당 기간에 겹치는 일정이 없습니다. 전체 시간이 비어 있습니다."
+        
+        result_lines = ["겹치는 일정:"]
+        for event in conflicts:
+            result_lines.append(f"- 제목: {event['제목']}, 시간: {event['시간']}, ID: {event['id']}")
+        
+        if free_slots:
+            result_lines.append(f"\n비어 있는 시간대 (최소 {min_duration_minutes}분):")
+            for slot in free_slots:
+                result_lines.append(f"- {slot['시간']} ({slot['길이(분)']}분)")
+        else:
+            result_lines.append(f"\n최소 {min_duration_minutes}분 이상 비어 있는 시간대가 없습니다.")
+        
+        return "\n".join(result_lines)
+    except Exception as e:
+        return f"일정 확인 중 오류 발생: {e}"
+
+
 def create_google_calendar_event(summary: str, start_time: str, end_time: str, location: Optional[str] = None, description: Optional[str] = None) -> str:
     """
     구글 캘린더에 새 일정을 생성합니다.
@@ -157,7 +190,7 @@ def create_calendar_events_batch(events_json: str) -> str:
             return "이벤트 데이터는 리스트 형태여야 합니다."
         
         # 배치 생성 실행
-        results = _calendar_service.create_events_batch(events_data, batch_size=10)
+        results = _calendar_service.create_events_batch(events_data)
         
         # 결과 집계
         success_count = sum(1 for r in results if r is not None)
@@ -187,7 +220,7 @@ def delete_calendar_events_batch(event_ids_json: str) -> str:
             return "이벤트 ID 데이터는 리스트 형태여야 합니다."
         
         # 배치 삭제 실행
-        results = _calendar_service.delete_events_batch(event_ids, batch_size=10)
+        results = _calendar_service.delete_events_batch(event_ids)
         
         # 결과 집계
         success_count = sum(1 for r in results if r)
@@ -218,6 +251,7 @@ def get_calendar_performance_report() -> str:
                 if 'avg_time' in stats:
                     result_lines.append(
                         f"- {func_name}: 평균 {stats['avg_time']:.4f}초, "
+                        f"p95 {stats['p95']:.4f}초, p99 {stats['p99']:.4f}초, "
                         f"호출 {stats['call_count']}회, "
                         f"성공률 {stats['success_rate']:.1f}%"
                     )
@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+"""
+요청 추적 (tracing)
+
+하나의 사용자 쿼리가 에이전트 → LLM → 도구 → 분석기 → 저장소 → SQL, Google API로 퍼져 나가는 과정을
+부모/자식 관계가 있는 구간(span)으로 기록합니다. 현재 구간은 contextvars로 전달되므로
+스레드마다, 그리고 bind_context로 감싼 작업 스레드에서도 부모 관계가 유지됩니다.
+
+기록한 구간은 JSON Lines 파일로 바로 내보내거나, 메모리에 모아 두었다가
+Chrome trace event 형식(chrome://tracing, Perfetto, speedscope에서 오프라인으로 열람)으로 저장합니다.
+
+추적이 꺼져 있으면 span()은 공유 no-op 객체를, traced 데코레이터는 원래 함수를 바로 호출하므로
+비용은 속성 확인 한 번입니다. 저장소 계층에서도 가볍게 가져다 쓸 수 있도록 다른 src 모듈에 의존하지 않습니다.
+"""
+
+import os
+import json
+import time
+import random
+import logging
+import functools
+import threading
+import contextvars
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 구간 종류
+KIND_REQUEST = 'request'
+KIND_AGENT = 'agent'
+KIND_LLM = 'llm'
+KIND_TOOL = 'tool'
+KIND_ANALYZER = 'analyzer'
+KIND_REPOSITORY = 'repository'
+KIND_SQL = 'sql'
+KIND_GOOGLE_API = 'google_api'
+KIND_INTERNAL = 'internal'
+
+# 현재 실행 중인 구간
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('current_span', default=None)
+
+
+def _new_id() -> str:
+    """
+    64비트 임의 ID (16자리 16진수)
+    """
+    return f"{random.getrandbits(64):016x}"
+
+
+class Span:
+    """
+    추적 구간 클래스
+    
+    시작/종료 시각은 perf_counter_ns 기준이며, 내보낼 때 추적기의 기준 시각으로 벽시계 시각으로 바꿉니다.
+    """
+    
+    __slots__ = ('name', 'kind', 'trace_id', 'span_id', 'parent_id', 'start_ns', 'end_ns',
+                 'thread_id', 'thread_name', 'attributes', 'error')
+    
+    def __init__(self, name: str, kind: str, parent: Optional['Span'], attributes: Dict[str, Any]):
+        """
+        구간 초기화
+        
+        Args:
+            name: 구간 이름
+            kind: 구간 종류 (request, agent, llm, tool, analyzer, repository, sql, google_api, internal)
+            parent: 부모 구간 (없으면 새 추적 시작)
+            attributes: 구간 속성
+        """
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent is not None else _new_id()
+        self.span_id = _new_id()
+        self.parent_id = parent.span_id if parent is not None else None
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self.end_ns: Optional[int] = None
+        self.start_ns = time.perf_counter_ns()
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        구간 속성 설정
+        
+        Args:
+            key: 속성 이름
+            value: 속성 값
+        """
+        self.attributes[key] = value
+    
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """
+        구간 길이 (밀리초, 끝나지 않았으면 None)
+        """
+        return (self.end_ns - self.start_ns) / 1e6 if self.end_ns is not None else None
+    
+    def __repr__(self) -> str:
+        return f"Span({self.kind}:{self.name}, id={self.span_id}, parent={self.parent_id})"
+
+
+class _NoopSpan:
+    """
+    추적이 꺼져 있을 때 사용하는 구간 (컨텍스트 매니저 겸용)
+    """
+    
+    __slots__ = ()
+    
+    def __enter__(self) -> '_NoopSpan':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _SpanContext:
+    """
+    구간 시작/종료 컨텍스트 매니저
+    """
+    
+    __slots__ = ('_tracer', '_name', '_kind', '_attributes', '_span', '_token')
+    
+    def __init__(self, tracer: 'Tracer', name: str, kind: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._kind = kind
+        self._attributes = attributes
+    
+    def __enter__(self) -> Span:
+        self._span = Span(self._name, self._kind, _current_span.get(), self._attributes)
+        self._token = _current_span.set(self._span)
+        return self._span
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        span = self._span
+        span.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._tracer._finish(span)
+        return False
+
+
+class JsonLinesExporter:
+    """
+    끝난 구간을 한 줄에 하나씩 JSON으로 추가 기록하는 내보내기 클래스
+    """
+    
+    def __init__(self, file_path: str):
+        """
+        JSON Lines 내보내기 초기화
+        
+        Args:
+            file_path: 기록할 파일 경로 (없으면 생성, 있으면 이어서 기록)
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file_path = file_path
+        self._file = open(file_path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+    
+    def __call__(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+    
+    def close(self) -> None:
+        """
+        파일 닫기
+        """
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """
+    추적기 클래스
+    
+    끝난 구간을 최근 max_spans개까지 메모리에 보관하고, 등록된 내보내기 함수에 전달합니다.
+    """
+    
+    def __init__(self, max_spans: int = 10000):
+        """
+        추적기 초기화
+        
+        Args:
+            max_spans: 메모리에 보관할 최대 구간 수
+        """
+        self.enabled = False
+        self._spans: deque = deque(maxlen=max_spans)
+        self._exporters: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = threading.Lock()
+        # perf_counter_ns를 벽시계 시각으로 바꾸기 위한 기준점
+        self._origin_ns = time.perf_counter_ns()
+        self._origin_epoch_ns = time.time_ns()
+    
+    def enable(self, jsonl_path: str = None) -> None:
+        """
+        추적 활성화
+        
+        Args:
+            jsonl_path: 끝난 구간을 바로 기록할 JSON Lines 파일 경로 (선택)
+        """
+        if jsonl_path:
+            self.add_exporter(JsonLinesExporter(jsonl_path))
+        self.enabled = True
+        logger.info("요청 추적이 활성화되었습니다.")
+    
+    def disable(self) -> None:
+        """
+        추적 비활성화 (파일 내보내기는 닫고 해제)
+        """
+        self.enabled = False
+        with self._lock:
+            exporters, self._exporters = self._exporters, []
+        for exporter in exporters:
+            close = getattr(exporter, 'close', None)
+            if close is not None:
+                close()
+        logger.info("요청 추적이 비활성화되었습니다.")
+    
+    def add_exporter(self, exporter: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        끝난 구간을 받을 내보내기 함수 등록
+        
+        Args:
+            exporter: 구간 딕셔너리(to_record 형식)를 받는 함수
+        """
+        with self._lock:
+            self._exporters.append(exporter)
+    
+    def span(self, name: str, kind: str = KIND_INTERNAL, **attributes: Any):
+        """
+        구간 컨텍스트 매니저
+        
+        Args:
+            name: 구간 이름
+            kind: 구간 종류
+            **attributes: 구간 속성
+        
+        Returns:
+            구간을 돌려주는 컨텍스트 매니저 (추적이 꺼져 있으면 no-op)
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _SpanContext(self, name, kind, attributes)
+    
+    def _finish(self, span: Span) -> None:
+        """
+        끝난 구간 보관 및 내보내기
+        """
+        self._spans.append(span)
+        if not self._exporters:
+            return
+        
+        record = self.to_record(span)
+        for exporter in list(self._exporters):
+            try:
+                exporter(record)
+            except Exception as e:
+                logger.error(f"추적 구간 내보내기 중 오류 발생: {e}")
+    
+    def get_spans(self, trace_id: str = None) -> List[Span]:
+        """
+        보관 중인 끝난 구간 조회
+        
+        Args:
+            trace_id: 추적 ID (지정 시 해당 추적의 구간만)
+        
+        Returns:
+            List[Span]: 끝난 순서의 구간 목록
+        """
+        spans = list(self._spans)
+        if trace_id is not None:
+            spans = [span for span in spans if span.trace_id == trace_id]
+        return spans
+    
+    def clear(self) -> None:
+        """
+        보관 중인 구간 삭제
+        """
+        self._spans.clear()
+    
+    def _epoch_us(self, perf_ns: int) -> float:
+        """
+        perf_counter_ns 값을 유닉스 시각(마이크로초)으로 변환
+        """
+        return (self._origin_epoch_ns + perf_ns - self._origin_ns) / 1000
+    
+    def to_record(self, span: Span) -> Dict[str, Any]:
+        """
+        구간을 JSON Lines 기록용 딕셔너리로 변환
+        
+        Args:
+            span: 구간
+        
+        Returns:
+            Dict[str, Any]: trace_id, span_id, parent_id, name, kind, start_us, duration_ms, thread, attributes, error
+        """
+        return {
+            'trace_id': span.trace_id,
+            'span_id': span.span_id,
+            'parent_id': span.parent_id,
+            'name': span.name,
+            'kind': span.kind,
+            'start_us': round(self._epoch_us(span.start_ns), 3),
+            'duration_ms': span.duration_ms,
+            'thread': span.thread_name,
+            'attributes': span.attributes,
+            'error': span.error
+        }
+    
+    def export_jsonl(self, file_path: str, spans: Iterable[Span] = None) -> str:
+        """
+        구간을 JSON Lines 파일로 저장
+        
+        Args:
+            file_path: 저장할 파일 경로
+            spans: 저장할 구간 (기본값: 보관 중인 전체 구간)
+        
+        Returns:
+            str: 저장된 파일 경로
+        """
+        spans = self.get_spans() if spans is None else spans
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for span in spans:
+                f.write(json.dumps(self.to_record(span), ensure_ascii=False, default=str) + '\n')
+        
+        logger.info(f"추적 구간이 저장되었습니다: {file_path}")
+        return file_path
+    
+    def export_chrome_trace(self, file_path: str, spans: Iterable[Span] = None) -> str:
+        """
+        구간을 Chrome trace event 형식 JSON 파일로 저장
+        
+        구간은 완료 이벤트("ph": "X")로, 스레드 이름은 메타데이터 이벤트로 기록합니다.
+        
+        Args:
+            file_path: 저장할 파일 경로
+            spans: 저장할 구간 (기본값: 보관 중인 전체 구간)
+        
+        Returns:
+            str: 저장된 파일 경로
+        """
+        spans = self.get_spans() if spans is None else list(spans)
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        thread_names: Dict[int, str] = {}
+        
+        for span in spans:
+            thread_names[span.thread_id] = span.thread_name
+            args = dict(span.attributes)
+            args.update(trace_id=span.trace_id, span_id=span.span_id, parent_id=span.parent_id)
+            if span.error:
+                args['error'] = span.error
+            events.append({
+                'name': span.name,
+                'cat': span.kind,
+                'ph': 'X',
+                'ts': round(self._epoch_us(span.start_ns), 3),
+                'dur': round((span.end_ns - span.start_ns) / 1000, 3),
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args
+            })
+        
+        for thread_id, thread_name in thread_names.items():
+            events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id,
+                'args': {'name': thread_name}
+            })
+        
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False, default=str)
+        
+        logger.info(f"Chrome 추적 파일이 저장되었습니다: {file_path}")
+        return file_path
+    
+    def summarize(self, trace_id: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        구간 종류별 시간 요약
+        
+        self_ms는 자식 구간 시간을 뺀 시간이므로, 어느 계층에서 시간이 쓰였는지 보여 줍니다.
+        
+        Args:
+            trace_id: 추적 ID (지정 시 해당 추적만)
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: 종류별 count, total_ms, self_ms (self_ms 내림차순)
+        """
+        spans = self.get_spans(trace_id)
+        child_ns: Dict[str, int] = {}
+        for span in spans:
+            if span.parent_id is not None:
+                child_ns[span.parent_id] = child_ns.get(span.parent_id, 0) + span.end_ns - span.start_ns
+        
+        summary: Dict[str, Dict[str, Any]] = {}
+        for span in spans:
+            duration = span.end_ns - span.start_ns
+            stats = summary.setdefault(span.kind, {'count': 0, 'total_ms': 0.0, 'self_ms': 0.0})
+            stats['count'] += 1
+            stats['total_ms'] += duration / 1e6
+            stats['self_ms'] += max(duration - child_ns.get(span.span_id, 0), 0) / 1e6
+        
+        return dict(sorted(summary.items(), key=lambda item: -item[1]['self_ms']))
+
+
+# 전역 추적기
+tracer = Tracer()
+
+
+def span(name: str, kind: str = KIND_INTERNAL, **attributes: Any):
+    """
+    전역 추적기의 구간 컨텍스트 매니저
+    
+    Args:
+        name: 구간 이름
+        kind: 구간 종류
+        **attributes: 구간 속성
+    
+    Returns:
+        구간을 돌려주는 컨텍스트 매니저 (추적이 꺼져 있으면 no-op)
+    """
+    if not tracer.enabled:
+        return _NOOP_SPAN
+    return _SpanContext(tracer, name, kind, attributes)
+
+
+def traced(name: Any = None, kind: str = KIND_INTERNAL) -> Callable:
+    """
+    함수 호출을 구간으로 기록하는 데코레이터
+    
+    @traced, @traced(kind='tool'), @traced('이름', kind='agent') 형태로 사용합니다.
+    
+    Args:
+        name: 구간 이름 (기본값: 함수의 __qualname__)
+        kind: 구간 종류
+    
+    Returns:
+        Callable: 데코레이터 또는 래핑된 함수
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _SpanContext(tracer, span_name, kind, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    
+    if callable(name):
+        func, name = name, None
+        return decorator(func)
+    return decorator
+
+
+def current_span() -> Optional[Span]:
+    """
+    현재 실행 중인 구간
+    
+    Returns:
+        Optional[Span]: 현재 구간 (추적 중이 아니면 None)
+    """
+    return _current_span.get()
+
+
+def bind_context(func: Callable) -> Callable:
+    """
+    현재 컨텍스트(현재 구간 포함)에서 실행되도록 함수를 감싸기
+    
+    ThreadPoolExecutor 등 다른 스레드에서 실행할 함수에 사용하면 그 안의 구간이 호출한 쪽 구간의 자식이 됩니다.
+    호출마다 컨텍스트 복사본을 사용하므로 여러 스레드에서 동시에 실행해도 됩니다.
+    
+    Args:
+        func: 감쌀 함수
+    
+    Returns:
+        Callable: 래핑된 함수
+    """
+    context = contextvars.copy_context()
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper
+
+
+def enable_tracing(jsonl_path: str = None) -> Tracer:
+    """
+    전역 추적 활성화
+    
+    Args:
+        jsonl_path: 끝난 구간을 바로 기록할 JSON Lines 파일 경로 (선택)
+    
+    Returns:
+        Tracer: 전역 추적기
+    """
+    tracer.enable(jsonl_path)
+    return tracer
+
+
+def disable_tracing() -> None:
+    """
+    전역 추적 비활성화
+    """
+    tracer.disable()
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+분석 결과 캐시 테스트
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.analyzers.base_analyzer import BaseAnalyzer
+from src.analyzers.result_cache import AnalysisResultCache, analysis_result_cache, memoize_by_data_version
+from src.cache_tags import invalidate_tags, table_tag
+from src.repositories.db_connection import DatabaseConnection
+from src.repositories.transaction_repository import TransactionRepository
+
+
+class CountingAnalyzer(BaseAnalyzer):
+    """호출 횟수를 세는 테스트용 분석기"""
+    
+    def __init__(self, transaction_repository):
+        super().__init__(transaction_repository)
+        self.calls = 0
+    
+    @memoize_by_data_version
+    def analyze(self, start_date, end_date, filters=None):
+        self.calls += 1
+        return {'count': self.repository.count(), 'filters': dict(filters or {})}
+
+
+class TestAnalysisResultCache(unittest.TestCase):
+    """데이터 버전 기반 분석 결과 캐시 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_db_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False).name
+        self.repository = TransactionRepository(DatabaseConnection(self.temp_db_file))
+        self.start_date = date(2024, 3, 1)
+        self.end_date = date(2024, 3, 31)
+        analysis_result_cache.clear()
+    
+    def tearDown(self):
+        """테스트 정리"""
+        self.repository.db.close()
+        analysis_result_cache.clear()
+        os.remove(self.temp_db_file)
+    
+    def _insert_raw(self, transaction_id):
+        """저장소를 거치지 않고 다른 연결로 거래 추가"""
+        with sqlite3.connect(self.temp_db_file) as conn:
+            conn.execute(
+                "INSERT INTO transactions (transaction_id, transaction_date, description, amount, transaction_type, source) "
+                "VALUES (?, '2024-03-15', '점심', '9000', 'expense', 'test')", (transaction_id,)
+            )
+    
+    def test_data_version_changes_on_every_write(self):
+        """다른 연결의 추가/수정/삭제도 데이터 버전을 올리는지 테스트"""
+        self.assertEqual(self.repository.get_data_version(), 0)
+        
+        self._insert_raw('tx-1')
+        self.assertEqual(self.repository.get_data_version(), 1)
+        
+        with sqlite3.connect(self.temp_db_file) as conn:
+            conn.execute("UPDATE transactions SET memo = 'x' WHERE transaction_id = 'tx-1'")
+            conn.execute("DELETE FROM transactions WHERE transaction_id = 'tx-1'")
+        self.assertEqual(self.repository.get_data_version(), 3)
+        
+        # 저장소를 다시 만들어도 버전은 유지
+        self.assertEqual(TransactionRepository(DatabaseConnection(self.temp_db_file)).get_data_version(), 3)
+    
+    def test_results_are_reused_until_data_changes(self):
+        """같은 인자와 데이터 버전이면 다시 계산하지 않는지 테스트"""
+        analyzer = CountingAnalyzer(self.repository)
+        
+        first = analyzer.analyze(self.start_date, self.end_date, {'category': '식비'})
+        second = analyzer.analyze(self.start_date, self.end_date, {'category': '식비'})
+        analyzer.analyze(self.start_date, self.end_date, {'category': '교통비'})
+        
+        self.assertEqual(first, second)
+        self.assertEqual(analyzer.calls, 2)
+        
+        # 거래가 바뀌면 새로 계산
+        self._insert_raw('tx-1')
+        result = analyzer.analyze(self.start_date, self.end_date, {'category': '식비'})
+        self.assertEqual(result['count'], 1)
+        self.assertEqual(analyzer.calls, 3)
+        
+        stats = analysis_result_cache.get_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 3)
+    
+    def test_returned_results_are_copies(self):
+        """반환된 결과를 수정해도 캐시된 결과는 바뀌지 않는지 테스트"""
+        analyzer = CountingAnalyzer(self.repository)
+        
+        analyzer.analyze(self.start_date, self.end_date)['count'] = 100
+        
+        self.assertEqual(analyzer.analyze(self.start_date, self.end_date)['count'], 0)
+    
+    def test_unversioned_repository_bypasses_cache(self):
+        """데이터 버전을 알 수 없는 저장소는 캐시를 사용하지 않는지 테스트"""
+        cache = AnalysisResultCache()
+        compute = MagicMock(return_value={'total': 1})
+        repository = MagicMock(spec=TransactionRepository)
+        
+        cache.get_or_compute(repository, 'analyze', (), {}, compute)
+        cache.get_or_compute(repository, 'analyze', (), {}, compute)
+        
+        self.assertEqual(compute.call_count, 2)
+        self.assertEqual(cache.get_stats()['bypassed'], 2)
+    
+    def test_lru_limit_and_uncacheable_results(self):
+        """최대 항목 수와 저장 제외 결과 처리 테스트"""
+        cache = AnalysisResultCache(max_size=2)
+        
+        for name in ('a', 'b', 'c'):
+            cache.get_or_compute(self.repository, name, (), {}, lambda: {'name': name})
+        cache.get_or_compute(self.repository, 'error', (), {}, lambda: {'error': 'x'},
+                             is_cacheable=lambda result: 'error' not in result)
+        
+        self.assertEqual(cache.get_stats()['total_items'], 2)
+        cache.get_or_compute(self.repository, 'a', (), {}, lambda: {'name': 'a'})
+        self.assertEqual(cache.get_stats()['hits'], 0)
+
+    
+    def test_transaction_tag_invalidation_drops_results(self):
+        """거래 테이블 태그가 무효화되면 저장된 결과를 비우고 다시 계산하는지 테스트"""
+        cache = AnalysisResultCache()
+        repository = MagicMock()
+        repository.db.db_path = self.temp_db_file
+        repository.get_data_version.return_value = 1
+        compute = MagicMock(return_value={'total': 1})
+        
+        cache.get_or_compute(repository, 'summary', (), {}, compute)
+        invalidate_tags(table_tag('categories'))
+        self.assertEqual(cache.get_stats()['total_items'], 1)
+        
+        invalidate_tags(table_tag('transactions'))
+        self.assertEqual(cache.get_stats()['total_items'], 0)
+        
+        # 데이터 버전이 같아도 태그 세대가 바뀌었으므로 다시 계산
+        cache.get_or_compute(repository, 'summary', (), {}, compute)
+        self.assertEqual(compute.call_count, 2)
+    
+    def _versioned_repository(self):
+        """스레드에서 공유할 수 있는 데이터 버전 고정 저장소"""
+        repository = MagicMock()
+        repository.db.db_path = self.temp_db_file
+        repository.get_data_version.return_value = 1
+        return repository
+    
+    def test_concurrent_misses_compute_once(self):
+        """같은 키를 동시에 요청하면 한 번만 계산하고 결과를 함께 받는지 테스트"""
+        cache = AnalysisResultCache()
+        repository = self._versioned_repository()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {'total': 1}
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                cache.get_or_compute(repository, 'summary', (), {}, compute)
+            ))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        
+        deadline = time.monotonic() + 5
+        while cache.get_stats()['coalesced'] < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'total': 1}] * 5)
+        self.assertEqual(cache.get_stats()['coalesced'], 4)
+        self.assertEqual(cache.get_stats()['misses'], 1)
+    
+    def test_concurrent_waiters_receive_compute_error(self):
+        """계산이 실패하면 기다리던 호출자도 같은 예외를 받고 다음 호출은 다시 계산하는지 테스트"""
+        cache = AnalysisResultCache()
+        repository = self._versioned_repository()
+        started = threading.Event()
+        release = threading.Event()
+        
+        def failing():
+            started.set()
+            release.wait(5)
+            raise ValueError("계산 실패")
+        
+        errors = []
+        
+        def call():
+            try:
+                cache.get_or_compute(repository, 'summary', (), {}, failing)
+            except ValueError as e:
+                errors.append(e)
+        
+        leader = threading.Thread(target=call)
+        leader.start()
+        self.assertTrue(started.wait(5))
+        waiter = threading.Thread(target=call)
+        waiter.start()
+        
+        deadline = time.monotonic() + 5
+        while cache.get_stats()['coalesced'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        leader.join()
+        waiter.join()
+        
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(cache.get_or_compute(repository, 'summary', (), {}, lambda: {'total': 2}), {'total': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
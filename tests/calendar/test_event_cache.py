@@ -0,0 +1,233 @@
+"""
+캘린더 이벤트 로컬 캐시 단위 테스트
+"""
+import time
+
+import pytest
+
+from src.calendar.event_cache import CalendarEventCache
+from src.calendar.models import CalendarEvent, CalendarSyncResult
+from src.calendar.service import CalendarService
+
+
+def make_event(event_id: str, start: str, end: str, summary: str = "일정") -> CalendarEvent:
+    """테스트용 이벤트 생성"""
+    return CalendarEvent(id=event_id, summary=summary, start_time=start, end_time=end)
+
+
+class StubSyncProvider:
+    """sync_events 호출을 기록하는 테스트용 제공자"""
+    
+    def __init__(self, events):
+        self.events = {event.id: event for event in events}
+        self.sync_calls = []
+        self.pending_changes = []
+        self.pending_deletes = []
+        self.created = 0
+    
+    def sync_events(self, sync_token=None):
+        self.sync_calls.append(sync_token)
+        if sync_token is None:
+            return CalendarSyncResult(events=list(self.events.values()), next_sync_token="token-1", full_sync=True)
+        
+        result = CalendarSyncResult(
+            events=self.pending_changes,
+            deleted_ids=self.pending_deletes,
+            next_sync_token=f"token-{len(self.sync_calls)}"
+        )
+        self.pending_changes, self.pending_deletes = [], []
+        return result
+    
+    def list_events(self, start_time, end_time):
+        raise AssertionError("캐시가 있으면 list_events를 호출하지 않아야 합니다")
+    
+    def get_event(self, event_id):
+        return self.events.get(event_id)
+    
+    def create_event(self, event):
+        self.created += 1
+        created = CalendarEvent(
+            id=f"created-{self.created}", summary=event.summary,
+            start_time=event.start_time, end_time=event.end_time
+        )
+        self.events[created.id] = created
+        return created
+    
+    def update_event(self, event_id, event):
+        self.events[event_id] = event
+        return event
+    
+    def delete_event(self, event_id):
+        return self.events.pop(event_id, None) is not None
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestCalendarEventCache:
+    """CalendarEventCache 클래스 테스트"""
+    
+    @pytest.fixture
+    def provider(self):
+        return StubSyncProvider([
+            make_event("morning", "2024-01-01T09:00:00+09:00", "2024-01-01T10:00:00+09:00"),
+            make_event("lunch", "2024-01-01T12:00:00+09:00", "2024-01-01T13:00:00+09:00"),
+            make_event("trip", "2023-12-30", "2024-01-03"),
+            make_event("next-week", "2024-01-08T09:00:00+09:00", "2024-01-08T10:00:00+09:00"),
+        ])
+    
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+    
+    @pytest.fixture
+    def cache(self, provider, clock):
+        return CalendarEventCache(provider, max_staleness=60, clock=clock)
+    
+    def test_range_query_returns_overlapping_events(self, cache, provider):
+        """기간과 겹치는 이벤트만 시작 시간 순으로 반환하는지 테스트"""
+        events = cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-01T11:00:00+09:00")
+        
+        assert [event.id for event in events] == ["trip", "morning"]
+        assert provider.sync_calls == [None]
+    
+    def test_queries_within_staleness_bound_do_not_sync(self, cache, provider, clock):
+        """허용 시간 안에서는 다시 동기화하지 않는지 테스트"""
+        cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00")
+        clock.now = 59
+        cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00")
+        
+        assert provider.sync_calls == [None]
+    
+    def test_stale_cache_applies_incremental_changes(self, cache, provider, clock):
+        """허용 시간이 지나면 syncToken으로 변경분만 반영하는지 테스트"""
+        cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00")
+        
+        provider.pending_changes = [
+            make_event("lunch", "2024-01-01T18:00:00+09:00", "2024-01-01T19:00:00+09:00", "저녁")
+        ]
+        provider.pending_deletes = ["morning"]
+        clock.now = 61
+        
+        events = cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00")
+        
+        assert provider.sync_calls == [None, "token-1"]
+        assert [event.id for event in events] == ["trip", "lunch"]
+        assert events[1].summary == "저녁"
+    
+    def test_count_events_matches_range_query(self, cache):
+        """이벤트 수 조회가 기간 조회 결과 수와 같은지 테스트"""
+        start, end = "2024-01-01T00:00:00+09:00", "2024-01-09T00:00:00+09:00"
+        
+        assert cache.count_events(start, end) == len(cache.list_events(start, end)) == 4
+    
+    def test_returned_events_are_copies(self, cache):
+        """반환된 이벤트를 수정해도 캐시가 바뀌지 않는지 테스트"""
+        event = cache.get_event("morning")
+        event.summary = "변경됨"
+        
+        assert cache.get_event("morning").summary == "일정"
+        assert cache.get_event("missing") is None
+    
+    def test_invalidate_forces_full_sync(self, cache, provider):
+        """invalidate 후에는 전체 동기화하는지 테스트"""
+        cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00")
+        cache.invalidate()
+        cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00")
+        
+        assert provider.sync_calls == [None, None]
+        assert cache.get_stats()['full_syncs'] == 2
+    
+    def test_service_write_through(self, cache, provider):
+        """서비스의 생성/수정/삭제 결과가 캐시에 바로 반영되는지 테스트"""
+        service = CalendarService(provider, event_cache=cache)
+        start, end = "2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00"
+        service.get_events_for_period(start, end, format_response=False)
+        
+        created = service.create_new_event(
+            "새 회의", "2024-01-01T15:00:00+09:00", "2024-01-01T16:00:00+09:00", format_response=False
+        )
+        service.update_event("lunch", summary="점심 약속")
+        service.delete_event("morning")
+        
+        events = service.get_events_for_period(start, end, format_response=False)
+        
+        assert [event.id for event in events] == ["trip", "lunch", created.id]
+        assert events[1].summary == "점심 약속"
+        assert provider.sync_calls == [None]
+    
+    def test_range_query_is_sub_millisecond(self, provider, clock):
+        """스텁 제공자 기준 기간 조회가 1ms 미만인지 테스트"""
+        events = [
+            make_event(f"event-{i}", f"2024-{1 + i // 200:02d}-{1 + i % 28:02d}T{9 + i % 8:02d}:00:00+09:00",
+                       f"2024-{1 + i // 200:02d}-{1 + i % 28:02d}T{10 + i % 8:02d}:00:00+09:00")
+            for i in range(2000)
+        ]
+        cache = CalendarEventCache(StubSyncProvider(events), max_staleness=60, clock=clock)
+        cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-02T00:00:00+09:00")
+        
+        iterations = 200
+        started = time.perf_counter()
+        for _ in range(iterations):
+            cache.list_events("2024-03-05T00:00:00+09:00", "2024-03-06T00:00:00+09:00")
+        elapsed = (time.perf_counter() - started) / iterations
+        
+        assert elapsed < 0.001
+    
+    def test_recurring_series_is_expanded_from_cache(self, clock):
+        """반복 일정 원본만 동기화하고 장기간 조회는 로컬에서 전개하는지 테스트"""
+        master = CalendarEvent(
+            id="weekly", summary="팀 회의",
+            start_time="2024-01-01T10:00:00+09:00", end_time="2024-01-01T11:00:00+09:00",
+            time_zone="Asia/Seoul", recurrence=["RRULE:FREQ=WEEKLY"]
+        )
+        moved = CalendarEvent(
+            id="weekly_20240108T010000Z", summary="팀 회의 (변경)",
+            start_time="2024-01-09T15:00:00+09:00", end_time="2024-01-09T16:00:00+09:00",
+            recurring_event_id="weekly", original_start_time="2024-01-08T10:00:00+09:00"
+        )
+        provider = StubSyncProvider([master, moved, make_event("single", "2024-01-02T09:00:00+09:00", "2024-01-02T10:00:00+09:00")])
+        cache = CalendarEventCache(provider, max_staleness=60, clock=clock)
+        
+        january = cache.list_events("2024-01-01T00:00:00+09:00", "2024-01-16T00:00:00+09:00")
+        year = cache.list_events("2024-01-01T00:00:00+09:00", "2025-01-01T00:00:00+09:00")
+        
+        assert [event.id for event in january] == [
+            "weekly_20240101T010000Z", "single", "weekly_20240108T010000Z", "weekly_20240115T010000Z"
+        ]
+        assert january[2].summary == "팀 회의 (변경)"
+        assert len([event for event in year if event.recurring_event_id == "weekly"]) == 53
+        assert cache.get_event("weekly_20240122T010000Z").start_time == "2024-01-22T10:00:00+09:00"
+        assert provider.sync_calls == [None]
+    
+    def test_cancelled_and_locally_deleted_occurrences_are_excluded(self, clock):
+        """취소된 인스턴스와 로컬에서 삭제한 인스턴스가 전개에서 빠지는지 테스트"""
+        master = CalendarEvent(
+            id="daily", summary="스탠드업",
+            start_time="2024-01-01T09:00:00+09:00", end_time="2024-01-01T09:15:00+09:00",
+            time_zone="Asia/Seoul", recurrence=["RRULE:FREQ=DAILY;COUNT=5"]
+        )
+        provider = StubSyncProvider([master])
+        cache = CalendarEventCache(provider, max_staleness=60, clock=clock)
+        start, end = "2024-01-01T00:00:00+09:00", "2024-01-08T00:00:00+09:00"
+        assert len(cache.list_events(start, end)) == 5
+        
+        cache.remove("daily_20240102T000000Z")
+        
+        provider.sync_events = lambda sync_token: CalendarSyncResult(
+            deleted_ids=["daily_20240103T000000Z"],
+            cancelled_occurrences=[("daily", "2024-01-03T09:00:00+09:00")],
+            next_sync_token="token-2"
+        )
+        cache.refresh()
+        
+        assert [event.start_time[:10] for event in cache.list_events(start, end)] == [
+            "2024-01-01", "2024-01-04", "2024-01-05"
+        ]
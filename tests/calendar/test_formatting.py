@@ -0,0 +1,210 @@
+"""
+캘린더 이벤트 일괄 변환/표시 형식 변환 테스트
+"""
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import pytest
+from unittest.mock import Mock
+
+from src.calendar.formatting import KST, _day_label, format_event_for_display, format_event_time
+from src.calendar.interfaces import CalendarProvider
+from src.calendar.models import CalendarEvent, EventTimes, parse_event_times
+from src.calendar.service import CalendarService
+
+
+def _baseline_format(event: CalendarEvent) -> str:
+    """비교용: 이벤트마다 문자열을 다시 파싱하고 strftime으로 변환하는 기존 방식"""
+    if event.all_day:
+        start = datetime.fromisoformat(event.start_time).date().strftime("%Y년 %m월 %d일")
+        end = datetime.fromisoformat(event.end_time).date().strftime("%Y년 %m월 %d일")
+        return f"{start} (종일)" if start == end else f"{start} ~ {end} (종일)"
+    
+    start_dt = datetime.fromisoformat(event.start_time.replace('Z', '+00:00')).astimezone(KST)
+    end_dt = datetime.fromisoformat(event.end_time.replace('Z', '+00:00')).astimezone(KST)
+    start_date, end_date = start_dt.strftime("%Y년 %m월 %d일"), end_dt.strftime("%Y년 %m월 %d일")
+    if start_date == end_date:
+        return f"{start_date} {start_dt.strftime('%H:%M')} ~ {end_dt.strftime('%H:%M')}"
+    return f"{start_date} {start_dt.strftime('%H:%M')} ~ {end_date} {end_dt.strftime('%H:%M')}"
+
+
+def make_sample_google_events(event_count: int) -> List[Dict[str, Any]]:
+    """
+    벤치마크용 Google Calendar API 이벤트 항목 생성 (5개 중 1개는 종일 일정)
+    
+    Args:
+        event_count: 생성할 이벤트 수
+    
+    Returns:
+        Google Calendar API 형식의 이벤트 딕셔너리 리스트
+    """
+    items = []
+    base = datetime(2024, 1, 1, 8, tzinfo=KST)
+    for i in range(event_count):
+        start = base + timedelta(hours=i * 5)
+        if i % 5 == 0:
+            items.append({
+                'id': f'event-{i}',
+                'summary': f'휴가 {i}',
+                'start': {'date': start.date().isoformat()},
+                'end': {'date': (start.date() + timedelta(days=1)).isoformat()}
+            })
+        else:
+            items.append({
+                'id': f'event-{i}',
+                'summary': f'회의 {i}',
+                'location': '회의실',
+                'start': {'dateTime': start.isoformat(), 'timeZone': 'Asia/Seoul'},
+                'end': {'dateTime': (start + timedelta(minutes=50)).isoformat(), 'timeZone': 'Asia/Seoul'}
+            })
+    return items
+
+
+def benchmark_event_pipeline(event_count: int = 10000, repeat: int = 3) -> Dict[str, float]:
+    """
+    이벤트 변환/표시 형식 변환 시간 측정
+    
+    Args:
+        event_count: 이벤트 수
+        repeat: 각 측정 반복 횟수 (최솟값 사용)
+    
+    Returns:
+        단계별 소요 시간(초): parse(일괄 변환), baseline_format(기존 방식),
+        format_cold(캐시 없는 첫 변환), format_warm(반복 변환), count_and_next(개수와 다음 일정만 계산)
+    """
+    items = make_sample_google_events(event_count)
+    results: Dict[str, float] = {}
+    
+    def measure(name: str, func, before: Optional[Any] = None) -> Any:
+        best, value = float('inf'), None
+        for _ in range(repeat):
+            if before:
+                before()
+            started = time.perf_counter()
+            value = func()
+            best = min(best, time.perf_counter() - started)
+        results[name] = best
+        return value
+    
+    def clear_caches() -> None:
+        parse_event_times.cache_clear()
+        format_event_time.cache_clear()
+        _day_label.cache_clear()
+    
+    events = measure('parse', lambda: CalendarEvent.from_google_events(items))
+    measure('baseline_format', lambda: [_baseline_format(event) for event in events])
+    measure('format_cold', lambda: [format_event_for_display(event) for event in events], before=clear_caches)
+    measure('format_warm', lambda: [format_event_for_display(event) for event in events])
+    
+    now = events[event_count // 2].times.start
+    measure('count_and_next', lambda: (
+        len(events),
+        next((event for event in events if event.times.start >= now), None)
+    ))
+    
+    results['event_count'] = event_count
+    return results
+
+
+class TestEventFormatting:
+    """이벤트 변환/표시 형식 테스트"""
+    
+    def test_bulk_conversion_skips_invalid_items(self):
+        """일괄 변환 시 변환할 수 없는 항목은 건너뛰는지 테스트"""
+        items = make_sample_google_events(5) + [{'id': 'broken', 'summary': '시간 없음', 'start': {}, 'end': {}}]
+        
+        events = CalendarEvent.from_google_events(items)
+        
+        assert [event.id for event in events] == [f'event-{i}' for i in range(5)]
+    
+    def test_times_are_parsed_once_into_timestamps(self):
+        """시간이 타임스탬프 구조로 변환되는지 테스트"""
+        event = CalendarEvent(
+            id='e', summary='회의',
+            start_time='2024-01-01T10:00:00+09:00', end_time='2024-01-01T11:30:00Z'
+        )
+        
+        assert event.times == EventTimes(
+            datetime.fromisoformat('2024-01-01T10:00:00+09:00').timestamp(),
+            datetime.fromisoformat('2024-01-01T11:30:00+00:00').timestamp(),
+            False
+        )
+        assert event.times is event.times
+    
+    @pytest.mark.parametrize('start, end, all_day, expected', [
+        ('2024-01-01T10:00:00+09:00', '2024-01-01T11:00:00+09:00', False, '2024년 01월 01일 10:00 ~ 11:00'),
+        ('2024-01-01T23:00:00Z', '2024-01-02T01:00:00Z', False, '2024년 01월 02일 08:00 ~ 10:00'),
+        ('2024-01-01T22:00:00+09:00', '2024-01-02T01:00:00+09:00', False,
+         '2024년 01월 01일 22:00 ~ 2024년 01월 02일 01:00'),
+        ('2024-01-01', '2024-01-01', True, '2024년 01월 01일 (종일)'),
+        ('2024-01-01', '2024-01-03', True, '2024년 01월 01일 ~ 2024년 01월 03일 (종일)'),
+        ('내일', '모레', False, '내일 ~ 모레'),
+    ])
+    def test_display_matches_previous_format(self, start, end, all_day, expected):
+        """표시 문자열이 기존 형식과 같은지 테스트"""
+        event = CalendarEvent(id='e', summary='회의', start_time=start, end_time=end, all_day=all_day, location='회의실')
+        
+        formatted = format_event_for_display(event)
+        
+        assert formatted == {
+            'id': 'e', '제목': '회의', '시간': expected, '종일 일정': all_day, '위치': '회의실'
+        }
+    
+    def test_display_matches_baseline_for_sample_calendar(self):
+        """샘플 캘린더 전체에서 기존 방식과 결과가 같은지 테스트"""
+        events = CalendarEvent.from_google_events(make_sample_google_events(500))
+        
+        assert [format_event_for_display(event)['시간'] for event in events] == [
+            _baseline_format(event) for event in events
+        ]
+    
+    def test_benchmark_10k_events(self):
+        """10,000개 이벤트 변환/형식 변환 벤치마크"""
+        timings = benchmark_event_pipeline(event_count=10000, repeat=1)
+        
+        assert timings['event_count'] == 10000
+        assert timings['format_warm'] < timings['baseline_format']
+        assert timings['count_and_next'] < timings['baseline_format']
+        assert timings['parse'] + timings['format_cold'] < 2.0
+
+
+class TestCountAndNextEvent:
+    """표시 형식 변환 없이 개수/다음 일정을 조회하는 서비스 메서드 테스트"""
+    
+    @pytest.fixture
+    def mock_provider(self):
+        return Mock(spec=CalendarProvider)
+    
+    def test_count_events_for_period(self, mock_provider):
+        """기간 내 이벤트 수 조회 테스트"""
+        mock_provider.list_events.return_value = CalendarEvent.from_google_events(make_sample_google_events(30))
+        service = CalendarService(mock_provider)
+        
+        assert service.count_events_for_period('2024-01-01T00:00:00+09:00', '2024-02-01T00:00:00+09:00') == 30
+    
+    def test_get_next_event_skips_started_events(self, mock_provider):
+        """진행 중인 이벤트를 제외하고 가장 먼저 시작하는 이벤트를 반환하는지 테스트"""
+        now = datetime.now().astimezone()
+        mock_provider.list_events.return_value = [
+            CalendarEvent(id='ongoing', summary='진행 중', start_time=(now - timedelta(minutes=10)).isoformat(),
+                          end_time=(now + timedelta(minutes=50)).isoformat()),
+            CalendarEvent(id='later', summary='나중', start_time=(now + timedelta(hours=3)).isoformat(),
+                          end_time=(now + timedelta(hours=4)).isoformat()),
+            CalendarEvent(id='next', summary='다음', start_time=(now + timedelta(hours=1)).isoformat(),
+                          end_time=(now + timedelta(hours=2)).isoformat()),
+        ]
+        service = CalendarService(mock_provider)
+        
+        assert service.get_next_event()['id'] == 'next'
+        assert service.get_next_event(format_response=False).summary == '다음'
+        
+        mock_provider.list_events.return_value = []
+        assert service.get_next_event() is None
+
+
+if __name__ == "__main__":
+    timings = benchmark_event_pipeline()
+    print(f"이벤트 {timings.pop('event_count'):,}개")
+    for name, seconds in timings.items():
+        print(f"{name}: {seconds * 1000:.2f}ms")
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch, MagicMock
 from googleapiclient.errors import HttpError
 from googleapiclient.discovery import Resource
 
+from src.api_rate_limiter import ApiRateLimiter
 from src.calendar.providers.google import GoogleCalendarProvider
 from src.calendar.models import CalendarEvent
 from src.calendar.auth import GoogleAuthService
@@ -58,7 +59,8 @@ class TestGoogleCalendarProvider:
         return GoogleCalendarProvider(
             auth_service=mock_auth_service,
             calendar_id="test-calendar",
-            use_service_pool=False
+            use_service_pool=False,
+            rate_limiter=ApiRateLimiter("test-calendar", rate=1000.0, capacity=1000.0)
         )
     
     @pytest.fixture
@@ -104,7 +106,7 @@ class TestGoogleCalendarProvider:
         assert provider.calendar_id == "custom-calendar"
         assert provider.use_service_pool is False
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_get_service_success(self, mock_build, provider, mock_service):
         """Google API 서비스 객체 생성 성공 테스트"""
         mock_build.return_value = mock_service
@@ -115,7 +117,7 @@ class TestGoogleCalendarProvider:
         mock_build.assert_called_once()
         provider.auth_service.get_credentials.assert_called_once()
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_get_service_auth_failure(self, mock_build, provider):
         """인증 실패 시 예외 발생 테스트"""
         provider.auth_service.get_credentials.side_effect = Exception("Auth failed")
@@ -123,7 +125,7 @@ class TestGoogleCalendarProvider:
         with pytest.raises(Exception):  # 인증 실패는 원본 예외가 그대로 전파됨
             provider._get_service()
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_list_events_success(self, mock_build, provider, mock_service, sample_google_event):
         """이벤트 목록 조회 성공 테스트"""
         mock_build.return_value = mock_service
@@ -149,7 +151,7 @@ class TestGoogleCalendarProvider:
             pageToken=None
         )
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_list_events_empty_response(self, mock_build, provider, mock_service):
         """빈 이벤트 목록 응답 테스트"""
         mock_build.return_value = mock_service
@@ -160,7 +162,7 @@ class TestGoogleCalendarProvider:
         assert len(events) == 0
         assert isinstance(events, list)
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_list_events_http_error_404(self, mock_build, provider, mock_service):
         """HTTP 404 오류 시 예외 발생 테스트"""
         mock_build.return_value = mock_service
@@ -174,7 +176,7 @@ class TestGoogleCalendarProvider:
         with pytest.raises(EventNotFoundError):
             provider.list_events('2024-01-01T00:00:00', '2024-01-31T23:59:59')
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_list_events_http_error_403(self, mock_build, provider, mock_service):
         """HTTP 403 오류 시 예외 발생 테스트"""
         mock_build.return_value = mock_service
@@ -188,7 +190,7 @@ class TestGoogleCalendarProvider:
         with pytest.raises(PermissionDeniedError):  # 403 오류는 PermissionDeniedError로 처리됨
             provider.list_events('2024-01-01T00:00:00', '2024-01-31T23:59:59')
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_create_event_success(self, mock_build, provider, mock_service, sample_calendar_event, sample_google_event):
         """이벤트 생성 성공 테스트"""
         mock_build.return_value = mock_service
@@ -208,7 +210,7 @@ class TestGoogleCalendarProvider:
             assert call_args[1]['calendarId'] == "test-calendar"
             assert 'body' in call_args[1]
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_create_event_invalid_data(self, mock_build, provider, mock_service):
         """잘못된 데이터로 이벤트 생성 시 예외 발생 테스트"""
         mock_build.return_value = mock_service
@@ -228,7 +230,7 @@ class TestGoogleCalendarProvider:
         with pytest.raises(CalendarServiceError):  # 400 오류는 CalendarServiceError로 처리됨
             provider.create_event(invalid_event)
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_update_event_success(self, mock_build, provider, mock_service, sample_calendar_event, sample_google_event):
         """이벤트 수정 성공 테스트"""
         mock_build.return_value = mock_service
@@ -246,7 +248,7 @@ class TestGoogleCalendarProvider:
             assert call_args[1]['calendarId'] == "test-calendar"
             assert call_args[1]['eventId'] == 'test-event-123'
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_update_event_not_found(self, mock_build, provider, mock_service, sample_calendar_event):
         """존재하지 않는 이벤트 수정 시 예외 발생 테스트"""
         mock_build.return_value = mock_service
@@ -260,7 +262,7 @@ class TestGoogleCalendarProvider:
         with pytest.raises(EventNotFoundError):
             provider.update_event('non-existent-id', sample_calendar_event)
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_delete_event_success(self, mock_build, provider, mock_service):
         """이벤트 삭제 성공 테스트"""
         mock_build.return_value = mock_service
@@ -278,7 +280,7 @@ class TestGoogleCalendarProvider:
             eventId='test-event-123'
         )
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_delete_event_not_found(self, mock_build, provider, mock_service):
         """존재하지 않는 이벤트 삭제 시 예외 발생 테스트"""
         mock_build.return_value = mock_service
@@ -292,7 +294,7 @@ class TestGoogleCalendarProvider:
         with pytest.raises(EventNotFoundError):
             provider.delete_event('non-existent-id')
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_get_event_success(self, mock_build, provider, mock_service, sample_google_event):
         """이벤트 조회 성공 테스트"""
         mock_build.return_value = mock_service
@@ -312,7 +314,7 @@ class TestGoogleCalendarProvider:
             eventId='test-event-123'
         )
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_get_event_not_found(self, mock_build, provider, mock_service):
         """존재하지 않는 이벤트 조회 시 None 반환 테스트"""
         mock_build.return_value = mock_service
@@ -327,7 +329,7 @@ class TestGoogleCalendarProvider:
         
         assert event is None
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_handle_http_error_rate_limit(self, mock_build, provider, mock_service):
         """Rate limit 오류 처리 테스트"""
         mock_build.return_value = mock_service
@@ -341,7 +343,7 @@ class TestGoogleCalendarProvider:
         with pytest.raises(APIQuotaExceededError):  # 429 오류는 APIQuotaExceededError로 처리됨
             provider.list_events('2024-01-01T00:00:00', '2024-01-31T23:59:59')
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_handle_http_error_server_error(self, mock_build, provider, mock_service):
         """서버 오류 처리 테스트"""
         mock_build.return_value = mock_service
@@ -355,7 +357,7 @@ class TestGoogleCalendarProvider:
         with pytest.raises(ServerError):
             provider.list_events('2024-01-01T00:00:00', '2024-01-31T23:59:59')
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_handle_network_error(self, mock_build, provider, mock_service):
         """네트워크 오류 처리 테스트"""
         mock_build.return_value = mock_service
@@ -364,11 +366,204 @@ class TestGoogleCalendarProvider:
         with pytest.raises(CalendarServiceError):  # 네트워크 오류는 CalendarServiceError로 래핑됨
             provider.list_events('2024-01-01T00:00:00', '2024-01-31T23:59:59')
     
-    @patch('src.calendar.providers.google.build')
+    @patch('src.calendar.providers.google.build_service')
     def test_handle_timeout_error(self, mock_build, provider, mock_service):
         """타임아웃 오류 처리 테스트"""
         mock_build.return_value = mock_service
         mock_service.events().list().execute.side_effect = TimeoutError("Request timeout")
         
         with pytest.raises(CalendarServiceError):  # 타임아웃 오류도 CalendarServiceError로 래핑됨
-            provider.list_events('2024-01-01T00:00:00', '2024-01-31T23:59:59')
\ No newline at end of file
+            provider.list_events('2024-01-01T00:00:00', '2024-01-31T23:59:59')    
+    @patch('src.calendar.providers.google.build_service')
+    def test_sync_events_incremental(self, mock_build, provider, mock_service, sample_google_event):
+        """syncToken 증분 동기화 테스트 (삭제 이벤트 분리)"""
+        mock_build.return_value = mock_service
+        mock_service.events().list().execute.return_value = {
+            'items': [sample_google_event, {'id': 'deleted-1', 'status': 'cancelled'}],
+            'nextSyncToken': 'next-token'
+        }
+        
+        result = provider.sync_events('prev-token')
+        
+        assert [event.id for event in result.events] == ['google-event-123']
+        assert result.deleted_ids == ['deleted-1']
+        assert result.next_sync_token == 'next-token'
+        assert result.full_sync is False
+        mock_service.events().list.assert_called_with(
+            calendarId="test-calendar",
+            singleEvents=False,
+            pageToken=None,
+            syncToken='prev-token'
+        )
+    
+    @patch('src.calendar.providers.google.build_service')
+    def test_sync_events_keeps_recurring_masters_and_cancelled_occurrences(self, mock_build, provider, mock_service):
+        """반복 일정 원본과 취소된 인스턴스 변환 테스트"""
+        mock_build.return_value = mock_service
+        mock_service.events().list().execute.return_value = {
+            'items': [
+                {
+                    'id': 'weekly',
+                    'summary': '팀 회의',
+                    'start': {'dateTime': '2024-01-01T10:00:00+09:00', 'timeZone': 'Asia/Seoul'},
+                    'end': {'dateTime': '2024-01-01T11:00:00+09:00', 'timeZone': 'Asia/Seoul'},
+                    'recurrence': ['RRULE:FREQ=WEEKLY']
+                },
+                {
+                    'id': 'weekly_20240108T010000Z',
+                    'status': 'cancelled',
+                    'recurringEventId': 'weekly',
+                    'originalStartTime': {'dateTime': '2024-01-08T10:00:00+09:00'}
+                }
+            ],
+            'nextSyncToken': 'next-token'
+        }
+        
+        result = provider.sync_events()
+        
+        master = result.events[0]
+        assert master.is_recurring
+        assert master.recurrence == ['RRULE:FREQ=WEEKLY']
+        assert master.time_zone == 'Asia/Seoul'
+        assert result.deleted_ids == ['weekly_20240108T010000Z']
+        assert result.cancelled_occurrences == [('weekly', '2024-01-08T10:00:00+09:00')]
+    
+    @patch('src.calendar.providers.google.build_service')
+    def test_sync_events_expired_token_falls_back_to_full_sync(self, mock_build, provider, mock_service, sample_google_event):
+        """syncToken 만료(410) 시 전체 동기화 테스트"""
+        mock_build.return_value = mock_service
+        http_error = HttpError(
+            resp=Mock(status=410),
+            content=b'{"error": {"message": "Sync token is no longer valid"}}'
+        )
+        mock_service.events().list().execute.side_effect = [
+            http_error,
+            {'items': [sample_google_event], 'nextSyncToken': 'fresh-token'}
+        ]
+        
+        result = provider.sync_events('expired-token')
+        
+        assert result.full_sync is True
+        assert result.next_sync_token == 'fresh-token'
+        assert len(result.events) == 1
+    
+    @staticmethod
+    def _install_fake_batches(mock_service, respond):
+        """new_batch_http_request를 하위 요청마다 respond(request_id)를 호출하는 가짜 배치로 대체"""
+        executed = []
+        
+        class FakeBatch:
+            def __init__(self, callback):
+                self.callback = callback
+                self.request_ids = []
+            
+            def add(self, request, request_id):
+                self.request_ids.append(request_id)
+            
+            def execute(self):
+                executed.append(list(self.request_ids))
+                for request_id in self.request_ids:
+                    try:
+                        self.callback(request_id, respond(request_id), None)
+                    except HttpError as e:
+                        self.callback(request_id, None, e)
+        
+        mock_service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+        return executed
+    
+    @patch('src.calendar.providers.google.build_service')
+    def test_create_events_batch_uses_batch_requests(self, mock_build, provider, mock_service,
+                                                     sample_calendar_event, sample_google_event):
+        """배치 생성 시 50개씩 묶어 HTTP 요청 수를 줄이는지 테스트"""
+        mock_build.return_value = mock_service
+        executed = self._install_fake_batches(
+            mock_service, lambda request_id: dict(sample_google_event, id=f'created-{request_id}')
+        )
+        
+        with patch('src.calendar.providers.google.time.sleep') as mock_sleep:
+            results = provider.create_events_batch([sample_calendar_event] * 120)
+        
+        assert [len(batch) for batch in executed] == [50, 50, 20]
+        assert [event.id for event in results[:2]] == ['created-0', 'created-1']
+        assert all(event is not None for event in results)
+        mock_sleep.assert_not_called()
+    
+    @patch('src.calendar.providers.google.build_service')
+    def test_delete_events_batch_retries_only_failed_items(self, mock_build, provider, mock_service):
+        """재시도 가능한 오류가 난 하위 요청만 다시 보내고 404는 실패로 처리하는지 테스트"""
+        mock_build.return_value = mock_service
+        attempts = {}
+        
+        def respond(request_id):
+            attempts[request_id] = attempts.get(request_id, 0) + 1
+            if request_id == '1':
+                raise HttpError(resp=Mock(status=404), content=b'Not Found')
+            if request_id == '2' and attempts[request_id] == 1:
+                raise HttpError(resp=Mock(status=503), content=b'Backend Error')
+            return ''
+        
+        executed = self._install_fake_batches(mock_service, respond)
+        
+        with patch('src.calendar.providers.google.time.sleep') as mock_sleep:
+            results = provider.delete_events_batch(['event-0', 'event-1', 'event-2'])
+        
+        assert results == [True, False, True]
+        assert executed == [['0', '1', '2'], ['2']]
+        mock_sleep.assert_called_once()
+    
+    @patch('src.calendar.providers.google.build_service')
+    def test_failed_half_open_batch_lets_breaker_recover(self, mock_build, mock_auth_service, mock_service,
+                                                         sample_google_event):
+        """반열림 상태의 시험 배치 요청이 통째로 실패해도 다음 복구 시점에 다시 시험 요청을 보내는지 테스트"""
+        mock_build.return_value = mock_service
+        now = [0.0]
+        limiter = ApiRateLimiter(
+            "test-calendar", rate=1000.0, capacity=1000.0,
+            failure_threshold=1, recovery_timeout=10.0, clock=lambda: now[0]
+        )
+        provider = GoogleCalendarProvider(
+            auth_service=mock_auth_service, calendar_id="test-calendar",
+            use_service_pool=False, rate_limiter=limiter
+        )
+        build_request = lambda service, event_id: service.events().get(calendarId='test-calendar', eventId=event_id)
+        
+        limiter.record_failure()
+        now[0] = 11.0
+        failing_batch = Mock()
+        failing_batch.execute.side_effect = ConnectionError("연결 끊김")
+        mock_service.new_batch_http_request.side_effect = lambda callback: failing_batch
+        
+        with patch('src.calendar.providers.google.time.sleep'):
+            _, errors = provider.execute_batch(['event-0'], build_request)
+        
+        assert list(errors) == [0]
+        assert limiter.breaker.state == 'open'
+        
+        now[0] = 22.0
+        self._install_fake_batches(mock_service, lambda request_id: sample_google_event)
+        responses, errors = provider.execute_batch(['event-0'], build_request)
+        
+        assert responses == [sample_google_event]
+        assert errors == {}
+        assert limiter.breaker.state == 'closed'
+    
+    @patch('src.calendar.providers.google.build_service')
+    def test_execute_batch_maps_item_errors(self, mock_build, provider, mock_service, sample_google_event):
+        """하위 요청 오류가 기존 예외 클래스로 변환되는지 테스트"""
+        mock_build.return_value = mock_service
+        
+        def respond(request_id):
+            if request_id == '1':
+                raise HttpError(resp=Mock(status=403), content=b'Forbidden')
+            return sample_google_event
+        
+        self._install_fake_batches(mock_service, respond)
+        
+        responses, errors = provider.execute_batch(
+            ['event-0', 'event-1'],
+            lambda service, event_id: service.events().get(calendarId='test-calendar', eventId=event_id)
+        )
+        
+        assert responses[0] == sample_google_event
+        assert list(errors) == [1]
+        assert isinstance(errors[1], PermissionDeniedError)
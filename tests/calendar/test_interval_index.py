@@ -0,0 +1,65 @@
+"""
+구간 트리 인덱스 단위 테스트
+"""
+import random
+
+from src.calendar.interval_index import IntervalIndex
+
+
+class TestIntervalIndex:
+    """IntervalIndex 클래스 테스트"""
+    
+    def test_overlapping_matches_brute_force(self):
+        """무작위 구간에서 전수 비교 결과와 같은지 테스트"""
+        rng = random.Random(42)
+        spans = {}
+        for key in range(500):
+            start = rng.uniform(0, 1000)
+            spans[key] = (start, start + rng.uniform(0.5, 50))
+        index = IntervalIndex((start, end, key) for key, (start, end) in spans.items())
+        
+        for _ in range(200):
+            query_start = rng.uniform(-10, 1010)
+            query_end = query_start + rng.uniform(0.1, 80)
+            expected = sorted(
+                key for key, (start, end) in spans.items() if start < query_end and end > query_start
+            )
+            
+            result = index.overlapping(query_start, query_end)
+            
+            assert sorted(key for _, _, key in result) == expected
+            assert [start for start, _, _ in result] == sorted(start for start, _, _ in result)
+    
+    def test_half_open_boundaries(self):
+        """맞닿은 구간은 겹치지 않는 것으로 보는지 테스트"""
+        index = IntervalIndex([(10, 20, "a"), (20, 30, "b"), (25, 25, "empty")])
+        
+        assert [key for _, _, key in index.overlapping(20, 25)] == ["b"]
+        assert index.overlapping(30, 40) == []
+        assert "empty" not in index
+    
+    def test_add_replace_and_remove(self):
+        """추가/교체/삭제 후 조회 결과가 갱신되는지 테스트"""
+        index = IntervalIndex([(0, 10, "a")])
+        assert len(index.overlapping(0, 100)) == 1
+        
+        index.add("a", 50, 60)
+        index.add("b", 5, 15)
+        assert [key for _, _, key in index.overlapping(0, 20)] == ["b"]
+        
+        index.remove("b")
+        assert index.overlapping(0, 20) == []
+        assert len(index) == 1
+    
+    def test_free_slots_with_min_duration(self):
+        """겹치는 일정을 병합하고 최소 길이 미만의 빈 시간은 제외하는지 테스트"""
+        index = IntervalIndex([
+            (10, 20, "a"),
+            (15, 30, "b"),   # a와 겹침
+            (35, 40, "c"),   # 5분짜리 빈 시간 뒤
+            (70, 120, "d"),  # 조회 범위 밖으로 이어짐
+        ])
+        
+        assert index.free_slots(0, 100, min_duration=10) == [(0, 10), (40, 70)]
+        assert index.free_slots(0, 100) == [(0, 10), (30, 35), (40, 70)]
+        assert index.free_slots(75, 100) == []
@@ -0,0 +1,121 @@
+"""
+캘린더 성능 지표 저장소 테스트
+"""
+import json
+
+import pytest
+
+from src.calendar.metrics import LatencyHistogram, MetricsRegistry, RollingWindow
+from src.calendar.utils import get_performance_stats, measure_performance, reset_performance_stats
+
+
+class FakeClock:
+    """수동으로 진행하는 테스트용 시계"""
+    
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트"""
+    
+    def test_percentiles_within_relative_error(self):
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+        
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.04)
+        assert histogram.percentile(95) == pytest.approx(0.95, rel=0.04)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.04)
+        assert histogram.percentile(100) == pytest.approx(1.0, rel=0.04)
+    
+    def test_memory_is_bounded(self):
+        histogram = LatencyHistogram()
+        for i in range(100_000):
+            histogram.record((i % 5000) / 1000)
+        
+        size_after_many = len(histogram._counts)
+        for i in range(100_000):
+            histogram.record((i % 5000) / 1000)
+        
+        assert len(histogram._counts) == size_after_many
+        assert size_after_many < 1100
+    
+    def test_empty_histogram(self):
+        assert LatencyHistogram().percentile(50) is None
+
+
+class TestRollingWindow:
+    """RollingWindow 테스트"""
+    
+    def test_old_slots_are_excluded(self):
+        clock = FakeClock()
+        window = RollingWindow(slot_seconds=60, slots=5, clock=clock)
+        
+        window.record(1.0, success=False)
+        clock.now += 600
+        window.record(0.5, success=True)
+        window.record(0.5, success=True)
+        
+        summary = window.summary()
+        assert summary['call_count'] == 2
+        assert summary['success_rate'] == 100
+        assert summary['avg_time'] == pytest.approx(0.5)
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 테스트"""
+    
+    def test_snapshot_and_export(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.record('list_events', 0.2)
+        registry.record('list_events', 0.4, success=False, error='boom')
+        
+        stats = registry.snapshot('list_events')
+        assert stats['call_count'] == 2
+        assert stats['success_rate'] == 50
+        assert stats['avg_time'] == pytest.approx(0.3)
+        assert stats['recent_calls'][-1]['error'] == 'boom'
+        
+        export_path = tmp_path / 'metrics.json'
+        registry.export(str(export_path))
+        exported = json.loads(export_path.read_text(encoding='utf-8'))
+        assert exported['functions']['list_events']['call_count'] == 2
+    
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.record('a', 0.1)
+        registry.record('b', 0.1)
+        
+        registry.reset('a')
+        assert registry.snapshot('a') == {'function': 'a', 'call_count': 0}
+        
+        registry.reset()
+        assert registry.snapshot() == {}
+
+
+class TestMeasurePerformance:
+    """measure_performance 데코레이터 테스트"""
+    
+    def test_records_into_registry_with_bounded_recent_calls(self):
+        @measure_performance
+        def metrics_probe_function(fail=False):
+            if fail:
+                raise ValueError("fail")
+            return 1
+        
+        reset_performance_stats('metrics_probe_function')
+        for _ in range(50):
+            metrics_probe_function()
+        with pytest.raises(ValueError):
+            metrics_probe_function(fail=True)
+        
+        stats = get_performance_stats('metrics_probe_function')
+        assert stats['call_count'] == 51
+        assert stats['error_count'] == 1
+        assert len(stats['recent_calls']) == 10
+        assert stats['p99'] is not None
@@ -0,0 +1,160 @@
+"""
+반복 일정 전개 엔진 단위 테스트
+"""
+from src.calendar.models import CalendarEvent
+from src.calendar.recurrence import RecurrenceExpander
+from src.calendar.utils import to_timestamp
+
+
+def make_master(event_id: str, start: str, end: str, recurrence, **kwargs) -> CalendarEvent:
+    """테스트용 반복 일정 원본 생성"""
+    return CalendarEvent(
+        id=event_id, summary="팀 회의", start_time=start, end_time=end,
+        recurrence=recurrence, **kwargs
+    )
+
+
+def expand(expander: RecurrenceExpander, start: str, end: str):
+    """ISO 문자열 기간으로 전개한 인스턴스 목록"""
+    return [occurrence for _, _, occurrence in expander.expand(to_timestamp(start), to_timestamp(end))]
+
+
+class TestRecurrenceExpander:
+    """RecurrenceExpander 클래스 테스트"""
+    
+    def test_weekly_rule_expands_per_window_with_google_instance_ids(self):
+        """주간 반복 일정이 기간 안의 인스턴스로만 전개되는지 테스트"""
+        expander = RecurrenceExpander()
+        expander.add(make_master(
+            "weekly", "2025-01-06T10:00:00+09:00", "2025-01-06T11:00:00+09:00",
+            ["RRULE:FREQ=WEEKLY;BYDAY=MO"], time_zone="Asia/Seoul"
+        ))
+        
+        year = expand(expander, "2025-01-01T00:00:00+09:00", "2026-01-01T00:00:00+09:00")
+        january = expand(expander, "2025-01-01T00:00:00+09:00", "2025-02-01T00:00:00+09:00")
+        
+        assert len(year) == 52
+        assert [event.start_time for event in january] == [
+            "2025-01-06T10:00:00+09:00", "2025-01-13T10:00:00+09:00",
+            "2025-01-20T10:00:00+09:00", "2025-01-27T10:00:00+09:00"
+        ]
+        assert january[0].id == "weekly_20250106T010000Z"
+        assert january[0].recurring_event_id == "weekly"
+        assert january[0].end_time == "2025-01-06T11:00:00+09:00"
+    
+    def test_occurrence_overlapping_window_start_is_included(self):
+        """기간 시작 전에 시작해 기간 안에서 끝나는 인스턴스도 포함하는지 테스트"""
+        expander = RecurrenceExpander()
+        expander.add(make_master(
+            "daily", "2025-01-01T23:00:00+09:00", "2025-01-02T01:00:00+09:00",
+            ["RRULE:FREQ=DAILY;COUNT=3"], time_zone="Asia/Seoul"
+        ))
+        
+        events = expand(expander, "2025-01-02T00:00:00+09:00", "2025-01-02T12:00:00+09:00")
+        
+        assert [event.start_time for event in events] == ["2025-01-01T23:00:00+09:00"]
+    
+    def test_zero_duration_instance_is_found_at_its_start(self):
+        """길이가 0인 인스턴스도 시작 시간으로 조회/전개되는지 테스트"""
+        expander = RecurrenceExpander()
+        expander.add(make_master(
+            "reminder", "2025-01-06T09:00:00+09:00", "2025-01-06T09:00:00+09:00",
+            ["RRULE:FREQ=DAILY;COUNT=3"], time_zone="Asia/Seoul"
+        ))
+        
+        instance = expander.get_instance("reminder_20250108T000000Z")
+        events = expand(expander, "2025-01-08T09:00:00+09:00", "2025-01-08T10:00:00+09:00")
+        
+        assert instance is not None
+        assert instance.start_time == instance.end_time == "2025-01-08T09:00:00+09:00"
+        assert [event.id for event in events] == ["reminder_20250108T000000Z"]
+        assert expand(expander, "2025-01-07T08:00:00+09:00", "2025-01-07T09:00:00+09:00") == []
+    
+    def test_exdate_and_exceptions_are_excluded(self):
+        """EXDATE와 취소/수정된 인스턴스가 전개에서 제외되는지 테스트"""
+        expander = RecurrenceExpander()
+        expander.add_exception("weekly", "2025-01-20T10:00:00+09:00")  # 원본보다 먼저 도착한 예외
+        expander.add(make_master(
+            "weekly", "2025-01-06T10:00:00+09:00", "2025-01-06T11:00:00+09:00",
+            ["RRULE:FREQ=WEEKLY;COUNT=4", "EXDATE;TZID=Asia/Seoul:20250113T100000"],
+            time_zone="Asia/Seoul"
+        ))
+        
+        events = expand(expander, "2025-01-01T00:00:00+09:00", "2025-02-01T00:00:00+09:00")
+        
+        assert [event.start_time[:10] for event in events] == ["2025-01-06", "2025-01-27"]
+        
+        assert expander.exclude_instance("weekly_20250127T010000Z")
+        assert [event.start_time[:10] for event in expand(
+            expander, "2025-01-01T00:00:00+09:00", "2025-02-01T00:00:00+09:00"
+        )] == ["2025-01-06"]
+    
+    def test_wall_clock_time_is_kept_across_dst(self):
+        """일광 절약 시간 전환 후에도 현지 시각이 유지되는지 테스트"""
+        expander = RecurrenceExpander()
+        expander.add(make_master(
+            "standup", "2025-03-03T09:00:00-05:00", "2025-03-03T09:15:00-05:00",
+            ["RRULE:FREQ=WEEKLY;UNTIL=20250317T235959Z"], time_zone="America/New_York"
+        ))
+        
+        events = expand(expander, "2025-03-01T00:00:00Z", "2025-04-01T00:00:00Z")
+        
+        assert [event.start_time for event in events] == [
+            "2025-03-03T09:00:00-05:00", "2025-03-10T09:00:00-04:00", "2025-03-17T09:00:00-04:00"
+        ]
+    
+    def test_all_day_series_with_date_until(self):
+        """종일 반복 일정과 날짜 형식 UNTIL 처리 테스트"""
+        expander = RecurrenceExpander()
+        expander.add(make_master(
+            "rent", "2025-03-01", "2025-03-02", ["RRULE:FREQ=MONTHLY;UNTIL=20250601"], all_day=True
+        ))
+        
+        events = expand(expander, "2025-01-01T00:00:00", "2026-01-01T00:00:00")
+        
+        assert [event.id for event in events] == ["rent_20250301", "rent_20250401", "rent_20250501", "rent_20250601"]
+        assert events[0].all_day and events[0].end_time == "2025-03-02"
+        assert expander.get_instance("rent_20250401").start_time == "2025-04-01"
+        assert expander.get_instance("rent_20250402") is None
+    
+    def test_expanded_windows_are_cached_and_invalidated(self):
+        """같은 기간 재조회는 캐시를 사용하고 변경 시 캐시가 비워지는지 테스트"""
+        expander = RecurrenceExpander(max_windows=2)
+        master = make_master(
+            "weekly", "2025-01-06T10:00:00+09:00", "2025-01-06T11:00:00+09:00",
+            ["RRULE:FREQ=WEEKLY"], time_zone="Asia/Seoul"
+        )
+        expander.add(master)
+        
+        expand(expander, "2025-01-01T00:00:00+09:00", "2026-01-01T00:00:00+09:00")
+        expand(expander, "2025-01-01T00:00:00+09:00", "2026-01-01T00:00:00+09:00")
+        assert expander.get_stats()['window_hits'] == 1
+        
+        master.summary = "주간 회의"
+        expander.add(master)
+        events = expand(expander, "2025-01-01T00:00:00+09:00", "2026-01-01T00:00:00+09:00")
+        assert events[0].summary == "주간 회의"
+        assert expander.get_stats()['window_misses'] == 2
+        
+        assert expander.remove("weekly")
+        assert expand(expander, "2025-01-01T00:00:00+09:00", "2026-01-01T00:00:00+09:00") == []
+    
+    def test_series_outside_window_is_not_expanded(self):
+        """기간과 겹치지 않는 유한 반복 일정은 전개하지 않는지 테스트"""
+        expander = RecurrenceExpander()
+        expander.add(make_master(
+            "old", "2020-01-06T10:00:00+09:00", "2020-01-06T11:00:00+09:00",
+            ["RRULE:FREQ=DAILY;COUNT=10"], time_zone="Asia/Seoul"
+        ))
+        
+        assert expand(expander, "2025-01-01T00:00:00+09:00", "2026-01-01T00:00:00+09:00") == []
+        assert expander.get_stats()['expansions'] == 0
+    
+    def test_invalid_rule_is_rejected(self):
+        """해석할 수 없는 반복 규칙은 등록하지 않는지 테스트"""
+        expander = RecurrenceExpander()
+        
+        assert not expander.add(make_master(
+            "broken", "2025-01-06T10:00:00+09:00", "2025-01-06T11:00:00+09:00", ["RRULE:FREQ=SOMETIMES"]
+        ))
+        assert "broken" not in expander
@@ -337,6 +337,34 @@ class TestCalendarService:
             assert len(events) == 2
             mock_provider.list_events.assert_called_once()
     
+    def test_update_events_batch_uses_prefetched_events(self, calendar_service, mock_provider, sample_events):
+        """배치 수정 시 기존 이벤트를 배치 요청으로 미리 조회하는지 테스트"""
+        mock_provider.get_events_batch = Mock(return_value=sample_events)
+        mock_provider.update_event.side_effect = lambda event_id, event: event
+        
+        results = calendar_service.update_events_batch(
+            [{'id': 'event-1', 'summary': '수정 1'}, {'id': 'event-2', 'summary': '수정 2'}],
+            format_response=False
+        )
+        
+        assert [event.summary for event in results] == ['수정 1', '수정 2']
+        mock_provider.get_events_batch.assert_called_once_with(['event-1', 'event-2'], 50)
+        mock_provider.get_event.assert_not_called()
+    
+    def test_update_events_batch_falls_back_when_prefetch_fails(self, calendar_service, mock_provider, sample_events):
+        """배치 조회가 실패하면 개별 조회로 대체해 수정을 계속하는지 테스트"""
+        mock_provider.get_events_batch = Mock(side_effect=Exception("배치 요청 실패"))
+        mock_provider.get_event.side_effect = {event.id: event for event in sample_events}.get
+        mock_provider.update_event.side_effect = lambda event_id, event: event
+        
+        results = calendar_service.update_events_batch(
+            [{'id': 'event-1', 'summary': '수정 1'}, {'id': 'event-2', 'summary': '수정 2'}],
+            format_response=False
+        )
+        
+        assert [event.summary for event in results] == ['수정 1', '수정 2']
+        assert mock_provider.get_event.call_count == 2
+    
     def test_format_event_for_display(self, calendar_service):
         """이벤트 응답 포맷팅 테스트"""
         event = CalendarEvent(
@@ -372,4 +400,32 @@ class TestCalendarService:
         assert formatted['제목'] == '최소 이벤트'
         assert '설명' not in formatted  # 설명이 없으면 키 자체가 없음
         assert '위치' not in formatted  # 위치가 없으면 키 자체가 없음
-        assert formatted['id'] is None
\ No newline at end of file
+        assert formatted['id'] is None
+    
+    def test_find_conflicts(self, calendar_service, mock_provider, sample_events):
+        """일정 충돌 확인 테스트 (제외 ID, 종일 일정 제외)"""
+        mock_provider.list_events.return_value = sample_events + [
+            CalendarEvent(id='all-day', summary='휴가', start_time='2024-01-01', end_time='2024-01-02', all_day=True)
+        ]
+        
+        conflicts = calendar_service.find_conflicts(
+            '2024-01-01T10:30:00+09:00', '2024-01-01T14:30:00+09:00',
+            exclude_event_id='event-2', format_response=False
+        )
+        
+        assert [event.id for event in conflicts] == ['event-1']
+    
+    def test_find_free_slots(self, calendar_service, mock_provider, sample_events):
+        """최소 길이 조건을 적용한 빈 시간 조회 테스트"""
+        mock_provider.list_events.return_value = sample_events
+        
+        slots = calendar_service.find_free_slots(
+            '2024-01-01T09:00:00+09:00', '2024-01-01T18:00:00+09:00', min_duration_minutes=90
+        )
+        
+        # 09:00~10:00(60분)은 최소 길이 미만이므로 제외
+        assert [slot['시간'] for slot in slots] == [
+            '2024년 01월 01일 11:00 ~ 14:00',
+            '2024년 01월 01일 15:00 ~ 18:00'
+        ]
+        assert slots[0]['길이(분)'] == 180
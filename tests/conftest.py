@@ -122,6 +122,10 @@ def setup_test_environment():
             return True
         return original_exists(path)
     
+    # 프로세스 전역 자격 증명 캐시가 테스트 간에 공유되지 않도록 초기화
+    from src.google_client import credential_cache
+    credential_cache.invalidate()
+    
     # 테스트 후 정리
     yield
     
@@ -11,6 +11,8 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 from src.financial_tools.analysis_tools import (
+    _get_transaction_repository,
+    _repositories,
     analyze_income,
     analyze_income_patterns,
     compare_income_expense
@@ -191,6 +193,22 @@ class TestIncomeAnalysisTools(unittest.TestCase):
         self.assertEqual(len(result['chart']['expense_values']), 3)
         self.assertEqual(len(result['chart']['net_values']), 3)
 
+    
+    @patch('src.financial_tools.analysis_tools.TransactionRepository')
+    @patch('src.financial_tools.analysis_tools.DatabaseConnection')
+    def test_repository_is_created_once(self, mock_connection, mock_repository_class):
+        """도구를 여러 번 호출해도 저장소(연결, 테이블 확인)는 한 번만 만드는지 테스트"""
+        _repositories.__dict__.clear()
+        try:
+            first = _get_transaction_repository()
+            second = _get_transaction_repository()
+        finally:
+            _repositories.__dict__.clear()
+        
+        self.assertIs(first, second)
+        mock_connection.assert_called_once()
+        mock_repository_class.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
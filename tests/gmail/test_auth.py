@@ -8,6 +8,8 @@ import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 
+from googleapiclient.http import HttpRequest
+
 from src.gmail.auth import GmailAuthService
 
 class TestGmailAuthService(unittest.TestCase):
@@ -142,7 +144,7 @@ class TestGmailAuthService(unittest.TestCase):
         # 검증
         self.assertTrue(result)
     
-    @patch("src.gmail.auth.build")
+    @patch("src.gmail.auth.build_service")
     @patch("src.gmail.auth.Credentials")
     def test_get_service(self, mock_credentials, mock_build):
         """서비스 객체 가져오기 테스트"""
@@ -160,7 +162,10 @@ class TestGmailAuthService(unittest.TestCase):
         
         # 검증
         self.assertEqual(service, mock_service)
-        mock_build.assert_called_once_with('gmail', 'v1', credentials=mock_creds)
+        mock_build.assert_called_once()
+        self.assertEqual(mock_build.call_args.args, ('gmail', 'v1'))
+        self.assertEqual(mock_build.call_args.kwargs['credentials'], mock_creds)
+        self.assertTrue(issubclass(mock_build.call_args.kwargs['requestBuilder'], HttpRequest))
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
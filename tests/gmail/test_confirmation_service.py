@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 from src.gmail.confirmation_service import ConfirmationService, ConfirmationRequest
+from src.gmail.confirmation_store import ConfirmationStore
 from src.gmail.models import ExtractedEventInfo
 from src.gmail.exceptions import NotificationError
 
@@ -17,7 +18,7 @@ class TestConfirmationService:
     def setup_method(self):
         """테스트 설정"""
         self.mock_notification_handler = Mock()
-        self.service = ConfirmationService([self.mock_notification_handler])
+        self.service = ConfirmationService([self.mock_notification_handler], store=ConfirmationStore())
         
         # 테스트용 일정 정보
         self.test_event_info = ExtractedEventInfo(
@@ -419,7 +420,7 @@ class TestConfirmationService:
         """알림 핸들러 예외 처리 테스트"""
         # Given
         failing_handler = Mock(side_effect=Exception("핸들러 오류"))
-        service = ConfirmationService([failing_handler])
+        service = ConfirmationService([failing_handler], store=ConfirmationStore())
         
         # When & Then - 예외가 발생해도 요청 생성은 성공해야 함
         request_id = service.request_confirmation(
@@ -429,4 +430,125 @@ class TestConfirmationService:
         
         assert request_id is not None
         assert request_id in service.pending_requests
-     
\ No newline at end of file
+    
+    def test_default_store_uses_configured_path(self, tmp_path):
+        """저장소를 지정하지 않으면 설정된 파일 경로에 저장하는지 테스트"""
+        # Given
+        db_path = str(tmp_path / "confirmations.db")
+        with patch('src.gmail.confirmation_service.CONFIRMATION_DB_PATH', db_path):
+            service = ConfirmationService()
+        
+        # When
+        request_id = service.request_confirmation(
+            event_info=self.test_event_info,
+            email_id="test_email_123"
+        )
+        service.store.close()
+        
+        # Then
+        assert service.store.db_path == db_path
+        reopened = ConfirmationStore(db_path)
+        assert request_id in reopened.pending_requests
+        reopened.close()
+     
+
+
+class TestConfirmationStore:
+    """ConfirmationStore 테스트 클래스"""
+    
+    def setup_method(self):
+        """테스트 설정"""
+        self.store = ConfirmationStore()
+        self.event_info = ExtractedEventInfo(
+            summary="테스트 회의",
+            start_time=datetime(2024, 1, 15, 14, 0),
+            confidence_scores={"summary": 0.9},
+            overall_confidence=0.8
+        )
+    
+    def teardown_method(self):
+        """테스트 정리"""
+        self.store.close()
+    
+    def test_persists_requests_across_instances(self, tmp_path):
+        """파일 DB에 저장된 요청이 새 인스턴스에서 복원되는지 테스트"""
+        # Given
+        db_path = str(tmp_path / "confirmations.db")
+        store = ConfirmationStore(db_path)
+        pending = ConfirmationRequest(email_id="email_1", event_info=self.event_info)
+        done = ConfirmationRequest(email_id="email_2", event_info=self.event_info)
+        store.add(pending)
+        store.add(done)
+        done.status = "confirmed"
+        done.response_data = {"confirmed": True}
+        store.complete(done)
+        store.close()
+        
+        # When
+        reopened = ConfirmationStore(db_path)
+        
+        # Then
+        assert list(reopened.pending_requests) == [pending.id]
+        restored = reopened.pending_requests[pending.id]
+        assert restored.event_info.summary == "테스트 회의"
+        assert restored.event_info.start_time == datetime(2024, 1, 15, 14, 0)
+        assert restored.expires_at == pending.expires_at
+        assert reopened.completed_requests[done.id].response_data == {"confirmed": True}
+        reopened.close()
+    
+    def test_pop_expired_only_returns_due_requests(self):
+        """만료 시각이 지난 대기 요청만 만료 처리되는지 테스트"""
+        # Given
+        now = datetime.now()
+        expired = ConfirmationRequest(email_id="email_1", expires_at=now - timedelta(minutes=1))
+        active = ConfirmationRequest(email_id="email_2", expires_at=now + timedelta(hours=1))
+        answered = ConfirmationRequest(email_id="email_3", expires_at=now - timedelta(minutes=2))
+        for request in (expired, active, answered):
+            self.store.add(request)
+        answered.status = "confirmed"
+        self.store.complete(answered)
+        
+        # When
+        result = self.store.pop_expired(now)
+        
+        # Then
+        assert [request.id for request in result] == [expired.id]
+        assert expired.status == "expired"
+        assert active.id in self.store.pending_requests
+        assert self.store.get(answered.id).status == "confirmed"
+        assert self.store.pop_expired(now) == []
+    
+    def test_find_pending_by_email_id(self):
+        """이메일 ID로 대기 중인 요청을 조회하는지 테스트"""
+        # Given
+        first = ConfirmationRequest(email_id="email_1")
+        second = ConfirmationRequest(email_id="email_2")
+        completed = ConfirmationRequest(email_id="email_1")
+        for request in (first, second, completed):
+            self.store.add(request)
+        completed.status = "rejected"
+        self.store.complete(completed)
+        
+        # When
+        result = self.store.find_pending("email_1")
+        
+        # Then
+        assert [request.id for request in result] == [first.id]
+        assert len(self.store.find_pending()) == 2
+    
+    def test_count_by_status(self):
+        """상태별 요청 수 집계 테스트"""
+        # Given
+        requests = [ConfirmationRequest(email_id=f"email_{i}") for i in range(3)]
+        for request in requests:
+            self.store.add(request)
+        requests[0].status = "confirmed"
+        self.store.complete(requests[0])
+        
+        # When
+        counts = self.store.count_by_status()
+        
+        # Then
+        assert counts == {"pending": 2, "confirmed": 1}
+        assert len(self.store.pending_requests) == 2
+        assert len(self.store.completed_requests) == 1
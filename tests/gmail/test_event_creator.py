@@ -0,0 +1,68 @@
+"""
+일정 생성기 테스트
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.calendar.models import CalendarEvent
+from src.calendar.exceptions import CalendarServiceError
+from src.gmail.event_creator import EventCreator
+from src.gmail.models import ExtractedEventInfo
+
+
+class TestEventCreatorConflicts:
+    """EventCreator 일정 충돌 확인 테스트 클래스"""
+    
+    def setup_method(self):
+        """테스트 설정"""
+        self.calendar_service = Mock()
+        self.calendar_service.create_new_event.return_value = CalendarEvent(
+            id="new-event", summary="회의",
+            start_time="2024-01-15T14:00:00", end_time="2024-01-15T15:00:00"
+        )
+        self.confirmation_service = Mock()
+        self.confirmation_service.request_confirmation.return_value = "request-1"
+        self.creator = EventCreator(
+            self.calendar_service,
+            notification_service=Mock(),
+            confirmation_service=self.confirmation_service
+        )
+        self.event_info = ExtractedEventInfo(
+            summary="회의",
+            start_time=datetime(2024, 1, 15, 14, 0),
+            end_time=datetime(2024, 1, 15, 15, 0),
+            overall_confidence=0.9
+        )
+        self.existing = CalendarEvent(
+            id="existing", summary="기존 일정",
+            start_time="2024-01-15T14:30:00", end_time="2024-01-15T16:00:00"
+        )
+    
+    def test_conflict_requests_confirmation(self):
+        """충돌이 있으면 생성 전에 사용자 확인을 요청하는지 테스트"""
+        self.calendar_service.find_conflicts.return_value = [self.existing]
+        
+        result = self.creator.create_event(self.event_info, "email_1")
+        
+        assert result['status'] == 'pending_confirmation'
+        assert result['conflicts'][0]['id'] == "existing"
+        self.calendar_service.create_new_event.assert_not_called()
+    
+    def test_conflict_flagged_without_confirmation(self):
+        """확인이 필요 없는 경우 일정을 만들고 충돌을 표시하는지 테스트"""
+        self.calendar_service.find_conflicts.return_value = [self.existing]
+        
+        result = self.creator.create_event(self.event_info, "email_1", require_confirmation=False)
+        
+        assert result['status'] == 'created'
+        assert [conflict['id'] for conflict in result['conflicts']] == ["existing"]
+    
+    def test_conflict_check_failure_does_not_block_creation(self):
+        """충돌 확인이 실패해도 일정 생성은 진행하는지 테스트"""
+        self.calendar_service.find_conflicts.side_effect = CalendarServiceError("조회 실패")
+        
+        result = self.creator.create_event(self.event_info, "email_1")
+        
+        assert result['status'] == 'created'
+        assert result['conflicts'] == []
@@ -2,6 +2,9 @@
 EventExtractor 클래스의 단위 테스트
 """
 
+import json
+import re
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
@@ -281,4 +284,104 @@ class TestEventExtractor:
         result = extractor.extract_event_info("test content")
         
         assert isinstance(result, ExtractedEventInfo)
-        assert result.overall_confidence == 0.0
\ No newline at end of file
+        assert result.overall_confidence == 0.0
+
+class StubModel:
+    """generate_content()만 제공하는 테스트용 모델"""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+    
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        response = Mock()
+        response.text = self.responses.pop(0) if self.responses else "{}"
+        return response
+
+
+class TestEventExtractorBatch:
+    """EventExtractor 일괄 추출 모드 테스트"""
+    
+    def test_batch_packs_emails_into_single_prompt(self):
+        """여러 이메일을 하나의 프롬프트로 묶어 추출하는지 테스트"""
+        model = StubModel(['''```json
+        [
+            {"email_id": "email_0", "summary": "팀 회의", "start_time": "2024-01-15T14:00:00"},
+            {"email_id": "email_1", "summary": "점심 약속", "location": "회사 앞 식당"}
+        ]
+        ```'''])
+        extractor = EventExtractor(model=model, max_concurrency=1)
+        
+        results = extractor.extract_event_info_batch([
+            ("월요일 오후 2시 팀 회의", None),
+            ("점심 약속 안내", EmailMetadata(id="m2", subject="점심", sender="a@b.com")),
+        ])
+        
+        assert len(model.prompts) == 1
+        assert 'email_0' in model.prompts[0] and 'email_1' in model.prompts[0]
+        assert [r.summary for r in results] == ["팀 회의", "점심 약속"]
+        assert results[0].start_time == datetime(2024, 1, 15, 14, 0)
+        assert results[1].location == "회사 앞 식당"
+    
+    def test_batch_falls_back_to_single_on_parse_failure(self):
+        """일괄 응답 파싱 실패 시 단건 추출로 대체하는지 테스트"""
+        model = StubModel([
+            "invalid json response",
+            '{"summary": "첫번째"}',
+            '{"summary": "두번째"}',
+        ])
+        extractor = EventExtractor(model=model, max_concurrency=1)
+        
+        results = extractor.extract_event_info_batch([("메일 1", None), ("메일 2", None)])
+        
+        assert len(model.prompts) == 3
+        assert [r.summary for r in results] == ["첫번째", "두번째"]
+    
+    def test_batch_retries_only_missing_emails(self):
+        """일괄 응답에서 누락된 이메일만 단건으로 다시 추출하는지 테스트"""
+        model = StubModel([
+            '[{"email_id": "email_0", "summary": "첫번째"}]',
+            '{"summary": "두번째"}',
+        ])
+        extractor = EventExtractor(model=model, max_concurrency=1)
+        
+        results = extractor.extract_event_info_batch([("메일 1", None), ("메일 2", None)])
+        
+        assert len(model.prompts) == 2
+        assert "메일 2" in model.prompts[1] and "메일 1" not in model.prompts[1]
+        assert [r.summary for r in results] == ["첫번째", "두번째"]
+    
+    def test_split_respects_batch_size_and_token_budget(self):
+        """배치 크기와 토큰 예산에 따른 분할 테스트"""
+        extractor = EventExtractor(model=StubModel([]), batch_size=3, max_batch_tokens=100)
+        
+        items = [(f"email_{i}", "가" * 20, None) for i in range(7)]
+        assert [len(b) for b in extractor._split_into_batches(items)] == [3, 3, 1]
+        
+        items = [("email_0", "가" * 150, None), ("email_1", "가" * 150, None), ("email_2", "짧음", None)]
+        assert [len(b) for b in extractor._split_into_batches(items)] == [1, 2]
+    
+    def test_batch_concurrency_preserves_order(self):
+        """동시 실행 시에도 입력 순서가 유지되는지 테스트"""
+        model = Mock()
+        
+        def generate_content(prompt):
+            ids = re.findall(r'<email id="(email_\d+)">', prompt)
+            response = Mock()
+            response.text = json.dumps([{"email_id": i, "summary": f"일정 {i}"} for i in ids])
+            return response
+        
+        model.generate_content.side_effect = generate_content
+        extractor = EventExtractor(model=model, batch_size=2, max_concurrency=3)
+        
+        results = extractor.extract_event_info_batch([(f"메일 {i}", None) for i in range(6)])
+        
+        assert model.generate_content.call_count == 3
+        assert [r.summary for r in results] == [f"일정 email_{i}" for i in range(6)]
+    
+    def test_batch_empty_input(self):
+        """빈 입력 처리 테스트"""
+        extractor = EventExtractor(model=StubModel([]))
+        
+        assert extractor.extract_event_info_batch([]) == []
@@ -0,0 +1,144 @@
+"""
+EventPreFilter 클래스의 단위 테스트
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.gmail.event_prefilter import EventPreFilter, PreFilterRoute
+from src.gmail.event_extractor import EventExtractor
+from src.gmail.models import EmailMetadata
+
+
+class TestEventPreFilter:
+    """EventPreFilter 클래스 테스트"""
+    
+    @pytest.fixture
+    def prefilter(self):
+        """EventPreFilter 인스턴스 생성"""
+        return EventPreFilter()
+    
+    def test_skip_email_without_date_signal(self, prefilter):
+        """날짜 신호가 없는 이메일은 건너뛰는지 테스트"""
+        decision = prefilter.classify("안녕하세요. 지난번 자료 잘 받았습니다. 감사합니다.")
+        
+        assert decision.route == PreFilterRoute.SKIP
+        assert decision.reason == 'no_date_signal'
+    
+    def test_url_digits_are_not_date_signal(self, prefilter):
+        """URL 안의 숫자를 날짜로 오인하지 않는지 테스트"""
+        decision = prefilter.classify("자세한 내용은 https://example.com/12/25/post 를 참고하세요.")
+        
+        assert decision.route == PreFilterRoute.SKIP
+    
+    def test_short_explicit_email_uses_regex_only(self, prefilter):
+        """짧고 명확한 일정 이메일은 패턴 매칭만 사용하는지 테스트"""
+        decision = prefilter.classify("1월 15일 오후 2시 팀 회의 있습니다.")
+        
+        assert decision.route == PreFilterRoute.REGEX_ONLY
+        assert decision.has_date and decision.has_time and decision.has_event_keyword
+    
+    def test_long_event_email_uses_llm(self, prefilter):
+        """긴 일정 이메일은 LLM으로 보내는지 테스트"""
+        content = "다음주 화요일 오후 3시에 분기 회의가 있습니다.\n" + "안건 설명입니다. " * 50
+        
+        decision = prefilter.classify(content)
+        
+        assert decision.route == PreFilterRoute.LLM
+    
+    def test_time_with_event_keyword_without_date(self, prefilter):
+        """날짜 없이 시간과 일정 키워드만 있어도 LLM으로 보내는지 테스트"""
+        decision = prefilter.classify("오후 3시에 미팅 가능하신가요? " + "내용 " * 100)
+        
+        assert decision.route == PreFilterRoute.LLM
+    
+    def test_promotional_sender_and_label(self, prefilter):
+        """홍보성 발신자/라벨 이메일 건너뛰기 테스트"""
+        content = "12/31까지 전 상품 50% 할인!"
+        newsletter = EmailMetadata(id="1", sender="Shop <newsletter@shop.com>")
+        promotion = EmailMetadata(id="2", sender="shop@shop.com", labels=["CATEGORY_PROMOTIONS"])
+        
+        assert prefilter.classify(content, newsletter).reason == 'promotional'
+        assert prefilter.classify(content, promotion).reason == 'promotional'
+        assert prefilter.classify(content, EmailMetadata(id="3", sender="friend@mail.com")).route != PreFilterRoute.SKIP
+    
+    def test_subject_date_is_considered(self, prefilter):
+        """제목에 포함된 날짜도 신호로 인식하는지 테스트"""
+        metadata = EmailMetadata(id="1", subject="3월 2일 워크샵 안내", sender="hr@company.com")
+        
+        decision = prefilter.classify("참석 여부를 회신해 주세요.", metadata)
+        
+        assert decision.route != PreFilterRoute.SKIP
+    
+    def test_metrics(self, prefilter):
+        """LLM 호출 절감 통계 테스트"""
+        prefilter.classify("감사합니다.")
+        prefilter.classify("1월 15일 오후 2시 팀 회의")
+        prefilter.classify("다음주 화요일 회의 " + "내용 " * 200)
+        
+        metrics = prefilter.get_metrics()
+        
+        assert metrics['total'] == 3
+        assert metrics['routes'] == {'skip': 1, 'regex_only': 1, 'llm': 1}
+        assert metrics['llm_calls_saved'] == 2
+        assert metrics['llm_call_savings_rate'] == pytest.approx(2 / 3)
+        
+        prefilter.reset_metrics()
+        assert prefilter.get_metrics()['total'] == 0
+    
+    def test_evaluate_labeled_corpus(self, prefilter):
+        """라벨링된 코퍼스에 대한 재현율 평가 테스트"""
+        corpus = [
+            ("1월 15일 오후 2시 팀 회의", None, True),
+            ("내일 점심 약속 잊지 마세요", None, True),
+            ("2024년 3월 2일 세미나 안내", None, True),
+            ("청구서가 발행되었습니다.", None, False),
+            ("비밀번호가 변경되었습니다.", None, False),
+        ]
+        
+        result = prefilter.evaluate(corpus)
+        
+        assert result['recall'] == 1.0
+        assert result['event_emails'] == 3
+        assert result['llm_calls_saved'] >= 2
+        assert result['missed_indices'] == []
+        # 평가는 운영 통계에 섞이지 않아야 함
+        assert prefilter.get_metrics()['total'] == 0
+
+
+class TestEventExtractorWithPreFilter:
+    """사전 필터가 연결된 EventExtractor 테스트"""
+    
+    @pytest.fixture
+    def model(self):
+        """호출을 기록하는 모델"""
+        model = Mock()
+        model.generate_content.return_value = Mock(text='{"summary": "LLM 일정"}')
+        return model
+    
+    def test_skip_and_regex_only_do_not_call_llm(self, model):
+        """건너뛰기/패턴 매칭 경로는 LLM을 호출하지 않는지 테스트"""
+        extractor = EventExtractor(model=model, prefilter=EventPreFilter())
+        
+        skipped = extractor.extract_event_info("감사합니다.")
+        regex_only = extractor.extract_event_info("2024년 1월 15일 14시 회의")
+        
+        model.generate_content.assert_not_called()
+        assert skipped.start_time is None
+        assert regex_only.start_time == datetime(2024, 1, 15, 14, 0)
+    
+    def test_batch_sends_only_llm_route_emails(self, model):
+        """일괄 추출 시 LLM 경로 이메일만 모델로 보내는지 테스트"""
+        extractor = EventExtractor(model=model, prefilter=EventPreFilter())
+        long_email = "다음주 화요일 오후 3시 회의가 있습니다. " + "안건 " * 200
+        
+        results = extractor.extract_event_info_batch([
+            ("감사합니다.", None),
+            (long_email, None),
+        ])
+        
+        assert model.generate_content.call_count == 1
+        assert long_email in model.generate_content.call_args[0][0]
+        assert results[0].summary == ""
+        assert results[1].summary == "LLM 일정"
@@ -0,0 +1,41 @@
+"""
+알림 서비스 테스트
+"""
+
+from src.gmail.notification_service import NotificationService, NotificationType
+
+
+class TestNotificationService:
+    """NotificationService 테스트 클래스"""
+    
+    def setup_method(self):
+        """테스트 설정"""
+        self.service = NotificationService(console_output=False, history_size=3)
+    
+    def test_history_keeps_latest_entries(self):
+        """이력이 최대 개수를 넘으면 오래된 항목부터 제거되는지 테스트"""
+        # When
+        for i in range(5):
+            self.service.notify_error(f"오류 {i}")
+        
+        # Then
+        history = self.service.get_notification_history()
+        assert len(self.service.notification_history) == 3
+        assert [n['message'] for n in history] == ["오류 4", "오류 3", "오류 2"]
+    
+    def test_history_filter_and_limit(self):
+        """유형 필터와 개수 제한을 적용해 최신 순으로 조회하는지 테스트"""
+        # Given
+        service = NotificationService(console_output=False)
+        service.notify_error("오류 1")
+        service.notify_info("정보 1")
+        service.notify_error("오류 2")
+        
+        # When
+        errors = service.get_notification_history(notification_type=NotificationType.ERROR)
+        latest = service.get_notification_history(limit=1)
+        
+        # Then
+        assert [n['message'] for n in errors] == ["오류 2", "오류 1"]
+        assert len(latest) == 1
+        assert latest[0]['type'] == NotificationType.ERROR.value
@@ -6,6 +6,8 @@
 
 import pytest
 import base64
+import hashlib
+import time
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 from typing import Dict, Any
@@ -509,6 +511,17 @@ class TestEmailProcessor:
         assert "항목 1" in text
         assert "항목 2" in text
     
+    def test_extract_text_from_html_unclosed_tag(self, email_processor):
+        """닫히지 않은 태그가 있어도 선형 시간 안에 처리하는지 테스트"""
+        html_content = '<p>hello</p>Unsubscribe if x<y and more words follow here' + ' word' * 2000
+        
+        start = time.perf_counter()
+        text = email_processor._extract_text_from_html(html_content)
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 1.0
+        assert "hello" in text
+    
     def test_extract_links_from_html(self, email_processor):
         """HTML 링크 추출 개선 테스트"""
         html_content = '''
@@ -707,27 +720,120 @@ class TestEmailProcessor:
             id="attachment_id"
         )
     
-    @patch('os.makedirs')
-    @patch('builtins.open', create=True)
-    def test_save_attachment_success(self, mock_open, mock_makedirs, email_processor):
+    def test_save_attachment_success(self, email_processor, tmp_path):
         """첨부 파일 저장 성공 테스트"""
         # Mock 설정
+        mock_service = email_processor._get_service()
         test_content = b"test file content"
-        email_processor.get_attachment_content = Mock(return_value=test_content)
-        
-        mock_file = Mock()
-        mock_open.return_value.__enter__.return_value = mock_file
+        mock_service.users().messages().attachments().get().execute.return_value = {
+            "data": base64.urlsafe_b64encode(test_content).decode()
+        }
+        save_path = tmp_path / "attachments"
         
         # 테스트 실행
         result = email_processor.save_attachment(
-            "email_id", "attachment_id", "test.txt", "/save/path"
+            "email_id", "attachment_id", "test.txt", str(save_path)
         )
         
         # 검증
         assert result is True
-        mock_makedirs.assert_called_once()
-        mock_file.write.assert_called_once_with(test_content)
-
+        assert (save_path / "test.txt").read_bytes() == test_content
+        assert not (save_path / "test.txt.part").exists()
+    
+    def test_iter_attachment_chunks_decodes_in_chunks(self, email_processor):
+        """첨부 파일을 여러 청크로 나누어 디코딩하는지 테스트"""
+        # Mock 설정 (패딩이 생략된 base64url 데이터)
+        mock_service = email_processor._get_service()
+        test_content = bytes(range(256)) * 40 + b"\xff\xfe"
+        encoded_content = base64.urlsafe_b64encode(test_content).decode().rstrip("=")
+        mock_service.users().messages().attachments().get().execute.return_value = {
+            "data": encoded_content
+        }
+        
+        # 테스트 실행
+        chunks = list(email_processor.iter_attachment_chunks("email_id", "attachment_id", chunk_size=1001))
+        
+        # 검증
+        assert len(chunks) > 1
+        assert b"".join(chunks) == test_content
+    
+    def test_download_attachment_skips_duplicate_content(self, email_processor, tmp_path):
+        """같은 내용의 첨부 파일은 다시 저장하지 않는지 테스트"""
+        # Mock 설정
+        mock_service = email_processor._get_service()
+        test_content = b"statement content" * 1000
+        mock_service.users().messages().attachments().get().execute.return_value = {
+            "data": base64.urlsafe_b64encode(test_content).decode()
+        }
+        
+        # 테스트 실행
+        first = email_processor.download_attachment("email_1", "att_1", "statement.xlsx", str(tmp_path))
+        second = email_processor.download_attachment("email_2", "att_2", "statement_copy.xlsx", str(tmp_path))
+        
+        # 검증
+        assert first.duplicate is False
+        assert first.sha256 == hashlib.sha256(test_content).hexdigest()
+        assert first.size == len(test_content)
+        assert second.duplicate is True
+        assert second.file_path == first.file_path
+        assert not (tmp_path / "statement_copy.xlsx").exists()
+        assert not (tmp_path / "statement_copy.xlsx.part").exists()
+    
+    def test_download_attachment_keeps_same_named_file(self, email_processor, tmp_path):
+        """같은 이름의 다른 내용은 덮어쓰지 않고 해시를 붙인 파일명으로 저장하는지 테스트"""
+        mock_service = email_processor._get_service()
+        request = mock_service.users().messages().attachments().get().execute
+        
+        request.return_value = {"data": base64.urlsafe_b64encode(b"january").decode()}
+        first = email_processor.download_attachment("email_1", "att_1", "statement.xlsx", str(tmp_path))
+        
+        request.return_value = {"data": base64.urlsafe_b64encode(b"february").decode()}
+        second = email_processor.download_attachment("email_2", "att_2", "statement.xlsx", str(tmp_path))
+        
+        assert first.file_path == str(tmp_path / "statement.xlsx")
+        assert second.file_path == str(tmp_path / f"statement_{second.sha256[:12]}.xlsx")
+        assert (tmp_path / "statement.xlsx").read_bytes() == b"january"
+        
+        # 두 해시 모두 자기 내용의 파일을 가리킴
+        request.return_value = {"data": base64.urlsafe_b64encode(b"january").decode()}
+        again = email_processor.download_attachment("email_3", "att_3", "statement.xlsx", str(tmp_path))
+        assert again.duplicate is True
+        assert again.file_path == first.file_path
+    
+    def test_download_attachment_deferred_hash_record(self, email_processor, tmp_path):
+        """record_hash=False이면 record_attachment를 호출하기 전까지 중복으로 보지 않는지 테스트"""
+        mock_service = email_processor._get_service()
+        mock_service.users().messages().attachments().get().execute.return_value = {
+            "data": base64.urlsafe_b64encode(b"statement").decode()
+        }
+        
+        first = email_processor.download_attachment("email_1", "att_1", "a.xlsx", str(tmp_path), record_hash=False)
+        retry = email_processor.download_attachment("email_1", "att_1", "a.xlsx", str(tmp_path), record_hash=False)
+        assert retry.duplicate is False
+        
+        # 수집 실패 후 재시도는 같은 내용의 기존 파일을 재사용하고 사본을 만들지 않음
+        assert retry.file_path == first.file_path
+        assert [path.name for path in tmp_path.iterdir()] == ["a.xlsx"]
+        
+        email_processor.record_attachment(str(tmp_path), retry)
+        again = email_processor.download_attachment("email_2", "att_2", "b.xlsx", str(tmp_path))
+        assert again.duplicate is True
+        assert first.sha256 == again.sha256
+    
+    def test_download_attachment_error_removes_partial_file(self, email_processor, tmp_path):
+        """손상된 데이터는 부분 파일을 남기지 않고 None을 반환하는지 테스트"""
+        # Mock 설정
+        mock_service = email_processor._get_service()
+        mock_service.users().messages().attachments().get().execute.return_value = {
+            "data": "abcde"
+        }
+        
+        # 테스트 실행
+        result = email_processor.download_attachment("email_id", "att_1", "broken.pdf", str(tmp_path))
+        
+        # 검증
+        assert result is None
+        assert list(tmp_path.iterdir()) == []
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+EmailProcessor HTML 처리 성능 테스트
+
+대용량 마케팅 이메일 코퍼스에서 단일 패스 HTML 파싱이 문서를 한 번만 훑고
+이전 정규식 기반 구현과 같은 내용을 추출하는지 확인합니다.
+"""
+
+import html
+import re
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.gmail import processor as processor_module
+from src.gmail.processor import EmailProcessor
+
+
+def make_marketing_email(index: int, sections: int = 40) -> str:
+    """인라인 스타일과 레이아웃 테이블로 구성된 대용량 마케팅 이메일 HTML 생성"""
+    css = "".join(
+        f".c{j}{{font-family:Arial,Helvetica,sans-serif;font-size:{12 + j % 6}px;color:#333333;line-height:20px}}\n"
+        for j in range(150)
+    )
+    parts = [
+        '<!DOCTYPE html><html><head><meta charset="utf-8">',
+        f'<style type="text/css">{css}</style>',
+        '<script type="text/javascript">window.dataLayer=window.dataLayer||[];</script>',
+        '</head><body style="margin:0;padding:0;background-color:#f4f4f4">',
+        '<table role="presentation" width="100%" cellpadding="0" cellspacing="0" border="0">',
+    ]
+    for j in range(sections):
+        parts.append(
+            f'<tr><td align="center" valign="top" style="padding:20px 10px;font-family:Arial,sans-serif;font-size:14px">'
+            f'<table role="presentation" width="600" cellpadding="0" cellspacing="0" border="0"><tr>'
+            f'<td width="200" valign="top" style="padding:0 10px 0 0">'
+            f'<a href="https://shop.example.com/p/{index}/{j}?utm_source=newsletter&amp;utm_medium=email" target="_blank">'
+            f'<img src="https://cdn.example.com/products/{index}/{j}.png" alt="특가 상품 {j}" width="200" style="display:block;border:0"></a></td>'
+            f'<td valign="top" style="padding:0;font-size:14px;line-height:20px;color:#555555">'
+            f'<h2 style="margin:0 0 8px 0;font-size:18px">특가 상품 {j} &ndash; 오늘만!</h2>'
+            f'<p style="margin:0 0 8px 0"><span style="color:#e60023;font-weight:bold">{j % 9 + 1}0% 할인</span> &amp; 무료배송 '
+            f'<font color="#999999">정가 <s>{j}9,000원</s></font></p>'
+            f'<ul style="margin:0;padding-left:18px"><li>적립금 2배</li><li>당일 출고</li></ul>'
+            f'</td></tr></table></td></tr>'
+        )
+    parts.append(
+        '<tr><td style="padding:20px;font-size:12px;color:#999999">수신거부는 '
+        '<a href="https://shop.example.com/unsubscribe">여기</a>를 눌러주세요. '
+        '문의: <a href="mailto:help@shop.example.com">help@shop.example.com</a></td></tr></table></body></html>'
+    )
+    return "".join(parts)
+
+
+def _strip_tags(fragment: str) -> str:
+    return html.unescape(re.sub(r'<[^>]+>', '', fragment).strip())
+
+
+def legacy_process_html(html_content: str) -> dict:
+    """단일 패스 도입 전의 정규식 기반 HTML 처리 (항목마다 문서 전체를 다시 검색)"""
+    # 텍스트
+    text = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    for element in ['div', 'p', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr']:
+        text = re.sub(f'<{element}[^>]*>', '\n', text, flags=re.IGNORECASE)
+        text = re.sub(f'</{element}>', '\n', text, flags=re.IGNORECASE)
+    text = html.unescape(re.sub(r'<[^>]+>', '', text))
+    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+    text = re.sub(r'[\u200B-\u200D\uFEFF]', '', text)
+    text = re.sub(r'[\u2028\u2029]', '\n', text)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text).strip()
+    
+    # 링크
+    links = [
+        {"url": url, "text": re.sub(r'<[^>]+>', '', body).strip(), "type": "link"}
+        for url, body in re.findall(r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>', html_content, re.DOTALL | re.IGNORECASE)
+    ]
+    links += [
+        {"url": f"mailto:{addr}", "text": addr, "type": "email"}
+        for addr in re.findall(r'mailto:([^"\'>\s]+)', html_content, re.IGNORECASE)
+    ]
+    
+    # 이미지
+    images = [
+        {"src": src, "alt": alt, "type": "image"}
+        for src, alt in re.findall(
+            r'<img[^>]*src=["\']([^"\']+)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>', html_content, re.IGNORECASE
+        )
+    ]
+    
+    # 테이블
+    tables = []
+    for table_content in re.findall(r'<table[^>]*>(.*?)</table>', html_content, re.DOTALL | re.IGNORECASE):
+        rows = []
+        for row in re.findall(r'<tr[^>]*>(.*?)</tr>', table_content, re.DOTALL | re.IGNORECASE):
+            cells = [_strip_tags(cell) for cell in re.findall(r'<t[hd][^>]*>(.*?)</t[hd]>', row, re.DOTALL | re.IGNORECASE)]
+            if cells:
+                rows.append(cells)
+        if rows:
+            tables.append({"rows": rows, "row_count": len(rows), "col_count": len(rows[0])})
+    
+    # 구조화된 내용
+    structured = {
+        "headings": [
+            {"level": int(level), "text": _strip_tags(body)}
+            for level, body in re.findall(r'<h([1-6])[^>]*>(.*?)</h[1-6]>', html_content, re.DOTALL | re.IGNORECASE)
+        ],
+        "lists": [
+            {"type": list_type, "items": [_strip_tags(item) for item in re.findall(r'<li[^>]*>(.*?)</li>', body, re.DOTALL | re.IGNORECASE)]}
+            for list_type, body in re.findall(r'<(ul|ol)[^>]*>(.*?)</\1>', html_content, re.DOTALL | re.IGNORECASE)
+        ],
+        "paragraphs": [
+            paragraph for paragraph in (
+                _strip_tags(body) for body in re.findall(r'<p[^>]*>(.*?)</p>', html_content, re.DOTALL | re.IGNORECASE)
+            ) if paragraph
+        ]
+    }
+    
+    return {"text": text, "links": links, "images": images, "tables": tables, "structured_content": structured}
+
+
+@pytest.mark.slow
+class TestEmailProcessorPerformance:
+    """EmailProcessor HTML 처리 성능 테스트"""
+    
+    @pytest.fixture(scope="class")
+    def processor(self):
+        """EmailProcessor 인스턴스 생성"""
+        return EmailProcessor(Mock())
+    
+    @pytest.fixture(scope="class")
+    def corpus(self):
+        """대용량 마케팅 이메일 코퍼스"""
+        return [make_marketing_email(i) for i in range(20)]
+    
+    def test_single_pass_extracts_everything(self, processor, corpus):
+        """단일 패스 결과가 개별 추출 결과와 동일한지 테스트"""
+        html_content = corpus[0]
+        
+        result = processor._process_html_content(html_content)
+        
+        assert result["text"] == processor._extract_text_from_html(html_content)
+        assert result["links"] == processor._extract_links_from_html(html_content)
+        assert result["images"] == processor._extract_images_from_html(html_content)
+        assert result["tables"] == processor._extract_tables_from_html(html_content)
+        assert result["structured_content"] == processor._extract_structured_content(html_content)
+        assert len(result["images"]) == 40
+        assert len(result["structured_content"]["headings"]) == 40
+        assert "dataLayer" not in result["text"] and "font-family" not in result["text"]
+    
+    def test_single_pass_scans_each_email_once(self, processor, corpus):
+        """이메일마다 HTML 토큰 정규식으로 문서를 한 번만 훑는지 테스트"""
+        scans = []
+        real_finditer = processor_module._HTML_TOKEN_PATTERN.finditer
+        
+        def counting_finditer(html_content, *args):
+            scans.append(len(html_content))
+            return real_finditer(html_content, *args)
+        
+        with patch.object(processor_module, '_HTML_TOKEN_PATTERN', Mock(finditer=counting_finditer)):
+            for html_content in corpus:
+                processor._process_html_content(html_content)
+        
+        assert scans == [len(html_content) for html_content in corpus]
+    
+    def test_single_pass_matches_legacy_on_corpus(self, processor, corpus):
+        """코퍼스 전체에서 이전 정규식 기반 구현과 같은 내용을 추출하는지 테스트"""
+        for html_content in corpus:
+            result = processor._process_html_content(html_content)
+            legacy = legacy_process_html(html_content)
+            
+            assert result["text"] == legacy["text"]
+            assert result["structured_content"] == legacy["structured_content"]
+            # 이전 구현은 href의 엔티티를 풀지 않고 alt를 놓쳤으므로 주소만 비교
+            assert [link["url"] for link in result["links"]] == [html.unescape(link["url"]) for link in legacy["links"]]
+            assert [image["src"] for image in result["images"]] == [image["src"] for image in legacy["images"]]
+            # 이전 구현은 중첩 테이블의 바깥 테이블을 놓쳤으므로 안쪽 테이블만 비교
+            assert all(table in result["tables"] for table in legacy["tables"])
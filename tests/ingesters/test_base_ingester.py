@@ -6,8 +6,10 @@ BaseIngester 테스트
 import pytest
 from abc import ABC
 from typing import List, Dict, Any
+from unittest.mock import Mock
 
 from src.ingesters.base_ingester import BaseIngester
+from src.gmail.models import AttachmentDownload
 
 # 테스트용 구체적인 수집기 클래스
 class TestIngester(BaseIngester):
@@ -88,4 +90,55 @@ class TestBaseIngester:
             'description': 'Test',
             'amount': 100
         }
-        assert ingester.validate_data(invalid_data) is False
\ No newline at end of file
+        assert ingester.validate_data(invalid_data) is False
+    
+    def test_ingest_email_attachments(self, tmp_path):
+        """이메일 첨부 파일 수집 테스트 (미지원 형식과 중복 첨부 파일 제외)"""
+        ingester = TestIngester()
+        new_file = tmp_path / "statement.test"
+        new_file.write_text("data")
+        
+        email_processor = Mock()
+        email_processor.get_email_content.return_value = {"id": "email_1"}
+        email_processor.extract_attachments.return_value = [
+            {"filename": "statement.test", "attachment_id": "att_1"},
+            {"filename": "image.png", "attachment_id": "att_2"},
+            {"filename": "old.test", "attachment_id": "att_3"},
+        ]
+        email_processor.download_attachment.side_effect = [
+            AttachmentDownload(file_path=str(new_file), sha256="a" * 64, size=4),
+            AttachmentDownload(file_path=str(new_file), sha256="b" * 64, size=4, duplicate=True),
+        ]
+        
+        result = ingester.ingest_email_attachments(email_processor, "email_1", str(tmp_path))
+        
+        assert len(result) == 1
+        assert result[0]['transaction_id'] == 'test_id'
+        downloaded = [call.args[1] for call in email_processor.download_attachment.call_args_list]
+        assert downloaded == ["att_1", "att_3"]
+        assert all(call.kwargs["record_hash"] is False for call in email_processor.download_attachment.call_args_list)
+        
+        # 새로 수집한 첨부 파일만 해시 기록
+        email_processor.record_attachment.assert_called_once()
+        assert email_processor.record_attachment.call_args.args[1].sha256 == "a" * 64
+    
+    def test_ingest_email_attachments_failure_is_not_recorded(self, tmp_path):
+        """수집에 실패한 첨부 파일은 해시를 기록하지 않아 다음에 다시 시도"""
+        ingester = TestIngester()
+        broken_file = tmp_path / "statement.test"
+        broken_file.write_text("data")
+        ingester.extract_transactions = Mock(side_effect=RuntimeError("parse error"))
+        
+        email_processor = Mock()
+        email_processor.get_email_content.return_value = {"id": "email_1"}
+        email_processor.extract_attachments.return_value = [
+            {"filename": "statement.test", "attachment_id": "att_1"},
+        ]
+        email_processor.download_attachment.return_value = AttachmentDownload(
+            file_path=str(broken_file), sha256="a" * 64, size=4
+        )
+        
+        with pytest.raises(ValueError):
+            ingester.ingest_email_attachments(email_processor, "email_1", str(tmp_path))
+        
+        email_processor.record_attachment.assert_not_called()
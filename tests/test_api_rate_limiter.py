@@ -0,0 +1,225 @@
+"""
+Google API 속도 제한기/서킷 브레이커 테스트
+"""
+import pytest
+from unittest.mock import Mock
+
+from googleapiclient.errors import HttpError
+
+from src.api_rate_limiter import (
+    ApiRateLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimiterRegistry,
+    TokenBucket,
+    get_retry_after,
+    is_rate_limit_error,
+    rate_limited_request_builder
+)
+
+
+class FakeClock:
+    """sleep 호출 시 시간이 흐르는 테스트용 시계"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_http_error(status, content=b'error', headers=None):
+    resp = {'status': str(status)}
+    resp.update(headers or {})
+    response = Mock()
+    response.status = status
+    response.reason = 'error'
+    response.get = resp.get
+    return HttpError(resp=response, content=content)
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+    
+    def test_burst_then_wait_for_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=5.0, clock=clock, sleep=clock.sleep)
+        
+        for _ in range(5):
+            assert bucket.acquire() == 0.0
+        
+        waited = bucket.acquire()
+        assert waited == pytest.approx(0.1)
+    
+    def test_throttle_blocks_until_retry_after_and_slows_down(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=5.0, clock=clock, sleep=clock.sleep)
+        
+        bucket.throttle(retry_after=3)
+        
+        assert bucket.rate == pytest.approx(5.0)
+        assert bucket.acquire() >= 3.0
+        assert clock.now >= 3.0
+    
+    def test_recover_restores_rate_gradually(self):
+        bucket = TokenBucket(rate=10.0, capacity=5.0, increase_step=1.0)
+        bucket.throttle()
+        
+        bucket.recover()
+        assert bucket.rate == pytest.approx(6.0)
+        for _ in range(10):
+            bucket.recover()
+        assert bucket.rate == pytest.approx(10.0)
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+    
+    def test_opens_after_consecutive_failures_and_recovers(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10.0, clock=clock)
+        
+        for _ in range(3):
+            assert breaker.before_call() is None
+            breaker.record_failure()
+        
+        assert breaker.state == "open"
+        assert breaker.before_call() == pytest.approx(10.0)
+        
+        clock.now += 10.0
+        assert breaker.before_call() is None  # 반열림 상태의 시험 요청
+        assert breaker.before_call() is not None  # 시험 요청 중에는 차단
+        
+        breaker.record_success()
+        assert breaker.state == "closed"
+    
+    def test_failed_trial_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5.0, clock=clock)
+        breaker.record_failure()
+        clock.now += 5.0
+        
+        assert breaker.before_call() is None
+        breaker.record_failure()
+        
+        assert breaker.state == "open"
+
+
+class TestApiRateLimiter:
+    """ApiRateLimiter 테스트"""
+    
+    def test_rejects_while_circuit_open(self):
+        clock = FakeClock()
+        limiter = ApiRateLimiter("test", rate=10.0, capacity=10.0, failure_threshold=2,
+                                 clock=clock, sleep=clock.sleep)
+        
+        limiter.record_response(make_http_error(503))
+        limiter.record_response(make_http_error(503))
+        
+        with pytest.raises(CircuitOpenError):
+            limiter.acquire()
+        
+        metrics = limiter.get_metrics()
+        assert metrics['failures'] == 2
+        assert metrics['rejected'] == 1
+        assert metrics['circuit_state'] == "open"
+    
+    def test_classifies_responses(self):
+        limiter = ApiRateLimiter("test", rate=10.0, capacity=10.0)
+        
+        assert limiter.record_response(make_http_error(429, headers={'retry-after': '0'})) is True
+        assert limiter.record_response(make_http_error(404)) is False
+        assert limiter.record_response(ConnectionError("reset")) is True
+        assert limiter.record_response(None) is False
+        
+        metrics = limiter.get_metrics()
+        assert metrics['throttled'] == 1
+        assert metrics['failures'] == 1
+        assert metrics['successes'] == 2
+    
+    def test_unknown_error_settles_half_open_trial(self):
+        clock = FakeClock()
+        limiter = ApiRateLimiter("test", rate=10.0, capacity=10.0, failure_threshold=1,
+                                 recovery_timeout=5.0, clock=clock, sleep=clock.sleep)
+        limiter.record_response(make_http_error(503))
+        clock.now += 5.0
+        
+        # 반열림 상태의 시험 요청이 알 수 없는 오류로 끝나도 실패로 기록
+        limiter.acquire()
+        assert limiter.record_response(RuntimeError("server not found")) is False
+        assert limiter.breaker.state == "open"
+        
+        # 다음 복구 시점에는 다시 시험 요청을 보낼 수 있음
+        clock.now += 5.0
+        limiter.acquire()
+        limiter.record_response(None)
+        assert limiter.breaker.state == "closed"
+    
+    def test_registry_shares_limiter_per_bucket(self):
+        registry = RateLimiterRegistry({'gmail': (5.0, 5.0)})
+        
+        assert registry.get('gmail') is registry.get('gmail')
+        assert registry.get('gmail', 'send') is not registry.get('gmail')
+        assert registry.get('gmail', 'send').bucket.max_rate == 5.0
+        assert set(registry.get_metrics()) == {'gmail', 'gmail:send'}
+
+
+class TestHelpers:
+    """오류 분류 함수 테스트"""
+    
+    def test_retry_after_header(self):
+        assert get_retry_after(make_http_error(429, headers={'retry-after': '7'})) == 7.0
+        assert get_retry_after(make_http_error(429)) is None
+    
+    def test_rate_limit_reasons(self):
+        assert is_rate_limit_error(make_http_error(429))
+        assert is_rate_limit_error(make_http_error(403, b'{"reason": "userRateLimitExceeded"}'))
+        assert not is_rate_limit_error(make_http_error(403, b'{"reason": "forbidden"}'))
+
+
+class TestRateLimitedRequest:
+    """requestBuilder로 생성한 요청 클래스 테스트"""
+    
+    def _make_request(self, limiter, responses):
+        request_class = rate_limited_request_builder(limiter, max_tries=3, delay=0.5)
+        http = Mock()
+        http.request.side_effect = responses
+        return request_class(http, lambda resp, content: content, 'https://example.com/api')
+    
+    def _response(self, status, headers=None):
+        resp = Mock()
+        resp.status = status
+        resp.reason = 'reason'
+        values = {'status': str(status)}
+        values.update(headers or {})
+        resp.get = values.get
+        resp.__getitem__ = lambda self, key: values[key]
+        resp.__contains__ = lambda self, key: key in values
+        return resp
+    
+    def test_retries_throttled_request_after_retry_after(self):
+        clock = FakeClock()
+        limiter = ApiRateLimiter("test", rate=100.0, capacity=10.0, clock=clock, sleep=clock.sleep)
+        request = self._make_request(limiter, [
+            (self._response(429, {'retry-after': '2'}), b'rate limited'),
+            (self._response(200), b'ok'),
+        ])
+        
+        assert request.execute() == b'ok'
+        assert clock.now >= 2.0
+        assert limiter.get_metrics()['throttled'] == 1
+    
+    def test_client_error_is_not_retried(self):
+        clock = FakeClock()
+        limiter = ApiRateLimiter("test", rate=100.0, capacity=10.0, clock=clock, sleep=clock.sleep)
+        request = self._make_request(limiter, [(self._response(404), b'not found')])
+        
+        with pytest.raises(HttpError):
+            request.execute()
+        
+        assert limiter.get_metrics()['requests'] == 1
@@ -12,9 +12,12 @@ import tempfile
 import shutil
 import sqlite3
 import json
+import zlib
+import hashlib
 import zipfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 # 현재 디렉토리를 모듈 경로에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -294,6 +297,168 @@ class TestBackupManager(unittest.TestCase):
         conn.close()
         
         self.assertEqual(count, 3)
+    
+    def test_online_backup_archive(self):
+        """
+        온라인 백업 압축 파일 및 체크섬 테스트
+        """
+        # 다른 연결이 쓰기 트랜잭션을 열어 둔 상태에서 백업
+        writer = sqlite3.connect(self.db_path)
+        writer.execute("UPDATE transactions SET memo = '미확정' WHERE transaction_id = 'TEST001'")
+        try:
+            backup_file = self.backup_manager.backup_database()
+        finally:
+            writer.rollback()
+            writer.close()
+        
+        self.assertTrue(backup_file.endswith('.db.zip'))
+        
+        # 체크섬은 기록된 압축 파일 전체의 SHA-256
+        with open(backup_file, 'rb') as f:
+            expected = hashlib.sha256(f.read()).hexdigest()
+        with open(f"{backup_file}.checksum", 'r') as f:
+            self.assertEqual(f.read().strip(), expected)
+        self.assertEqual(self.backup_manager.last_backup_info['checksum'], expected)
+        
+        # 압축 파일 안의 스냅샷은 커밋된 데이터만 포함
+        with zipfile.ZipFile(backup_file, 'r') as zipf:
+            self.assertIsNone(zipf.testzip())
+            member = zipf.namelist()[0]
+            zipf.extract(member, self.temp_dir)
+        
+        conn = sqlite3.connect(os.path.join(self.temp_dir, member))
+        try:
+            rows = conn.execute("SELECT transaction_id, memo FROM transactions ORDER BY id").fetchall()
+            self.assertEqual(conn.execute("PRAGMA integrity_check").fetchone()[0], 'ok')
+        finally:
+            conn.close()
+        
+        self.assertEqual(rows, [('TEST001', None), ('TEST002', None)])
+    
+    def test_online_backup_through_temp_file(self):
+        """
+        메모리 한도를 넘는 데이터베이스의 임시 파일 백업 테스트
+        """
+        self.backup_manager.snapshot_memory_limit_mb = 0
+        self.backup_manager.backup_step_pages = 1
+        
+        backup_file = self.backup_manager.backup_database()
+        self.assertTrue(backup_file)
+        self.assertTrue(self.backup_manager.verify_backup(backup_file))
+        
+        # 임시 스냅샷 파일은 남기지 않음
+        temp_dir = os.path.join(self.backup_dir, 'temp')
+        self.assertEqual(os.listdir(temp_dir), [])
+    
+    def test_online_backup_without_serialize(self):
+        """
+        Connection.serialize()가 없는 Python에서도 전체/증분 백업이 임시 파일로 동작하는지 테스트
+        """
+        with patch('src.backup_manager._SQLITE_CAN_SERIALIZE', False):
+            backup_file = self.backup_manager.backup_database()
+            chain_file = self.backup_manager.backup_database(self.backup_manager.BACKUP_TYPE_INCREMENTAL)
+        
+        self.assertTrue(backup_file)
+        self.assertTrue(self.backup_manager.verify_backup(backup_file))
+        self.assertTrue(chain_file)
+        self.assertTrue(self.backup_manager.verify_backup(chain_file))
+        self.assertEqual(os.listdir(os.path.join(self.backup_dir, 'temp')), [])
+    
+    def _transaction_ids(self):
+        """
+        현재 데이터베이스의 거래 ID 목록
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return [row[0] for row in conn.execute("SELECT transaction_id FROM transactions ORDER BY id")]
+        finally:
+            conn.close()
+    
+    def test_incremental_chain_point_in_time_restore(self):
+        """
+        증분 백업 체인 및 시점 복원 테스트
+        """
+        self.backup_manager.chain_chunk_kb = 4
+        
+        # 증분 백업에서 바뀌지 않을 페이지를 충분히 만들기
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE attachments (id INTEGER PRIMARY KEY, body BLOB)")
+        conn.executemany("INSERT INTO attachments (body) VALUES (?)", [(os.urandom(1000),) for _ in range(100)])
+        conn.commit()
+        conn.close()
+        
+        # 기준 백업 (모든 청크 저장)
+        base_file = self.backup_manager.backup_database(self.backup_manager.BACKUP_TYPE_INCREMENTAL)
+        base = self.backup_manager._load_manifest(base_file)
+        self.assertIsNone(base['parent'])
+        self.assertEqual(len(base['chunks']), base['chunk_count'])
+        
+        # 행 삭제 후 증분 백업 (바뀐 청크만 기록)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM transactions WHERE transaction_id = 'TEST001'")
+        conn.commit()
+        conn.close()
+        
+        delta_file = self.backup_manager.backup_database(self.backup_manager.BACKUP_TYPE_INCREMENTAL)
+        delta = self.backup_manager._load_manifest(delta_file)
+        self.assertEqual(delta['parent'], base['id'])
+        self.assertEqual(delta['base'], base['id'])
+        self.assertLess(len(delta['chunks']), delta['chunk_count'])
+        
+        # 변경 없이 다시 백업하면 새 청크 없음
+        same_file = self.backup_manager.backup_database(self.backup_manager.BACKUP_TYPE_INCREMENTAL)
+        same = self.backup_manager._load_manifest(same_file)
+        self.assertEqual(same['chunks'], {})
+        self.assertEqual(same['stored_bytes'], 0)
+        self.assertTrue(self.backup_manager.verify_backup(same_file))
+        
+        # 기준 백업 시점으로 복원하면 삭제된 행이 돌아옴
+        self.assertTrue(self.backup_manager.restore_to_point_in_time(base['timestamp']))
+        self.assertEqual(self._transaction_ids(), ['TEST001', 'TEST002'])
+        
+        # 증분 백업으로 복원하면 삭제가 반영됨
+        self.assertTrue(self.backup_manager.restore_database(delta_file))
+        self.assertEqual(self._transaction_ids(), ['TEST002'])
+        
+        # 체인 목록 (최신 순)
+        chain = self.backup_manager.list_backups('chain')
+        self.assertEqual([item['file'] for item in chain[-3:]], [same_file, delta_file, base_file])
+        self.assertEqual(chain[-1]['type'], self.backup_manager.BACKUP_TYPE_FULL)
+        
+        # 기준 백업 이전 시각은 복원할 수 없음
+        self.assertFalse(self.backup_manager.restore_to_point_in_time('2000-01-01T00:00:00'))
+    
+    def test_incremental_chain_corruption_and_pruning(self):
+        """
+        백업 체인 손상 검출 및 오래된 체인 정리 테스트
+        """
+        self.backup_manager.chain_max_length = 1
+        self.backup_manager.max_backup_chains = 1
+        
+        first_file = self.backup_manager.backup_database(self.backup_manager.BACKUP_TYPE_INCREMENTAL)
+        first = self.backup_manager._load_manifest(first_file)
+        
+        # 청크 손상 검출
+        digest = first['chunks']['0']
+        chunk_path = self.backup_manager._chunk_path(digest)
+        with open(chunk_path, 'rb') as f:
+            original = f.read()
+        with open(chunk_path, 'wb') as f:
+            f.write(zlib.compress(b'corrupted'))
+        self.assertFalse(self.backup_manager.verify_backup(first_file))
+        with open(chunk_path, 'wb') as f:
+            f.write(original)
+        self.assertTrue(self.backup_manager.verify_backup(first_file))
+        
+        # 체인 길이(1)를 넘으면 새 기준 백업을 만들고 오래된 체인은 정리
+        second_file = self.backup_manager.backup_database(self.backup_manager.BACKUP_TYPE_INCREMENTAL)
+        third_file = self.backup_manager.backup_database(self.backup_manager.BACKUP_TYPE_INCREMENTAL)
+        third = self.backup_manager._load_manifest(third_file)
+        
+        self.assertEqual(third['depth'], 0)
+        self.assertFalse(os.path.exists(first_file))
+        self.assertFalse(os.path.exists(second_file))
+        self.assertTrue(self.backup_manager.verify_backup(third_file))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -10,8 +10,11 @@ import sys
 import unittest
 import tempfile
 import shutil
+import threading
 import time
 from datetime import datetime
+from typing import Dict, Tuple
+from unittest.mock import MagicMock
 
 # 현재 디렉토리를 모듈 경로에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -20,9 +23,47 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
 from src.cache_manager import (
-    CacheEntry, MemoryCache, DiskCache, CacheManager,
-    cached, invalidate_cache, get_cache_manager
+    CacheEntry, MemoryCache, DiskCache, SqliteDiskCache, CacheManager,
+    cached, invalidate_cache, get_cache_manager,
+    invalidate_cache_by_pattern
 )
+from src.cache_tags import invalidate_tags
+
+def benchmark_memory_cache(sizes: Tuple[int, ...] = (1_000, 100_000), operations: int = 50_000) -> Dict[int, Dict[str, float]]:
+    """
+    항목 수에 따른 메모리 캐시 get/set 시간 측정
+    
+    캐시를 가득 채운 상태에서 조회(히트)와 저장(매번 LRU 제거 발생)의 평균 시간을 잽니다.
+    
+    Args:
+        sizes: 측정할 캐시 크기 목록
+        operations: 크기별 get/set 반복 횟수
+        
+    Returns:
+        Dict[int, Dict[str, float]]: 크기별 {'get_ns', 'set_ns'} (연산당 나노초)
+    """
+    results = {}
+    
+    for size in sizes:
+        cache = MemoryCache(max_size=size, default_ttl=3600)
+        for i in range(size):
+            cache.set(f"key:{i}", i)
+        
+        keys = [f"key:{i % size}" for i in range(operations)]
+        start = time.perf_counter_ns()
+        for key in keys:
+            cache.get(key)
+        get_ns = (time.perf_counter_ns() - start) / operations
+        
+        new_keys = [f"new:{i}" for i in range(operations)]
+        start = time.perf_counter_ns()
+        for key in new_keys:
+            cache.set(key, key)
+        set_ns = (time.perf_counter_ns() - start) / operations
+        
+        results[size] = {'get_ns': get_ns, 'set_ns': set_ns}
+    
+    return results
 
 class TestCacheManager(unittest.TestCase):
     """
@@ -121,6 +162,95 @@ class TestCacheManager(unittest.TestCase):
         self.memory_cache.clear()
         self.assertIsNone(self.memory_cache.get('test_key'))
     
+    def test_memory_cache_lru_eviction(self):
+        """
+        메모리 캐시 LRU 제거 테스트
+        """
+        cache = MemoryCache(max_size=3)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key)
+        
+        # 'a' 접근 후 새 항목을 넣으면 가장 오래 쓰지 않은 'b'가 제거됨
+        cache.get('a')
+        cache.set('d', 'd')
+        
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'a')
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+    
+    def test_memory_cache_hit_miss_accounting(self):
+        """
+        메모리 캐시 히트/미스 집계 테스트
+        """
+        cache = MemoryCache(max_size=10)
+        cache.set('key', None)
+        
+        self.assertIsNone(cache.get('key', 'default'))
+        cache.get('missing')
+        cache.get('missing')
+        cache.get('key')
+        
+        stats = cache.get_stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertAlmostEqual(stats['hit_rate'], 50.0)
+        
+        cache.reset_stats()
+        self.assertEqual(cache.get_stats()['hit_rate'], 0)
+    
+    def test_memory_cache_ttl_heap(self):
+        """
+        만료 힙 기반 만료 처리 테스트
+        """
+        now = [1000.0]
+        cache = MemoryCache(max_size=2, clock=lambda: now[0])
+        cache.set('short', 1, ttl=5)
+        cache.set('long', 2, ttl=100)
+        
+        # 만료된 항목이 있으면 LRU 항목 대신 만료된 항목부터 제거
+        now[0] += 10
+        cache.set('new', 3)
+        
+        self.assertEqual(cache.get('long'), 2)
+        self.assertEqual(cache.get('new'), 3)
+        stats = cache.get_stats()
+        self.assertEqual(stats['expirations'], 1)
+        self.assertEqual(stats['evictions'], 0)
+        
+        # 덮어쓴 항목은 이전 만료 시각으로 제거되지 않음
+        cache.set('long', 4, ttl=500)
+        now[0] += 200
+        self.assertEqual(cache.get('long'), 4)
+    
+    def test_memory_cache_byte_limit(self):
+        """
+        메모리 캐시 크기(바이트) 제한 테스트
+        """
+        cache = MemoryCache(max_size=100, max_bytes=100, size_of=len)
+        cache.set('a', 'x' * 40)
+        cache.set('b', 'y' * 40)
+        cache.set('c', 'z' * 40)
+        
+        stats = cache.get_stats()
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(stats['total_bytes'], 80)
+        
+        # 전체 용량보다 큰 값은 저장하지 않고 기존 항목도 유지
+        cache.set('huge', 'h' * 200)
+        self.assertIsNone(cache.get('huge'))
+        self.assertEqual(cache.get('b'), 'y' * 40)
+    
+    def test_memory_cache_constant_time(self):
+        """
+        항목 수가 늘어도 조회/저장 시간이 크게 늘지 않는지 테스트
+        """
+        results = benchmark_memory_cache(sizes=(1_000, 100_000), operations=20_000)
+        
+        small, large = results[1_000], results[100_000]
+        self.assertLess(large['get_ns'], small['get_ns'] * 5)
+        self.assertLess(large['set_ns'], small['set_ns'] * 5)
+    
     def test_disk_cache(self):
         """
         디스크 캐시 테스트
@@ -157,6 +287,296 @@ class TestCacheManager(unittest.TestCase):
         self.disk_cache.clear()
         self.assertIsNone(self.disk_cache.get('test_key'))
     
+    def test_sqlite_disk_cache(self):
+        """
+        SQLite 디스크 캐시 테스트
+        """
+        cache = SqliteDiskCache(cache_dir=self.temp_dir, default_ttl=60, config_manager=MagicMock())
+        self.addCleanup(cache.close)
+        
+        cache.set('test_key', {'value': 1})
+        cache.set('none_key', None)
+        self.assertEqual(cache.get('test_key'), {'value': 1})
+        self.assertEqual(cache.get('none_key', 'default'), None)
+        self.assertEqual(cache.get('non_existent_key', 'default_value'), 'default_value')
+        
+        # 유효 시간이 지난 항목은 조회되지 않고 정리됨
+        cache.set('ttl_key', 'ttl_value', ttl=0)
+        self.assertIsNone(cache.get('ttl_key'))
+        
+        self.assertTrue(cache.delete('test_key'))
+        self.assertFalse(cache.delete('test_key'))
+        
+        stats = cache.get_stats()
+        self.assertEqual(stats['total_items'], 1)
+        self.assertIn('total_size_bytes', stats)
+        
+        cache.clear()
+        self.assertEqual(cache.get_stats()['total_items'], 0)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, SqliteDiskCache.DB_FILENAME)))
+    
+    def test_sqlite_disk_cache_read_does_not_write(self):
+        """
+        조회 시 쓰기 없이 접근 기록을 모아서 반영하는지 테스트
+        """
+        cache = SqliteDiskCache(
+            cache_dir=self.temp_dir, config_manager=MagicMock(),
+            access_flush_size=3, access_flush_interval=3600
+        )
+        self.addCleanup(cache.close)
+        cache.set('key', 'value')
+        
+        changes = cache._connection.total_changes
+        cache.get('key')
+        cache.get('key')
+        self.assertEqual(cache._connection.total_changes, changes)
+        
+        # 누적 조회 수가 기준에 도달하면 한 번에 반영
+        cache.get('other')
+        cache.set('second', 'value')
+        cache.get('second')
+        cache.get('key')
+        self.assertEqual(cache.get_stats()['avg_access_count'], 2)
+    
+    def test_sqlite_disk_cache_compression(self):
+        """
+        SQLite 디스크 캐시 압축 테스트
+        """
+        cache = SqliteDiskCache(
+            cache_dir=self.temp_dir, config_manager=MagicMock(),
+            compression='zlib', compress_threshold=64
+        )
+        self.addCleanup(cache.close)
+        
+        large = 'a' * 10000
+        cache.set('large', large)
+        cache.set('small', 'tiny')
+        
+        self.assertEqual(cache.get('large'), large)
+        self.assertEqual(cache.get('small'), 'tiny')
+        stats = cache.get_stats()
+        self.assertLess(stats['total_size_bytes'], stats['uncompressed_size_bytes'])
+        
+        with self.assertRaises(ValueError):
+            SqliteDiskCache(cache_dir=self.temp_dir, config_manager=MagicMock(), compression='lz4')
+    
+    def test_cache_manager_disk_backend_config(self):
+        """
+        설정으로 디스크 캐시 백엔드를 선택하는지 테스트
+        """
+        settings = {
+            'system.cache.memory_cache_enabled': False,
+            'system.cache.disk_cache_dir': self.temp_dir,
+            'system.cache.disk_cache_backend': 'sqlite',
+            'system.cache.disk_cache_compression': 'zlib'
+        }
+        config_manager = MagicMock()
+        config_manager.get_config_value.side_effect = lambda key, default=None: settings.get(key, default)
+        
+        cache_manager = CacheManager(config_manager)
+        self.addCleanup(cache_manager.disk_cache.close)
+        
+        self.assertIsInstance(cache_manager.disk_cache, SqliteDiskCache)
+        self.assertEqual(cache_manager.disk_cache.compression, 'zlib')
+        cache_manager.set('key', 'value')
+        self.assertEqual(cache_manager.get('key'), 'value')
+        
+        settings['system.cache.disk_cache_backend'] = 'redis'
+        with self.assertRaises(ValueError):
+            CacheManager(config_manager)
+    
+    def test_cache_manager_tag_invalidation(self):
+        """
+        태그 무효화 시 해당 태그 항목만 무효화되는지 테스트
+        """
+        settings = {
+            'system.cache.disk_cache_dir': self.temp_dir,
+            'system.cache.disk_cache_backend': 'sqlite'
+        }
+        config_manager = MagicMock()
+        config_manager.get_config_value.side_effect = lambda key, default=None: settings.get(key, default)
+        cache_manager = CacheManager(config_manager)
+        self.addCleanup(cache_manager.disk_cache.close)
+        
+        cache_manager.set('march', 'march_report', tags=['table:test_tx', 'test_tx:2024-03'])
+        cache_manager.set('april', 'april_report', tags=['table:test_tx', 'test_tx:2024-04'])
+        cache_manager.set('plain', 'plain_value')
+        
+        invalidate_tags('test_tx:2024-03')
+        
+        # 디스크 캐시 항목은 태그 인덱스로 즉시 삭제, 메모리 캐시는 세대 비교로 미스 처리
+        self.assertEqual(cache_manager.disk_cache.get_stats()['total_items'], 2)
+        self.assertIsNone(cache_manager.get('march'))
+        self.assertEqual(cache_manager.get('april'), 'april_report')
+        self.assertEqual(cache_manager.get('plain'), 'plain_value')
+        
+        # 디스크에서 메모리로 올린 항목도 태그 세대를 유지
+        cache_manager.memory_cache.clear()
+        self.assertEqual(cache_manager.get('april'), 'april_report')
+        cache_manager.invalidate_tags('table:test_tx')
+        self.assertIsNone(cache_manager.get('april'))
+        self.assertEqual(cache_manager.get('plain'), 'plain_value')
+    
+    def test_cache_tiers_delete_by_tag_and_prefix(self):
+        """
+        캐시 계층별 태그/접두사 삭제 테스트
+        """
+        sqlite_cache = SqliteDiskCache(cache_dir=os.path.join(self.temp_dir, 'sqlite'), config_manager=MagicMock())
+        self.addCleanup(sqlite_cache.close)
+        
+        for cache in (self.memory_cache, self.disk_cache, sqlite_cache):
+            cache.set('report:2024-03', 1, tags=['month:2024-03'])
+            cache.set('report:2024-04', 2, tags=['month:2024-04'])
+            cache.set('summary', 3, tags=['month:2024-03', 'month:2024-04'])
+            
+            self.assertEqual(cache.delete_tag('month:2024-03'), 2)
+            self.assertIsNone(cache.get('summary'))
+            self.assertEqual(cache.get('report:2024-04'), 2)
+            
+            cache.set('report:2024-05', 5)
+            self.assertEqual(cache.delete_prefix('report:'), 2)
+            self.assertEqual(cache.delete_tag('month:2024-04'), 0)
+    
+    def test_cached_decorator_with_tags(self):
+        """
+        태그를 붙여 캐싱하고 태그로 무효화하는 데코레이터 테스트
+        """
+        call_count = 0
+        
+        @cached(ttl=60, tags=lambda month: ['table:decorated', f'decorated:{month}'])
+        def monthly_total(month):
+            nonlocal call_count
+            call_count += 1
+            return f"total_{month}"
+        
+        @invalidate_cache(tags=lambda month: [f'decorated:{month}'])
+        def add_transaction(month):
+            return month
+        
+        monthly_total('2024-03')
+        monthly_total('2024-04')
+        monthly_total('2024-03')
+        self.assertEqual(call_count, 2)
+        
+        # 3월 데이터만 변경되면 4월 결과는 캐시 유지
+        add_transaction('2024-03')
+        monthly_total('2024-03')
+        monthly_total('2024-04')
+        self.assertEqual(call_count, 3)
+        
+        # 키 접두사 무효화
+        self.assertGreaterEqual(invalidate_cache_by_pattern(f'{__name__}*'), 1)
+        monthly_total('2024-04')
+        self.assertEqual(call_count, 4)
+    
+    def _wait_for_refresh(self, cache_manager, timeout=5.0):
+        """
+        백그라운드 갱신이 끝날 때까지 대기
+        """
+        deadline = time.time() + timeout
+        while cache_manager.get_stats()['compute']['in_flight'] and time.time() < deadline:
+            time.sleep(0.01)
+    
+    def test_get_or_compute_single_flight(self):
+        """
+        동시에 미스가 나도 한 번만 계산하는지 테스트
+        """
+        call_count = 0
+        barrier = threading.Barrier(8)
+        results = []
+        
+        def compute():
+            nonlocal call_count
+            call_count += 1
+            time.sleep(0.2)
+            return 'summary'
+        
+        def worker():
+            barrier.wait()
+            results.append(self.cache_manager.get_or_compute('monthly_summary', compute, ttl=60))
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(call_count, 1)
+        self.assertEqual(results, ['summary'] * 8)
+        self.assertEqual(self.cache_manager.get('monthly_summary'), 'summary')
+        stats = self.cache_manager.get_stats()['compute']
+        self.assertEqual(stats['computed'], 1)
+        self.assertEqual(stats['in_flight'], 0)
+    
+    def test_get_or_compute_error_is_not_cached(self):
+        """
+        계산 실패는 캐시하지 않고 다음 호출에서 다시 계산하는지 테스트
+        """
+        def fail():
+            raise ValueError('boom')
+        
+        with self.assertRaises(ValueError):
+            self.cache_manager.get_or_compute('failing', fail, ttl=60)
+        
+        self.assertEqual(self.cache_manager.get_or_compute('failing', lambda: 'ok', ttl=60), 'ok')
+        self.assertEqual(self.cache_manager.get_stats()['compute']['in_flight'], 0)
+    
+    def test_get_or_compute_invalidated_during_compute(self):
+        """
+        계산 중 태그가 무효화되면 계산한 값을 최신 값으로 저장하지 않는지 테스트
+        """
+        data = {'total': 1}
+        
+        def compute():
+            value = data['total']
+            # 계산 도중 다른 쓰기가 데이터를 바꾸고 태그를 무효화
+            data['total'] = 2
+            invalidate_tags('table:transactions')
+            return value
+        
+        self.assertEqual(self.cache_manager.get_or_compute('k', compute, ttl=60, tags=['table:transactions']), 1)
+        self.assertIsNone(self.cache_manager.get('k'))
+        self.assertEqual(
+            self.cache_manager.get_or_compute('k', lambda: data['total'], ttl=60, tags=['table:transactions']), 2
+        )
+        self.assertEqual(self.cache_manager.get('k'), 2)
+    
+    def test_get_or_compute_stale_while_revalidate(self):
+        """
+        만료 후 디스크 캐시의 이전 값을 반환하며 백그라운드에서 갱신하는지 테스트
+        """
+        self.cache_manager.get_or_compute('report', lambda: 'v1', ttl=0.05, stale_ttl=60, beta=0)
+        time.sleep(0.1)
+        
+        # 유효 시간이 지난 값은 일반 조회에서는 미스
+        self.assertIsNone(self.memory_cache.get('report'))
+        self.assertIsNone(self.cache_manager.get('report'))
+        
+        self.assertEqual(self.cache_manager.get_or_compute('report', lambda: 'v2', ttl=60, stale_ttl=60), 'v1')
+        self._wait_for_refresh(self.cache_manager)
+        
+        self.assertEqual(self.cache_manager.get('report'), 'v2')
+        self.assertEqual(self.cache_manager.get_stats()['compute']['stale_served'], 1)
+        
+        # 이전 값 반환 기간도 지나면 동기적으로 계산
+        self.cache_manager.get_or_compute('expired', lambda: 'v1', ttl=0.05, stale_ttl=0.05)
+        time.sleep(0.15)
+        self.assertEqual(self.cache_manager.get_or_compute('expired', lambda: 'v2', ttl=60), 'v2')
+    
+    def test_get_or_compute_early_refresh(self):
+        """
+        만료 전 확률적 조기 갱신 테스트
+        """
+        self.cache_manager.get_or_compute('early', lambda: 'v1', ttl=60)
+        self.assertEqual(self.cache_manager.get_or_compute('early', lambda: 'v2', ttl=60, beta=0), 'v1')
+        
+        # beta가 매우 크면 만료 전이라도 거의 확실히 갱신
+        self.assertEqual(self.cache_manager.get_or_compute('early', lambda: 'v2', ttl=60, beta=1e12), 'v1')
+        self._wait_for_refresh(self.cache_manager)
+        
+        self.assertEqual(self.cache_manager.get('early'), 'v2')
+        self.assertEqual(self.cache_manager.get_stats()['compute']['early_refreshes'], 1)
+    
     def test_cache_manager(self):
         """
         캐시 관리자 테스트
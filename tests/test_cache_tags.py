@@ -0,0 +1,81 @@
+"""
+캐시 태그 세대 관리 테스트
+"""
+import gc
+from unittest.mock import MagicMock
+
+from src.cache_tags import TagVersions, month_tag, rule_type_tag, table_tag, tag_versions
+from src.repositories.db_connection import DatabaseConnection
+from src.repositories.transaction_repository import TransactionRepository
+from src.rule_engine import RuleEngine
+
+
+def test_stamp_is_stale_after_bump():
+    """무효화된 태그가 포함된 스탬프만 이전 세대로 판단"""
+    versions = TagVersions()
+    stamp = versions.stamp(["b", "a", "a"])
+    
+    assert stamp == (("a", 0), ("b", 0))
+    assert versions.is_current(stamp)
+    
+    versions.bump(["b"])
+    
+    assert not versions.is_current(stamp)
+    assert versions.is_current(versions.stamp(["a"]))
+    assert versions.version("b") == 1
+
+
+def test_listeners_are_weak_references():
+    """리스너 객체가 사라지면 자동으로 등록 해제"""
+    class Listener:
+        def __init__(self):
+            self.calls = []
+        
+        def on_invalidated(self, tags):
+            self.calls.append(tags)
+    
+    versions = TagVersions()
+    listener = Listener()
+    versions.add_listener(listener.on_invalidated)
+    
+    versions.bump(["x", "y"])
+    assert listener.calls == [("x", "y")]
+    
+    del listener
+    gc.collect()
+    versions.bump(["x"])
+    assert versions._listeners == []
+
+
+def test_tag_helpers():
+    """태그 이름 생성 함수"""
+    assert table_tag("transactions") == "table:transactions"
+    assert month_tag("transactions", "2024-03-15") == "transactions:2024-03"
+    assert rule_type_tag("category") == "rules:category"
+
+
+def test_rule_engine_invalidates_only_its_rule_type():
+    """규칙 변경 시 해당 규칙 유형 태그만 무효화"""
+    engine = RuleEngine(MagicMock())
+    category, payment = tag_versions.version("rules:category"), tag_versions.version("rules:payment_method")
+    
+    engine._invalidate_cache("category")
+    
+    assert tag_versions.version("rules:category") == category + 1
+    assert tag_versions.version("rules:payment_method") == payment
+
+
+def test_transaction_delete_invalidates_table_and_month(tmp_path):
+    """거래 삭제 시 거래 테이블과 해당 월 태그만 무효화"""
+    repository = TransactionRepository(DatabaseConnection(str(tmp_path / "test.db")))
+    repository.db.execute(
+        "INSERT INTO transactions (transaction_id, transaction_date, description, amount, transaction_type, source) "
+        "VALUES ('tx-1', '2024-03-15', '점심', '9000', 'expense', 'test')"
+    )
+    row_id = repository.db.fetch_one("SELECT id FROM transactions WHERE transaction_id = 'tx-1'")['id']
+    tags = ["table:transactions", "transactions:2024-03", "transactions:2024-04"]
+    before = [tag_versions.version(tag) for tag in tags]
+    
+    assert repository.delete(row_id)
+    
+    assert [tag_versions.version(tag) for tag in tags] == [before[0] + 1, before[1] + 1, before[2]]
@@ -20,6 +20,8 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
 from src.db_optimizer import DatabaseOptimizer
+from src.repositories.db_connection import DatabaseConnection
+from src.statement_profiler import StatementProfiler
 
 class TestDatabaseOptimizer(unittest.TestCase):
     """
@@ -165,6 +167,55 @@ class TestDatabaseOptimizer(unittest.TestCase):
             self.assertIn('reason', rec)
             self.assertIn('sql', rec)
     
+    def test_recommend_indexes_from_statement_profile(self):
+        """
+        문장 프로파일의 전체 스캔 기반 인덱스 추천 테스트
+        """
+        # 느린 문장으로 기록되도록 임계값 0으로 프로파일링
+        profiler = StatementProfiler(slow_threshold_ms=0)
+        db = DatabaseConnection(self.db_path, profiler=profiler)
+        for memo in ('a', 'b', 'c'):
+            db.fetch_all("SELECT * FROM transactions WHERE memo = ? AND transaction_type = 'expense'", (memo,))
+        db.close()
+        
+        profile_path = profiler.export(os.path.dirname(self.db_path), f"{os.path.basename(self.db_path)}.json")
+        try:
+            recommendations = self.optimizer.recommend_indexes(profile_path)
+        finally:
+            os.unlink(profile_path)
+        
+        # 실제 실행 기록 기반 추천이 먼저 나옴
+        workload = [rec for rec in recommendations if 'statements' in rec]
+        self.assertEqual({rec['column'] for rec in workload}, {'memo', 'transaction_type'})
+        self.assertEqual(recommendations[:len(workload)], workload)
+        self.assertEqual(workload[0]['count'], 3)
+        
+        # 같은 열을 이름 규칙으로 중복 추천하지 않음
+        columns = [rec['column'] for rec in recommendations if rec['table'] == 'transactions']
+        self.assertEqual(columns.count('transaction_type'), 1)
+    
+    def test_advise_indexes(self):
+        """
+        워크로드 기반 인덱스 추천 테스트
+        """
+        report = self.optimizer.advise_indexes([
+            "SELECT * FROM transactions WHERE category = '식비' AND transaction_date >= '2024-01-10'",
+            "SELECT * FROM transactions WHERE id = 1"
+        ], repeat=1)
+        
+        self.assertNotIn('error', report)
+        self.assertEqual(len(report['statements']), 2)
+        self.assertEqual(report['statements'][0]['full_scan_tables'], ['transactions'])
+        self.assertGreaterEqual(report['candidates_evaluated'], 1)
+        for rec in report['recommendations']:
+            self.assertIn('table', rec)
+            self.assertIn('column', rec)
+            self.assertIn('sql', rec)
+        
+        # 원본 데이터베이스에는 인덱스를 만들지 않음
+        self.cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'")
+        self.assertEqual(self.cursor.fetchone()[0], 0)
+    
     def test_create_index(self):
         """
         인덱스 생성 테스트
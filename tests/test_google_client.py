@@ -0,0 +1,295 @@
+"""
+Google API 클라이언트 공통 캐시 테스트
+"""
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+from unittest.mock import Mock, patch
+
+from google.auth.credentials import AnonymousCredentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.http import HttpRequest
+
+from src.google_client import (
+    CredentialCache,
+    DiscoveryDocumentCache,
+    SharedHttp,
+    build_service,
+    get_shared_http,
+    traced_request_builder
+)
+from src.tracing import KIND_GOOGLE_API, tracer
+
+
+class FakeCredentials:
+    """만료 시각과 갱신 횟수를 제어하는 테스트용 자격 증명"""
+    
+    def __init__(self, expires_in: float, refresh_token: str = "refresh"):
+        self.refresh_token = refresh_token
+        self.expiry = datetime.utcnow() + timedelta(seconds=expires_in)
+        self.refresh_count = 0
+    
+    @property
+    def valid(self):
+        return self.expiry > datetime.utcnow()
+    
+    def refresh(self, request):
+        self.refresh_count += 1
+        self.expiry = datetime.utcnow() + timedelta(hours=1)
+
+
+def test_discovery_cache_memory_and_disk_hits(tmp_path):
+    """디스커버리 문서는 첫 조회 후 메모리, 새 인스턴스에서는 디스크에서 읽음"""
+    cache = DiscoveryDocumentCache(str(tmp_path), ttl=3600)
+    
+    document = cache.get("calendar", "v3")
+    assert document["name"] == "calendar"
+    assert cache.get("calendar", "v3") is document
+    
+    stats = cache.get_stats()
+    assert stats['memory_hits'] == 1
+    assert stats['static_loads'] + stats['network_loads'] == 1
+    assert os.listdir(tmp_path)
+    
+    other = DiscoveryDocumentCache(str(tmp_path), ttl=3600)
+    assert other.get("calendar", "v3")["name"] == "calendar"
+    assert other.get_stats()['disk_hits'] == 1
+
+
+def test_discovery_cache_expired_disk_entry_is_ignored(tmp_path):
+    """유효 기간이 지난 디스크 캐시는 사용하지 않음"""
+    DiscoveryDocumentCache(str(tmp_path), ttl=3600).get("gmail", "v1")
+    
+    expired = DiscoveryDocumentCache(str(tmp_path), ttl=0)
+    expired.get("gmail", "v1")
+    assert expired.get_stats()['disk_hits'] == 0
+
+
+def test_credential_cache_invalidated_when_token_file_changes(tmp_path):
+    """토큰 파일이 외부에서 바뀌면 캐시된 자격 증명을 버림"""
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}")
+    cache = CredentialCache(refresh_margin=60)
+    creds = FakeCredentials(expires_in=3600)
+    
+    cache.put(str(token_path), ["scope"], creds)
+    assert cache.get(str(token_path), ["scope"]) is creds
+    assert cache.get(str(token_path), ["other"]) is None
+    
+    stat = os.stat(token_path)
+    os.utime(token_path, (stat.st_atime, stat.st_mtime + 10))
+    assert cache.get(str(token_path), ["scope"]) is None
+
+
+def test_credential_cache_skips_missing_token_file(tmp_path):
+    """토큰 파일이 없으면 저장하지 않음"""
+    cache = CredentialCache()
+    cache.put(str(tmp_path / "missing.json"), None, FakeCredentials(expires_in=3600))
+    assert cache.get(str(tmp_path / "missing.json")) is None
+
+
+def test_credential_cache_refreshes_before_expiry(tmp_path):
+    """만료가 가까운 자격 증명은 조회 시 미리 갱신하고 저장 함수를 호출"""
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}")
+    cache = CredentialCache(refresh_margin=300)
+    creds = FakeCredentials(expires_in=120)
+    on_refresh = Mock(side_effect=lambda c: token_path.write_text('{"token": "new"}'))
+    
+    cache.put(str(token_path), None, creds)
+    
+    with patch('src.google_client.Request'):
+        assert cache.get(str(token_path), on_refresh=on_refresh) is creds
+        assert cache.get(str(token_path), on_refresh=on_refresh) is creds
+    
+    assert creds.refresh_count == 1
+    on_refresh.assert_called_once_with(creds)
+
+
+def test_credential_cache_refresh_does_not_hold_global_lock(tmp_path):
+    """갱신 중에도 다른 토큰 파일은 조회되고, 같은 토큰 파일은 한 번만 갱신"""
+    slow_path, other_path = tmp_path / "slow.json", tmp_path / "other.json"
+    slow_path.write_text("{}")
+    other_path.write_text("{}")
+    cache = CredentialCache(refresh_margin=300)
+    slow, other = FakeCredentials(expires_in=120), FakeCredentials(expires_in=3600)
+    cache.put(str(slow_path), None, slow)
+    cache.put(str(other_path), None, other)
+    
+    started, release = threading.Event(), threading.Event()
+    refresh = slow.refresh
+    
+    def blocking_refresh(request):
+        started.set()
+        assert release.wait(5)
+        refresh(request)
+    
+    slow.refresh = blocking_refresh
+    results = []
+    
+    with patch('src.google_client.Request'):
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get(str(slow_path))))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+        
+        assert cache.get(str(other_path)) is other
+        
+        release.set()
+        for thread in threads:
+            thread.join(5)
+    
+    assert results == [slow, slow, slow]
+    assert slow.refresh_count == 1
+
+
+def test_credential_cache_invalidate(tmp_path):
+    """특정 토큰 파일 항목만 제거"""
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+    first.write_text("{}")
+    second.write_text("{}")
+    cache = CredentialCache()
+    cache.put(str(first), None, FakeCredentials(expires_in=3600))
+    cache.put(str(second), None, FakeCredentials(expires_in=3600))
+    
+    cache.invalidate(str(first))
+    
+    assert cache.get(str(first)) is None
+    assert cache.get(str(second)) is not None
+
+
+def test_shared_http_uses_one_connection_per_thread():
+    """같은 스레드는 연결을 재사용하고 스레드마다 별도 연결을 사용"""
+    shared = SharedHttp(timeout=5)
+    connections = []
+    
+    main = shared._http()
+    assert shared._http() is main
+    
+    thread = threading.Thread(target=lambda: connections.append(shared._http()))
+    thread.start()
+    thread.join()
+    
+    assert connections[0] is not main
+    assert shared.get_stats()['connections_created'] == 2
+
+
+def test_build_service_uses_cached_document():
+    """서비스 생성 시 디스커버리 문서를 캐시에서 읽음"""
+    with patch('src.google_client.discovery_documents') as documents, \
+            patch('src.google_client.build_from_document') as build_from_document:
+        documents.get.return_value = {"name": "calendar"}
+        
+        service = build_service('calendar', 'v3', http=Mock())
+    
+    documents.get.assert_called_once_with('calendar', 'v3')
+    assert service is build_from_document.return_value
+
+
+def test_traced_request_builder_records_google_api_span():
+    """추적이 켜져 있으면 요청 실행을 google_api 구간으로 기록"""
+    class FakeRequest(HttpRequest):
+        def execute(self, http=None, num_retries=0):
+            return {"labels": []}
+    
+    request_class = traced_request_builder(FakeRequest)
+    assert traced_request_builder(FakeRequest) is request_class
+    request = request_class(
+        Mock(), lambda resp, content: content, "https://gmail.googleapis.com/gmail/v1/users/me/labels?alt=json",
+        method="GET", methodId="gmail.users.labels.list"
+    )
+    
+    tracer.clear()
+    assert request.execute() == {"labels": []}
+    assert tracer.get_spans() == []
+    
+    tracer.enable()
+    try:
+        assert request.execute() == {"labels": []}
+    finally:
+        tracer.disable()
+    
+    (api_span,) = tracer.get_spans()
+    tracer.clear()
+    assert api_span.name == "google_api.gmail.users.labels.list"
+    assert api_span.kind == KIND_GOOGLE_API
+    assert api_span.attributes == {
+        "method": "GET", "uri": "https://gmail.googleapis.com/gmail/v1/users/me/labels"
+    }
+
+
+def benchmark_startup(
+    apis: Iterable[Tuple[str, str]] = (("calendar", "v3"), ("gmail", "v1")),
+    repeat: int = 5,
+    cache_dir: Optional[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    서비스 객체 첫 생성 시간 측정 (네트워크 요청 없음)
+    
+    기존 방식(googleapiclient build), 캐시가 빈 상태의 첫 생성, 캐시가 채워진 뒤의 생성 시간을 비교합니다.
+    
+    Args:
+        apis: (API 이름, 버전) 목록
+        repeat: 각 측정 반복 횟수 (최솟값 사용)
+        cache_dir: 측정에 사용할 디스크 캐시 디렉토리 (기본값: 임시 디렉토리)
+    
+    Returns:
+        API별 {'baseline', 'cold', 'warm', 'speedup'} (초 단위)
+    """
+    credentials = AnonymousCredentials()
+    shared_http = get_shared_http()
+    results: Dict[str, Dict[str, float]] = {}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = DiscoveryDocumentCache(cache_dir or temp_dir)
+        
+        for api, version in apis:
+            baseline = cold = warm = float('inf')
+            
+            for _ in range(repeat):
+                start = time.perf_counter()
+                build(api, version, credentials=credentials, cache_discovery=False)
+                baseline = min(baseline, time.perf_counter() - start)
+                
+                cache.clear(disk=True)
+                start = time.perf_counter()
+                build_from_document(cache.get(api, version), http=AuthorizedHttp(credentials, http=shared_http))
+                cold = min(cold, time.perf_counter() - start)
+                
+                start = time.perf_counter()
+                build_from_document(cache.get(api, version), http=AuthorizedHttp(credentials, http=shared_http))
+                warm = min(warm, time.perf_counter() - start)
+            
+            results[f"{api}:{version}"] = {
+                'baseline': baseline,
+                'cold': cold,
+                'warm': warm,
+                'speedup': baseline / warm if warm else float('inf')
+            }
+    
+    return results
+
+
+def test_benchmark_startup_warm_is_faster(tmp_path):
+    """캐시가 채워진 뒤의 서비스 생성이 기존 방식보다 빠름"""
+    results = benchmark_startup(apis=[("calendar", "v3")], repeat=1, cache_dir=str(tmp_path))
+    
+    timings = results["calendar:v3"]
+    assert timings['warm'] < timings['baseline']
+    assert timings['speedup'] > 1
+
+
+if __name__ == "__main__":
+    for name, timings in benchmark_startup().items():
+        print(
+            f"{name}: 기존 {timings['baseline'] * 1000:.2f}ms, "
+            f"캐시 없음 {timings['cold'] * 1000:.2f}ms, "
+            f"캐시 사용 {timings['warm'] * 1000:.2f}ms ({timings['speedup']:.1f}배)"
+        )
@@ -0,0 +1,155 @@
+"""
+워크로드 기반 인덱스 추천 테스트
+"""
+import random
+import sqlite3
+
+import pytest
+
+from src.index_advisor import IndexAdvisor, IndexCandidate, parse_query_shape
+from src.repositories.db_connection import DatabaseConnection
+from src.statement_profiler import StatementProfiler
+
+SUMMARY_QUERY = (
+    "SELECT category, SUM(amount) FROM transactions "
+    "WHERE is_excluded = 0 AND transaction_type = ? AND transaction_date BETWEEN ? AND ? "
+    "GROUP BY category"
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """인덱스가 없는 거래 테이블 데이터베이스"""
+    path = str(tmp_path / "workload.db")
+    rng = random.Random(7)
+    connection = sqlite3.connect(path)
+    connection.execute("""
+        CREATE TABLE transactions (
+            id INTEGER PRIMARY KEY, transaction_date TEXT, description TEXT, amount REAL,
+            transaction_type TEXT, category TEXT, is_excluded INTEGER DEFAULT 0
+        )
+    """)
+    connection.executemany(
+        "INSERT INTO transactions (transaction_date, description, amount, transaction_type, category, is_excluded) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", f"거래 {i}", rng.randint(1, 100) * 1000,
+             rng.choice(['expense', 'income']), rng.choice(['식비', '교통비', '기타']), int(rng.random() < 0.05))
+            for i in range(30000)
+        ]
+    )
+    connection.commit()
+    connection.close()
+    return path
+
+
+def test_parse_query_shape_orders_equality_before_range():
+    """동등 비교, 범위 비교, ORDER BY 열과 별칭을 토큰 단위로 해석"""
+    shape = parse_query_shape(
+        "SELECT t.* FROM transactions AS t JOIN categories c ON c.name = t.category "
+        "WHERE t.is_excluded = 0 AND transaction_type IN (?, ?) AND ? <= transaction_date "
+        "AND description LIKE '%AND%' AND strftime('%Y', transaction_date) = ? ORDER BY transaction_date DESC"
+    )
+    
+    assert shape.tables == {'transactions': 'transactions', 't': 'transactions', 'categories': 'categories', 'c': 'categories'}
+    assert shape.equality == [('c', 'name'), ('t', 'category'), ('t', 'is_excluded'), (None, 'transaction_type')]
+    assert shape.ranges == [(None, 'transaction_date')]
+    assert shape.order_by == [(None, 'transaction_date')]
+    assert shape.placeholders == 4
+
+
+def test_parse_query_shape_skips_disjunctions_and_keeps_between():
+    """최상위 OR 조건은 제외하고 BETWEEN의 AND는 분리하지 않음"""
+    assert parse_query_shape("SELECT * FROM t WHERE a = 1 OR b = 2").equality == []
+    
+    shape = parse_query_shape("UPDATE t SET memo = ? WHERE (a = ? AND b BETWEEN ? AND ?) AND c IS NOT NULL")
+    
+    assert shape.tables == {'t': 't'}
+    assert shape.equality == [(None, 'a')]
+    assert shape.ranges == [(None, 'b')]
+    assert parse_query_shape("INSERT OR IGNORE INTO t (a) VALUES (?)").tables == {'t': 't'}
+
+
+def test_advisor_proposes_composite_covering_index(db_path):
+    """전체 스캔하는 요약 쿼리에 복합/커버링 인덱스를 추천하고 속도 향상을 측정"""
+    workload = [
+        {'sql': SUMMARY_QUERY, 'count': 100, 'params': ['expense', '2024-03-01', '2024-03-31']},
+        {'sql': "INSERT INTO transactions (transaction_date, amount) VALUES (?, ?)", 'count': 10,
+         'params': ['2024-01-01', 1000]}
+    ]
+    
+    report = IndexAdvisor(db_path, repeat=3).advise(workload, max_indexes=2)
+    
+    best = report['recommendations'][0]
+    assert best['columns'][:3] == ['is_excluded', 'transaction_type', 'transaction_date']
+    assert best['statements'] == [report['statements'][0]['fingerprint']]
+    assert report['statements'][0]['full_scan_tables'] == ['transactions']
+    assert any('USING' in detail and 'INDEX' in detail for detail in report['statements'][0]['plan_after'])
+    assert report['estimated_speedup'] > 1.5
+    
+    # 원본 데이터베이스는 변경하지 않음
+    connection = sqlite3.connect(db_path)
+    assert connection.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'").fetchone()[0] == 0
+    assert connection.execute("SELECT COUNT(*) FROM transactions").fetchone()[0] == 30000
+    connection.close()
+
+
+def test_advisor_uses_statement_profile(db_path):
+    """문장 프로파일의 실행 횟수와 샘플 파라미터를 워크로드로 사용"""
+    profiler = StatementProfiler()
+    db = DatabaseConnection(db_path, profiler=profiler)
+    for month in range(1, 4):
+        db.fetch_all(SUMMARY_QUERY, ('income', f'2024-{month:02d}-01', f'2024-{month:02d}-28'))
+    db.fetch_one("SELECT * FROM transactions WHERE id = ?", (1,))
+    db.close()
+    
+    advisor = IndexAdvisor(db_path, repeat=1)
+    workload = advisor.load_workload(profiler.get_stats(include_samples=True))
+    
+    assert {statement['weight'] for statement in workload} == {3, 1}
+    summary = next(statement for statement in workload if statement['weight'] == 3)
+    assert summary['params'] == ['income', '2024-01-01', '2024-01-28']
+    
+    report = advisor.advise(workload)
+    
+    # 기본 키 조회는 후보를 만들지 않음
+    assert all('id' not in rec['columns'] for rec in report['recommendations'])
+
+
+def test_advisor_runs_exported_profile_fingerprints(db_path, tmp_path):
+    """저장된 프로파일에는 지문만 있으므로 지문을 NULL 파라미터로 실행"""
+    profiler = StatementProfiler()
+    db = DatabaseConnection(db_path, profiler=profiler)
+    db.fetch_all("SELECT * FROM transactions WHERE category IN (?, ?) AND amount > 5000", ('식비', '기타'))
+    db.close()
+    
+    advisor = IndexAdvisor(db_path, repeat=1)
+    workload = advisor.load_workload(profiler.export(str(tmp_path / "profiles")))
+    
+    assert workload[0]['sql'] == "SELECT * FROM transactions WHERE category IN (?) AND amount > ?"
+    assert workload[0]['params'] is None
+    assert advisor.advise(workload)['statements'][0]['before_ms'] is not None
+
+
+def test_advisor_excludes_statements_that_fail_to_run(db_path):
+    """실행에 실패한 문장은 비용 0으로 계산하지 않고 비교에서 제외"""
+    workload = [
+        {'sql': SUMMARY_QUERY, 'count': 10, 'params': ['expense', '2024-03-01', '2024-03-31']},
+        {'sql': "INSERT INTO transactions (id, amount) VALUES (?, ?)", 'count': 1000, 'params': [1, 1000]}
+    ]
+    
+    report = IndexAdvisor(db_path, repeat=1).advise(workload)
+    
+    assert [statement['fingerprint'] for statement in report['statements']] == [report['statements'][0]['fingerprint']]
+    assert 'INSERT' not in report['statements'][0]['fingerprint']
+    assert report['baseline_ms'] > 0
+
+
+def test_index_candidate_sql():
+    """후보 인덱스 이름은 create_index와 같은 규칙"""
+    candidate = IndexCandidate('transactions', ('is_excluded', 'transaction_date'), False)
+    
+    assert candidate.sql == (
+        "CREATE INDEX idx_transactions_is_excluded_transaction_date "
+        "ON transactions(is_excluded, transaction_date);"
+    )
@@ -22,6 +22,7 @@ if parent_dir not in sys.path:
 
 from src.logging_system import (
     LoggingSystem, StructuredLogger, JsonFormatter,
+    RepeatedMessageFilter, BatchRotatingFileHandler,
     setup_logging, get_logger, log_exception, set_level,
     add_file_handler, remove_handler, get_log_files, clear_logs
 )
@@ -358,6 +359,117 @@ class TestLoggingSystem(unittest.TestCase):
         
         # 로그 파일 정리
         clear_logs()
+    
+    def test_async_pipeline(self):
+        """
+        비동기 묶음 기록 테스트
+        """
+        logging_system = LoggingSystem()
+        logging_system.json_logging = True
+        logging_system.rate_limit_enabled = False
+        logging_system.setup_logging(log_file=self.log_file, async_mode=True)
+        
+        try:
+            # 루트 로거에는 큐 핸들러 하나만 연결
+            root_logger = logging.getLogger()
+            self.assertEqual(root_logger.handlers, [logging_system.queue_handler])
+            
+            logger = get_logger('test.async')
+            for i in range(50):
+                logger.info("비동기 메시지 %d", i, context={'index': i, 'when': Path('x')})
+            
+            logging_system.flush()
+            stats = logging_system.get_pipeline_stats()
+            self.assertTrue(stats['async'])
+            self.assertEqual(stats['dropped'], 0)
+            self.assertGreaterEqual(stats['records'], 50)
+            self.assertLess(stats['batches'], stats['records'])
+        finally:
+            logging_system.shutdown()
+        
+        self.assertEqual(logging.getLogger().handlers, [])
+        
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if 'test.async' in line]
+        
+        self.assertEqual(len(records), 50)
+        self.assertEqual(records[-1]['message'], "비동기 메시지 49")
+        self.assertEqual(records[-1]['context'], {'index': 49, 'when': 'x'})
+    
+    def test_repeated_message_filter(self):
+        """
+        반복 메시지 제한 테스트
+        """
+        repeat_filter = RepeatedMessageFilter(window=10, burst=3)
+        logger = logging.getLogger('test.repeat')
+        
+        def make_record(created, level=logging.INFO):
+            record = logger.makeRecord('test.repeat', level, __file__, 10, "반복 %s", ('값',), None)
+            record.created = created
+            return record
+        
+        # 창마다 burst건만 통과
+        passed = [repeat_filter.filter(make_record(100.0 + i * 0.1)) for i in range(10)]
+        self.assertEqual(passed.count(True), 3)
+        self.assertEqual(repeat_filter.suppressed_total, 7)
+        
+        # ERROR 이상은 제한하지 않음
+        self.assertTrue(repeat_filter.filter(make_record(101.0, logging.ERROR)))
+        
+        # 다음 창의 첫 레코드에 생략 건수 표시
+        record = make_record(111.0)
+        self.assertTrue(repeat_filter.filter(record))
+        self.assertEqual(record.getMessage(), "반복 값 (직전 10초 동안 반복 7건 생략)")
+        
+        # 같은 레코드는 한 번만 판단
+        self.assertTrue(repeat_filter.filter(record))
+        self.assertEqual(repeat_filter.suppressed_total, 7)
+    
+    def test_repeated_message_filter_fstring(self):
+        """
+        f-string 메시지도 같은 호출 위치이면 반복으로 제한하는지 테스트
+        """
+        repeat_filter = RepeatedMessageFilter(window=10, burst=3)
+        logger = logging.getLogger('test.repeat')
+        
+        records = []
+        for i in range(100):
+            record = logger.makeRecord('test.repeat', logging.INFO, __file__, 20, f"거래 {i} 처리 완료", None, None)
+            record.created = 100.0 + i * 0.01
+            records.append(record)
+        
+        passed = [repeat_filter.filter(record) for record in records]
+        self.assertEqual(passed.count(True), 3)
+        self.assertEqual(repeat_filter.suppressed_total, 97)
+        
+        # 다른 줄에서 나온 레코드는 따로 셈
+        other = logger.makeRecord('test.repeat', logging.INFO, __file__, 21, "거래 0 처리 완료", None, None)
+        other.created = 101.0
+        self.assertTrue(repeat_filter.filter(other))
+    
+    def test_batch_rotation(self):
+        """
+        묶음 기록 시 크기 기반 순환 테스트
+        """
+        handler = BatchRotatingFileHandler(self.log_file, maxBytes=100, backupCount=2, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger = logging.getLogger('test.rotation')
+        
+        try:
+            for batch in range(3):
+                records = [
+                    logger.makeRecord('test.rotation', logging.INFO, __file__, 1, f"묶음 {batch} 줄 {i}", None, None)
+                    for i in range(5)
+                ]
+                self.assertEqual(handler.emit_batch(records), 5)
+        finally:
+            handler.close()
+        
+        # 묶음 단위로 순환하여 각 파일에는 한 묶음만 기록
+        for path, batch in ((self.log_file, 2), (f"{self.log_file}.1", 1), (f"{self.log_file}.2", 0)):
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            self.assertEqual(lines, [f"묶음 {batch} 줄 {i}" for i in range(5)])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -194,6 +194,43 @@ class TestPerformanceMonitor(unittest.TestCase):
         # 모니터링 비활성화
         self.performance_monitor.disable()
     
+    def test_sampling_mode(self):
+        """
+        샘플링 모드 테스트
+        """
+        monitor = self.performance_monitor
+        monitor.profiling_mode = 'sampling'
+        monitor.enable()
+        self.assertTrue(monitor.sampling_profiler.running)
+        
+        # 샘플링 모드에서는 함수 계측을 건너뜀
+        @monitor.profile_function
+        def sampled_function():
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                pass
+            return 'test'
+        
+        self.assertEqual(sampled_function(), 'test')
+        self.assertNotIn('sampled_function', monitor.get_function_stats())
+        
+        monitor.disable()
+        self.assertFalse(monitor.sampling_profiler.running)
+        
+        stats = monitor.get_sampling_stats()
+        self.assertGreater(stats['samples'], 0)
+        
+        # flame graph 파일 저장
+        fd, file_path = tempfile.mkstemp(suffix='.collapsed')
+        os.close(fd)
+        try:
+            self.assertEqual(monitor.export_flamegraph(file_path), file_path)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            self.assertTrue(any('sampled_function' in line for line in lines))
+        finally:
+            os.unlink(file_path)
+    
     def test_decorators_and_context_managers(self):
         """
         데코레이터 및 컨텍스트 매니저 테스트
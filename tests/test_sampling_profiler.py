@@ -0,0 +1,186 @@
+"""
+샘플링 프로파일러 테스트
+"""
+import threading
+import time
+
+import pytest
+
+from src.sampling_profiler import SamplingProfiler
+
+WORKER_ENTRY = ('worker', '*/test_sampling_profiler.py', '_busy_worker')
+BLOCKED_ENTRY = ('blocked', '*/test_sampling_profiler.py', '_blocked_worker')
+
+
+def _spin(stop: threading.Event, ready: threading.Event = None) -> None:
+    if ready is not None:
+        ready.set()
+    while not stop.is_set():
+        sum(range(200))
+
+
+def _busy_worker(stop: threading.Event, ready: threading.Event = None) -> None:
+    _spin(stop, ready)
+
+
+def _blocked_worker(ready: threading.Event, release: threading.Event) -> None:
+    ready.set()
+    release.wait()
+
+
+def _recurse(depth: int, stop: threading.Event) -> None:
+    if depth:
+        _recurse(depth - 1, stop)
+    else:
+        _busy_worker(stop)
+
+
+@pytest.fixture
+def worker():
+    """_busy_worker를 실행하는 스레드"""
+    stop = threading.Event()
+    ready = threading.Event()
+    thread = threading.Thread(target=_busy_worker, args=(stop, ready), name='busy-worker', daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_default_entry_points_match_by_code_location():
+    """process_query, 공개 도구 함수, Gmail 감시 루프를 진입점으로 판별"""
+    profiler = SamplingProfiler()
+    
+    def code_at(path, name):
+        namespace = {}
+        exec(compile(f"def {name}():\n    pass\n", path, 'exec'), namespace)
+        return namespace[name].__code__
+    
+    assert profiler._entry_label(code_at('/app/main.py', 'process_query')) == 'process_query'
+    assert profiler._entry_label(code_at('/app/src/financial_tools/analysis_tools.py', 'analyze_expenses')) == 'tool:analyze_expenses'
+    assert profiler._entry_label(code_at('/app/src/financial_tools/analysis_tools.py', '_load')) is None
+    assert profiler._entry_label(code_at('/app/src/gmail/service.py', '_watch_unread_emails')) == 'gmail_watcher'
+    assert profiler._entry_label(code_at('/app/src/gmail/service.py', 'search_emails')) is None
+
+
+def test_decorator_wrappers_are_not_entry_points():
+    """메모이제이션 래퍼는 tool:wrapper가 아니라 감싼 도구 함수로 집계"""
+    profiler = SamplingProfiler()
+    source = (
+        "import functools\n"
+        "def _memoize_tool(func):\n"
+        "    @functools.wraps(func)\n"
+        "    def wrapper(*args, **kwargs):\n"
+        "        return func(*args, **kwargs)\n"
+        "    return wrapper\n"
+        "@_memoize_tool\n"
+        "def analyze_income():\n"
+        "    pass\n"
+    )
+    namespace = {}
+    exec(compile(source, '/app/src/financial_tools/analysis_tools.py', 'exec'), namespace)
+    tool = namespace['analyze_income']
+    
+    assert profiler._entry_label(tool.__code__) is None
+    assert profiler._entry_label(tool.__wrapped__.__code__) == 'tool:analyze_income'
+
+
+def test_sample_once_attributes_to_entry_point():
+    """샘플링한 스택을 진입점과 잎 함수별로 집계"""
+    ready = threading.Event()
+    release = threading.Event()
+    thread = threading.Thread(target=_blocked_worker, args=(ready, release), name='blocked-worker', daemon=True)
+    thread.start()
+    try:
+        # 진입 함수 안에서 release를 기다리는 동안만 샘플링하므로 모든 샘플이 진입점 아래에 있음
+        assert ready.wait(5)
+        profiler = SamplingProfiler(interval_ms=5, include_idle=True, entry_points=[BLOCKED_ENTRY])
+        
+        for _ in range(20):
+            profiler.sample_once()
+    finally:
+        release.set()
+        thread.join()
+    
+    entry = profiler.entry_point_stats()['blocked']
+    assert entry['samples'] == entry['inclusive_samples'] == 20
+    assert entry['time_ms'] == pytest.approx(100)
+    
+    stacks = [line for line in profiler.collapsed_stacks() if line.startswith('blocked-worker;')]
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in stacks) == 20
+    assert all('test_sampling_profiler:_blocked_worker' in line.split(';') for line in stacks)
+
+
+def test_idle_threads_are_skipped():
+    """이벤트 대기 중인 스레드는 대기 샘플로만 셈"""
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, name='idle', daemon=True)
+    thread.start()
+    try:
+        time.sleep(0.05)
+        profiler = SamplingProfiler()
+        profiler.sample_once()
+        
+        assert profiler.idle_samples >= 1
+        assert not any(line.startswith('idle;') for line in profiler.collapsed_stacks())
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_export_collapsed_stacks(worker, tmp_path):
+    """collapsed stack 파일은 '뿌리;...;잎 샘플수' 형식"""
+    profiler = SamplingProfiler(entry_points=[WORKER_ENTRY])
+    for _ in range(5):
+        profiler.sample_once()
+    
+    path = profiler.export_collapsed(str(tmp_path / "flame" / "out.collapsed"))
+    lines = open(path, encoding='utf-8').read().splitlines()
+    worker_lines = [line for line in lines if line.startswith('busy-worker;')]
+    
+    assert worker_lines
+    stack, count = worker_lines[0].rsplit(' ', 1)
+    assert int(count) >= 1
+    assert 'test_sampling_profiler:_busy_worker' in stack.split(';')
+    
+    by_entry = profiler.collapsed_stacks(by_entry_point=True)
+    assert any(line.startswith('worker;') for line in by_entry)
+
+
+def test_deep_stacks_keep_root_and_leaf():
+    """최대 깊이를 넘는 스택도 뿌리 쪽 진입점을 유지"""
+    stop = threading.Event()
+    thread = threading.Thread(target=_recurse, args=(50, stop), name='deep', daemon=True)
+    thread.start()
+    try:
+        time.sleep(0.05)
+        profiler = SamplingProfiler(max_depth=16, entry_points=[('deep', '*/test_sampling_profiler.py', '_recurse')])
+        profiler.sample_once()
+        
+        deep_lines = [line for line in profiler.collapsed_stacks() if line.startswith('deep;')]
+        assert deep_lines
+        frames = deep_lines[0].rsplit(' ', 1)[0].split(';')
+        assert '...' in frames
+        assert len(frames) == 1 + 16 + 1
+        assert 'deep' in profiler.entry_point_stats()
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_background_sampling_stays_within_budget(worker):
+    """백그라운드 샘플링은 허용 비용 비율에 맞춰 간격을 조정"""
+    profiler = SamplingProfiler(interval_ms=2, max_overhead=0.02, entry_points=[WORKER_ENTRY])
+    
+    assert profiler.start()
+    assert not profiler.start()
+    time.sleep(0.3)
+    assert profiler.stop()
+    
+    stats = profiler.get_stats()
+    assert not stats['running']
+    assert stats['samples'] > 0
+    assert stats['current_interval_ms'] >= 2
+    assert stats['sampling_ms'] <= stats['current_interval_ms'] * stats['samples']
+    assert 'worker' in stats['entry_points']
@@ -0,0 +1,138 @@
+"""
+SQL 문장 프로파일러 테스트
+"""
+import json
+
+import pytest
+
+from src.repositories.db_connection import DatabaseConnection
+from src.statement_profiler import (
+    LatencyHistogram, StatementProfiler, disable_statement_profiling, enable_statement_profiling,
+    fingerprint_sql, get_active_profiler, load_statement_profile
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """테스트용 거래 테이블이 있는 연결"""
+    connection = DatabaseConnection(str(tmp_path / "test.db"))
+    connection.execute("CREATE TABLE transactions (id INTEGER PRIMARY KEY, memo TEXT, amount INTEGER)")
+    connection.execute_many(
+        "INSERT INTO transactions (memo, amount) VALUES (?, ?)",
+        [(f"memo {i}", i * 100) for i in range(50)]
+    )
+    yield connection
+    connection.close()
+
+
+def test_fingerprint_replaces_literals():
+    """값만 다른 문장은 같은 지문으로 정규화"""
+    first = fingerprint_sql("SELECT * FROM transactions\n  WHERE memo = 'a''b' AND amount > 10")
+    second = fingerprint_sql("SELECT * FROM transactions WHERE memo = 'x' AND amount > -2.5")
+    
+    assert first == second == "SELECT * FROM transactions WHERE memo = ? AND amount > ?"
+    assert fingerprint_sql("SELECT * FROM t WHERE id IN (?, ?, ?)") == fingerprint_sql("SELECT * FROM t WHERE id IN (?,?)")
+    assert fingerprint_sql("SELECT idx2 FROM t2") == "SELECT idx2 FROM t2"
+
+
+def test_histogram_percentiles():
+    """버킷 상한으로 백분위수를 추정"""
+    histogram = LatencyHistogram()
+    for elapsed_ms in [0.2] * 90 + [40.0] * 10:
+        histogram.record(elapsed_ms)
+    
+    summary = histogram.to_dict()
+    
+    assert summary['count'] == 100
+    assert summary['p50_ms'] == 0.25
+    assert summary['p99_ms'] == 40.0
+    assert summary['buckets'] == {'<=0.25': 90, '<=50': 10}
+
+
+def test_connection_records_latency_and_rows(db):
+    """연결 전용 프로파일러가 문장별 횟수와 행 수를 기록"""
+    profiler = StatementProfiler()
+    db.profiler = profiler
+    
+    for amount in (100, 2000, 3000):
+        db.fetch_all("SELECT * FROM transactions WHERE amount >= ?", (amount,))
+    db.fetch_one("SELECT * FROM transactions WHERE id = 1")
+    db.execute("UPDATE transactions SET memo = 'x' WHERE amount < 500")
+    
+    stats = {item['fingerprint']: item for item in profiler.get_stats()}
+    
+    select = stats["SELECT * FROM transactions WHERE amount >= ?"]
+    assert select['count'] == 3
+    assert select['rows'] == 49 + 30 + 20
+    assert stats["SELECT * FROM transactions WHERE id = ?"]['rows'] == 1
+    assert stats["UPDATE transactions SET memo = ? WHERE amount < ?"]['rows'] == 5
+    
+    with pytest.raises(RuntimeError):
+        db.fetch_all("SELECT * FROM missing_table")
+    assert {item['fingerprint']: item for item in profiler.get_stats()}["SELECT * FROM missing_table"]['errors'] == 1
+
+
+def test_slow_statement_plan_is_captured(db):
+    """느린 문장은 실행 계획을 한 번 저장"""
+    profiler = StatementProfiler(slow_threshold_ms=0)
+    db.profiler = profiler
+    
+    db.fetch_all("SELECT * FROM transactions WHERE memo = ?", ("memo 3",))
+    db.fetch_all("SELECT * FROM transactions WHERE memo = ?", ("memo 4",))
+    
+    statement = profiler.get_stats()[0]
+    
+    assert statement['slow_count'] == 2
+    assert any(row['detail'].startswith('SCAN') for row in statement['plan'])
+
+
+def test_statement_stats_are_bounded():
+    """최대 지문 수를 넘으면 가장 오래 사용하지 않은 지문부터 제거"""
+    profiler = StatementProfiler(max_statements=2)
+    
+    profiler.record("SELECT 1 FROM a", 1.0)
+    profiler.record("SELECT 1 FROM b", 1.0)
+    profiler.record("SELECT 1 FROM a", 1.0)
+    profiler.record("SELECT 1 FROM c", 1.0)
+    
+    assert len(profiler) == 2
+    assert profiler.evicted == 1
+    assert {item['fingerprint'] for item in profiler.get_stats()} == {"SELECT ? FROM a", "SELECT ? FROM c"}
+
+
+def test_global_profiling_and_export(db, tmp_path):
+    """전역 프로파일링은 프로파일러가 없는 연결에도 적용되고 profiles/로 저장"""
+    profiler = enable_statement_profiling(StatementProfiler())
+    try:
+        db.fetch_all("SELECT * FROM transactions")
+        assert get_active_profiler() is profiler
+    finally:
+        disable_statement_profiling(profiler)
+    db.fetch_all("SELECT * FROM transactions")
+    
+    assert get_active_profiler() is None
+    path = profiler.export(str(tmp_path / "profiles"))
+    statements = load_statement_profile(path)
+    
+    assert [item['count'] for item in statements] == [1]
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['slow_threshold_ms'] == profiler.slow_threshold_ms
+
+
+def test_export_omits_raw_sql_and_params(db, tmp_path):
+    """저장 파일에는 거래 데이터가 담긴 원본 SQL과 파라미터 없이 지문만 저장"""
+    profiler = StatementProfiler()
+    db.profiler = profiler
+    db.fetch_all("SELECT * FROM transactions WHERE memo = 'memo 7' AND amount > ?", (4200,))
+    
+    in_memory = profiler.get_stats(include_samples=True)[0]
+    assert in_memory['sample_params'] == [4200]
+    
+    path = profiler.export(str(tmp_path / "profiles"))
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    statement = json.loads(text)['statements'][0]
+    
+    assert 'sample' not in statement and 'sample_params' not in statement
+    assert statement['fingerprint'] == "SELECT * FROM transactions WHERE memo = ? AND amount > ?"
+    assert 'memo 7' not in text and '4200' not in text
@@ -0,0 +1,180 @@
+"""
+요청 추적 테스트
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.repositories.base_repository import BaseRepository
+from src.repositories.db_connection import DatabaseConnection
+from src.tracing import (
+    KIND_REPOSITORY, KIND_SQL, KIND_TOOL, bind_context, current_span, span, traced, tracer
+)
+
+
+@pytest.fixture
+def tracing():
+    """전역 추적기를 켜고 테스트 후 끄기"""
+    tracer.clear()
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+    tracer.clear()
+
+
+class NoteRepository(BaseRepository[dict]):
+    """SQL 구간 확인용 저장소"""
+    
+    def __init__(self, db):
+        self.db = db
+    
+    def create(self, entity):
+        self.db.execute("INSERT INTO notes (body) VALUES (?)", (entity['body'],))
+        return entity
+    
+    def read(self, id):
+        return self.db.fetch_one("SELECT * FROM notes WHERE id = ?", (id,))
+    
+    def update(self, entity):
+        return entity
+    
+    def delete(self, id):
+        return False
+    
+    def list(self, filters=None):
+        return self.db.fetch_all("SELECT * FROM notes WHERE body != 'x'")
+    
+    def count(self, filters=None):
+        return len(self.list(filters))
+    
+    def exists(self, id):
+        return self.read(id) is not None
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """메모 테이블이 있는 저장소"""
+    db = DatabaseConnection(str(tmp_path / "trace.db"))
+    db.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+    yield NoteRepository(db)
+    db.close()
+
+
+def test_disabled_tracing_records_nothing():
+    """추적이 꺼져 있으면 no-op 구간을 쓰고 아무것도 남기지 않음"""
+    tracer.clear()
+    
+    @traced(kind=KIND_TOOL)
+    def tool(value):
+        return value * 2
+    
+    with span('outer') as outer:
+        outer.set_attribute('ignored', True)
+        assert tool(21) == 42
+        assert current_span() is None
+    
+    assert tracer.get_spans() == []
+
+
+def test_nested_spans_share_trace(tracing):
+    """중첩 구간은 같은 추적 ID와 부모 ID로 연결되고 예외를 기록"""
+    @traced('lookup', kind=KIND_TOOL)
+    def lookup():
+        with span('inner', amount=3):
+            raise ValueError("bad input")
+    
+    with span('request', 'request') as root:
+        with pytest.raises(ValueError):
+            lookup()
+    
+    inner, tool_span, request = tracing.get_spans()
+    assert request is root and request.parent_id is None
+    assert tool_span.parent_id == request.span_id
+    assert inner.parent_id == tool_span.span_id
+    assert {inner.trace_id, tool_span.trace_id} == {request.trace_id}
+    assert inner.attributes == {'amount': 3}
+    assert tool_span.error == "ValueError: bad input"
+    assert request.error is None
+
+
+def test_repository_and_sql_spans(tracing, repository):
+    """저장소 메서드와 SQL 실행이 부모/자식 구간으로 기록"""
+    repository.create({'body': 'hello'})
+    tracing.clear()
+    
+    with span('tool', KIND_TOOL):
+        assert repository.count() == 1
+    
+    spans = {item.name: item for item in tracing.get_spans()}
+    count_span = spans['NoteRepository.count']
+    list_span = spans['NoteRepository.list']
+    sql_span = spans['sql.fetch_all']
+    
+    assert count_span.kind == list_span.kind == KIND_REPOSITORY
+    assert list_span.parent_id == count_span.span_id
+    assert sql_span.parent_id == list_span.span_id
+    assert sql_span.kind == KIND_SQL
+    assert sql_span.attributes['statement'] == "SELECT * FROM notes WHERE body != ?"
+    assert sql_span.attributes['rows'] == 1
+
+
+def test_bind_context_keeps_parent_in_worker_threads(tracing):
+    """bind_context로 넘긴 작업은 다른 스레드에서도 호출한 쪽 구간의 자식"""
+    def work(index):
+        with span(f'work-{index}'):
+            return index
+    
+    with span('batch') as batch:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert list(executor.map(bind_context(work), range(4))) == [0, 1, 2, 3]
+    
+    workers = [item for item in tracing.get_spans() if item.name.startswith('work-')]
+    assert len(workers) == 4
+    assert all(item.parent_id == batch.span_id for item in workers)
+
+
+def test_export_jsonl_and_chrome_trace(tracing, tmp_path):
+    """JSON Lines와 Chrome trace event 형식으로 저장"""
+    with span('request', 'request', query='지출'):
+        with span('child'):
+            pass
+    
+    jsonl_path = tracing.export_jsonl(str(tmp_path / "spans.jsonl"))
+    records = [json.loads(line) for line in open(jsonl_path, encoding='utf-8')]
+    assert [record['name'] for record in records] == ['child', 'request']
+    assert records[0]['parent_id'] == records[1]['span_id']
+    assert records[1]['attributes'] == {'query': '지출'}
+    
+    chrome_path = tracing.export_chrome_trace(str(tmp_path / "trace.json"))
+    events = json.load(open(chrome_path, encoding='utf-8'))['traceEvents']
+    complete = {event['name']: event for event in events if event['ph'] == 'X'}
+    assert complete['request']['cat'] == 'request'
+    assert complete['request']['ts'] <= complete['child']['ts']
+    assert complete['child']['dur'] <= complete['request']['dur']
+    assert any(event['ph'] == 'M' and event['name'] == 'thread_name' for event in events)
+
+
+def test_jsonl_exporter_streams_finished_spans(tmp_path):
+    """enable(jsonl_path)는 끝난 구간을 파일에 바로 추가"""
+    path = tmp_path / "live.jsonl"
+    tracer.enable(str(path))
+    try:
+        with span('first'):
+            pass
+        assert json.loads(path.read_text(encoding='utf-8'))['name'] == 'first'
+    finally:
+        tracer.disable()
+        tracer.clear()
+
+
+def test_summarize_reports_self_time(tracing):
+    """종류별 요약의 self_ms는 자식 구간 시간을 제외"""
+    with span('request', 'request'):
+        with span('query', KIND_SQL):
+            pass
+    
+    summary = tracing.summarize()
+    request, query = [item for item in tracing.get_spans() if item.name in ('request', 'query')][::-1]
+    assert summary[KIND_SQL]['count'] == 1
+    assert summary['request']['self_ms'] == pytest.approx(request.duration_ms - query.duration_ms)